@@ -0,0 +1,4 @@
+import os
+
+# Config читается при импорте модулей washer и требует API_URL
+os.environ.setdefault('API_URL', 'http://localhost:8000/')
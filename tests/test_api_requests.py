@@ -0,0 +1,48 @@
+import threading
+import time
+
+import httpx
+import pytest
+
+from washer.api_requests import BackendApi
+
+
+@pytest.fixture
+def api():
+    api = BackendApi(transport=httpx.MockTransport(lambda request: None))
+    yield api
+    api.close()
+
+
+def test_map_concurrently_bounds_work_in_the_client_pool(api):
+    lock = threading.Lock()
+    running = peak = 0
+    threads = set()
+
+    def work(item):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+            threads.add(threading.current_thread().name)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        if item == 3:
+            raise httpx.ConnectError('down')
+        return item * 10
+
+    results = dict(api.map_concurrently(work, list(range(8)), 2))
+
+    assert sorted(results) == list(range(8))
+    assert isinstance(results.pop(3), httpx.ConnectError)
+    assert all(value == item * 10 for item, value in results.items())
+    assert peak <= 2
+    assert all(name.startswith('backend-api') for name in threads)
+
+
+def test_map_concurrently_runs_inline_inside_the_pool(api):
+    def nested():
+        return list(api.map_concurrently(lambda item: item, [1, 2], 2))
+
+    assert api.executor.submit(nested).result(timeout=5) == [(1, 1), (2, 2)]
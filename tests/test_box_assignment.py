@@ -0,0 +1,89 @@
+from datetime import datetime
+
+import pytest
+
+from washer.box_assignment import (
+    STRATEGIES,
+    best_fit,
+    book,
+    first_fit,
+    get_strategy,
+    least_utilized,
+    round_robin,
+)
+
+START = datetime(2026, 3, 2, 10)
+
+
+def at(hour: int) -> datetime:
+    return datetime(2026, 3, 2, hour)
+
+
+CANDIDATES = {
+    1: [(at(8), at(14))],
+    2: [(at(10), at(13)), (at(15), at(22))],
+    3: [(at(10), at(12))],
+}
+
+
+def test_first_fit_picks_lowest_box_id():
+    assert first_fit(START, CANDIDATES) == 1
+
+
+def test_best_fit_picks_tightest_range():
+    assert best_fit(START, CANDIDATES) == 3
+
+
+def test_best_fit_avoids_unbookable_leftovers():
+    candidates = {
+        1: [(at(9), at(12))],
+        2: [(at(10), at(15))],
+    }
+    # В боксе 1 останется час до записи, который никто не займёт
+    assert best_fit(START, candidates) == 2
+
+
+def test_least_utilized_picks_most_free_time():
+    assert least_utilized(START, CANDIDATES) == 2
+
+
+@pytest.fixture(autouse=True)
+def reset_round_robin():
+    round_robin.reset()
+
+
+def test_round_robin_rotates_through_free_boxes():
+    assert [round_robin(START, CANDIDATES) for _ in range(4)] == [1, 2, 3, 1]
+
+
+def test_round_robin_skips_busy_boxes():
+    assert round_robin(START, CANDIDATES) == 1
+    assert round_robin(START, {1: [], 3: []}) == 3
+    assert round_robin(START, {1: [], 2: []}) == 1
+
+
+def test_strategies_break_ties_by_box_id():
+    candidates = {4: [(at(10), at(12))], 2: [(at(10), at(12))]}
+    for strategy in STRATEGIES.values():
+        assert strategy(START, candidates) == 2
+
+
+@pytest.mark.parametrize(
+    'name', ['first_fit', 'best_fit', 'least_utilized', 'round_robin']
+)
+def test_get_strategy_by_name(name):
+    assert get_strategy(name) is STRATEGIES[name]
+
+
+def test_unknown_strategy_falls_back_to_first_fit():
+    assert get_strategy('worst_fit') is first_fit
+
+
+def test_book_splits_the_containing_range():
+    ranges = [(at(8), at(14)), (at(15), at(18))]
+    assert book(START, ranges) == [
+        (at(8), at(10)),
+        (at(12), at(14)),
+        (at(15), at(18)),
+    ]
+    assert book(at(15), ranges) == [(at(8), at(14)), (at(17), at(18))]
@@ -0,0 +1,95 @@
+import math
+import random
+
+import pytest
+
+from washer.geo import KDTree, LocationIndex, chord_to_km, unit_vector
+
+
+def random_locations(count: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            'id': location_id,
+            'latitude': rng.uniform(-90, 90),
+            'longitude': rng.uniform(-180, 180),
+        }
+        for location_id in range(count)
+    ]
+
+
+def chord(a: tuple[float, ...], b: tuple[float, ...]) -> float:
+    return math.dist(a, b)
+
+
+def brute_force(points, target, k, max_distance=None):
+    distances = sorted(
+        (chord(vector, target), item['id']) for vector, item in points
+    )
+    if max_distance is not None:
+        distances = [pair for pair in distances if pair[0] <= max_distance]
+    return distances[:k]
+
+
+@pytest.mark.parametrize('k', [1, 5, 50, 500])
+def test_nearest_matches_brute_force(k):
+    points = [
+        (unit_vector(item['latitude'], item['longitude']), item)
+        for item in random_locations(300)
+    ]
+    tree = KDTree(points)
+    rng = random.Random(1)
+    for _ in range(20):
+        target = unit_vector(rng.uniform(-90, 90), rng.uniform(-180, 180))
+        found = tree.nearest(target, k)
+        expected = brute_force(points, target, k)
+        assert [item['id'] for _, item in found] == [
+            item_id for _, item_id in expected
+        ]
+        assert [distance for distance, _ in found] == pytest.approx(
+            [distance for distance, _ in expected]
+        )
+
+
+def test_nearest_respects_max_distance():
+    points = [
+        (unit_vector(item['latitude'], item['longitude']), item)
+        for item in random_locations(200, seed=2)
+    ]
+    tree = KDTree(points)
+    target = unit_vector(55.75, 37.62)
+    found = tree.nearest(target, 100, max_distance=0.5)
+    expected = brute_force(points, target, 100, max_distance=0.5)
+    assert [item['id'] for _, item in found] == [
+        item_id for _, item_id in expected
+    ]
+
+
+def test_nearest_on_empty_tree_and_zero_k():
+    assert KDTree([]).nearest(unit_vector(0, 0), 3) == []
+    tree = KDTree([(unit_vector(0, 0), {'id': 1})])
+    assert tree.nearest(unit_vector(0, 0), 0) == []
+
+
+def test_location_index_distance_and_radius():
+    index = LocationIndex(
+        [
+            {'id': 1, 'latitude': 43.238, 'longitude': 76.945},
+            {'id': 2, 'latitude': 51.169, 'longitude': 71.449},
+            {'id': 3, 'latitude': None, 'longitude': None},
+        ]
+    )
+    assert len(index) == 2
+
+    nearest = index.nearest(43.25, 76.95, k=2)
+    assert [location['id'] for _, location in nearest] == [1, 2]
+    assert nearest[0][0] == pytest.approx(1.4, abs=0.2)
+    # Алматы — Астана около 970 км по дуге
+    assert nearest[1][0] == pytest.approx(970, rel=0.05)
+
+    within = index.nearest(43.25, 76.95, k=2, radius_km=100)
+    assert [location['id'] for _, location in within] == [1]
+
+
+def test_chord_to_km_half_circumference():
+    assert chord_to_km(2.0) == pytest.approx(math.pi * 6371.0088)
@@ -0,0 +1,44 @@
+import io
+
+from PIL import Image
+
+from washer.images import prepare_upload, resize_image
+
+ORIENTATION = 0x0112
+GPS_INFO = 0x8825
+
+
+def small_jpeg(exif: Image.Exif = None) -> bytes:
+    # Шум плохо сжимается, так что пережатие с UPLOAD_QUALITY
+    # даёт файл больше исходного
+    image = Image.effect_noise((40, 20), 64).convert('RGB')
+    output = io.BytesIO()
+    image.save(output, format='JPEG', quality=20, exif=exif or Image.Exif())
+    return output.getvalue()
+
+
+def test_small_jpeg_with_exif_is_stripped_and_rotated():
+    exif = Image.Exif()
+    exif[ORIENTATION] = 6
+    exif[GPS_INFO] = {1: 'N', 2: (55.0, 45.0, 0.0)}
+    data = small_jpeg(exif)
+
+    prepared = prepare_upload(data, 512).read()
+
+    assert prepared != data
+    with Image.open(io.BytesIO(prepared)) as image:
+        assert not image.getexif()
+        assert image.size == (20, 40)
+
+
+def test_small_jpeg_without_metadata_keeps_smaller_original():
+    data = small_jpeg()
+
+    result = resize_image(data, 512, 512, 85, cover=False, image_format='JPEG')
+
+    assert result is data
+
+
+def test_unreadable_data_is_returned_as_is():
+    data = b'not an image'
+    assert resize_image(data, 10, 10, 80) is data
@@ -0,0 +1,54 @@
+import httpx
+import pytest
+
+from washer.resilience import ResilientTransport
+from washer.uploads import UploadCancelled
+
+
+class ScriptedTransport(httpx.BaseTransport):
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def handle_request(self, request):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return httpx.Response(outcome, request=request)
+
+
+def half_open(transport: ResilientTransport):
+    breaker = transport.breaker('GET /boxes/{id}')
+    breaker.failures = breaker.failure_threshold
+    breaker.opened_at = -breaker.reset_timeout
+    assert breaker.state == 'half-open'
+    return breaker
+
+
+def test_non_transport_error_releases_half_open_trial():
+    inner = ScriptedTransport(UploadCancelled(), 200)
+    transport = ResilientTransport(inner, retries=0, backoff=0)
+    url = 'http://backend/boxes/1'
+    breaker = half_open(transport)
+
+    with pytest.raises(UploadCancelled):
+        transport.handle_request(httpx.Request('GET', url))
+    assert not breaker.trial_in_flight
+
+    response = transport.handle_request(httpx.Request('GET', url))
+    assert response.status_code == 200
+    assert inner.calls == 2
+    assert breaker.state == 'closed'
+
+
+def test_transport_error_in_half_open_reopens_circuit():
+    inner = ScriptedTransport(httpx.ConnectError('down'))
+    transport = ResilientTransport(inner, retries=0, backoff=0)
+    url = 'http://backend/boxes/1'
+    breaker = half_open(transport)
+
+    with pytest.raises(httpx.ConnectError):
+        transport.handle_request(httpx.Request('GET', url))
+    assert breaker.state == 'open'
+    assert not breaker.trial_in_flight
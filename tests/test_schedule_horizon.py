@@ -0,0 +1,49 @@
+from datetime import date
+
+import pytest
+
+from washer.schedule_horizon import ScheduleHorizon
+
+TODAY = date(2026, 3, 2)
+SCHEDULES = [
+    {'day_of_week': 0, 'is_available': True},
+    {'day_of_week': 1, 'is_available': False},
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    ScheduleHorizon.invalidate()
+    yield
+    ScheduleHorizon.invalidate()
+
+
+def test_expand_keeps_available_weekdays():
+    dates = ScheduleHorizon.expand(SCHEDULES, TODAY, 14)
+    assert dates == {date(2026, 3, 2), date(2026, 3, 9)}
+
+
+def test_cache_returns_schedules_and_dates():
+    horizon = ScheduleHorizon(horizon_days=14, ttl=60)
+    dates = horizon.build(1, SCHEDULES, TODAY)
+
+    assert horizon.get_cached(1, TODAY) == (SCHEDULES, dates)
+    assert horizon.get_cached(2, TODAY) is None
+
+
+def test_cache_expires_after_ttl(monkeypatch):
+    horizon = ScheduleHorizon(horizon_days=14, ttl=60)
+    now = 1000.0
+    monkeypatch.setattr('time.monotonic', lambda: now)
+    horizon.build(1, SCHEDULES, TODAY)
+
+    now += 59
+    assert horizon.get_cached(1, TODAY) is not None
+    now += 1
+    assert horizon.get_cached(1, TODAY) is None
+
+
+def test_cache_is_dropped_on_a_new_day():
+    horizon = ScheduleHorizon(horizon_days=14, ttl=60)
+    horizon.build(1, SCHEDULES, TODAY)
+    assert horizon.get_cached(1, date(2026, 3, 3)) is None
@@ -0,0 +1,49 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from washer.metrics import RequestMetricsRegistry, RequestTimer
+from washer.single_flight import SingleFlightTransport
+
+URL = 'http://backend/car_washes/1/boxes'
+
+
+class GatedTransport(httpx.BaseTransport):
+    """Держит запрос, пока не соберутся все ведомые."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def handle_request(self, request):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        return httpx.Response(200, json={'data': []}, request=request)
+
+
+def test_followers_are_counted_only_as_deduplicated():
+    registry = RequestMetricsRegistry()
+    inner = GatedTransport()
+    transport = SingleFlightTransport(inner, registry)
+    client = httpx.Client(
+        transport=transport,
+        event_hooks=RequestTimer(registry).event_hooks(),
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(client.get, URL) for _ in range(4)]
+        inner.started.wait(5)
+        # Даём ведомым встать в ожидание ответа ведущего
+        time.sleep(0.1)
+        inner.release.set()
+        responses = [future.result() for future in futures]
+
+    assert all(response.status_code == 200 for response in responses)
+    assert inner.calls == 1
+    stats = registry.summary()['GET /car_washes/{id}/boxes']
+    assert stats['count'] == 1
+    assert stats['deduplicated'] == 3
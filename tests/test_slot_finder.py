@@ -0,0 +1,145 @@
+import threading
+from datetime import date, datetime
+
+import httpx
+
+from washer.slot_finder import EarliestSlotFinder, box_slots, first_slot_boxes
+
+DAY = date(2026, 3, 2)
+NEXT_DAY = date(2026, 3, 3)
+# Поиск идёт заранее, ограничение «не раньше следующего часа» не влияет
+NOW = datetime(2026, 3, 1, 12, 0)
+
+
+class AvailabilityApi:
+    """Ответы available_times по дням и журнал запрошенных дней."""
+
+    def __init__(self, days: dict[date, dict], failing: set = frozenset()):
+        self.days = days
+        self.failing = failing
+        self.requested = []
+
+    def get_available_times(self, car_wash_id: int, day: str):
+        self.requested.append(day)
+        if date.fromisoformat(day) in self.failing:
+            return httpx.Response(503, text='unavailable')
+        available_times = self.days.get(date.fromisoformat(day), {})
+        return httpx.Response(200, json={'available_times': available_times})
+
+
+def ranges(day: date, *hours: tuple[int, int]) -> list[list[str]]:
+    return [
+        [f'{day}T{start:02}:00:00', f'{day}T{end:02}:00:00']
+        for start, end in hours
+    ]
+
+
+def finder(api, now=NOW, **kwargs) -> EarliestSlotFinder:
+    return EarliestSlotFinder(api, 1, [DAY, NEXT_DAY], now=now, **kwargs)
+
+
+def test_box_slots_steps_by_hour_within_ranges():
+    slots = list(box_slots(7, ranges(DAY, (9, 12), (14, 15)), DAY))
+    assert slots == [
+        (datetime(2026, 3, 2, 9), 7),
+        (datetime(2026, 3, 2, 10), 7),
+    ]
+
+
+def test_earliest_slot_across_boxes():
+    api = AvailabilityApi(
+        {
+            DAY: {
+                '1': ranges(DAY, (12, 18)),
+                '2': ranges(DAY, (10, 12)),
+                '3': ranges(DAY, (10, 14)),
+            }
+        }
+    )
+    assert finder(api).earliest(DAY, count=3) == [
+        (datetime(2026, 3, 2, 10), 2),
+        (datetime(2026, 3, 2, 10), 3),
+        (datetime(2026, 3, 2, 11), 3),
+    ]
+    assert api.requested == ['2026-03-02']
+
+
+def test_earliest_candidates_lists_every_free_box():
+    api = AvailabilityApi(
+        {
+            DAY: {
+                '1': ranges(DAY, (10, 12)),
+                '2': ranges(DAY, (8, 20)),
+                '3': ranges(DAY, (11, 13)),
+            }
+        }
+    )
+    slot_time, candidates = finder(api).earliest_candidates(DAY)
+    assert slot_time == datetime(2026, 3, 2, 8)
+    assert list(candidates) == [2]
+
+    api.days[DAY]['2'] = ranges(DAY, (10, 20))
+    slot_time, candidates = finder(api).earliest_candidates(DAY)
+    assert slot_time == datetime(2026, 3, 2, 10)
+    assert candidates == {
+        1: [(datetime(2026, 3, 2, 10), datetime(2026, 3, 2, 12))],
+        2: [(datetime(2026, 3, 2, 10), datetime(2026, 3, 2, 20))],
+    }
+
+
+def test_full_day_moves_to_next_day():
+    api = AvailabilityApi(
+        {
+            DAY: {'1': ranges(DAY, (10, 11))},
+            NEXT_DAY: {'1': ranges(NEXT_DAY, (9, 11))},
+        }
+    )
+    slot_time, candidates = finder(api).earliest_candidates(DAY)
+    assert slot_time == datetime(2026, 3, 3, 9)
+    assert list(candidates) == [1]
+    assert api.requested == ['2026-03-02', '2026-03-03']
+
+
+def test_last_slot_of_day_does_not_fetch_next_day():
+    api = AvailabilityApi(
+        {
+            DAY: {
+                '1': ranges(DAY, (18, 20)),
+                '2': ranges(DAY, (18, 20)),
+            },
+            NEXT_DAY: {'1': ranges(NEXT_DAY, (9, 11))},
+        }
+    )
+    slot_time, candidates = finder(api).earliest_candidates(DAY)
+    assert slot_time == datetime(2026, 3, 2, 18)
+    assert sorted(candidates) == [1, 2]
+    assert api.requested == ['2026-03-02']
+
+
+def test_today_starts_after_the_next_hour():
+    api = AvailabilityApi({DAY: {'1': ranges(DAY, (8, 20))}})
+    now = datetime(2026, 3, 2, 10, 30)
+    assert finder(api, now=now).earliest(DAY) == [
+        (datetime(2026, 3, 2, 11), 1)
+    ]
+
+
+def test_failed_day_is_not_skipped():
+    api = AvailabilityApi(
+        {NEXT_DAY: {'1': ranges(NEXT_DAY, (9, 11))}}, failing={DAY}
+    )
+    search = finder(api)
+    assert search.earliest_candidates(DAY) is None
+    assert search.failed
+
+
+def test_cancelled_search_stops_before_next_day():
+    cancelled = threading.Event()
+    cancelled.set()
+    api = AvailabilityApi({DAY: {'1': ranges(DAY, (9, 11))}})
+    assert finder(api, cancelled=cancelled).earliest(DAY) == []
+    assert api.requested == []
+
+
+def test_first_slot_boxes_on_empty_stream():
+    assert first_slot_boxes(iter(())) is None
@@ -1,24 +1,96 @@
-import io
+import itertools
 import json
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import BinaryIO
 
 import httpx
 
 from washer.config import config
+from washer.images import upload_file
+from washer.logger import get_logger
+from washer.metrics import (
+    RequestMetricsRegistry,
+    RequestTimer,
+    request_metrics,
+)
 from washer.models.user import UserRegistration
+from washer.resilience import ResilientTransport
+from washer.schedule_horizon import ScheduleHorizon
+from washer.single_flight import SingleFlightTransport
+from washer.token_auth import TokenAuth, token_expiry
+from washer.uploads import streaming_files
+
+logger = get_logger(__name__)
+
+BULK_REQUEST_WORKERS = 7
+EXECUTOR_THREAD_PREFIX = 'backend-api'
 
 
 class BackendApi:
-    def __init__(self):
+    def __init__(self, transport: httpx.BaseTransport = None):
         self.url = config.api_url
         self.access_token = None
         self.refresh_token = None
+        self.token_expires_at = None
+        self.on_tokens_changed = None
+        self.refresh_lock = threading.Lock()
+        self.background_refresh = None
         self.executor = ThreadPoolExecutor(
-            max_workers=10
-        )  # Добавлен ThreadPoolExecutor
+            max_workers=10, thread_name_prefix=EXECUTOR_THREAD_PREFIX
+        )
+        if transport is None and config.stub_backend:
+            from washer.stub_backend import get_shared_stub_backend
+
+            transport = get_shared_stub_backend().transport()
+        # Замеры этого клиента; общий реестр процесса получает копии
+        self.metrics = RequestMetricsRegistry(parent=request_metrics)
+        self.client = httpx.Client(
+            transport=SingleFlightTransport(
+                ResilientTransport(transport or httpx.HTTPTransport()),
+                self.metrics,
+            ),
+            auth=TokenAuth(self, config.token_refresh_margin),
+            event_hooks=RequestTimer(self.metrics).event_hooks(),
+        )
+
+    @staticmethod
+    def for_page(page) -> 'BackendApi':
+        """
+        Клиент API сессии Flet, общий для всех страниц: один пул
+        соединений, один пул потоков и одно состояние токена.
+        Токены берутся из client_storage, пока у клиента их нет,
+        а обновлённые токены сохраняются обратно.
+        """
+        api = getattr(page, 'api', None)
+        if api is None:
+            api = BackendApi()
+            page.api = api
+
+        if api.access_token is None:
+            api.set_tokens(
+                page.client_storage.get('access_token'),
+                page.client_storage.get('refresh_token'),
+            )
+
+        def save_tokens(tokens: dict):
+            page.client_storage.set('access_token', tokens['access_token'])
+            page.client_storage.set('refresh_token', tokens['refresh_token'])
+
+        api.on_tokens_changed = save_tokens
+        return api
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+        self.client.close()
 
     def set_access_token(self, token: str):
         self.access_token = token
+        self.token_expires_at = token_expiry(token) if token else None
+
+    def set_tokens(self, access_token: str, refresh_token: str):
+        self.set_access_token(access_token)
+        self.refresh_token = refresh_token
 
     def get_headers(self):
         headers = {
@@ -30,16 +102,39 @@ class BackendApi:
     def create_box(self, box_data: dict) -> httpx.Response:
         api_url = f"{str(self.url).rstrip('/')}/car_washes/boxes"
         headers = self.get_headers()
-        return httpx.post(api_url, json=box_data, headers=headers)
+        return self.client.post(api_url, json=box_data, headers=headers)
 
     def create_schedule(self, schedule_data):
         url = f"{str(self.url).rstrip('/')}/car_washes/schedules"
-        print(f'Отправляем запрос на URL: {url}')
-        response = httpx.post(
+        logger.debug('Отправляем запрос на URL: %s', url)
+        response = self.client.post(
             url, json=schedule_data, headers=self.get_headers()
         )
         return response
 
+    def create_schedules(self, schedules_data: list[dict]) -> dict:
+        """
+        Создаёт расписания на несколько дней одновременными запросами,
+        так что неделя занимает время одного запроса, а не семи.
+
+        :return: Словарь с 'created' (day_of_week -> созданное
+        расписание) и 'failed' (day_of_week -> текст ошибки).
+        """
+        result = {'created': {}, 'failed': {}}
+
+        for schedule_data, response in self.map_concurrently(
+            self.create_schedule, schedules_data, BULK_REQUEST_WORKERS
+        ):
+            day_of_week = schedule_data['day_of_week']
+            if isinstance(response, Exception):
+                result['failed'][day_of_week] = str(response)
+            elif response.status_code == 200:
+                result['created'][day_of_week] = response.json()
+            else:
+                result['failed'][day_of_week] = response.text
+
+        return result
+
     def get_boxes(self, car_wash_id: int) -> httpx.Response:
         api_url = (
             f"{str(self.url).rstrip('/')}/car_washes/boxes"
@@ -47,7 +142,7 @@ class BackendApi:
         )
 
         headers = self.get_headers()
-        return httpx.get(api_url, headers=headers)
+        return self.client.get(api_url, headers=headers)
 
     def get_schedules(self, car_wash_id: int) -> httpx.Response:
         api_url = (
@@ -56,16 +151,29 @@ class BackendApi:
         )
 
         headers = self.get_headers()
-        return httpx.get(api_url, headers=headers)
+        return self.client.get(api_url, headers=headers)
 
     def delete_schedule(self, schedule_id: int) -> httpx.Response:
         api_url = (
             f"{str(self.url).rstrip('/')}/car_washes/schedules/{schedule_id}"
         )
         headers = self.get_headers()
-        return httpx.delete(api_url, headers=headers)
+        return self.client.delete(api_url, headers=headers)
+
+    def register_user(
+        self,
+        user: UserRegistration,
+        image: BinaryIO = None,
+        on_progress=None,
+        cancel: threading.Event = None,
+    ) -> httpx.Response:
+        """
+        Регистрация пользователя с необязательным аватаром.
 
-    def register_user(self, user: UserRegistration) -> httpx.Response:
+        image — открытый файл аватара, он отправляется потоком; без него
+        используется user.image. on_progress(sent, total) и cancel
+        описаны в washer.uploads.streaming_files.
+        """
         api_url = f"{str(self.url).rstrip('/')}/jwt/register"
 
         user_data = user.model_dump(exclude={'image'}, exclude_unset=True)
@@ -73,34 +181,36 @@ class BackendApi:
 
         files = {'new_user': (None, user_json, 'application/json')}
 
-        if user.image:
-            files['image'] = (
-                'avatar.png',
-                io.BytesIO(user.image),
-                'image/png',
-            )
+        image = image or user.image
+        if image:
+            files['image'] = upload_file('avatar', image)
 
-        print(f'Отправка запроса на {api_url} с данными {files}')
-        response = httpx.post(api_url, files=files, headers=self.get_headers())
-        print(f'Получен ответ: {response.status_code} - {response.text}')
+        logger.debug('Отправка запроса на %s, поля: %s', api_url, list(files))
+        response = self.client.post(
+            api_url,
+            files=streaming_files(files, on_progress, cancel),
+            headers=self.get_headers(),
+        )
+        logger.debug('Получен ответ: %s', response.status_code)
         return response
 
     def login(self, username: str, password: str) -> dict:
-        response = httpx.post(
+        response = self.client.post(
             f'{str(self.url).rstrip("/")}/jwt/token',
             data={'username': username, 'password': password},
         )
         if response.status_code == 200:
             tokens = response.json()
-            self.access_token = tokens.get('access_token')
-            self.refresh_token = tokens.get('refresh_token')
+            self.set_tokens(
+                tokens.get('access_token'), tokens.get('refresh_token')
+            )
             return tokens
         else:
             return {'error': 'Ошибка авторизации'}
 
     def get_logged_user(self) -> dict:
         if not self.access_token:
-            print('Access token not set!')
+            logger.warning('Access token not set!')
             return {'error': 'Access token not set!'}
 
         headers = {
@@ -109,24 +219,28 @@ class BackendApi:
         }
         api_url = f"{str(self.url).rstrip('/')}/users/me"
         try:
-            response = httpx.get(api_url, headers=headers)
+            response = self.client.get(api_url, headers=headers)
             if response.status_code == 200:
                 return response.json()
             else:
-                print(
-                    f'Ошибка при получении данных пользователя: '
-                    f'{response.status_code} - {response.text}'
+                logger.error(
+                    'Ошибка при получении данных пользователя: %s - %s',
+                    response.status_code,
+                    response.text,
                 )
                 return {
                     'error': f'Error {response.status_code}: {response.text}'
                 }
         except httpx.RequestError as e:
-            print(f'Ошибка запроса при получении данных пользователя: {e}')
+            logger.error(
+                'Ошибка запроса при получении данных пользователя: %s',
+                e,
+            )
             return {'error': 'Request failed'}
 
     def create_user_car(self, car_data: dict) -> httpx.Response:
         if not self.access_token:
-            print('Токен доступа отсутствует!')
+            logger.warning('Токен доступа отсутствует!')
             return None
 
         api_url = f"{str(self.url).rstrip('/')}/cars"
@@ -136,7 +250,7 @@ class BackendApi:
             'Content-Type': 'application/json',
         }
 
-        response = httpx.post(api_url, json=car_data, headers=headers)
+        response = self.client.post(api_url, json=car_data, headers=headers)
         return response
 
     def get_user_cars(self, user_id: int, limit: int = 100) -> httpx.Response:
@@ -144,13 +258,13 @@ class BackendApi:
             f"{str(self.url).rstrip('/')}/cars?user_id={user_id}&limit={limit}"
         )
         headers = self.get_headers()
-        response = httpx.get(api_url, headers=headers)
+        response = self.client.get(api_url, headers=headers)
         return response
 
     def get_car_by_id(self, car_id: int) -> httpx.Response:
         headers = {'Authorization': f'Bearer {self.access_token}'}
-        api_url = f'{str(self.url).rstrip('/')}/cars/{car_id}'
-        response = httpx.get(api_url, headers=headers)
+        api_url = f"{str(self.url).rstrip('/')}/cars/{car_id}"
+        response = self.client.get(api_url, headers=headers)
         return response
 
     def upload_car_wash_image(self, data: dict, files: dict) -> httpx.Response:
@@ -161,32 +275,51 @@ class BackendApi:
             'Accept': 'application/json',
         }
 
-        response = httpx.post(api_url, data=data, files=files, headers=headers)
+        response = self.client.post(
+            api_url, data=data, files=files, headers=headers
+        )
         return response
 
     def update_box(self, box_id: int, new_name: str) -> httpx.Response:
         api_url = f"{str(self.url).rstrip('/')}/car_washes/boxes/{box_id}"
         headers = self.get_headers()
-        return httpx.patch(api_url, json={'name': new_name}, headers=headers)
+        return self.client.patch(
+            api_url, json={'name': new_name}, headers=headers
+        )
 
     def delete_box(self, box_id: int) -> httpx.Response:
         api_url = f"{str(self.url).rstrip('/')}/car_washes/boxes/{box_id}"
         headers = self.get_headers()
-        return httpx.delete(api_url, headers=headers)
+        return self.client.delete(api_url, headers=headers)
 
     def create_booking(self, booking_data: dict) -> httpx.Response:
         api_url = f"{str(self.url).rstrip('/')}/car_washes/bookings"
         headers = self.get_headers()
-        response = httpx.post(api_url, json=booking_data, headers=headers)
+        response = self.client.post(
+            api_url, json=booking_data, headers=headers
+        )
+        self.invalidate_schedule_horizon(response)
         return response
 
-    def get_bookings(self, car_wash_id: int) -> httpx.Response:
+    @staticmethod
+    def invalidate_schedule_horizon(response: httpx.Response):
+        """
+        Сбрасывает кэш доступных дат после изменения букингов. Запрос
+        не содержит id автомойки, поэтому кэш сбрасывается целиком.
+        """
+        if response.is_success:
+            ScheduleHorizon.invalidate()
+
+    def get_bookings(
+        self, car_wash_id: int, updated_since: str = None
+    ) -> httpx.Response:
         api_url = (
             f"{str(self.url).rstrip('/')}/car_washes/bookings"
             f"?car_wash_id={car_wash_id}&limit=1000"
         )
+        params = {'updated_since': updated_since} if updated_since else None
         headers = self.get_headers()
-        response = httpx.get(api_url, headers=headers)
+        response = self.client.get(api_url, params=params, headers=headers)
         return response
 
     def get_available_times(
@@ -198,7 +331,7 @@ class BackendApi:
         )
 
         headers = self.get_headers()
-        response = httpx.get(api_url, headers=headers)
+        response = self.client.get(api_url, headers=headers)
         return response
 
     def get_available_times_async(
@@ -216,18 +349,17 @@ class BackendApi:
 
         self.executor.submit(task)
 
-    def get_locations(self) -> httpx.Response:
-        api_url = (
-            f"{str(self.url).rstrip('/')}/car_washes/locations?page=1&limit=10"
-        )
+    def get_locations(self, page: int = 1, limit: int = 10) -> httpx.Response:
+        api_url = f"{str(self.url).rstrip('/')}/car_washes/locations"
         headers = self.get_headers()
-        response = httpx.get(api_url, headers=headers)
+        params = {'page': page, 'limit': limit}
+        response = self.client.get(api_url, headers=headers, params=params)
         return response
 
     def create_price(self, price_data: dict) -> httpx.Response:
         api_url = f"{str(self.url).rstrip('/')}/car_washes/prices"
         headers = self.get_headers()
-        response = httpx.post(api_url, json=price_data, headers=headers)
+        response = self.client.post(api_url, json=price_data, headers=headers)
         return response
 
     def get_prices(self, car_wash_id: int) -> httpx.Response:
@@ -236,25 +368,25 @@ class BackendApi:
             f"?car_wash_id={car_wash_id}"
         )
         headers = self.get_headers()
-        response = httpx.get(api_url, headers=headers)
+        response = self.client.get(api_url, headers=headers)
         return response
 
     def update_price(self, price_id: int, price_data: dict) -> httpx.Response:
         api_url = f"{str(self.url).rstrip('/')}/car_washes/prices/{price_id}"
         headers = self.get_headers()
-        response = httpx.patch(api_url, json=price_data, headers=headers)
+        response = self.client.patch(api_url, json=price_data, headers=headers)
         return response
 
     def delete_price(self, price_id: int) -> httpx.Response:
         api_url = f"{str(self.url).rstrip('/')}/car_washes/prices/{price_id}"
         headers = self.get_headers()
-        response = httpx.delete(api_url, headers=headers)
+        response = self.client.delete(api_url, headers=headers)
         return response
 
     def get_body_types(self, limit=100) -> httpx.Response:
         api_url = f"{str(self.url).rstrip('/')}/cars/body_types?limit={limit}"
         headers = self.get_headers()
-        response = httpx.get(api_url, headers=headers)
+        response = self.client.get(api_url, headers=headers)
         return response
 
     def get_car_price(self, car_wash_id: int) -> httpx.Response:
@@ -263,11 +395,28 @@ class BackendApi:
             f"?page=1&limit=100&order_by=id&car_wash_id={car_wash_id}"
         )
         headers = self.get_headers()
-        response = httpx.get(api_url, headers=headers)
+        response = self.client.get(api_url, headers=headers)
 
-        print(f'Отправляем запрос на {api_url}')
-        print(f'Ответ сервера: {response.status_code}, {response.text}')
+        logger.debug('Отправляем запрос на %s', api_url)
+        logger.debug(
+            'Ответ сервера: %s, %s',
+            response.status_code,
+            response.text,
+        )
+
+        return response
 
+    def update_booking(
+        self, booking_id: int, booking_data: dict
+    ) -> httpx.Response:
+        api_url = (
+            f"{str(self.url).rstrip('/')}/car_washes/bookings/{booking_id}"
+        )
+        headers = self.get_headers()
+        response = self.client.patch(
+            api_url, json=booking_data, headers=headers
+        )
+        self.invalidate_schedule_horizon(response)
         return response
 
     def delete_booking(self, booking_id: int) -> httpx.Response:
@@ -275,9 +424,87 @@ class BackendApi:
             f"{str(self.url).rstrip('/')}/car_washes/bookings/{booking_id}"
         )
         headers = self.get_headers()
-        response = httpx.delete(api_url, headers=headers)
+        response = self.client.delete(api_url, headers=headers)
+        self.invalidate_schedule_horizon(response)
         return response
 
+    def map_concurrently(self, func, items: list, max_workers: int):
+        """
+        Выполняет func для каждого элемента параллельно в пуле потоков
+        клиента, не больше max_workers задач за раз: следующий элемент
+        отправляется, когда завершилась одна из начатых задач.
+
+        Отдаёт пары (элемент, ответ или исключение httpx) по мере
+        завершения запросов. Вызов из потока самого пула выполняется
+        последовательно, чтобы ожидание своих задач не заняло весь пул.
+        """
+        if threading.current_thread().name.startswith(EXECUTOR_THREAD_PREFIX):
+            for item in items:
+                try:
+                    yield item, func(item)
+                except httpx.HTTPError as e:
+                    yield item, e
+            return
+
+        remaining = iter(items)
+        pending = {
+            self.executor.submit(func, item): item
+            for item in itertools.islice(remaining, max_workers)
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                for next_item in itertools.islice(remaining, 1):
+                    pending[self.executor.submit(func, next_item)] = next_item
+                try:
+                    yield item, future.result()
+                except httpx.HTTPError as e:
+                    yield item, e
+
+    def delete_bookings(
+        self,
+        booking_ids: list[int],
+        on_progress=None,
+        max_workers: int = BULK_REQUEST_WORKERS,
+    ) -> dict:
+        """
+        Удаляет несколько букингов параллельными запросами.
+
+        on_progress(done, total) вызывается после каждого ответа
+        в потоке, который вызвал метод.
+
+        :return: Словарь с 'deleted' (список id) и 'failed'
+        (id -> текст ошибки).
+        """
+        result = {'deleted': [], 'failed': {}}
+        total = len(booking_ids)
+
+        for done, (booking_id, response) in enumerate(
+            self.map_concurrently(
+                self.delete_booking, booking_ids, max_workers
+            ),
+            start=1,
+        ):
+            if isinstance(response, Exception):
+                result['failed'][booking_id] = str(response)
+            # 404: букинг уже удалён, повторять нечего
+            elif response.status_code in (200, 204, 404):
+                result['deleted'].append(booking_id)
+            else:
+                result['failed'][booking_id] = response.text
+
+            if on_progress:
+                on_progress(done, total)
+
+        logger.debug(
+            'Удалено букингов: %s из %s, ошибок: %s',
+            len(result['deleted']),
+            total,
+            len(result['failed']),
+        )
+        return result
+
     def update_user_data(self, user_id: int, new_values: dict) -> dict:
         """
         Обновление данных пользователя.
@@ -291,7 +518,7 @@ class BackendApi:
         headers = self.get_headers()
         headers['Content-Type'] = 'application/x-www-form-urlencoded'
         try:
-            response = httpx.patch(
+            response = self.client.patch(
                 url,
                 data={'new_values': json.dumps(new_values)},
                 headers=headers,
@@ -304,7 +531,7 @@ class BackendApi:
             else:
                 return {'error': response.text}
         except httpx.RequestError as e:
-            print(f'Ошибка запроса при обновлении пользователя: {e}')
+            logger.error('Ошибка запроса при обновлении пользователя: %s', e)
             return {'error': str(e)}
 
     def update_schedule(
@@ -314,13 +541,15 @@ class BackendApi:
             f"{str(self.url).rstrip('/')}/car_washes/schedules/{schedule_id}"
         )
         headers = self.get_headers()
-        response = httpx.patch(api_url, json=updated_data, headers=headers)
+        response = self.client.patch(
+            api_url, json=updated_data, headers=headers
+        )
         return response
 
     def get_brands(self, limit=1000) -> httpx.Response:
         api_url = f"{str(self.url).rstrip('/')}/cars/brands?limit={limit}"
         headers = self.get_headers()
-        return httpx.get(api_url, headers=headers)
+        return self.client.get(api_url, headers=headers)
 
     def get_models(self, brand_id: int, limit=100) -> httpx.Response:
         api_url = (
@@ -329,7 +558,7 @@ class BackendApi:
         )
 
         headers = self.get_headers()
-        return httpx.get(api_url, headers=headers)
+        return self.client.get(api_url, headers=headers)
 
     def get_generations(self, model_id: int, limit=100) -> httpx.Response:
         api_url = (
@@ -338,7 +567,7 @@ class BackendApi:
         )
 
         headers = self.get_headers()
-        return httpx.get(api_url, headers=headers)
+        return self.client.get(api_url, headers=headers)
 
     def get_configurations(
         self, generation_id: int, limit: int = 100
@@ -349,28 +578,80 @@ class BackendApi:
         )
 
         headers = self.get_headers()
-        return httpx.get(api_url, headers=headers)
+        return self.client.get(api_url, headers=headers)
+
+    def refresh_access_token(self, stale_token: str = None) -> dict:
+        """
+        Обновляет пару токенов через /jwt/refresh.
+
+        Одновременные вызовы объединяются: пока один поток обновляет
+        токен, остальные ждут блокировку и, увидев, что токен уже
+        сменился, возвращают новый без повторного запроса.
+
+        :param stale_token: Токен, который вызывающий считает
+        устаревшим. По умолчанию — текущий.
+        """
+        stale_token = stale_token or self.access_token
+        with self.refresh_lock:
+            if self.access_token != stale_token:
+                return {
+                    'access_token': self.access_token,
+                    'refresh_token': self.refresh_token,
+                }
+            if not self.refresh_token:
+                return {'error': 'Refresh token not set'}
+
+            response = self.client.post(
+                f'{str(self.url).rstrip("/")}/jwt/refresh',
+                json={'refresh_token': self.refresh_token},
+            )
+            if response.status_code != 200:
+                logger.error('Ошибка обновления токена: %s', response.text)
+                if response.status_code == 401:
+                    # Сессия истекла, повторять обновление бессмысленно
+                    self.refresh_token = None
+                return {
+                    'error': 'Failed to refresh token',
+                    'details': response.text,
+                }
 
-    def refresh_token(self, refresh_token: str) -> dict:
-        response = httpx.post(
-            f'{str(self.url).rstrip("/")}/jwt/refresh',
-            json={'refresh_token': refresh_token},
-        )
-        if response.status_code == 200:
             tokens = response.json()
-            self.access_token = tokens.get('access_token')
-            self.refresh_token = tokens.get('refresh_token')
-            return tokens
-        else:
-            return {
-                'error': 'Failed to refresh token',
-                'details': response.text,
-            }
+            self.set_tokens(
+                tokens.get('access_token'), tokens.get('refresh_token')
+            )
+            # Под блокировкой, чтобы logout не разошёлся с сохранением
+            if self.on_tokens_changed:
+                self.on_tokens_changed(tokens)
+
+        logger.debug('Access-токен обновлён')
+        return tokens
+
+    def refresh_in_background(self, stale_token: str = None):
+        """Запускает обновление токена в пуле, если оно ещё не идёт."""
+        stale_token = stale_token or self.access_token
+        if self.background_refresh is None or self.background_refresh.done():
+            self.background_refresh = self.executor.submit(
+                self.refresh_access_token, stale_token
+            )
+
+    def logout(self):
+        """
+        Забывает токены сессии и отменяет ожидающее фоновое обновление.
+        Обновление, которое уже идёт, завершается до сброса, поэтому
+        новые токены не попадут в client_storage после выхода.
+        """
+        if self.background_refresh is not None:
+            self.background_refresh.cancel()
+            self.background_refresh = None
+        with self.refresh_lock:
+            self.on_tokens_changed = None
+            self.set_tokens(None, None)
+        logger.debug('Токены сессии сброшены')
 
     def delete_user_car(self, car_id: int) -> httpx.Response:
         api_url = f"{str(self.url).rstrip('/')}/cars/{car_id}"
         headers = self.get_headers()
-        response = httpx.delete(api_url, headers=headers)
+        response = self.client.delete(api_url, headers=headers)
         return response
 
     def get_configuration_by_id(
@@ -379,19 +660,19 @@ class BackendApi:
         api_url = f"{str(self.url).rstrip('/')}/cars/configurations"
         headers = self.get_headers()
         params = {'configuration_id': configuration_id, 'limit': limit}
-        response = httpx.get(api_url, headers=headers, params=params)
+        response = self.client.get(api_url, headers=headers, params=params)
         return response
 
     def get_user_avatar(self) -> httpx.Response:
         api_url = f"{str(self.url).rstrip('/')}/users/me"
         headers = self.get_headers()
-        return httpx.get(api_url, headers=headers)
+        return self.client.get(api_url, headers=headers)
 
     def get_car_washes(self, page: int = 1) -> httpx.Response:
         api_url = f"{str(self.url).rstrip('/')}/car_washes"
         headers = self.get_headers()
         params = {'page': page}
-        response = httpx.get(api_url, headers=headers, params=params)
+        response = self.client.get(api_url, headers=headers, params=params)
         return response
 
     def get_location_data(self, location_id: int) -> httpx.Response:
@@ -399,19 +680,19 @@ class BackendApi:
             f"{str(self.url).rstrip('/')}/car_washes/locations/{location_id}"
         )
         headers = self.get_headers()
-        response = httpx.get(api_url, headers=headers)
+        response = self.client.get(api_url, headers=headers)
         return response
 
     def get_box_by_id(self, box_id: int) -> httpx.Response:
         api_url = f"{str(self.url).rstrip('/')}/car_washes/boxes/{box_id}"
         headers = self.get_headers()
-        response = httpx.get(api_url, headers=headers)
+        response = self.client.get(api_url, headers=headers)
         return response
 
     def get_car_wash_by_id(self, car_wash_id: int) -> httpx.Response:
         api_url = f"{str(self.url).rstrip('/')}/car_washes/{car_wash_id}"
         headers = self.get_headers()
-        response = httpx.get(api_url, headers=headers)
+        response = self.client.get(api_url, headers=headers)
         return response
 
     def get_location_by_id(self, location_id: int) -> httpx.Response:
@@ -419,7 +700,7 @@ class BackendApi:
             f"{str(self.url).rstrip('/')}/car_washes/locations/{location_id}"
         )
         headers = self.get_headers()
-        response = httpx.get(api_url, headers=headers)
+        response = self.client.get(api_url, headers=headers)
         return response
 
     def get_user_bookings(
@@ -432,21 +713,28 @@ class BackendApi:
         headers = self.get_headers()
         params = {'user_id': user_id, 'limit': limit}
         try:
-            response = httpx.get(api_url, headers=headers, params=params)
+            response = self.client.get(api_url, headers=headers, params=params)
             return response
         except httpx.RequestError as e:
-            print(f'Ошибка запроса при получении букингов: {e}')
+            logger.error('Ошибка запроса при получении букингов: %s', e)
             return None
 
     def update_user_with_avatar(
-        self, user_id: int, new_values: dict, image_bytes: bytes
+        self,
+        user_id: int,
+        new_values: dict,
+        image: BinaryIO,
+        on_progress=None,
+        cancel: threading.Event = None,
     ) -> httpx.Response:
         """
         Обновление данных пользователя с загрузкой аватара.
 
         :param user_id: Идентификатор пользователя.
         :param new_values: Словарь с обновляемыми полями пользователя.
-        :param image_bytes: Байтовые данные изображения аватара.
+        :param image: Открытый файл или байты изображения аватара.
+        :param on_progress: Колбэк on_progress(sent, total).
+        :param cancel: Событие, прерывающее загрузку с UploadCancelled.
         :return: Объект httpx.Response или None в случае ошибки.
         """
         api_url = f"{str(self.url).rstrip('/')}/users/{user_id}"
@@ -454,21 +742,29 @@ class BackendApi:
             'Authorization': f'Bearer {self.access_token}',
             'Accept': 'application/json',
         }
-        files = {'image': ('avatar.png', io.BytesIO(image_bytes))}
+        files = {'image': upload_file('avatar', image)}
         data = {
             'new_values': json.dumps(new_values)
         }  # Добавлено поле 'new_values'
         try:
-            response = httpx.patch(
-                api_url, files=files, data=data, headers=headers
+            response = self.client.patch(
+                api_url,
+                files=streaming_files(files, on_progress, cancel),
+                data=data,
+                headers=headers,
             )
             return response
         except httpx.RequestError as e:
-            print(f'Ошибка запроса при обновлении пользователя: {e}')
+            logger.error('Ошибка запроса при обновлении пользователя: %s', e)
             return None
 
     def update_car_wash(
-        self, car_wash_id: int, new_values: dict, files: dict = None
+        self,
+        car_wash_id: int,
+        new_values: dict,
+        files: dict = None,
+        on_progress=None,
+        cancel: threading.Event = None,
     ) -> httpx.Response:
         """
         Обновление данных автомойки.
@@ -476,6 +772,8 @@ class BackendApi:
         :param car_wash_id: Идентификатор автомойки.
         :param new_values: Словарь с обновляемыми полями.
         :param files: Словарь с файлами для загрузки (например, изображение).
+        :param on_progress: Колбэк on_progress(sent, total).
+        :param cancel: Событие, прерывающее загрузку с UploadCancelled.
         :return: Объект httpx.Response.
         """
         api_url = f"{str(self.url).rstrip('/')}/car_washes/{car_wash_id}"
@@ -487,26 +785,27 @@ class BackendApi:
         data = {'new_values': json.dumps(new_values)} if new_values else None
 
         try:
-            response = httpx.patch(
+            response = self.client.patch(
                 api_url,
-                files=files,
+                files=streaming_files(files, on_progress, cancel),
                 data=data,
                 headers=headers,
             )
             return response
         except httpx.RequestError as e:
-            print(f'Ошибка запроса при обновлении автомойки: {e}')
+            logger.error('Ошибка запроса при обновлении автомойки: %s', e)
             return None
 
     def get_user_by_id(self, user_id: int) -> httpx.Response:
         api_url = f"{str(self.url).rstrip('/')}/users/{user_id}"
         headers = self.get_headers()
         try:
-            response = httpx.get(api_url, headers=headers)
+            response = self.client.get(api_url, headers=headers)
             return response
         except httpx.RequestError as e:
-            print(
-                f'Ошибка запроса при получении пользователя с ID '
-                f'{user_id}: {e}'
+            logger.error(
+                'Ошибка запроса при получении пользователя с ID %s: %s',
+                user_id,
+                e,
             )
             return None
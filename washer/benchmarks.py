@@ -0,0 +1,407 @@
+import argparse
+import heapq
+import json
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+from washer.api_requests import BackendApi
+from washer.box_assignment import STRATEGIES, RoundRobin, book
+from washer.car_wash_store import CarWashStore
+from washer.slot_finder import SLOT_DURATION, first_slot_boxes, range_slots
+from washer.stub_backend import StubBackend, StubBackendData
+from washer.ui_components.admin_booking_table import AdminBookingTable
+from washer.ui_components.booking_page import BookingPage
+from washer.ui_components.carwash_edit_page import CarWashEditPage
+from washer.ui_components.clients_page import ClientsPage
+from washer.ui_components.select_car_page import SelectCarPage
+from washer.ui_components.wash_selection_page import WashSelectionPage
+
+BASELINES_PATH = Path(__file__).with_name('benchmark_baselines.json')
+DEFAULT_THRESHOLD = 0.25
+
+BENCHMARKS = {}
+
+
+def benchmark(name: str):
+    """
+    Регистрирует фабрику бенчмарка: она готовит данные и возвращает
+    функцию без аргументов, время которой замеряется.
+    """
+
+    def decorator(factory):
+        BENCHMARKS[name] = factory
+        return factory
+
+    return decorator
+
+
+class BenchmarkPage:
+    """
+    Заглушка ft.Page: страницы обращаются к ней только для update()
+    и client_storage, отрисовка в замер не входит.
+    """
+
+    def __init__(self):
+        self.client_storage = SimpleNamespace(get=lambda key: None)
+        self.overlay = []
+        self.updates = 0
+
+    def update(self, *controls):
+        self.updates += 1
+
+
+def stub_api(data: StubBackendData) -> BackendApi:
+    return BackendApi(transport=StubBackend(data=data).transport())
+
+
+def make_page(page_class, **attributes):
+    """Создаёт страницу без __init__, который строит весь экран."""
+    instance = object.__new__(page_class)
+    instance.page = BenchmarkPage()
+    for name, value in attributes.items():
+        setattr(instance, name, value)
+    return instance
+
+
+def synthetic_time_ranges(day: date, boxes: int) -> dict[str, list]:
+    """Свободные окна по боксам с разрывами, как после нескольких букингов."""
+    available_times = {}
+    for box_id in range(1, boxes + 1):
+        ranges = []
+        hour = 8
+        while hour < 22:
+            length = 2 + (box_id + hour) % 4
+            end = min(hour + length, 22)
+            ranges.append(
+                [
+                    datetime.combine(day, datetime.min.time())
+                    .replace(hour=hour)
+                    .isoformat(),
+                    datetime.combine(day, datetime.min.time())
+                    .replace(hour=end)
+                    .isoformat(),
+                ]
+            )
+            hour = end + 1
+        available_times[str(box_id)] = ranges
+    return available_times
+
+
+@benchmark('booking_page.parse_available_times')
+def bench_parse_available_times():
+    day = date.today() + timedelta(days=1)
+    times = [
+        time_range
+        for ranges in synthetic_time_ranges(day, boxes=40).values()
+        for time_range in ranges
+    ]
+    page = make_page(BookingPage, selected_date=day)
+    return lambda: page.parse_available_times(times)
+
+
+@benchmark('admin_booking_table.create_booking_table')
+def bench_create_booking_table():
+    data = StubBackendData(washes=1, boxes_per_wash=6, bookings_per_day=20)
+    car_wash = data.car_washes[0]
+    api = stub_api(data)
+    table = make_page(
+        AdminBookingTable,
+        car_wash=car_wash,
+        api=api,
+        store=CarWashStore(api, car_wash['id']),
+        available_times={},
+        loaded_days=set(),
+        dates_storage={},
+    )
+    table.load_boxes()
+    table.load_bookings()
+    table.assign_colors_to_created_bookings()
+
+    day = date.today()
+    table.dates_storage[day.weekday()] = day
+    table.load_available_times(day)
+    schedule = next(
+        schedule
+        for schedule in data.schedules
+        if schedule['car_wash_id'] == car_wash['id']
+        and schedule['day_of_week'] == day.weekday()
+    )
+    timeslots = table.generate_timeslots(
+        schedule['start_time'], schedule['end_time']
+    )
+    return lambda: table.create_booking_table(str(day), schedule, timeslots)
+
+
+@benchmark('wash_selection_page.get_available_slots')
+def bench_get_available_slots():
+    data = StubBackendData(washes=1, boxes_per_wash=8, bookings_per_day=10)
+    page = make_page(WashSelectionPage, api=stub_api(data))
+    car_wash_id = data.car_washes[0]['id']
+    day = date.today() + timedelta(days=1)
+    return lambda: page.get_available_slots(car_wash_id, day)
+
+
+@benchmark('clients_page.load_clients')
+def bench_load_clients():
+    data = StubBackendData(washes=1, bookings_per_day=15, days=7)
+    api = stub_api(data)
+    page = make_page(
+        ClientsPage,
+        api=api,
+        store=CarWashStore(api, data.car_washes[0]['id']),
+        car_wash=data.car_washes[0],
+        build_clients_ui=lambda: None,
+    )
+
+    def run():
+        page.clients = defaultdict(lambda: {'user_info': {}, 'cars': []})
+        page.load_clients()
+
+    return run
+
+
+@benchmark('carwash_edit_page.revenue')
+def bench_revenue():
+    data = StubBackendData(washes=1, bookings_per_day=30, days=30)
+    api = stub_api(data)
+    page = make_page(
+        CarWashEditPage,
+        api=api,
+        store=CarWashStore(api, data.car_washes[0]['id']),
+        car_wash=data.car_washes[0],
+    )
+
+    def run():
+        page.load_total_revenue()
+        page.load_monthly_revenue()
+
+    return run
+
+
+@benchmark('select_car_page.brand_filter')
+def bench_brand_filter():
+    brands = [
+        {'id': index, 'name': f'Brand{index:04d}'} for index in range(500)
+    ]
+    page = make_page(
+        SelectCarPage,
+        full_brands_list=brands,
+        brands_list=SimpleNamespace(controls=[]),
+    )
+    queries = ['b', 'br', 'bra', 'brand0', 'brand01', 'brand012', '']
+
+    def run():
+        for query in queries:
+            page.on_search_change(SimpleNamespace(data=query))
+
+    return run
+
+
+def simulate_box_assignment(
+    strategy_name: str,
+    boxes: int = 6,
+    days: int = 200,
+    opening_hour: int = 8,
+    closing_hour: int = 22,
+    seed: int = 0,
+) -> dict:
+    """
+    Имитация автоподбора ближайшего времени на синтетическом спросе.
+
+    Каждый день клиенты в случайном порядке просят ближайшее время не
+    раньше желаемого часа, бокс выбирает стратегия. Спрос выше
+    вместимости, поэтому загрузка зависит от того, сколько времени
+    стратегия оставляет в обрывках короче слота. Одинаковый seed даёт
+    всем стратегиям одинаковую последовательность клиентов.
+    """
+    choose = STRATEGIES[strategy_name]
+    if isinstance(choose, RoundRobin):
+        choose.reset()
+    rng = random.Random(seed)
+    requested = booked = 0
+    fragmented = timedelta()
+
+    for offset in range(days):
+        day = date(2024, 1, 1) + timedelta(days=offset)
+        opening = datetime.combine(day, datetime.min.time()).replace(
+            hour=opening_hour
+        )
+        closing = opening.replace(hour=closing_hour)
+        free = {box_id: [(opening, closing)] for box_id in range(1, boxes + 1)}
+        latest_start = closing_hour - opening_hour - 2
+
+        for _ in range(rng.randint(boxes * 5, boxes * 9)):
+            requested += 1
+            desired = opening + timedelta(hours=rng.randint(0, latest_start))
+            found = first_slot_boxes(
+                heapq.merge(
+                    *(
+                        range_slots(box_id, ranges, desired)
+                        for box_id, ranges in free.items()
+                    )
+                )
+            )
+            if found is None:
+                continue
+            slot_time, box_ids = found
+            box_id = choose(
+                slot_time, {box_id: free[box_id] for box_id in box_ids}
+            )
+            free[box_id] = book(slot_time, free[box_id])
+            booked += 1
+
+        fragmented += sum(
+            (
+                end - start
+                for ranges in free.values()
+                for start, end in ranges
+                if end - start < SLOT_DURATION
+            ),
+            timedelta(),
+        )
+
+    capacity = timedelta(hours=closing_hour - opening_hour) * boxes * days
+    return {
+        'utilization': booked * SLOT_DURATION / capacity,
+        'rejected': 1 - booked / requested,
+        'fragmented': fragmented / capacity,
+    }
+
+
+def print_box_assignment_simulation():
+    print(f'{"стратегия":16} {"загрузка":>9} {"отказы":>9} {"обрывки":>9}')
+    for name in STRATEGIES:
+        result = simulate_box_assignment(name)
+        print(
+            f'{name:16} {result["utilization"]:9.1%} '
+            f'{result["rejected"]:9.1%} {result["fragmented"]:9.1%}'
+        )
+
+
+def measure(func, rounds: int, warmup: int = 2) -> dict:
+    for _ in range(warmup):
+        func()
+
+    durations = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - started)
+
+    return {
+        'rounds': rounds,
+        'min': min(durations),
+        'median': statistics.median(durations),
+        'mean': statistics.fmean(durations),
+        'stdev': statistics.stdev(durations) if rounds > 1 else 0.0,
+    }
+
+
+def load_baselines(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def save_baselines(path: Path, results: dict):
+    path.write_text(
+        json.dumps(
+            {
+                name: {'median': stats['median'], 'min': stats['min']}
+                for name, stats in sorted(results.items())
+            },
+            indent=2,
+        )
+        + '\n',
+        encoding='utf-8',
+    )
+
+
+def find_regressions(
+    results: dict, baselines: dict, threshold: float
+) -> list[tuple[str, float]]:
+    """Бенчмарки, медиана которых выросла больше чем на threshold."""
+    regressions = []
+    for name, stats in results.items():
+        baseline = baselines.get(name)
+        if not baseline:
+            continue
+        change = stats['median'] / baseline['median'] - 1
+        if change > threshold:
+            regressions.append((name, change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Бенчмарки горячих путей клиента на данных заглушки.'
+    )
+    parser.add_argument('--rounds', type=int, default=20)
+    parser.add_argument(
+        '--only', action='append', help='Запустить только этот бенчмарк'
+    )
+    parser.add_argument('--baselines', type=Path, default=BASELINES_PATH)
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help='Допустимый рост медианы относительно базовой линии',
+    )
+    parser.add_argument(
+        '--save',
+        action='store_true',
+        help='Сохранить результаты как новую базовую линию',
+    )
+    parser.add_argument(
+        '--assignment',
+        action='store_true',
+        help='Сравнить стратегии выбора бокса на имитации спроса',
+    )
+    args = parser.parse_args()
+
+    if args.assignment:
+        print_box_assignment_simulation()
+        return
+
+    names = args.only or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f'Неизвестные бенчмарки: {", ".join(unknown)}')
+
+    baselines = load_baselines(args.baselines)
+    results = {}
+    for name in names:
+        results[name] = measure(BENCHMARKS[name](), args.rounds)
+        stats = results[name]
+        baseline = baselines.get(name)
+        change = (
+            f'{stats["median"] / baseline["median"] - 1:+.1%}'
+            if baseline
+            else 'нет базы'
+        )
+        print(
+            f'{name:45} median={stats["median"] * 1000:8.2f} мс '
+            f'min={stats["min"] * 1000:8.2f} мс '
+            f'stdev={stats["stdev"] * 1000:6.2f} мс  {change}'
+        )
+
+    if args.save:
+        save_baselines(args.baselines, {**baselines, **results})
+        print(f'Базовая линия сохранена в {args.baselines}')
+        return
+
+    regressions = find_regressions(results, baselines, args.threshold)
+    for name, change in regressions:
+        print(f'Регрессия {name}: {change:+.1%}', file=sys.stderr)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,259 @@
+import threading
+
+import httpx
+
+from washer.config import config
+from washer.logger import get_logger
+from washer.resilience import is_stale
+
+logger = get_logger(__name__)
+
+
+class BookingStore:
+    """
+    Общее хранилище букингов автомойки в памяти.
+
+    Страницы администратора подписываются на изменения и получают
+    только изменившиеся букинги и id удалённых, а не весь список.
+    """
+
+    def __init__(self, car_wash_id: int):
+        self.car_wash_id = car_wash_id
+        self.lock = threading.Lock()
+        self.bookings: dict[int, dict] = {}
+        self.listeners = {}
+        self.loaded = False
+        self.cursor = None
+
+    def subscribe(self, key: str, listener):
+        """
+        listener(changed, removed) вызывается из потока ленты.
+        Повторная подписка с тем же ключом заменяет прежнего
+        слушателя, так что пересозданная страница не копит подписки.
+        """
+        with self.lock:
+            self.listeners[key] = listener
+
+    def unsubscribe(self, key: str):
+        with self.lock:
+            self.listeners.pop(key, None)
+
+    def all(self) -> list[dict]:
+        with self.lock:
+            return [dict(booking) for booking in self.bookings.values()]
+
+    def replace_all(self, bookings: list[dict]) -> int:
+        """
+        Полный снимок: удалённые букинги вычисляются по отсутствию.
+        Возвращает число изменённых и удалённых букингов.
+        """
+        with self.lock:
+            incoming = {booking['id']: booking for booking in bookings}
+            removed = [
+                booking_id
+                for booking_id in self.bookings
+                if booking_id not in incoming
+            ]
+            changed = self.merge(incoming.values())
+            for booking_id in removed:
+                del self.bookings[booking_id]
+            self.loaded = True
+        self.notify(changed, removed)
+        return len(changed) + len(removed)
+
+    def upsert(self, bookings: list[dict]) -> int:
+        with self.lock:
+            changed = self.merge(bookings)
+        self.notify(changed, [])
+        return len(changed)
+
+    def remove(self, booking_ids: list[int]) -> int:
+        with self.lock:
+            removed = [
+                booking_id
+                for booking_id in booking_ids
+                if self.bookings.pop(booking_id, None) is not None
+            ]
+        self.notify([], removed)
+        return len(removed)
+
+    def merge(self, bookings) -> list[dict]:
+        changed = []
+        for booking in bookings:
+            updated_at = booking.get('updated_at')
+            if updated_at and (
+                self.cursor is None or updated_at > self.cursor
+            ):
+                self.cursor = updated_at
+            if self.bookings.get(booking['id']) != booking:
+                self.bookings[booking['id']] = dict(booking)
+                changed.append(booking)
+        return changed
+
+    def notify(self, changed: list[dict], removed: list[int]):
+        if not changed and not removed:
+            return
+
+        with self.lock:
+            listeners = list(self.listeners.items())
+
+        for key, listener in listeners:
+            try:
+                listener([dict(booking) for booking in changed], removed)
+            except Exception as e:
+                # Страница ушла с экрана, её контролы больше не обновить
+                logger.warning('Слушатель %s отключён: %s', key, e)
+                self.unsubscribe(key)
+
+
+class BookingFeed:
+    """
+    Лента изменений букингов автомойки на основе опроса get_bookings
+    с курсором updated_since.
+
+    Если ответ содержит только букинги новее курсора, он применяется
+    как дельта, иначе (бэкенд не фильтрует) — как полный снимок.
+    Интервал опроса растёт вдвое после пустых ответов и ошибок
+    и сбрасывается, как только появились изменения. Раз в
+    full_sync_every опросов делается полная синхронизация, чтобы
+    заметить удалённые букинги.
+
+    Ленты хранятся по хранилищу, а не по id автомойки: у каждой сессии
+    своё хранилище со своими слушателями, и остановка ленты одной
+    сессии не затрагивает другие сессии той же мойки.
+    """
+
+    feeds: dict[BookingStore, 'BookingFeed'] = {}
+    feeds_lock = threading.Lock()
+
+    def __init__(
+        self,
+        api,
+        store: BookingStore,
+        min_interval: float = None,
+        max_interval: float = None,
+        full_sync_every: int = 10,
+    ):
+        self.api = api
+        self.store = store
+        self.min_interval = min_interval or config.booking_feed_interval
+        self.max_interval = max_interval or config.booking_feed_max_interval
+        self.interval = self.min_interval
+        self.full_sync_every = full_sync_every
+        self.polls_since_full_sync = 0
+        self.stop_event = threading.Event()
+        self.wake_event = threading.Event()
+        self.thread = None
+
+    @classmethod
+    def start_for(cls, api, store: BookingStore) -> 'BookingFeed':
+        with cls.feeds_lock:
+            feed = cls.feeds.get(store)
+            if feed is not None and feed.is_running():
+                feed.api = api
+                return feed
+
+            feed = cls(api, store)
+            cls.feeds[store] = feed
+            feed.start()
+        return feed
+
+    @classmethod
+    def stop_for(cls, store: BookingStore):
+        """Останавливает ленту хранилища store и снимает его слушателей."""
+        with cls.feeds_lock:
+            feed = cls.feeds.pop(store, None)
+        if feed is not None:
+            feed.stop()
+        with store.lock:
+            store.listeners.clear()
+
+    def is_running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        self.stop_event.clear()
+        self.thread = threading.Thread(
+            target=self.run,
+            name=f'booking-feed-{self.store.car_wash_id}',
+            daemon=True,
+        )
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        self.wake_event.set()
+
+    def poke(self):
+        """Опросить сразу, например после собственного изменения."""
+        self.interval = self.min_interval
+        self.wake_event.set()
+
+    def run(self):
+        while not self.stop_event.is_set():
+            self.wake_event.wait(self.interval)
+            self.wake_event.clear()
+            if self.stop_event.is_set():
+                break
+
+            try:
+                changes = self.poll()
+            except httpx.HTTPError as e:
+                logger.warning('Ошибка опроса ленты букингов: %s', e)
+                changes = None
+            except Exception:
+                # Некорректный ответ или ошибка слушателя не должны
+                # останавливать живые обновления сессии
+                logger.exception('Сбой опроса ленты букингов')
+                changes = None
+
+            if changes:
+                self.interval = self.min_interval
+            else:
+                self.interval = min(self.interval * 2, self.max_interval)
+
+    def poll(self) -> int:
+        """Один запрос к ленте. Возвращает число изменений или None."""
+        full_sync = (
+            not self.store.loaded
+            or self.store.cursor is None
+            or self.polls_since_full_sync >= self.full_sync_every
+        )
+        cursor = None if full_sync else self.store.cursor
+
+        response = self.api.get_bookings(
+            self.store.car_wash_id, updated_since=cursor
+        )
+        if response.status_code != 200:
+            logger.warning(
+                'Лента букингов: %s, %s',
+                response.status_code,
+                response.text,
+            )
+            return None
+        if is_stale(response):
+            # Кэшированный ответ не отражает изменений с прошлого опроса:
+            # как снимок он откатил бы букинги и сдвинул курсор
+            logger.debug('Лента букингов: бэкенд недоступен, опрос пропущен')
+            return None
+
+        bookings = response.json().get('data', [])
+        is_delta = cursor is not None and all(
+            (booking.get('updated_at') or '') > cursor for booking in bookings
+        )
+
+        if is_delta:
+            changes = self.store.upsert(bookings)
+            self.polls_since_full_sync += 1
+        else:
+            changes = self.store.replace_all(bookings)
+            self.polls_since_full_sync = 0
+
+        logger.debug(
+            'Лента букингов %s: %s, получено %s, изменений %s',
+            self.store.car_wash_id,
+            'дельта' if is_delta else 'снимок',
+            len(bookings),
+            changes,
+        )
+        return changes
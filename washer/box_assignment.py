@@ -0,0 +1,137 @@
+import threading
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from washer.config import config
+from washer.logger import get_logger
+from washer.slot_finder import SLOT_DURATION
+
+logger = get_logger(__name__)
+
+Ranges = list[tuple[datetime, datetime]]
+# Стратегия получает время записи и свободные интервалы дня для каждого
+# бокса, свободного в это время, и возвращает id выбранного бокса
+Strategy = Callable[[datetime, dict[int, Ranges]], int]
+
+STRATEGIES: dict[str, Strategy] = {}
+
+
+def strategy(name: str):
+    """Регистрирует стратегию выбора бокса под именем name."""
+
+    def decorator(func: Strategy) -> Strategy:
+        STRATEGIES[name] = func
+        return func
+
+    return decorator
+
+
+def get_strategy(name: str = None) -> Strategy:
+    """Стратегия по имени, по умолчанию box_assignment_strategy."""
+    name = name or config.box_assignment_strategy
+    if name not in STRATEGIES:
+        logger.warning(
+            'Неизвестная стратегия выбора бокса %s, используется first_fit',
+            name,
+        )
+        return first_fit
+    return STRATEGIES[name]
+
+
+def containing_range(
+    start: datetime, ranges: Ranges
+) -> tuple[datetime, datetime]:
+    end = start + SLOT_DURATION
+    return next(
+        (
+            (range_start, range_end)
+            for range_start, range_end in ranges
+            if range_start <= start and end <= range_end
+        ),
+        (start, end),
+    )
+
+
+def book(start: datetime, ranges: Ranges) -> Ranges:
+    """Свободные интервалы после записи на start."""
+    end = start + SLOT_DURATION
+    booked = containing_range(start, ranges)
+    remaining = []
+    for range_start, range_end in ranges:
+        if (range_start, range_end) != booked:
+            remaining.append((range_start, range_end))
+            continue
+        if range_start < start:
+            remaining.append((range_start, start))
+        if end < range_end:
+            remaining.append((end, range_end))
+    return remaining
+
+
+@strategy('first_fit')
+def first_fit(start: datetime, candidates: dict[int, Ranges]) -> int:
+    """Бокс с наименьшим id — прежнее поведение."""
+    return min(candidates)
+
+
+@strategy('best_fit')
+def best_fit(start: datetime, candidates: dict[int, Ranges]) -> int:
+    """
+    Бокс, в котором запись оставит меньше всего времени в обрывках
+    короче слота: такие обрывки уже никто не сможет забронировать.
+    При равенстве выбирается самый короткий свободный интервал, чтобы
+    длинные окна оставались для следующих клиентов.
+    """
+
+    def cost(box_id: int):
+        range_start, range_end = containing_range(start, candidates[box_id])
+        pieces = (start - range_start, range_end - start - SLOT_DURATION)
+        wasted = sum(
+            (piece for piece in pieces if piece < SLOT_DURATION), timedelta()
+        )
+        return wasted, range_end - range_start, box_id
+
+    return min(candidates, key=cost)
+
+
+@strategy('least_utilized')
+def least_utilized(start: datetime, candidates: dict[int, Ranges]) -> int:
+    """
+    Бокс с наибольшим свободным временем за день: записи по очереди
+    расходятся по наименее загруженным боксам.
+    """
+
+    def free_time(box_id: int) -> timedelta:
+        return sum(
+            (end - begin for begin, end in candidates[box_id]), timedelta()
+        )
+
+    return min(candidates, key=lambda box_id: (-free_time(box_id), box_id))
+
+
+class RoundRobin:
+    """
+    Боксы по очереди: берётся свободный бокс со следующим id после
+    выбранного в прошлый раз, после последнего — снова с наименьшего.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.last_box_id = None
+
+    def __call__(self, start: datetime, candidates: dict[int, Ranges]) -> int:
+        with self.lock:
+            following = [
+                box_id
+                for box_id in candidates
+                if self.last_box_id is not None and box_id > self.last_box_id
+            ]
+            self.last_box_id = min(following or candidates)
+            return self.last_box_id
+
+    def reset(self):
+        with self.lock:
+            self.last_box_id = None
+
+
+round_robin = strategy('round_robin')(RoundRobin())
@@ -0,0 +1,294 @@
+import math
+import threading
+import time
+
+import httpx
+
+from washer.config import config
+from washer.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Одновременных запросов страниц или отдельных автомоек
+DIRECTORY_WORKERS = 4
+
+
+class CarWashDirectory:
+    """
+    Справочник автомоек, общий для всех сессий процесса.
+
+    В веб-режиме Flet один процесс обслуживает много пользователей,
+    поэтому список загружается один раз на представление и отдаётся
+    всем сессиям копиями. Представления разделены по ролям: клиенты
+    видят общий каталог, а список администратора хранится отдельно для
+    каждого пользователя, так как бэкенд может ограничивать его мойки.
+
+    Список хранится постранично, как его отдаёт бэкенд: первая
+    страница загружается сразу, остальные — по мере прокрутки
+    (load_more) или в фоне (load_all). Все загруженные автомойки
+    доступны по id через lookup.
+
+    Через car_wash_directory_ttl секунд данные считаются устаревшими:
+    страница сразу получает прежний список, а первая страница
+    загружается заново в фоне (stale-while-revalidate). invalidate_all
+    сбрасывает все представления после изменения автомойки.
+    """
+
+    views: dict[str, 'CarWashDirectory'] = {}
+    views_lock = threading.Lock()
+
+    def __init__(self, view: str, ttl: float = None):
+        self.view = view
+        self.ttl = config.car_wash_directory_ttl if ttl is None else ttl
+        self.lock = threading.Lock()
+        self.in_flight: dict[int, threading.Event] = {}
+        self.pages: dict[int, list[dict]] = {}
+        self.index: dict[int, dict] = {}
+        self.page_count = None
+        self.fetched_at = None
+        self.generation = 0
+        self.refreshing = False
+
+    @classmethod
+    def for_view(cls, role: str, user_id: int = None) -> 'CarWashDirectory':
+        view = role if user_id is None else f'{role}:{user_id}'
+        with cls.views_lock:
+            if view not in cls.views:
+                cls.views[view] = cls(view)
+            return cls.views[view]
+
+    @classmethod
+    def invalidate_all(cls):
+        with cls.views_lock:
+            directories = list(cls.views.values())
+        for directory in directories:
+            directory.invalidate()
+
+    def invalidate(self):
+        with self.lock:
+            self.reset()
+        logger.debug('Справочник автомоек %s сброшен', self.view)
+
+    def reset(self):
+        self.pages = {}
+        self.index = {}
+        self.page_count = None
+        self.fetched_at = None
+        self.generation += 1
+
+    def is_fresh(self) -> bool:
+        return (
+            self.fetched_at is not None
+            and time.monotonic() - self.fetched_at < self.ttl
+        )
+
+    @property
+    def has_more(self) -> bool:
+        with self.lock:
+            return self.page_count is None or len(self.pages) < self.page_count
+
+    def loaded(self) -> list[dict]:
+        """Копии всех загруженных автомоек в порядке страниц."""
+        with self.lock:
+            return [
+                dict(car_wash)
+                for number in sorted(self.pages)
+                for car_wash in self.pages[number]
+            ]
+
+    def car_washes(self, api, on_refresh=None) -> list[dict]:
+        """
+        Копия загруженной части списка, как минимум первая страница.
+        Возвращает None, если загрузить её не удалось и прежних данных
+        нет.
+
+        Если данные устарели, первая страница обновляется в фоне, и при
+        изменениях вызывается on_refresh(car_washes) из фонового потока.
+        """
+        with self.lock:
+            first_page, fresh = self.pages.get(1), self.is_fresh()
+        if first_page is None:
+            if self.page(api, 1) is None:
+                return None
+        elif not fresh:
+            self.refresh_in_background(api, on_refresh)
+        return self.loaded()
+
+    def page(self, api, number: int, force: bool = False) -> list[dict]:
+        """
+        Страница списка. Одновременные запросы одной страницы из разных
+        сессий ждут одного ответа, а не повторяют его. force загружает
+        первую страницу заново; если она изменилась, остальные страницы
+        сбрасываются.
+        """
+        with self.lock:
+            if not force and number in self.pages:
+                return [dict(item) for item in self.pages[number]]
+            waiting = None if force else self.in_flight.get(number)
+            if waiting is None:
+                flight = self.in_flight[number] = threading.Event()
+            generation = self.generation
+
+        if waiting is not None:
+            waiting.wait()
+            with self.lock:
+                car_washes = self.pages.get(number)
+            return (
+                None
+                if car_washes is None
+                else [dict(item) for item in car_washes]
+            )
+
+        try:
+            response = api.get_car_washes(page=number)
+            if response.status_code != 200:
+                logger.error(
+                    'Ошибка загрузки автомоек, страница %s: %s, %s',
+                    number,
+                    response.status_code,
+                    response.text,
+                )
+                return None
+            payload = response.json()
+            car_washes = payload.get('data', [])
+            self.store_page(number, payload, generation)
+        finally:
+            with self.lock:
+                if self.in_flight.get(number) is flight:
+                    del self.in_flight[number]
+            flight.set()
+
+        logger.debug(
+            'Справочник автомоек %s: страница %s из %s, автомоек %s',
+            self.view,
+            number,
+            self.page_count,
+            len(car_washes),
+        )
+        return [dict(car_wash) for car_wash in car_washes]
+
+    def store_page(self, number: int, payload: dict, generation: int):
+        car_washes = payload.get('data', [])
+        with self.lock:
+            if generation != self.generation:
+                return
+            if number == 1:
+                if self.pages.get(1) not in (None, car_washes):
+                    self.reset()
+                self.fetched_at = time.monotonic()
+            self.pages[number] = car_washes
+            self.index.update(
+                (car_wash['id'], car_wash) for car_wash in car_washes
+            )
+            self.page_count = self.count_pages(number, payload)
+
+    def count_pages(self, number: int, payload: dict) -> int:
+        """
+        Число страниц по ответу: из total и размера первой страницы,
+        а если total нет — по признаку next.
+        """
+        if payload.get('next') is None:
+            return number
+        first_page = self.pages.get(1)
+        total = payload.get('total')
+        if total and first_page:
+            return max(number + 1, math.ceil(total / len(first_page)))
+        return max(self.page_count or 0, number + 1)
+
+    def load_more(self, api) -> list[dict]:
+        """
+        Загружает следующую незагруженную страницу для бесконечной
+        прокрутки. Возвращает её автомойки или [], если страниц больше
+        нет.
+        """
+        with self.lock:
+            number = min(set(range(1, len(self.pages) + 2)) - set(self.pages))
+            done = self.page_count is not None and number > self.page_count
+        if done:
+            return []
+        return self.page(api, number) or []
+
+    def load_all(self, api, max_workers: int = DIRECTORY_WORKERS):
+        """
+        Загружает оставшиеся страницы, не больше max_workers запросов
+        одновременно. Если число страниц неизвестно, идёт по next.
+        """
+        if self.page(api, 1) is None:
+            return
+        with self.lock:
+            page_count = self.page_count
+            missing = [
+                number
+                for number in range(2, page_count + 1)
+                if number not in self.pages
+            ]
+        for number, result in api.map_concurrently(
+            lambda number: self.page(api, number), missing, max_workers
+        ):
+            if isinstance(result, Exception):
+                logger.warning(
+                    'Страница %s автомоек не загружена: %s', number, result
+                )
+        while self.has_more and self.load_more(api):
+            pass
+
+    def lookup(
+        self, api, car_wash_ids, max_workers: int = DIRECTORY_WORKERS
+    ) -> dict[int, dict]:
+        """
+        Автомойки по id. Уже загруженные берутся из справочника,
+        недостающие запрашиваются по одной, не больше max_workers
+        одновременно, и тоже попадают в индекс.
+        """
+        wanted = set(car_wash_ids) - {None}
+        with self.lock:
+            found = {
+                car_wash_id: dict(self.index[car_wash_id])
+                for car_wash_id in wanted
+                if car_wash_id in self.index
+            }
+            generation = self.generation
+
+        for car_wash_id, response in api.map_concurrently(
+            api.get_car_wash_by_id, sorted(wanted - set(found)), max_workers
+        ):
+            if isinstance(response, Exception) or response.status_code != 200:
+                logger.error(
+                    'Не удалось загрузить автомойку %s: %s',
+                    car_wash_id,
+                    response
+                    if isinstance(response, Exception)
+                    else response.text,
+                )
+                continue
+            car_wash = response.json()
+            found[car_wash_id] = dict(car_wash)
+            with self.lock:
+                if generation == self.generation:
+                    self.index[car_wash_id] = car_wash
+        return found
+
+    def refresh_in_background(self, api, on_refresh=None):
+        with self.lock:
+            if self.refreshing:
+                return
+            self.refreshing = True
+            previous = self.pages.get(1)
+
+        def refresh():
+            try:
+                first_page = self.page(api, 1, force=True)
+            except httpx.HTTPError as e:
+                logger.warning('Справочник автомоек не обновлён: %s', e)
+                first_page = None
+            finally:
+                with self.lock:
+                    self.refreshing = False
+
+            if first_page is not None and first_page != previous:
+                if on_refresh is not None:
+                    on_refresh(first_page)
+
+        threading.Thread(
+            target=refresh, name='car-wash-directory', daemon=True
+        ).start()
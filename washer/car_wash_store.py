@@ -0,0 +1,175 @@
+import flet as ft
+
+from washer.booking_feed import BookingFeed, BookingStore
+from washer.logger import get_logger
+from washer.resilience import is_stale
+
+logger = get_logger(__name__)
+
+
+class CarWashStore:
+    """
+    Данные активной автомойки, общие для страниц администратора:
+    боксы, расписания, цены и букинги.
+
+    Каждая коллекция загружается с сервера один раз и хранится
+    нормализованной по id. После изменений на сервере страницы
+    обновляют хранилище, а не перезапрашивают списки, поэтому
+    переходы между страницами администратора не ходят в сеть.
+    Букинги поддерживает в актуальном состоянии BookingFeed.
+
+    Хранилище принадлежит одной сессии: close() останавливает только
+    его ленту и его слушателей, сессии других пользователей той же
+    мойки продолжают получать изменения.
+    """
+
+    LOADERS = {
+        'boxes': 'get_boxes',
+        'schedules': 'get_schedules',
+        'prices': 'get_prices',
+    }
+
+    def __init__(self, api, car_wash_id: int, bookings: BookingStore = None):
+        self.api = api
+        self.car_wash_id = car_wash_id
+        self.collections: dict[str, dict[int, dict]] = {}
+        self.bookings = bookings or BookingStore(car_wash_id)
+        self.feed: BookingFeed = None
+
+    @staticmethod
+    def for_page(page: ft.Page, api, car_wash) -> 'CarWashStore':
+        """Хранилище, привязанное к странице Flet, для этой автомойки."""
+        store = getattr(page, 'car_wash_store', None)
+        if store is None or store.car_wash_id != car_wash['id']:
+            if store is not None:
+                store.close()
+            store = CarWashStore(api, car_wash['id'])
+            page.car_wash_store = store
+        else:
+            store.api = api
+        return store
+
+    @staticmethod
+    def release(page: ft.Page):
+        """Сбрасывает хранилище при выходе из администрирования мойки."""
+        store = getattr(page, 'car_wash_store', None)
+        if store is not None:
+            store.close()
+            page.car_wash_store = None
+
+    def load(self, collection: str) -> list[dict]:
+        """
+        Копии элементов коллекции. Возвращает None, если коллекцию
+        не удалось загрузить.
+        """
+        if collection not in self.collections:
+            loader = getattr(self.api, self.LOADERS[collection])
+            response = loader(self.car_wash_id)
+            if response.status_code != 200:
+                logger.error(
+                    'Ошибка загрузки %s для автомойки %s: %s',
+                    collection,
+                    self.car_wash_id,
+                    response.text,
+                )
+                return None
+
+            items = {
+                item['id']: item
+                for item in response.json().get('data', [])
+                if item.get('car_wash_id', self.car_wash_id)
+                == self.car_wash_id
+            }
+            if is_stale(response):
+                # Показываем кэшированные данные, но не храним их:
+                # следующее чтение снова обратится к серверу
+                logger.warning(
+                    'Бэкенд недоступен, %s автомойки %s из кэша',
+                    collection,
+                    self.car_wash_id,
+                )
+                return [dict(item) for item in items.values()]
+            self.collections[collection] = items
+            logger.debug(
+                'Загружено %s: %s для автомойки %s',
+                collection,
+                len(self.collections[collection]),
+                self.car_wash_id,
+            )
+
+        return [dict(item) for item in self.collections[collection].values()]
+
+    def boxes(self) -> list[dict]:
+        return self.load('boxes')
+
+    def schedules(self) -> list[dict]:
+        return self.load('schedules')
+
+    def prices(self) -> list[dict]:
+        return self.load('prices')
+
+    def put(self, collection: str, item: dict):
+        if collection in self.collections:
+            self.collections[collection][item['id']] = dict(item)
+
+    def remove(self, collection: str, item_id: int):
+        if collection in self.collections:
+            self.collections[collection].pop(item_id, None)
+
+    def apply_response(self, collection: str, payload):
+        """
+        Кладёт в хранилище элемент из ответа на создание или изменение.
+        Если ответ не похож на элемент, коллекция будет перезагружена
+        при следующем чтении.
+        """
+        item = (
+            payload.get('data', payload) if isinstance(payload, dict) else None
+        )
+        if isinstance(item, dict) and 'id' in item:
+            self.put(collection, item)
+        else:
+            self.invalidate(collection)
+
+    def invalidate(self, collection: str = None):
+        """
+        Сбрасывает коллекцию, а без аргумента — все данные. Букинги
+        перезагружаются полным снимком при следующем чтении.
+        """
+        if collection in (None, 'bookings'):
+            self.bookings.loaded = False
+        if collection is None:
+            self.collections.clear()
+        else:
+            self.collections.pop(collection, None)
+
+    def load_bookings(self) -> list[dict]:
+        if not self.bookings.loaded:
+            response = self.api.get_bookings(self.car_wash_id)
+            if response.status_code != 200:
+                logger.error(
+                    'Ошибка загрузки букингов для автомойки %s: %s, %s',
+                    self.car_wash_id,
+                    response.status_code,
+                    response.text,
+                )
+                return None
+            bookings = response.json().get('data', [])
+            if is_stale(response):
+                # Кэшированный снимок не применяется к хранилищу, чтобы
+                # не сдвинуть курсор ленты, — только показывается
+                logger.warning(
+                    'Бэкенд недоступен, букинги автомойки %s из кэша',
+                    self.car_wash_id,
+                )
+                return [dict(booking) for booking in bookings]
+            self.bookings.replace_all(bookings)
+        return self.bookings.all()
+
+    def start_feed(self) -> BookingFeed:
+        self.feed = BookingFeed.start_for(self.api, self.bookings)
+        return self.feed
+
+    def close(self):
+        """Останавливает ленту этого хранилища и снимает его слушателей."""
+        BookingFeed.stop_for(self.bookings)
+        self.feed = None
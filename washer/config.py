@@ -4,6 +4,25 @@ from pydantic_settings import BaseSettings
 
 class Config(BaseSettings):
     api_url: HttpUrl
+    api_retries: int = 2
+    api_retry_backoff: float = 0.2
+    api_timeout: float = 10.0
+    booking_horizon_days: int = 60
+    booking_feed_interval: float = 3.0
+    booking_feed_max_interval: float = 30.0
+    box_assignment_strategy: str = 'best_fit'
+    car_wash_directory_ttl: float = 300.0
+    circuit_failure_threshold: int = 5
+    circuit_reset_timeout: float = 15.0
+    image_cache_dir: str = '~/.cache/washer/images'
+    image_cache_max_mb: int = 100
+    log_level: str = 'WARNING'
+    log_modules: str = ''
+    request_metrics_overlay: bool = False
+    schedule_horizon_ttl: float = 300.0
+    stub_backend: bool = False
+    stub_backend_latency: float = 0.0
+    token_refresh_margin: float = 60.0
 
     class Config:
         env_file = '.env'
@@ -0,0 +1,263 @@
+import heapq
+import math
+import threading
+import time
+
+import httpx
+
+from washer.config import config
+from washer.logger import get_logger
+
+logger = get_logger(__name__)
+
+EARTH_RADIUS_KM = 6371.0088
+LOCATIONS_PAGE_SIZE = 100
+LOCATIONS_WORKERS = 4
+
+
+def unit_vector(latitude: float, longitude: float) -> tuple[float, ...]:
+    phi, lam = math.radians(latitude), math.radians(longitude)
+    return (
+        math.cos(phi) * math.cos(lam),
+        math.cos(phi) * math.sin(lam),
+        math.sin(phi),
+    )
+
+
+def chord_to_km(chord: float) -> float:
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2))
+
+
+class KDTree:
+    """
+    k-d дерево по точкам на единичной сфере.
+
+    Точки хранятся как трёхмерные векторы: длина хорды монотонна
+    расстоянию по дуге, поэтому поиск в евклидовом пространстве даёт
+    точных ближайших соседей без поправок на долготу и полюса.
+    Узел — кортеж (точка, элемент, ось, левое, правое поддерево).
+    """
+
+    def __init__(self, points: list[tuple[tuple[float, ...], object]]):
+        self.size = len(points)
+        self.root = self.build(list(points), 0)
+
+    def build(self, points: list, depth: int):
+        if not points:
+            return None
+        axis = depth % 3
+        points.sort(key=lambda point: point[0][axis])
+        middle = len(points) // 2
+        vector, item = points[middle]
+        return (
+            vector,
+            item,
+            axis,
+            self.build(points[:middle], depth + 1),
+            self.build(points[middle + 1 :], depth + 1),
+        )
+
+    def nearest(
+        self, target: tuple[float, ...], k: int, max_distance: float = None
+    ) -> list[tuple[float, object]]:
+        """
+        k ближайших к target элементов как пары (длина хорды, элемент),
+        по возрастанию расстояния. max_distance ограничивает хорду.
+        """
+        if k <= 0 or self.root is None:
+            return []
+
+        limit = math.inf if max_distance is None else max_distance**2
+        # Куча с обратным знаком: на вершине самый дальний из найденных
+        found: list[tuple[float, int, object]] = []
+
+        def worst() -> float:
+            return -found[0][0] if len(found) == k else limit
+
+        def visit(node):
+            if node is None:
+                return
+            vector, item, axis, left, right = node
+            distance = sum((a - b) ** 2 for a, b in zip(vector, target))
+            if distance <= worst():
+                entry = (-distance, id(item), item)
+                if len(found) < k:
+                    heapq.heappush(found, entry)
+                else:
+                    heapq.heapreplace(found, entry)
+
+            delta = target[axis] - vector[axis]
+            near, far = (left, right) if delta < 0 else (right, left)
+            visit(near)
+            if delta**2 <= worst():
+                visit(far)
+
+        visit(self.root)
+        return [
+            (math.sqrt(-distance), item)
+            for distance, _, item in sorted(found, reverse=True)
+        ]
+
+
+class LocationIndex:
+    """
+    Пространственный индекс локаций автомоек.
+
+    Загружает все локации постранично (LOCATIONS_PAGE_SIZE на страницу,
+    до LOCATIONS_WORKERS запросов одновременно) и строит по координатам
+    KDTree, так что ближайшие k локаций находятся за O(log n) в среднем.
+    Один индекс на процесс обновляется не чаще car_wash_directory_ttl.
+    """
+
+    shared_index: 'LocationIndex' = None
+    shared_at = None
+    shared_lock = threading.Lock()
+    loading: threading.Event = None
+
+    def __init__(self, locations: list[dict]):
+        self.locations = {location['id']: location for location in locations}
+        self.tree = KDTree(
+            [
+                (
+                    unit_vector(
+                        float(location['latitude']),
+                        float(location['longitude']),
+                    ),
+                    location,
+                )
+                for location in locations
+                if location.get('latitude') is not None
+                and location.get('longitude') is not None
+            ]
+        )
+
+    def __len__(self) -> int:
+        return self.tree.size
+
+    @classmethod
+    def shared(cls, api) -> 'LocationIndex':
+        """
+        Общий индекс процесса. Возвращает None, если локации загрузить
+        не удалось и прежнего индекса нет.
+
+        Локации загружаются вне блокировки и одним запросом на процесс:
+        первую загрузку остальные сессии ждут, а устаревший индекс
+        отдаётся сразу и обновляется в фоне.
+        """
+        with cls.shared_lock:
+            index = cls.shared_index
+            fresh = (
+                cls.shared_at is not None
+                and time.monotonic() - cls.shared_at
+                < config.car_wash_directory_ttl
+            )
+            loading = cls.loading
+            owner = not fresh and loading is None
+            if owner:
+                loading = cls.loading = threading.Event()
+
+        if fresh:
+            return index
+        if index is not None:
+            if owner:
+                threading.Thread(
+                    target=cls.reload,
+                    args=(api, loading),
+                    name='location-index',
+                    daemon=True,
+                ).start()
+            return index
+
+        if owner:
+            cls.reload(api, loading)
+        else:
+            loading.wait()
+        return cls.shared_index
+
+    @classmethod
+    def reload(cls, api, loading: threading.Event):
+        """Загружает индекс и подменяет общий под блокировкой."""
+        index = None
+        try:
+            index = cls.load(api)
+        except httpx.HTTPError as e:
+            logger.warning('Индекс локаций не обновлён: %s', e)
+        finally:
+            with cls.shared_lock:
+                if index is not None:
+                    cls.shared_index = index
+                    cls.shared_at = time.monotonic()
+                cls.loading = None
+            loading.set()
+
+    @classmethod
+    def load(cls, api, max_workers: int = LOCATIONS_WORKERS):
+        response = api.get_locations(page=1, limit=LOCATIONS_PAGE_SIZE)
+        if response.status_code != 200:
+            logger.error('Ошибка загрузки локаций: %s', response.text)
+            return None
+
+        payload = response.json()
+        locations = payload.get('data', [])
+        total = payload.get('total')
+        if total is None:
+            # Без total число страниц неизвестно: идём по next
+            page = 1
+            while payload.get('next'):
+                page += 1
+                response = api.get_locations(
+                    page=page, limit=LOCATIONS_PAGE_SIZE
+                )
+                if response.status_code != 200:
+                    logger.warning(
+                        'Страница %s локаций не загружена: %s',
+                        page,
+                        response.status_code,
+                    )
+                    break
+                payload = response.json()
+                locations.extend(payload.get('data', []))
+            return cls(locations)
+
+        pages = list(range(2, math.ceil(total / LOCATIONS_PAGE_SIZE) + 1))
+
+        for page, result in api.map_concurrently(
+            lambda page: api.get_locations(
+                page=page, limit=LOCATIONS_PAGE_SIZE
+            ),
+            pages,
+            max_workers,
+        ):
+            if isinstance(result, Exception) or result.status_code != 200:
+                logger.warning('Страница %s локаций не загружена', page)
+                continue
+            locations.extend(result.json().get('data', []))
+
+        logger.debug('Загружено локаций для индекса: %s', len(locations))
+        return cls(locations)
+
+    def get(self, location_id: int) -> dict:
+        return self.locations.get(location_id)
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 10,
+        radius_km: float = None,
+    ) -> list[tuple[float, dict]]:
+        """
+        k ближайших локаций как пары (расстояние в км, локация),
+        по возрастанию расстояния, не дальше radius_km.
+        """
+        max_chord = (
+            None
+            if radius_km is None
+            else 2 * math.sin(min(radius_km / EARTH_RADIUS_KM, math.pi) / 2)
+        )
+        return [
+            (chord_to_km(chord), location)
+            for chord, location in self.tree.nearest(
+                unit_vector(latitude, longitude), k, max_chord
+            )
+        ]
@@ -0,0 +1,380 @@
+import base64
+import hashlib
+import io
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO
+
+import flet as ft
+import httpx
+from PIL import Image, ImageOps
+
+from washer.config import config
+from washer.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Ширина карточки на всю строку списка, в логических пикселях
+CARD_WIDTH = 480
+# Запас под экраны высокой плотности
+PIXEL_RATIO = 2
+THUMBNAIL_QUALITY = 80
+# Наибольшая сторона загружаемых на сервер изображений
+AVATAR_UPLOAD_SIZE = 512
+CAR_WASH_UPLOAD_SIZE = 1280
+UPLOAD_QUALITY = 85
+
+
+def resize_image(
+    data: bytes,
+    width: int,
+    height: int,
+    quality: int,
+    cover: bool = True,
+    image_format: str = 'WEBP',
+) -> bytes:
+    """
+    Уменьшает изображение и перекодирует его без метаданных.
+
+    При cover=True результат покрывает прямоугольник width x height
+    (лишнее обрежет ImageFit.COVER), иначе вписывается в него.
+    Изображения с прозрачностью всегда сохраняются в WebP.
+    Исходные байты возвращаются, только если они меньше результата
+    и не содержат метаданных, а также для неразборчивых данных.
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as source:
+            has_metadata = bool(source.getexif()) or 'xmp' in source.info
+            image = ImageOps.exif_transpose(source)
+            scale = (max if cover else min)(
+                width / image.width, height / image.height
+            )
+            if scale < 1:
+                image = image.resize(
+                    (
+                        max(1, round(image.width * scale)),
+                        max(1, round(image.height * scale)),
+                    ),
+                    Image.LANCZOS,
+                )
+            transparent = (
+                image.mode in ('RGBA', 'LA', 'PA')
+                or 'transparency' in image.info
+            )
+            if transparent:
+                image_format = 'WEBP'
+            mode = 'RGBA' if transparent else 'RGB'
+            if image.mode != mode:
+                image = image.convert(mode)
+
+            output = io.BytesIO()
+            image.save(output, format=image_format, quality=quality)
+    except (OSError, ValueError) as e:
+        logger.warning('Не удалось обработать изображение: %s', e)
+        return data
+
+    result = output.getvalue()
+    if has_metadata or len(result) < len(data):
+        return result
+    return data
+
+
+def is_remote(url: str) -> bool:
+    """Ссылка на сервер, а не на файл из assets."""
+    return bool(url) and url.startswith(('http://', 'https://'))
+
+
+def image_type(data: bytes) -> tuple[str, str]:
+    """Расширение и MIME-тип по сигнатуре файла, по умолчанию PNG."""
+    if data.startswith(b'\xff\xd8\xff'):
+        return 'jpg', 'image/jpeg'
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'webp', 'image/webp'
+    return 'png', 'image/png'
+
+
+def upload_file(name: str, image) -> tuple:
+    """
+    Значение для files в httpx с типом, определённым по содержимому.
+    image — байты или открытый файл; файл httpx прочитает кусками.
+    """
+    if isinstance(image, bytes):
+        image = io.BytesIO(image)
+    position = image.tell()
+    extension, content_type = image_type(image.read(12))
+    image.seek(position)
+    return f'{name}.{extension}', image, content_type
+
+
+def prepare_upload(source, max_size: int) -> BinaryIO:
+    """
+    Готовит изображение к загрузке на сервер: вписывает в квадрат
+    max_size, убирает метаданные (EXIF, геотеги) и пережимает в JPEG,
+    а изображения с прозрачностью — в WebP. source — байты или путь
+    к файлу. Возвращает файловый объект, который закрывает вызывающий;
+    если пережать не удалось, файл отдаётся с диска без копии в памяти.
+    """
+    from_disk = not isinstance(source, bytes)
+    data = Path(source).read_bytes() if from_disk else source
+    prepared = resize_image(
+        data,
+        max_size,
+        max_size,
+        UPLOAD_QUALITY,
+        cover=False,
+        image_format='JPEG',
+    )
+    logger.debug(
+        'Изображение для загрузки: %s -> %s байт', len(data), len(prepared)
+    )
+    if prepared is data and from_disk:
+        return open(source, 'rb')
+    return io.BytesIO(prepared)
+
+
+upload_executor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix='image-upload'
+)
+
+
+def prepare_upload_in_background(source, max_size: int) -> Future:
+    """
+    Запускает prepare_upload в фоне. Страницы вызывают её сразу после
+    выбора файла, а результат забирают при отправке формы.
+    """
+    return upload_executor.submit(prepare_upload, source, max_size)
+
+
+def discard_prepared(future: Future):
+    """Закрывает файл из prepare_upload_in_background, когда он не нужен."""
+
+    def close(done: Future):
+        if done.exception() is None:
+            done.result().close()
+
+    future.add_done_callback(close)
+
+
+class ImageCache:
+    """
+    Дисковый кэш удалённых изображений с миниатюрами.
+
+    Оригиналы и миниатюры хранятся под sha256 содержимого, так что
+    одна картинка по разным ссылкам лежит один раз. Индекс
+    «ссылка -> хэш» сохраняется в index.json. Размер каталога
+    ограничен: при переполнении удаляются файлы, к которым дольше
+    всего не обращались (время доступа — mtime, обновляется при
+    чтении).
+    """
+
+    def __init__(
+        self,
+        directory: Path = None,
+        max_bytes: int = None,
+        memory_items: int = 64,
+    ):
+        self.directory = Path(directory or config.image_cache_dir).expanduser()
+        self.max_bytes = max_bytes or config.image_cache_max_mb * 1024**2
+        self.memory_items = memory_items
+        self.lock = threading.Lock()
+        self.index: dict[str, str] = None
+        self.memory: OrderedDict[tuple, str] = OrderedDict()
+        self.pending: dict[tuple, list] = {}
+        self.executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix='image-cache'
+        )
+        self.client = httpx.Client(
+            timeout=config.api_timeout, follow_redirects=True
+        )
+
+    @staticmethod
+    def thumbnail_size(width: float, height: float) -> tuple[int, int]:
+        if width is None or width == float('inf'):
+            width = CARD_WIDTH
+        if height is None or height == float('inf'):
+            height = width
+        return int(width * PIXEL_RATIO), int(height * PIXEL_RATIO)
+
+    def image(self, url: str, width=None, height=None, **kwargs) -> ft.Image:
+        """
+        ft.Image для удалённой картинки. Если миниатюра уже в кэше,
+        она передаётся как base64, иначе изображение показывается по
+        ссылке, а миниатюра готовится в фоне и подменяет его.
+        """
+        if not is_remote(url):
+            return ft.Image(src=url, width=width, height=height, **kwargs)
+
+        size = self.thumbnail_size(width, height)
+        cached = self.cached_base64(url, size)
+        if cached is not None:
+            return ft.Image(
+                src_base64=cached, width=width, height=height, **kwargs
+            )
+
+        image = ft.Image(src=url, width=width, height=height, **kwargs)
+
+        def on_ready(thumbnail: str):
+            image.src_base64 = thumbnail
+            if image.page is not None:
+                image.update()
+
+        self.load(url, size, on_ready)
+        return image
+
+    def prefetch(self, urls, width=None, height=None):
+        """Готовит миниатюры для списка заранее, параллельно."""
+        size = self.thumbnail_size(width, height)
+        for url in dict.fromkeys(urls):
+            if is_remote(url) and self.cached_base64(url, size) is None:
+                self.load(url, size)
+
+    def load(self, url: str, size: tuple[int, int], on_ready=None):
+        key = (url, size)
+        with self.lock:
+            callbacks = self.pending.get(key)
+            if callbacks is not None:
+                if on_ready:
+                    callbacks.append(on_ready)
+                return
+            self.pending[key] = [on_ready] if on_ready else []
+
+        self.executor.submit(self.fetch_thumbnail, url, size)
+
+    def fetch_thumbnail(self, url: str, size: tuple[int, int]):
+        key = (url, size)
+        thumbnail = None
+        try:
+            thumbnail = self.thumbnail(url, size)
+        except (httpx.HTTPError, OSError) as e:
+            logger.warning('Не удалось загрузить изображение %s: %s', url, e)
+        finally:
+            with self.lock:
+                callbacks = self.pending.pop(key, [])
+
+        if thumbnail is None:
+            return
+        for callback in callbacks:
+            try:
+                callback(thumbnail)
+            except Exception as e:
+                logger.warning('Изображение %s не обновлено: %s', url, e)
+
+    def cached_base64(self, url: str, size: tuple[int, int]) -> str:
+        key = (url, size)
+        with self.lock:
+            if key in self.memory:
+                self.memory.move_to_end(key)
+                return self.memory[key]
+            digest = self.load_index().get(url)
+
+        if digest is None:
+            return None
+        data = self.read(self.thumbnail_path(digest, size))
+        if data is None:
+            return None
+        return self.remember(key, data)
+
+    def thumbnail(self, url: str, size: tuple[int, int]) -> str:
+        with self.lock:
+            digest = self.load_index().get(url)
+
+        original = digest and self.read(self.directory / f'{digest}.orig')
+        if not original:
+            response = self.client.get(url)
+            response.raise_for_status()
+            original = response.content
+            digest = hashlib.sha256(original).hexdigest()
+            self.write(self.directory / f'{digest}.orig', original)
+            with self.lock:
+                self.load_index()[url] = digest
+                self.save_index()
+
+        thumbnail = resize_image(
+            original, size[0], size[1], THUMBNAIL_QUALITY, cover=True
+        )
+        path = self.thumbnail_path(digest, size)
+        if not path.exists():
+            self.write(path, thumbnail)
+        self.evict()
+        return self.remember((url, size), thumbnail)
+
+    def thumbnail_path(self, digest: str, size: tuple[int, int]) -> Path:
+        return self.directory / f'{digest}_{size[0]}x{size[1]}.webp'
+
+    def remember(self, key: tuple, data: bytes) -> str:
+        encoded = base64.b64encode(data).decode()
+        with self.lock:
+            self.memory[key] = encoded
+            self.memory.move_to_end(key)
+            while len(self.memory) > self.memory_items:
+                self.memory.popitem(last=False)
+        return encoded
+
+    def load_index(self) -> dict[str, str]:
+        if self.index is None:
+            path = self.directory / 'index.json'
+            try:
+                self.index = json.loads(path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                self.index = {}
+        return self.index
+
+    def save_index(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / 'index.json'
+        temporary = self.temporary_path(path)
+        temporary.write_text(json.dumps(self.index), encoding='utf-8')
+        temporary.replace(path)
+
+    def temporary_path(self, path: Path) -> Path:
+        return path.with_name(f'{path.name}.{threading.get_ident()}.tmp')
+
+    def read(self, path: Path) -> bytes:
+        try:
+            data = path.read_bytes()
+            path.touch()
+            return data
+        except OSError:
+            return None
+
+    def write(self, path: Path, data: bytes):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporary = self.temporary_path(path)
+        temporary.write_bytes(data)
+        temporary.replace(path)
+
+    def evict(self):
+        files = [
+            (path.stat(), path)
+            for path in self.directory.iterdir()
+            if path.suffix in ('.orig', '.webp')
+        ]
+        total = sum(stat.st_size for stat, _ in files)
+        if total <= self.max_bytes:
+            return
+
+        removed = set()
+        for stat, path in sorted(files, key=lambda item: item[0].st_mtime):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+            removed.add(path.name.split('_')[0].split('.')[0])
+
+        with self.lock:
+            self.memory.clear()
+            index = self.load_index()
+            for url, digest in list(index.items()):
+                if (
+                    digest in removed
+                    and not (self.directory / f'{digest}.orig').exists()
+                ):
+                    del index[url]
+            self.save_index()
+        logger.debug('Кэш изображений очищен до %s байт', total)
+
+
+image_cache = ImageCache()
@@ -0,0 +1,69 @@
+import logging
+
+from washer.config import config
+
+ROOT_LOGGER_NAME = 'washer'
+LOG_FORMAT = '%(asctime)s %(levelname)s %(name)s: %(message)s'
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Возвращает логгер модуля внутри иерархии 'washer'.
+
+    Сообщения форматируются лениво (logger.debug('... %s', value)),
+    поэтому отключённые уровни не тратят время на сборку строк.
+    """
+    if name != ROOT_LOGGER_NAME and not name.startswith(
+        f'{ROOT_LOGGER_NAME}.'
+    ):
+        name = f'{ROOT_LOGGER_NAME}.{name}'
+    return logging.getLogger(name)
+
+
+def parse_module_levels(value: str) -> dict[str, int]:
+    """
+    Разбирает переключатели вида
+    'ui_components.booking_page=DEBUG,api_requests=INFO'.
+    """
+    levels = {}
+    for item in value.split(','):
+        item = item.strip()
+        if not item or '=' not in item:
+            continue
+        module, level = item.split('=', 1)
+        levels[get_logger(module.strip()).name] = logging.getLevelName(
+            level.strip().upper()
+        )
+    return {
+        module: level
+        for module, level in levels.items()
+        if isinstance(level, int)
+    }
+
+
+def setup_logging(
+    level: str = None, module_levels: str = None
+) -> logging.Logger:
+    """
+    Настраивает логгер приложения.
+
+    По умолчанию уровень WARNING: отладочные сообщения из горячих путей
+    не пишутся в stdout. Уровень и переключатели по модулям задаются
+    через LOG_LEVEL и LOG_MODULES.
+    """
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    root.setLevel((level or config.log_level).upper())
+    root.propagate = False
+
+    if not root.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        root.addHandler(handler)
+
+    module_levels = parse_module_levels(
+        module_levels if module_levels is not None else config.log_modules
+    )
+    for module, module_level in module_levels.items():
+        logging.getLogger(module).setLevel(module_level)
+
+    return root
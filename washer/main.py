@@ -1,10 +1,16 @@
 import flet as ft
 
 from washer.api_requests import BackendApi
+from washer.car_wash_store import CarWashStore
+from washer.config import config
+from washer.logger import setup_logging
+from washer.ui_components.request_metrics_page import RequestMetricsPage
 from washer.ui_components.sign_up_page import SignUpPage
 
 
 def main(page: ft.Page):
+    setup_logging()
+
     page.fonts = {
         'LavishlyYours': 'http://77.73.66.191:9001/api/v1/buckets/general-bucket/objects/download?preview=true&prefix=LavishlyYours-Regular.ttf&version_id=null'
         # 'LavishlyYours': 'https://drive.google.com/uc?export=view&id=17uMDY7jYszJZS3td3pLzhnPbeKIXnZTD'
@@ -12,6 +18,12 @@ def main(page: ft.Page):
 
     page.api = BackendApi()
 
+    def on_close(e):
+        CarWashStore.release(page)
+        page.api.close()
+
+    page.on_close = on_close
+
     page.title = 'User Registration'
     page.vertical_alignment = ft.MainAxisAlignment.CENTER
     page.horizontal_alignment = ft.CrossAxisAlignment.CENTER
@@ -19,5 +31,8 @@ def main(page: ft.Page):
 
     SignUpPage(page)
 
+    if config.request_metrics_overlay:
+        RequestMetricsPage.attach(page)
+
 
 ft.app(target=main)
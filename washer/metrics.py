@@ -0,0 +1,315 @@
+import json
+import math
+import re
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+
+import httpx
+
+from washer.logger import get_logger
+
+logger = get_logger(__name__)
+
+ID_SEGMENT_PATTERN = re.compile(r'/\d+(?=/|$)')
+SCREENS_PACKAGE = 'washer.ui_components.'
+QUANTILES = (0.5, 0.9, 0.99)
+# Расширение запроса, получившего чужой ответ через SingleFlightTransport
+DEDUPLICATED_EXTENSION = 'washer_deduplicated'
+
+
+@dataclass
+class RequestSample:
+    method: str
+    endpoint: str
+    url: str
+    status_code: int
+    screen: str
+    started_at: float
+    connect: float = None
+    tls: float = None
+    ttfb: float = None
+    total: float = 0.0
+    request_bytes: int = 0
+    response_bytes: int = 0
+
+
+def percentile(sorted_values: list[float], quantile: float) -> float:
+    """Перцентиль по методу ближайшего ранга."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, math.ceil(quantile * len(sorted_values)) - 1)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+def endpoint_name(method: str, url: httpx.URL) -> str:
+    """
+    Шаблон эндпоинта для группировки: числовые идентификаторы в пути
+    заменяются на {id}, query-параметры отбрасываются.
+    """
+    return f'{method} {ID_SEGMENT_PATTERN.sub("/{id}", url.path)}'
+
+
+def prometheus_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def current_screen() -> str:
+    """Имя класса страницы ui_components, из которой пришёл запрос."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        if module.startswith(SCREENS_PACKAGE):
+            instance = frame.f_locals.get('self')
+            if instance is not None:
+                return type(instance).__name__
+            return module[len(SCREENS_PACKAGE) :]
+        frame = frame.f_back
+    return None
+
+
+class RequestMetricsRegistry:
+    """
+    Потокобезопасное хранилище замеров HTTP-запросов с перцентилями
+    по эндпоинтам и экспортом в JSON и Prometheus.
+
+    Реестр сессии создаётся с parent=request_metrics: замеры попадают
+    и в него, и в общий реестр процесса для экспорта, а сброс реестра
+    сессии не затрагивает остальные.
+    """
+
+    def __init__(
+        self,
+        max_samples: int = 1000,
+        parent: 'RequestMetricsRegistry' = None,
+    ):
+        self.parent = parent
+        self.lock = threading.Lock()
+        self.recent = deque(maxlen=max_samples)
+        self.totals: dict[str, dict] = {}
+
+    def endpoint_totals(self, endpoint: str) -> dict:
+        return self.totals.setdefault(
+            endpoint,
+            {
+                'count': 0,
+                'errors': 0,
+                'deduplicated': 0,
+                'duration_sum': 0.0,
+                'request_bytes': 0,
+                'response_bytes': 0,
+                'status_codes': {},
+                'durations': deque(maxlen=self.recent.maxlen),
+            },
+        )
+
+    def record(self, sample: RequestSample):
+        with self.lock:
+            self.recent.append(sample)
+            totals = self.endpoint_totals(sample.endpoint)
+            totals['count'] += 1
+            if sample.status_code is None or sample.status_code >= 400:
+                totals['errors'] += 1
+            totals['duration_sum'] += sample.total
+            totals['request_bytes'] += sample.request_bytes
+            totals['response_bytes'] += sample.response_bytes
+            status = str(sample.status_code)
+            totals['status_codes'][status] = (
+                totals['status_codes'].get(status, 0) + 1
+            )
+            totals['durations'].append(sample.total)
+
+        if self.parent is not None:
+            self.parent.record(sample)
+            return
+        logger.debug(
+            '%s [%s] -> %s за %.3f с',
+            sample.endpoint,
+            sample.screen,
+            sample.status_code,
+            sample.total,
+        )
+
+    def record_deduplicated(self, endpoint: str):
+        """Запрос получил ответ уже идущего запроса, без обращения к сети."""
+        with self.lock:
+            self.endpoint_totals(endpoint)['deduplicated'] += 1
+        if self.parent is not None:
+            self.parent.record_deduplicated(endpoint)
+
+    def samples(self) -> list[RequestSample]:
+        with self.lock:
+            return list(self.recent)
+
+    def slowest(self, limit: int = 10) -> list[RequestSample]:
+        return sorted(
+            self.samples(), key=lambda sample: sample.total, reverse=True
+        )[:limit]
+
+    def summary(self) -> dict[str, dict]:
+        with self.lock:
+            snapshot = {
+                endpoint: (
+                    dict(totals, status_codes=dict(totals['status_codes'])),
+                    sorted(totals['durations']),
+                )
+                for endpoint, totals in self.totals.items()
+            }
+
+        summary = {}
+        for endpoint, (totals, durations) in snapshot.items():
+            summary[endpoint] = {
+                'count': totals['count'],
+                'errors': totals['errors'],
+                'deduplicated': totals['deduplicated'],
+                'duration_sum': totals['duration_sum'],
+                'request_bytes': totals['request_bytes'],
+                'response_bytes': totals['response_bytes'],
+                'status_codes': totals['status_codes'],
+                'p50': percentile(durations, 0.5),
+                'p90': percentile(durations, 0.9),
+                'p99': percentile(durations, 0.99),
+                'max': durations[-1] if durations else 0.0,
+            }
+        return summary
+
+    def to_json(self, slowest_limit: int = 10) -> str:
+        return json.dumps(
+            {
+                'endpoints': self.summary(),
+                'slowest': [
+                    asdict(sample) for sample in self.slowest(slowest_limit)
+                ],
+            },
+            ensure_ascii=False,
+            indent=2,
+        )
+
+    def to_prometheus(self) -> str:
+        lines = [
+            '# HELP washer_http_request_duration_seconds '
+            'Client-side duration of backend requests.',
+            '# TYPE washer_http_request_duration_seconds summary',
+        ]
+        summary = self.summary()
+        for endpoint, stats in summary.items():
+            label = prometheus_label(endpoint)
+            for quantile in QUANTILES:
+                value = stats[f'p{int(quantile * 100)}']
+                lines.append(
+                    f'washer_http_request_duration_seconds'
+                    f'{{endpoint="{label}",quantile="{quantile}"}} {value}'
+                )
+            lines.append(
+                f'washer_http_request_duration_seconds_sum'
+                f'{{endpoint="{label}"}} {stats["duration_sum"]}'
+            )
+            lines.append(
+                f'washer_http_request_duration_seconds_count'
+                f'{{endpoint="{label}"}} {stats["count"]}'
+            )
+
+        lines.append('# TYPE washer_http_requests_total counter')
+        for endpoint, stats in summary.items():
+            label = prometheus_label(endpoint)
+            for status, count in stats['status_codes'].items():
+                lines.append(
+                    f'washer_http_requests_total'
+                    f'{{endpoint="{label}",status="{status}"}} {count}'
+                )
+
+        lines.append('# TYPE washer_http_deduplicated_requests_total counter')
+        for endpoint, stats in summary.items():
+            lines.append(
+                f'washer_http_deduplicated_requests_total'
+                f'{{endpoint="{prometheus_label(endpoint)}"}} '
+                f'{stats["deduplicated"]}'
+            )
+
+        for direction in ('request', 'response'):
+            lines.append(f'# TYPE washer_http_{direction}_bytes_total counter')
+            for endpoint, stats in summary.items():
+                label = prometheus_label(endpoint)
+                lines.append(
+                    f'washer_http_{direction}_bytes_total'
+                    f'{{endpoint="{label}"}} {stats[f"{direction}_bytes"]}'
+                )
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        with self.lock:
+            self.recent.clear()
+            self.totals.clear()
+
+
+request_metrics = RequestMetricsRegistry()
+
+
+class RequestTimer:
+    """
+    Event hooks httpx, которые замеряют каждый запрос клиента.
+
+    Фазы соединения берутся из trace-расширения httpcore:
+    connect (включая DNS-резолвинг), TLS и время до первого байта.
+    """
+
+    def __init__(self, registry: RequestMetricsRegistry = None):
+        self.registry = registry or request_metrics
+
+    def event_hooks(self) -> dict:
+        return {
+            'request': [self.on_request],
+            'response': [self.on_response],
+        }
+
+    def on_request(self, request: httpx.Request):
+        marks = {'start': time.perf_counter()}
+
+        def trace(event_name: str, info: dict):
+            marks[event_name.split('.', 1)[-1]] = time.perf_counter()
+
+        request.extensions['trace'] = trace
+        request.extensions['washer_timing'] = {
+            'marks': marks,
+            'started_at': time.time(),
+            'screen': current_screen(),
+        }
+
+    def on_response(self, response: httpx.Response):
+        request = response.request
+        timing = request.extensions.get('washer_timing')
+        if timing is None or request.extensions.get(DEDUPLICATED_EXTENSION):
+            # Объединённый запрос уже учтён как deduplicated
+            return
+
+        marks = timing['marks']
+        ttfb_mark = time.perf_counter()
+        response.read()
+        end = time.perf_counter()
+
+        def phase(name: str):
+            started = marks.get(f'{name}.started')
+            completed = marks.get(f'{name}.complete')
+            if started is None or completed is None:
+                return None
+            return completed - started
+
+        headers_received = marks.get('receive_response_headers.complete')
+        self.registry.record(
+            RequestSample(
+                method=request.method,
+                endpoint=endpoint_name(request.method, request.url),
+                url=str(request.url),
+                status_code=response.status_code,
+                screen=timing['screen'],
+                started_at=timing['started_at'],
+                connect=phase('connect_tcp'),
+                tls=phase('start_tls'),
+                ttfb=(headers_received or ttfb_mark) - marks['start'],
+                total=end - marks['start'],
+                request_bytes=int(request.headers.get('content-length', 0)),
+                response_bytes=len(response.content),
+            )
+        )
@@ -0,0 +1,55 @@
+import threading
+
+from washer.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RequestToken:
+    """
+    Запрос, начатый ради одного действия пользователя. cancelled
+    устанавливается, когда пользователь делает новый выбор: долгие
+    операции прерываются, а ответ, пришедший позже, отбрасывается.
+    """
+
+    def __init__(self, generation: int):
+        self.generation = generation
+        self.cancelled = threading.Event()
+        self.loading = False
+
+    @property
+    def is_current(self) -> bool:
+        return not self.cancelled.is_set()
+
+
+class RequestGenerations:
+    """
+    Поколения запросов экрана: begin() отменяет все начатые ранее
+    запросы, так что отрисовывается только ответ на последний выбор,
+    а не тот, что пришёл последним.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.current: RequestToken = None
+
+    def begin(self) -> RequestToken:
+        with self.lock:
+            if self.current is not None:
+                self.current.cancelled.set()
+            self.generation += 1
+            self.current = RequestToken(self.generation)
+            return self.current
+
+    def is_stale(self, request: RequestToken) -> bool:
+        if request.is_current:
+            return False
+        logger.debug(
+            '%s: ответ поколения %s отброшен, текущее %s',
+            self.name,
+            request.generation,
+            self.generation,
+        )
+        return True
@@ -0,0 +1,271 @@
+import hashlib
+import random
+import threading
+import time
+from collections import OrderedDict
+
+import httpx
+
+from washer.config import config
+from washer.logger import get_logger
+from washer.metrics import endpoint_name
+
+logger = get_logger(__name__)
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+RETRY_STATUS_CODES = frozenset({502, 503, 504})
+UPLOAD_TIMEOUT = 60.0
+
+# Заголовок ответа, отданного из кэша, пока бэкенд недоступен
+STALE_HEADER = 'X-Washer-Stale'
+
+# Бюджеты времени для эндпоинтов, отличающихся от api_timeout
+ENDPOINT_TIMEOUTS = {
+    'GET /car_washes/{id}/available_times': 5.0,
+    'POST /jwt/refresh': 5.0,
+    'POST /jwt/token': 10.0,
+}
+
+
+def decoded_headers(response: httpx.Response) -> list[tuple[str, str]]:
+    """Заголовки для ответа, собранного из уже прочитанного тела."""
+    return [
+        (name, value)
+        for name, value in response.headers.items()
+        if name.lower() not in ('content-encoding', 'content-length')
+    ]
+
+
+def cache_key(request: httpx.Request) -> tuple[str, str]:
+    """
+    Ключ кэша ответов: URL и хэш заголовка Authorization, чтобы ответ
+    одного пользователя не достался другому с тем же URL.
+    """
+    authorization = request.headers.get('Authorization', '')
+    return (
+        str(request.url),
+        hashlib.sha256(authorization.encode()).hexdigest(),
+    )
+
+
+def is_stale(response: httpx.Response) -> bool:
+    """Ответ взят из кэша ResilientTransport, а не получен с сервера."""
+    return STALE_HEADER in response.headers
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Бэкенд признан недоступным, запрос не отправлялся."""
+
+
+class CircuitBreaker:
+    """
+    Предохранитель для одного эндпоинта.
+
+    После failure_threshold ошибок подряд размыкается и reset_timeout
+    секунд отклоняет запросы сразу. Затем пропускает один пробный
+    запрос: успех замыкает цепь, ошибка размыкает её снова.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.lock = threading.Lock()
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            return 'open'
+        return 'half-open'
+
+    def allow(self) -> bool:
+        with self.lock:
+            state = self.state
+            if state == 'closed':
+                return True
+            if state == 'half-open' and not self.trial_in_flight:
+                self.trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_in_flight = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            self.trial_in_flight = False
+            if (
+                self.opened_at is not None
+                or self.failures >= self.failure_threshold
+            ):
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        """Освобождает пробный запрос, не засчитывая ни успех, ни ошибку."""
+        with self.lock:
+            self.trial_in_flight = False
+
+
+class ResilientTransport(httpx.BaseTransport):
+    """
+    Транспорт поверх httpx с политикой отказоустойчивости:
+
+    - таймаут по эндпоинту (ENDPOINT_TIMEOUTS, загрузка файлов —
+      UPLOAD_TIMEOUT, остальное — api_timeout);
+    - повтор идемпотентных запросов после сетевых ошибок и ответов
+      502/503/504 с экспоненциальной задержкой и полным джиттером;
+    - предохранитель на каждый эндпоинт. Пока он разомкнут, GET
+      получает последний успешный ответ из кэша с заголовком
+      X-Washer-Stale, а прочие запросы — CircuitOpenError.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        retries: int = None,
+        backoff: float = None,
+        cache_size: int = 128,
+    ):
+        self.transport = transport
+        self.retries = config.api_retries if retries is None else retries
+        self.backoff = config.api_retry_backoff if backoff is None else backoff
+        self.cache_size = cache_size
+        self.lock = threading.Lock()
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self.cache: OrderedDict[tuple[str, str], tuple] = OrderedDict()
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        with self.lock:
+            if endpoint not in self.breakers:
+                self.breakers[endpoint] = CircuitBreaker(
+                    config.circuit_failure_threshold,
+                    config.circuit_reset_timeout,
+                )
+            return self.breakers[endpoint]
+
+    def timeout_for(self, request: httpx.Request, endpoint: str) -> float:
+        if endpoint in ENDPOINT_TIMEOUTS:
+            return ENDPOINT_TIMEOUTS[endpoint]
+        content_type = request.headers.get('Content-Type', '')
+        if content_type.startswith('multipart/'):
+            return UPLOAD_TIMEOUT
+        return config.api_timeout
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint = endpoint_name(request.method, request.url)
+        breaker = self.breaker(endpoint)
+        if not breaker.allow():
+            return self.fallback(
+                request, CircuitOpenError(f'{endpoint}: цепь разомкнута')
+            )
+
+        timeout = self.timeout_for(request, endpoint)
+        request.extensions['timeout'] = httpx.Timeout(timeout).as_dict()
+        attempts = 1 + (
+            self.retries if request.method in IDEMPOTENT_METHODS else 0
+        )
+
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                response = self.transport.handle_request(request)
+            except httpx.TransportError as e:
+                breaker.record_failure()
+                if last_attempt:
+                    return self.fallback(request, e)
+                logger.warning(
+                    '%s: %s, повтор %s из %s',
+                    endpoint,
+                    e,
+                    attempt + 1,
+                    attempts - 1,
+                )
+            except BaseException:
+                # Отмена загрузки или ошибка разбора ответа ничего не
+                # говорят о доступности бэкенда, но пробный запрос
+                # полуоткрытой цепи должен освободиться.
+                breaker.release()
+                raise
+            else:
+                if response.status_code < 500:
+                    breaker.record_success()
+                    return self.remember(request, response)
+
+                breaker.record_failure()
+                if response.status_code not in RETRY_STATUS_CODES:
+                    return response
+                stale = self.stale(request) if last_attempt else None
+                if last_attempt and stale is None:
+                    return response
+                response.close()
+                if stale is not None:
+                    return stale
+                logger.warning(
+                    '%s: %s, повтор %s из %s',
+                    endpoint,
+                    response.status_code,
+                    attempt + 1,
+                    attempts - 1,
+                )
+
+            if not breaker.allow():
+                return self.fallback(
+                    request, CircuitOpenError(f'{endpoint}: цепь разомкнута')
+                )
+            time.sleep(random.uniform(0, self.backoff * 2**attempt))
+
+    def remember(
+        self, request: httpx.Request, response: httpx.Response
+    ) -> httpx.Response:
+        if request.method != 'GET' or response.status_code != 200:
+            return response
+
+        content = response.read()
+        headers = decoded_headers(response)
+        key = cache_key(request)
+        with self.lock:
+            self.cache[key] = (headers, content)
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return httpx.Response(
+            200, headers=headers, content=content, request=request
+        )
+
+    def fallback(
+        self, request: httpx.Request, error: httpx.TransportError
+    ) -> httpx.Response:
+        """Устаревший ответ из кэша для GET или исходная ошибка."""
+        response = self.stale(request)
+        if response is None:
+            raise error
+        logger.warning('Бэкенд недоступен: %s', error)
+        return response
+
+    def stale(self, request: httpx.Request) -> httpx.Response:
+        if request.method != 'GET':
+            return None
+        with self.lock:
+            cached = self.cache.get(cache_key(request))
+        if cached is None:
+            return None
+
+        logger.warning('Отдаём кэшированный ответ для %s', request.url)
+        headers, content = cached
+        return httpx.Response(
+            200,
+            headers=[*headers, (STALE_HEADER, '1')],
+            content=content,
+            request=request,
+        )
+
+    def close(self):
+        self.transport.close()
@@ -0,0 +1,96 @@
+import time
+from datetime import date, timedelta
+
+from washer.config import config
+
+
+class ScheduleHorizon:
+    """
+    Проекция недельного расписания автомойки на горизонт бронирования.
+
+    Расписания и набор доступных дат хранятся в кэше класса не дольше
+    ttl секунд и в пределах одного дня, поэтому повторные визиты на
+    страницу бронирования и навигация по месяцам календаря не требуют
+    ни запросов, ни пересчёта, а правки расписания из другого процесса
+    видны не позже чем через ttl.
+    """
+
+    available_dates_cache: dict[
+        int, tuple[float, date, int, tuple[dict, ...], frozenset[date]]
+    ] = {}
+
+    def __init__(self, horizon_days: int = None, ttl: float = None):
+        self.horizon_days = horizon_days or config.booking_horizon_days
+        self.ttl = config.schedule_horizon_ttl if ttl is None else ttl
+
+    @staticmethod
+    def expand(
+        schedules: list[dict], start: date, horizon_days: int
+    ) -> frozenset[date]:
+        """
+        Разворачивает недельное расписание в конкретные даты.
+
+        :param schedules: Расписания автомойки с полями
+        'day_of_week' и 'is_available'.
+        :param start: Первая дата горизонта (обычно сегодня).
+        :param horizon_days: Количество дней в горизонте.
+        :return: Множество доступных для бронирования дат.
+        """
+        available_days_of_week = {
+            schedule['day_of_week']
+            for schedule in schedules
+            if schedule.get('is_available', False)
+            and 'day_of_week' in schedule
+        }
+        if not available_days_of_week:
+            return frozenset()
+
+        return frozenset(
+            start + timedelta(days=i)
+            for i in range(horizon_days)
+            if (start + timedelta(days=i)).weekday() in available_days_of_week
+        )
+
+    def get_cached(
+        self, car_wash_id: int, today: date = None
+    ) -> tuple[list[dict], frozenset[date]]:
+        """
+        Возвращает закэшированные расписания и даты или None, если кэш
+        устарел (истёк ttl, сменился день или размер горизонта).
+        """
+        today = today or date.today()
+        cached = ScheduleHorizon.available_dates_cache.get(car_wash_id)
+        if cached is None:
+            return None
+
+        computed_at, computed_on, horizon_days, schedules, available_dates = (
+            cached
+        )
+        if (
+            time.monotonic() - computed_at >= self.ttl
+            or computed_on != today
+            or horizon_days != self.horizon_days
+        ):
+            return None
+        return list(schedules), available_dates
+
+    def build(
+        self, car_wash_id: int, schedules: list[dict], today: date = None
+    ) -> frozenset[date]:
+        today = today or date.today()
+        available_dates = self.expand(schedules, today, self.horizon_days)
+        ScheduleHorizon.available_dates_cache[car_wash_id] = (
+            time.monotonic(),
+            today,
+            self.horizon_days,
+            tuple(schedules),
+            available_dates,
+        )
+        return available_dates
+
+    @staticmethod
+    def invalidate(car_wash_id: int = None):
+        if car_wash_id is None:
+            ScheduleHorizon.available_dates_cache.clear()
+        else:
+            ScheduleHorizon.available_dates_cache.pop(car_wash_id, None)
@@ -0,0 +1,92 @@
+import threading
+
+import httpx
+
+from washer.logger import get_logger
+from washer.metrics import (
+    DEDUPLICATED_EXTENSION,
+    RequestMetricsRegistry,
+    endpoint_name,
+    request_metrics,
+)
+from washer.resilience import decoded_headers
+
+logger = get_logger(__name__)
+
+
+class Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+    def response_for(self, request: httpx.Request) -> httpx.Response:
+        status_code, headers, content = self.result
+        return httpx.Response(
+            status_code, headers=headers, content=content, request=request
+        )
+
+
+class SingleFlightTransport(httpx.BaseTransport):
+    """
+    Объединяет одновременные одинаковые GET-запросы в один.
+
+    Первый запрос уходит в сеть, остальные с тем же URL и токеном
+    ждут его и получают копию ответа (или ту же ошибку). Число
+    сэкономленных запросов пишется в метрики как deduplicated, а
+    RequestTimer не замеряет их как обычные запросы.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        registry: RequestMetricsRegistry = None,
+    ):
+        self.transport = transport
+        self.registry = registry or request_metrics
+        self.lock = threading.Lock()
+        self.in_flight: dict[tuple, Flight] = {}
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != 'GET':
+            return self.transport.handle_request(request)
+
+        key = (str(request.url), request.headers.get('Authorization'))
+        with self.lock:
+            flight = self.in_flight.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = Flight()
+                self.in_flight[key] = flight
+
+        if not is_leader:
+            flight.done.wait()
+            request.extensions[DEDUPLICATED_EXTENSION] = True
+            self.registry.record_deduplicated(
+                endpoint_name(request.method, request.url)
+            )
+            logger.debug('Запрос %s объединён с уже идущим', request.url)
+            if flight.error is not None:
+                raise flight.error
+            return flight.response_for(request)
+
+        try:
+            response = self.transport.handle_request(request)
+            content = response.read()
+            flight.result = (
+                response.status_code,
+                decoded_headers(response),
+                content,
+            )
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.in_flight[key]
+            flight.done.set()
+
+        return flight.response_for(request)
+
+    def close(self):
+        self.transport.close()
@@ -0,0 +1,233 @@
+import heapq
+import threading
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, timedelta
+from itertools import islice
+
+from washer.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Мойка занимает два часа, начало можно выбрать с шагом в час
+SLOT_DURATION = timedelta(hours=2)
+SLOT_STEP = timedelta(hours=1)
+
+
+def earliest_start(day: date, now: datetime = None) -> datetime:
+    """
+    Самое раннее время записи на день: сегодня — не раньше начала
+    следующего часа после ближайшего, на другие дни — без ограничения.
+    """
+    now = now or datetime.now()
+    if day != now.date():
+        return None
+    return (now + timedelta(hours=1)).replace(
+        minute=0, second=0, microsecond=0
+    )
+
+
+def parse_ranges(
+    time_ranges: Iterable, day: date
+) -> list[tuple[datetime, datetime]]:
+    """
+    Свободные интервалы бокса из available_times (пары ISO-строк
+    [начало, конец]) как отсортированные пары datetime на день day.
+    """
+    ranges = []
+    for time_range in time_ranges:
+        try:
+            start = datetime.fromisoformat(time_range[0])
+            end = datetime.fromisoformat(time_range[1])
+        except (ValueError, TypeError, IndexError) as e:
+            logger.error(
+                'Invalid time range detected: %s, Error: %s', time_range, e
+            )
+            continue
+        if start.date() != day:
+            continue
+        ranges.append(
+            (
+                datetime.combine(day, start.time()),
+                datetime.combine(day, end.time()),
+            )
+        )
+    return sorted(ranges)
+
+
+def range_slots(
+    box_id: int,
+    ranges: list[tuple[datetime, datetime]],
+    not_before: datetime = None,
+) -> Iterator[tuple[datetime, int]]:
+    """Возрастающий поток пар (начало слота, box_id) по интервалам."""
+    for start, end in ranges:
+        while start + SLOT_DURATION <= end:
+            if not_before is None or start >= not_before:
+                yield start, box_id
+            start += SLOT_STEP
+
+
+def box_slots(
+    box_id: int,
+    time_ranges: Iterable,
+    day: date,
+    not_before: datetime = None,
+) -> Iterator[tuple[datetime, int]]:
+    """
+    Возрастающий поток пар (начало слота, box_id) одного бокса на день.
+
+    :param time_ranges: Свободные интервалы бокса из available_times,
+    пары ISO-строк [начало, конец].
+    :param not_before: Слоты раньше этого времени пропускаются.
+    """
+    return range_slots(box_id, parse_ranges(time_ranges, day), not_before)
+
+
+def first_slot_boxes(
+    slots: Iterator[tuple[datetime, int]],
+) -> tuple[datetime, list[int]]:
+    """
+    Первое время из возрастающего потока slots и все боксы, свободные
+    в это время, или None, если поток пуст.
+    """
+    first = next(slots, None)
+    if first is None:
+        return None
+    slot_time, box_id = first
+    box_ids = [box_id]
+    for other_time, other_box_id in slots:
+        if other_time != slot_time:
+            break
+        box_ids.append(other_box_id)
+    return slot_time, box_ids
+
+
+class EarliestSlotFinder:
+    """
+    Поиск ближайшего свободного времени по дням и боксам автомойки.
+
+    Дни просматриваются по порядку, свободное время дня запрашивается
+    только когда до него дошёл поиск. Слоты боксов одного дня
+    сливаются кучей (heapq.merge) из возрастающих потоков, поэтому
+    первые count слотов находятся без построения и сортировки полного
+    списка. Ответы available_times хранятся в finder, пока он жив.
+    """
+
+    def __init__(
+        self,
+        api,
+        car_wash_id: int,
+        dates: Iterable[date],
+        now: datetime = None,
+        cancelled: threading.Event = None,
+    ):
+        self.api = api
+        self.car_wash_id = car_wash_id
+        self.dates = sorted(dates)
+        self.now = now
+        self.cancelled = cancelled
+        self.days: dict[date, dict] = {}
+        self.failed = False
+
+    def availability(self, day: date) -> dict:
+        """
+        Свободные интервалы боксов на день {box_id: [[начало, конец]]}
+        или None, если загрузить их не удалось.
+        """
+        if day not in self.days:
+            response = self.api.get_available_times(
+                self.car_wash_id, day.strftime('%Y-%m-%d')
+            )
+            if response.status_code != 200:
+                logger.error(
+                    'Ошибка загрузки доступных времен на %s: %s',
+                    day,
+                    response.text,
+                )
+                return None
+            self.days[day] = response.json().get('available_times', {})
+        return self.days[day]
+
+    def day_slots(self, day: date) -> Iterator[tuple[datetime, int]]:
+        available_times = self.availability(day)
+        if available_times is None:
+            self.failed = True
+            return iter(())
+
+        not_before = earliest_start(day, self.now)
+        return heapq.merge(
+            *(
+                box_slots(int(box_id), time_ranges, day, not_before)
+                for box_id, time_ranges in available_times.items()
+            )
+        )
+
+    def day_streams(
+        self, start: date
+    ) -> Iterator[Iterator[tuple[datetime, int]]]:
+        """
+        Потоки слотов по дням начиная с дня start. Следующий день
+        запрашивается, только когда вызывающий перешёл к нему. Потоки
+        обрываются на дне, который не удалось загрузить, чтобы не
+        перескочить через него, и перед следующим днём, если
+        установлено событие cancelled.
+        """
+        for day in self.dates:
+            if day < start:
+                continue
+            if self.cancelled is not None and self.cancelled.is_set():
+                logger.debug('Поиск ближайшего времени отменён на %s', day)
+                return
+            yield self.day_slots(day)
+            if self.failed:
+                return
+
+    def slots(self, start: date) -> Iterator[tuple[datetime, int]]:
+        """
+        Все свободные слоты начиная с дня start по возрастанию времени,
+        при равном времени — по номеру бокса.
+        """
+        for day_slots in self.day_streams(start):
+            yield from day_slots
+
+    def earliest(
+        self, start: date, count: int = 1
+    ) -> list[tuple[datetime, int]]:
+        """Первые count слотов начиная с дня start: (время, box_id)."""
+        found = list(islice(self.slots(start), count))
+        logger.debug(
+            'Ближайшие слоты с %s: %s, запрошено дней: %s',
+            start,
+            found,
+            len(self.days),
+        )
+        return found
+
+    def earliest_candidates(
+        self, start: date
+    ) -> tuple[datetime, dict[int, list[tuple[datetime, datetime]]]]:
+        """
+        Ближайшее время начиная с дня start и свободные интервалы дня
+        для каждого бокса, свободного в это время, — для выбора бокса
+        стратегией из box_assignment. None, если времени нет.
+        """
+        # Боксы ищутся в потоке одного дня: общий поток ради проверки
+        # последнего слота дня запросил бы свободное время следующего
+        found = None
+        for day_slots in self.day_streams(start):
+            found = first_slot_boxes(day_slots)
+            if found is not None:
+                break
+        if found is None:
+            return None
+
+        slot_time, box_ids = found
+        day = slot_time.date()
+        available_times = {
+            int(box_id): time_ranges
+            for box_id, time_ranges in self.availability(day).items()
+        }
+        return slot_time, {
+            box_id: parse_ranges(available_times[box_id], day)
+            for box_id in box_ids
+        }
@@ -0,0 +1,712 @@
+import argparse
+import base64
+import json
+import random
+import re
+import threading
+import time
+from datetime import date, datetime, timedelta
+from urllib.parse import parse_qs
+
+import httpx
+
+from washer.logger import get_logger
+from washer.metrics import endpoint_name
+
+logger = get_logger(__name__)
+
+BODY_TYPES = [
+    'седан',
+    'хэтчбек',
+    'универсал',
+    'внедорожник',
+    'купе',
+    'минивэн',
+    'пикап',
+    'кроссовер',
+]
+
+BOOKING_STATES = ['CREATED', 'ACCEPTED', 'STARTED', 'COMPLETED']
+
+
+def timestamp() -> str:
+    return datetime.now().isoformat(timespec='microseconds')
+
+
+def encode_token(payload: dict) -> str:
+    """Неподписанный JWT: фронтенду достаточно прочитать payload."""
+
+    def segment(data: dict) -> str:
+        raw = json.dumps(data, separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b'=').decode()
+
+    return f'{segment({"alg": "none", "typ": "JWT"})}.{segment(payload)}.stub'
+
+
+def decode_token(token: str) -> dict:
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        return json.loads(base64.urlsafe_b64decode(payload))
+    except (IndexError, ValueError):
+        return {}
+
+
+class StubBackendData:
+    """
+    Синтетические данные бэкенда, масштабируемые параметрами.
+
+    :param washes: Количество автомоек.
+    :param boxes_per_wash: Количество боксов на автомойку.
+    :param bookings_per_day: Букингов в день на автомойку.
+    :param catalog_size: Количество брендов в каталоге автомобилей.
+    :param days: Сколько дней вокруг сегодняшнего заполнять букингами.
+    :param seed: Зерно генератора для воспроизводимости.
+    """
+
+    def __init__(
+        self,
+        washes: int = 5,
+        boxes_per_wash: int = 3,
+        bookings_per_day: int = 8,
+        catalog_size: int = 50,
+        days: int = 14,
+        seed: int = 0,
+        today: date = None,
+    ):
+        self.random = random.Random(seed)
+        self.today = today or date.today()
+        self.next_ids: dict[str, int] = {}
+
+        self.body_types = [
+            {'id': index, 'name': name}
+            for index, name in enumerate(BODY_TYPES, start=1)
+        ]
+        self.users = [
+            self.make_user('admin', 'admin'),
+            self.make_user('user', 'user'),
+        ]
+        self.locations = []
+        self.car_washes = []
+        self.boxes = []
+        self.schedules = []
+        self.prices = []
+        self.brands = []
+        self.models = []
+        self.generations = []
+        self.configurations = []
+        self.cars = []
+        self.bookings = []
+
+        self.generate_catalog(catalog_size)
+        for _ in range(washes):
+            self.generate_car_wash(boxes_per_wash)
+        self.generate_clients(max(1, bookings_per_day))
+        self.generate_bookings(bookings_per_day, days)
+
+    def next_id(self, collection: str) -> int:
+        self.next_ids[collection] = self.next_ids.get(collection, 0) + 1
+        return self.next_ids[collection]
+
+    def make_user(self, username: str, role: str) -> dict:
+        user_id = self.next_id('users')
+        return {
+            'id': user_id,
+            'username': username,
+            'first_name': f'Имя{user_id}',
+            'last_name': f'Фамилия{user_id}',
+            'email': f'{username}@example.com',
+            'phone_number': f'+7700{user_id:07d}',
+            'image_link': None,
+            'is_verified': True,
+            'role': {'id': 1 if role == 'admin' else 2, 'name': role},
+        }
+
+    def generate_catalog(self, catalog_size: int):
+        for brand_index in range(1, catalog_size + 1):
+            brand = {
+                'id': self.next_id('brands'),
+                'name': f'Brand{brand_index}',
+            }
+            self.brands.append(brand)
+            for model_index in range(1, 4):
+                model = {
+                    'id': self.next_id('models'),
+                    'name': f'Model{model_index}',
+                    'brand_id': brand['id'],
+                }
+                self.models.append(model)
+                for generation_index in range(1, 3):
+                    year = 2000 + 8 * generation_index
+                    roman = 'I' * generation_index
+                    generation = {
+                        'id': self.next_id('generations'),
+                        'name': f'{roman} ({year}-{year + 7})',
+                        'model_id': model['id'],
+                    }
+                    self.generations.append(generation)
+                    self.configurations.append(
+                        {
+                            'id': self.next_id('configurations'),
+                            'generation_id': generation['id'],
+                            'body_type_id': self.random.choice(
+                                self.body_types
+                            )['id'],
+                        }
+                    )
+
+    def generate_car_wash(self, boxes_per_wash: int):
+        location = {
+            'id': self.next_id('locations'),
+            'city': 'Алматы',
+            'address': f'ул. Тестовая, {len(self.locations) + 1}',
+            'latitude': round(43.2 + self.random.uniform(-0.1, 0.1), 6),
+            'longitude': round(76.9 + self.random.uniform(-0.1, 0.1), 6),
+        }
+        self.locations.append(location)
+
+        car_wash = {
+            'id': self.next_id('car_washes'),
+            'name': f'Автомойка {len(self.car_washes) + 1}',
+            'image_link': None,
+            'phone_number': f'+7727{location["id"]:07d}',
+            'location_id': location['id'],
+        }
+        self.car_washes.append(car_wash)
+
+        for box_index in range(1, boxes_per_wash + 1):
+            self.boxes.append(
+                {
+                    'id': self.next_id('boxes'),
+                    'name': f'Бокс {box_index}',
+                    'car_wash_id': car_wash['id'],
+                }
+            )
+
+        for day_of_week in range(7):
+            self.schedules.append(
+                {
+                    'id': self.next_id('schedules'),
+                    'car_wash_id': car_wash['id'],
+                    'day_of_week': day_of_week,
+                    'start_time': '08:00:00',
+                    'end_time': '22:00:00',
+                    'is_available': True,
+                }
+            )
+
+        for body_type in self.body_types:
+            self.prices.append(
+                {
+                    'id': self.next_id('prices'),
+                    'car_wash_id': car_wash['id'],
+                    'body_type_id': body_type['id'],
+                    'price': str(self.random.randrange(3000, 9000, 500)),
+                }
+            )
+
+    def generate_clients(self, clients: int):
+        for index in range(clients):
+            user = self.make_user(f'client{index + 1}', 'user')
+            self.users.append(user)
+            self.add_car(user['id'])
+        self.add_car(self.users[1]['id'])
+
+    def add_car(self, user_id: int) -> dict:
+        configuration = self.random.choice(self.configurations)
+        generation = next(
+            g
+            for g in self.generations
+            if g['id'] == configuration['generation_id']
+        )
+        model = next(
+            m for m in self.models if m['id'] == generation['model_id']
+        )
+        brand = next(b for b in self.brands if b['id'] == model['brand_id'])
+        body_type = self.body_type_name(configuration['body_type_id'])
+        car = {
+            'id': self.next_id('cars'),
+            'user_id': user_id,
+            'configuration_id': configuration['id'],
+            'name': (
+                f'{brand["name"]} {model["name"]} '
+                f'{generation["name"]} {body_type}'
+            ),
+            'license_plate': f'{self.random.randrange(100, 999)}ABC02',
+        }
+        self.cars.append(car)
+        return car
+
+    def body_type_name(self, body_type_id: int) -> str:
+        return next(
+            bt['name'] for bt in self.body_types if bt['id'] == body_type_id
+        )
+
+    def generate_bookings(self, bookings_per_day: int, days: int):
+        for car_wash in self.car_washes:
+            boxes = [
+                b for b in self.boxes if b['car_wash_id'] == car_wash['id']
+            ]
+            if not boxes:
+                continue
+            for offset in range(-days // 2, days - days // 2):
+                day = self.today + timedelta(days=offset)
+                slots = [
+                    (box, hour) for box in boxes for hour in range(8, 21, 2)
+                ]
+                self.random.shuffle(slots)
+                for box, hour in slots[:bookings_per_day]:
+                    start = datetime.combine(day, datetime.min.time()).replace(
+                        hour=hour
+                    )
+                    state = (
+                        'COMPLETED'
+                        if offset < 0
+                        else self.random.choice(BOOKING_STATES[:2])
+                    )
+                    self.add_booking(
+                        {
+                            'box_id': box['id'],
+                            'user_car_id': self.random.choice(self.cars)['id'],
+                            'state': state,
+                            'notes': '',
+                            'start_datetime': start.isoformat(),
+                            'end_datetime': (
+                                start + timedelta(hours=2)
+                            ).isoformat(),
+                        }
+                    )
+
+    def add_booking(self, booking_data: dict) -> dict:
+        box = self.find('boxes', booking_data['box_id'])
+        car = self.find('cars', booking_data['user_car_id'])
+        user = self.find('users', car['user_id']) if car else None
+        booking = {
+            'id': self.next_id('bookings'),
+            'box_id': booking_data['box_id'],
+            'car_wash_id': box['car_wash_id'] if box else None,
+            'user_car_id': booking_data['user_car_id'],
+            'user_id': car['user_id'] if car else None,
+            'state': booking_data.get('state', 'CREATED'),
+            'notes': booking_data.get('notes', ''),
+            'start_datetime': booking_data['start_datetime'],
+            'end_datetime': booking_data['end_datetime'],
+            'total_price': str(self.random.randrange(3000, 12000, 500)),
+            'additions': [],
+            'user_car': dict(car, user=user) if car else None,
+            'updated_at': timestamp(),
+        }
+        self.bookings.append(booking)
+        return booking
+
+    def find(self, collection: str, item_id: int) -> dict:
+        return next(
+            (
+                item
+                for item in getattr(self, collection)
+                if item['id'] == item_id
+            ),
+            None,
+        )
+
+    def available_times(self, car_wash_id: int, day: date) -> dict:
+        """Свободные интервалы по боксам с учётом расписания и букингов."""
+        schedule = next(
+            (
+                s
+                for s in self.schedules
+                if s['car_wash_id'] == car_wash_id
+                and s['day_of_week'] == day.weekday()
+                and s['is_available']
+            ),
+            None,
+        )
+        if schedule is None:
+            return {}
+
+        day_start = datetime.combine(
+            day, datetime.strptime(schedule['start_time'], '%H:%M:%S').time()
+        )
+        day_end = datetime.combine(
+            day, datetime.strptime(schedule['end_time'], '%H:%M:%S').time()
+        )
+
+        available = {}
+        for box in self.boxes:
+            if box['car_wash_id'] != car_wash_id:
+                continue
+            busy = sorted(
+                (
+                    datetime.fromisoformat(b['start_datetime']),
+                    datetime.fromisoformat(b['end_datetime']),
+                )
+                for b in self.bookings
+                if b['box_id'] == box['id']
+                and b['start_datetime'].startswith(day.isoformat())
+            )
+            ranges = []
+            cursor = day_start
+            for start, end in busy:
+                if start > cursor:
+                    ranges.append([cursor.isoformat(), start.isoformat()])
+                cursor = max(cursor, end)
+            if cursor < day_end:
+                ranges.append([cursor.isoformat(), day_end.isoformat()])
+            if ranges:
+                available[str(box['id'])] = ranges
+        return available
+
+
+class StubBackend:
+    """
+    Локальная замена бэкенда на httpx.MockTransport.
+
+    Реализует эндпоинты, которые использует BackendApi, поверх
+    StubBackendData и умеет добавлять искусственную задержку:
+    общую (latency + случайный jitter) или по шаблону эндпоинта,
+    например {'GET /car_washes/{id}/available_times': 0.3}.
+    """
+
+    def __init__(
+        self,
+        data: StubBackendData = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        endpoint_latency: dict[str, float] = None,
+        seed: int = 0,
+    ):
+        self.data = data or StubBackendData(seed=seed)
+        self.latency = latency
+        self.jitter = jitter
+        self.endpoint_latency = endpoint_latency or {}
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.request_count = 0
+        self.routes = [
+            ('POST', r'/jwt/token', self.issue_token),
+            ('POST', r'/jwt/refresh', self.refresh_token),
+            ('POST', r'/jwt/register', self.register_user),
+            ('GET', r'/users/me', self.get_me),
+            ('GET', r'/users/(\d+)', self.get_user),
+            ('PATCH', r'/users/(\d+)', self.update_user),
+            ('GET', r'/car_washes', self.list_car_washes),
+            ('GET', r'/car_washes/(\d+)', self.get_car_wash),
+            ('PATCH', r'/car_washes/(\d+)', self.update_car_wash),
+            (
+                'GET',
+                r'/car_washes/(\d+)/available_times',
+                self.get_available_times,
+            ),
+            ('GET', r'/car_washes/locations', self.list('locations')),
+            ('GET', r'/car_washes/locations/(\d+)', self.get('locations')),
+            ('GET', r'/car_washes/boxes', self.list('boxes')),
+            ('POST', r'/car_washes/boxes', self.create('boxes')),
+            ('GET', r'/car_washes/boxes/(\d+)', self.get('boxes')),
+            ('PATCH', r'/car_washes/boxes/(\d+)', self.update('boxes')),
+            ('DELETE', r'/car_washes/boxes/(\d+)', self.delete('boxes')),
+            ('GET', r'/car_washes/schedules', self.list('schedules')),
+            ('POST', r'/car_washes/schedules', self.create('schedules')),
+            (
+                'PATCH',
+                r'/car_washes/schedules/(\d+)',
+                self.update('schedules'),
+            ),
+            (
+                'DELETE',
+                r'/car_washes/schedules/(\d+)',
+                self.delete('schedules'),
+            ),
+            ('GET', r'/car_washes/prices', self.list('prices')),
+            ('POST', r'/car_washes/prices', self.create('prices')),
+            ('PATCH', r'/car_washes/prices/(\d+)', self.update('prices')),
+            ('DELETE', r'/car_washes/prices/(\d+)', self.delete('prices')),
+            ('GET', r'/car_washes/bookings', self.list('bookings')),
+            ('POST', r'/car_washes/bookings', self.create_booking),
+            ('GET', r'/car_washes/bookings/(\d+)', self.get('bookings')),
+            ('PATCH', r'/car_washes/bookings/(\d+)', self.update('bookings')),
+            (
+                'DELETE',
+                r'/car_washes/bookings/(\d+)',
+                self.delete('bookings'),
+            ),
+            ('GET', r'/cars', self.list('cars')),
+            ('POST', r'/cars', self.create_car),
+            ('GET', r'/cars/(\d+)', self.get('cars')),
+            ('DELETE', r'/cars/(\d+)', self.delete('cars')),
+            ('GET', r'/cars/brands', self.list('brands')),
+            ('GET', r'/cars/models', self.list('models')),
+            ('GET', r'/cars/generations', self.list('generations')),
+            ('GET', r'/cars/configurations', self.list('configurations')),
+            ('GET', r'/cars/body_types', self.list('body_types')),
+        ]
+        self.routes = [
+            (method, re.compile(f'{pattern}/?'), handler)
+            for method, pattern, handler in self.routes
+        ]
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.sleep(request)
+        with self.lock:
+            self.request_count += 1
+            for method, pattern, handler in self.routes:
+                match = pattern.fullmatch(request.url.path)
+                if method == request.method and match:
+                    return handler(request, *map(int, match.groups()))
+        logger.warning('Stub: нет обработчика для %s', request.url)
+        return httpx.Response(404, json={'detail': 'Not Found'})
+
+    def sleep(self, request: httpx.Request):
+        endpoint = endpoint_name(request.method, request.url)
+        delay = self.endpoint_latency.get(endpoint, self.latency)
+        if self.jitter:
+            with self.lock:
+                delay += self.random.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    # Общие обработчики коллекций
+
+    def list(self, collection: str):
+        def handler(request: httpx.Request) -> httpx.Response:
+            params = dict(request.url.params)
+            page = int(params.pop('page', 1))
+            limit = int(params.pop('limit', 50))
+            params.pop('order_by', None)
+            updated_since = params.pop('updated_since', None)
+            if collection == 'configurations':
+                configuration_id = params.pop('configuration_id', None)
+                if configuration_id is not None:
+                    params['id'] = configuration_id
+
+            items = [
+                item
+                for item in getattr(self.data, collection)
+                if all(
+                    str(item.get(field)) == value
+                    for field, value in params.items()
+                )
+                and (
+                    updated_since is None
+                    or item.get('updated_at', '') > updated_since
+                )
+            ]
+            return self.paginate(items, page, limit)
+
+        return handler
+
+    def get(self, collection: str):
+        def handler(request: httpx.Request, item_id: int) -> httpx.Response:
+            item = self.data.find(collection, item_id)
+            if item is None:
+                return httpx.Response(404, json={'detail': 'Not Found'})
+            return httpx.Response(200, json=item)
+
+        return handler
+
+    def create(self, collection: str):
+        def handler(request: httpx.Request) -> httpx.Response:
+            item = dict(json.loads(request.content or b'{}'))
+            item['id'] = self.data.next_id(collection)
+            getattr(self.data, collection).append(item)
+            return httpx.Response(200, json=item)
+
+        return handler
+
+    def update(self, collection: str):
+        def handler(request: httpx.Request, item_id: int) -> httpx.Response:
+            item = self.data.find(collection, item_id)
+            if item is None:
+                return httpx.Response(404, json={'detail': 'Not Found'})
+            item.update(json.loads(request.content or b'{}'))
+            if 'updated_at' in item:
+                item['updated_at'] = timestamp()
+            return httpx.Response(200, json=item)
+
+        return handler
+
+    def delete(self, collection: str):
+        def handler(request: httpx.Request, item_id: int) -> httpx.Response:
+            items = getattr(self.data, collection)
+            item = self.data.find(collection, item_id)
+            if item is None:
+                return httpx.Response(404, json={'detail': 'Not Found'})
+            items.remove(item)
+            return httpx.Response(200, json=item)
+
+        return handler
+
+    def paginate(self, items: list, page: int, limit: int) -> httpx.Response:
+        offset = (page - 1) * limit
+        has_next = offset + limit < len(items)
+        return httpx.Response(
+            200,
+            json={
+                'data': items[offset : offset + limit],
+                'total': len(items),
+                'page': page,
+                'next': page + 1 if has_next else None,
+            },
+        )
+
+    # Авторизация и пользователи
+
+    def tokens_for(self, user: dict) -> dict:
+        now = int(time.time())
+        return {
+            'access_token': encode_token(
+                {'sub': str(user['id']), 'exp': now + 15 * 60}
+            ),
+            'refresh_token': encode_token(
+                {'sub': str(user['id']), 'exp': now + 7 * 24 * 3600}
+            ),
+            'token_type': 'bearer',
+        }
+
+    def current_user(self, request: httpx.Request) -> dict:
+        authorization = request.headers.get('authorization', '')
+        payload = decode_token(authorization.removeprefix('Bearer '))
+        if payload.get('exp', 0) < time.time():
+            return None
+        return self.data.find('users', int(payload.get('sub', 0)))
+
+    def issue_token(self, request: httpx.Request) -> httpx.Response:
+        form = parse_qs(request.content.decode())
+        username = form.get('username', [''])[0]
+        user = next(
+            (u for u in self.data.users if u['username'] == username), None
+        )
+        if user is None:
+            return httpx.Response(401, json={'detail': 'Invalid credentials'})
+        return httpx.Response(200, json=self.tokens_for(user))
+
+    def refresh_token(self, request: httpx.Request) -> httpx.Response:
+        token = json.loads(request.content or b'{}').get('refresh_token', '')
+        payload = decode_token(token)
+        user = self.data.find('users', int(payload.get('sub', 0)))
+        if user is None or payload.get('exp', 0) < time.time():
+            return httpx.Response(401, json={'detail': 'Token has expired'})
+        return httpx.Response(200, json=self.tokens_for(user))
+
+    def register_user(self, request: httpx.Request) -> httpx.Response:
+        user = self.data.make_user(f'new{self.request_count}', 'user')
+        self.data.users.append(user)
+        return httpx.Response(200, json=self.tokens_for(user))
+
+    def get_me(self, request: httpx.Request) -> httpx.Response:
+        user = self.current_user(request)
+        if user is None:
+            return httpx.Response(401, json={'detail': 'Token has expired'})
+        return httpx.Response(200, json=user)
+
+    def get_user(self, request: httpx.Request, user_id: int):
+        return self.get('users')(request, user_id)
+
+    def update_user(self, request: httpx.Request, user_id: int):
+        user = self.data.find('users', user_id)
+        if user is None:
+            return httpx.Response(404, json={'detail': 'Not Found'})
+        return httpx.Response(200, json=user)
+
+    # Автомойки и букинги
+
+    def list_car_washes(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get('page', 1))
+        limit = int(request.url.params.get('limit', 10))
+        return self.paginate(self.data.car_washes, page, limit)
+
+    def get_car_wash(self, request: httpx.Request, car_wash_id: int):
+        return self.get('car_washes')(request, car_wash_id)
+
+    def update_car_wash(self, request: httpx.Request, car_wash_id: int):
+        return self.get('car_washes')(request, car_wash_id)
+
+    def get_available_times(self, request: httpx.Request, car_wash_id: int):
+        day = date.fromisoformat(request.url.params.get('date'))
+        return httpx.Response(
+            200,
+            json={
+                'available_times': self.data.available_times(car_wash_id, day)
+            },
+        )
+
+    def create_booking(self, request: httpx.Request) -> httpx.Response:
+        booking = self.data.add_booking(json.loads(request.content))
+        return httpx.Response(201, json=booking)
+
+    def create_car(self, request: httpx.Request) -> httpx.Response:
+        user = self.current_user(request) or self.data.users[1]
+        car = self.data.add_car(user['id'])
+        return httpx.Response(200, json=car)
+
+
+shared_stub_backend = None
+
+
+def get_shared_stub_backend() -> StubBackend:
+    """Один стаб на процесс, чтобы данные жили между экранами."""
+    global shared_stub_backend
+    if shared_stub_backend is None:
+        from washer.config import config
+
+        shared_stub_backend = StubBackend(latency=config.stub_backend_latency)
+    return shared_stub_backend
+
+
+def main():
+    from washer.api_requests import BackendApi
+    from washer.metrics import request_metrics
+
+    parser = argparse.ArgumentParser(
+        description='Нагрузочный прогон BackendApi против локального стаба.'
+    )
+    parser.add_argument('--washes', type=int, default=5)
+    parser.add_argument('--boxes', type=int, default=3)
+    parser.add_argument('--bookings-per-day', type=int, default=8)
+    parser.add_argument('--catalog-size', type=int, default=50)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--format', choices=['json', 'prometheus'], default='json'
+    )
+    args = parser.parse_args()
+
+    stub = StubBackend(
+        StubBackendData(
+            washes=args.washes,
+            boxes_per_wash=args.boxes,
+            bookings_per_day=args.bookings_per_day,
+            catalog_size=args.catalog_size,
+            seed=args.seed,
+        ),
+        latency=args.latency,
+        jitter=args.jitter,
+        seed=args.seed,
+    )
+    api = BackendApi(transport=stub.transport())
+    api.login('user', 'password')
+
+    for _ in range(args.iterations):
+        for car_wash in stub.data.car_washes:
+            api.get_schedules(car_wash['id'])
+            api.get_boxes(car_wash['id'])
+            api.get_prices(car_wash['id'])
+            api.get_available_times(
+                car_wash['id'], stub.data.today.isoformat()
+            )
+            api.get_bookings(car_wash['id'])
+        api.get_car_washes(page=1)
+        api.get_brands()
+
+    if args.format == 'json':
+        print(request_metrics.to_json())
+    else:
+        print(request_metrics.to_prometheus())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+import base64
+import json
+import time
+
+import httpx
+
+from washer.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Ближе к истечению токен обновляется синхронно, перед запросом
+BLOCKING_REFRESH_MARGIN = 5.0
+
+
+def token_expiry(token: str) -> float:
+    """
+    Время истечения JWT (exp) без проверки подписи. Возвращает None,
+    если токен не удалось разобрать.
+    """
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))['exp'])
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class TokenAuth(httpx.Auth):
+    """
+    Авторизация запросов BackendApi с обновлением access-токена.
+
+    Перед запросом токен, который скоро истечёт, обновляется в фоне,
+    а уже почти истёкший — синхронно. На 401 токен обновляется и запрос
+    повторяется один раз. Само обновление выполняет
+    BackendApi.refresh_access_token, который объединяет одновременные
+    вызовы в один запрос к /jwt/refresh.
+    """
+
+    def __init__(self, api, refresh_margin: float):
+        self.api = api
+        self.refresh_margin = refresh_margin
+
+    def auth_flow(self, request: httpx.Request):
+        authorized = request.headers.get('Authorization', '').startswith(
+            'Bearer '
+        )
+        if not authorized or self.api.access_token is None:
+            yield request
+            return
+
+        self.ensure_fresh_token()
+        token = self.api.access_token
+        request.headers['Authorization'] = f'Bearer {token}'
+        response = yield request
+
+        if response.status_code != 401 or not self.api.refresh_token:
+            return
+
+        logger.debug('401 для %s, обновляем токен', request.url.path)
+        tokens = self.api.refresh_access_token(stale_token=token)
+        if 'error' in tokens:
+            return
+        request.headers['Authorization'] = f'Bearer {self.api.access_token}'
+        yield request
+
+    def ensure_fresh_token(self):
+        # Токен и срок читаются до обновления: если другой поток успеет
+        # обновить токен раньше, refresh_access_token увидит это и не
+        # потратит уже сменённый refresh-токен повторно
+        token = self.api.access_token
+        expires_at = self.api.token_expires_at
+        if expires_at is None or not self.api.refresh_token:
+            return
+
+        remaining = expires_at - time.time()
+        if remaining <= BLOCKING_REFRESH_MARGIN:
+            self.api.refresh_access_token(stale_token=token)
+        elif remaining <= self.refresh_margin:
+            self.api.refresh_in_background(stale_token=token)
@@ -1,6 +1,9 @@
 import flet as ft
 
 from washer.api_requests import BackendApi
+from washer.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class AccountEditPage:
@@ -128,14 +131,14 @@ class AccountEditPage:
         self.page.update()
 
     def save_changes(self, e=None):
-        print('Saving account changes')
+        logger.debug('Saving account changes')
         updated_username = self.username_field.value.strip()
         updated_first_name = self.first_name_field.value.strip()
         updated_last_name = self.last_name_field.value.strip()
 
-        print(f'Updated username: {updated_username}')
-        print(f'Updated first name: {updated_first_name}')
-        print(f'Updated last name: {updated_last_name}')
+        logger.debug('Updated username: %s', updated_username)
+        logger.debug('Updated first name: %s', updated_first_name)
+        logger.debug('Updated last name: %s', updated_last_name)
 
         new_values = {
             'username': updated_username or self.user_data.get('username'),
@@ -145,35 +148,35 @@ class AccountEditPage:
             'role_id': 2,
         }
 
-        print(f'New values to update: {new_values}')
+        logger.debug('New values to update: %s', new_values)
 
         try:
-            print('Sending request to update user data')
+            logger.debug('Sending request to update user data')
             response = self.api.update_user_data(
                 self.user_data['id'], new_values
             )
-            print(f'Update user data response: {response}')
+            logger.debug('Update user data response: %s', response)
         except Exception as ex:
+            logger.debug('Ошибка при обновлении данных: %s', ex)
             error_message = f'Ошибка при обновлении данных: {str(ex)}'
-            print(error_message)
             self.show_error_message(error_message)
             return
 
         if response and response.get('status_code') == 200:
-            print('Данные успешно обновлены')
+            logger.debug('Данные успешно обновлены')
             self.show_success_message('Данные успешно обновлены')
             if self.on_save_callback:
-                print('Calling on_save_callback')
+                logger.debug('Calling on_save_callback')
                 self.on_save_callback()
         else:
             error_message = response.get('error', 'Неизвестная ошибка')
-            print(f'Ошибка при обновлении данных: {error_message}')
+            logger.error('Ошибка при обновлении данных: %s', error_message)
             self.show_error_message(
                 f'Ошибка при обновлении данных: {error_message}'
             )
 
     def go_back(self, e):
-        print('Navigating back to AccountSettingsPage')
+        logger.debug('Navigating back to AccountSettingsPage')
         from washer.ui_components.account_settings_page import (
             AccountSettingsPage,
         )
@@ -181,16 +184,16 @@ class AccountEditPage:
         AccountSettingsPage(self.page, self.api)
 
     def show_snack_bar(self, message: str, bgcolor: str = ft.colors.RED):
-        print(f'Показываем сообщение в SnackBar: {message}')
+        logger.debug('Показываем сообщение в SnackBar: %s', message)
         self.snack_bar.content.value = message
         self.snack_bar.bgcolor = bgcolor
         self.snack_bar.open = True
         self.page.update()
 
     def show_success_message(self, message: str):
-        print(f'Showing success message: {message}')
+        logger.debug('Showing success message: %s', message)
         self.show_snack_bar(message, bgcolor=ft.colors.GREEN)
 
     def show_error_message(self, message: str):
-        print(f'Showing error message: {message}')
+        logger.error('Showing error message: %s', message)
         self.show_snack_bar(message, bgcolor=ft.colors.RED)
@@ -1,28 +1,33 @@
 import flet as ft
 
 from washer.api_requests import BackendApi
+from washer.images import AVATAR_UPLOAD_SIZE, prepare_upload
+from washer.logger import get_logger
 from washer.ui_components.account_edit_page import AccountEditPage
 from washer.ui_components.password_change_page import PasswordChangePage
 from washer.ui_components.sign_in_page import SignInPage
+from washer.ui_components.upload_progress_dialog import UploadProgressDialog
+from washer.uploads import UploadCancelled
+
+logger = get_logger(__name__)
 
 
 class AccountSettingsPage:
     def __init__(self, page: ft.Page, api: BackendApi = None):
         self.page = page
-        self.api = api if api else BackendApi()
+        self.api = api or BackendApi.for_page(self.page)
         self.user_data = {}
 
         self.setup_snack_bar()
 
-        self.access_token = self.page.client_storage.get('access_token')
-        if not self.access_token:
-            print('Access token не найден, перенаправление на страницу входа.')
+        if not self.api.access_token:
+            logger.warning(
+                'Access token не найден, перенаправление на страницу входа.',
+            )
             self.redirect_to_sign_in_page()
             return
 
-        self.api.set_access_token(self.access_token)
-
-        self.selected_image_bytes = None
+        self.selected_image = None
         self.avatar_container = self.create_avatar_container()
         self.file_picker = self.create_file_picker()
         self.page.overlay.append(self.file_picker)
@@ -106,15 +111,18 @@ class AccountSettingsPage:
         )
 
     def load_user_data(self):
-        print(
-            'Заголовки запроса для получения данных пользователя:',
+        logger.debug(
+            'Заголовки запроса для получения данных пользователя: %s',
             self.api.get_headers(),
         )
 
         self.user_data = self.api.get_logged_user()
 
         if 'error' not in self.user_data:
-            print('Данные пользователя успешно загружены:', self.user_data)
+            logger.debug(
+                'Данные пользователя успешно загружены: %s',
+                self.user_data,
+            )
             avatar_url = self.user_data.get('image_link')
             if avatar_url:
                 self.avatar_container.content = ft.Image(
@@ -131,7 +139,10 @@ class AccountSettingsPage:
             self.show_account_settings()
         else:
             error_message = self.user_data['error']
-            print('Ошибка при загрузке данных пользователя:', error_message)
+            logger.error(
+                'Ошибка при загрузке данных пользователя: %s',
+                error_message,
+            )
             self.page.clean()
             self.page.drawer = None
             self.page.add(
@@ -299,38 +310,51 @@ class AccountSettingsPage:
         if e.files:
             file = e.files[0]
             try:
-                self.selected_image_bytes = file.content
                 self.avatar_container.content = ft.Image(
-                    src=ft.ImageSource.bytes(self.selected_image_bytes),
+                    src=file.path,
                     width=100,
                     height=100,
                     fit=ft.ImageFit.COVER,
                     border_radius=ft.border_radius.all(50),
                 )
                 self.page.update()
+                self.selected_image = file.path
                 self.upload_avatar_to_server()
             except Exception as ex:
+                logger.debug('Ошибка при обработке файла: %s', ex)
                 error_message = f'Ошибка при обработке файла: {str(ex)}'
-                print(error_message)
                 self.show_error_message(error_message)
 
     def upload_avatar_to_server(self):
         user_id = self.user_data.get('id')
-        if not user_id or not self.selected_image_bytes:
-            print('Необходимые данные отсутствуют для обновления аватара.')
+        if not user_id or not self.selected_image:
+            logger.warning(
+                'Необходимые данные отсутствуют для обновления аватара.',
+            )
             self.show_error_message(
                 'Необходимые данные отсутствуют для обновления аватара.'
             )
             return
 
+        progress_dialog = UploadProgressDialog(self.page)
+        progress_dialog.open()
+        self.page.run_thread(self.send_avatar, user_id, progress_dialog)
+
+    def send_avatar(self, user_id, progress_dialog: UploadProgressDialog):
         try:
-            response = self.api.update_user_with_avatar(
-                user_id=user_id,
-                new_values={},
-                image_bytes=self.selected_image_bytes,
-            )
+            with prepare_upload(
+                self.selected_image, AVATAR_UPLOAD_SIZE
+            ) as image:
+                response = self.api.update_user_with_avatar(
+                    user_id=user_id,
+                    new_values={},
+                    image=image,
+                    on_progress=progress_dialog.on_progress,
+                    cancel=progress_dialog.cancel,
+                )
+            progress_dialog.close()
             if response and response.status_code == 200:
-                print('Аватар успешно обновлен.')
+                logger.debug('Аватар успешно обновлен.')
                 self.show_success_message('Аватар успешно обновлен!')
                 self.load_user_data()
             else:
@@ -338,13 +362,17 @@ class AccountSettingsPage:
                     response.text
                     or 'Неизвестная ошибка при обновлении аватара.'
                 )
-                print(f'Ошибка при обновлении аватара: {error_text}')
+                logger.error('Ошибка при обновлении аватара: %s', error_text)
                 self.show_error_message(
                     f'Ошибка при обновлении аватара: {error_text}'
                 )
+        except UploadCancelled:
+            progress_dialog.close()
+            logger.debug('Загрузка аватара отменена.')
         except Exception as e:
+            progress_dialog.close()
+            logger.debug('Ошибка при обновлении аватара: %s', e)
             error_message = f'Ошибка при обновлении аватара: {str(e)}'
-            print(error_message)
             self.show_error_message(error_message)
 
     def return_to_profile(self, e):
@@ -371,7 +399,7 @@ class AccountSettingsPage:
         bgcolor: str = ft.colors.GREEN,
         text_color: str = ft.colors.WHITE,
     ):
-        print(f'Показываем сообщение: {message}')
+        logger.debug('Показываем сообщение: %s', message)
 
         self.snack_bar.content.value = message
         self.snack_bar.content.color = text_color
@@ -388,7 +416,7 @@ class AccountSettingsPage:
         self.show_snack_bar(message, bgcolor=ft.colors.RED)
 
     def open_account_edit_page(self, e):
-        print('Opening AccountEditPage')
+        logger.debug('Opening AccountEditPage')
         AccountEditPage(
             self.page, self.user_data, self.on_account_updated, self.api
         )
@@ -398,7 +426,7 @@ class AccountSettingsPage:
         self.load_user_data()
 
     def open_password_change_page(self, e):
-        print('Opening PasswordChangePage')
+        logger.debug('Opening PasswordChangePage')
         PasswordChangePage(
             self.page, self.user_data, self.on_password_changed, self.api
         )
@@ -408,22 +436,23 @@ class AccountSettingsPage:
         self.show_success_message('Пароль успешно изменен.')
 
     def on_phone_click(self, e):
-        print("Кнопка 'Номер телефона' нажата")
+        logger.debug("Кнопка 'Номер телефона' нажата")
         # Пока без логики, можно добавить заглушку или оставить пустым
         pass
 
     def on_logout_click(self, e):
+        self.api.logout()
         self.page.client_storage.clear()
         self.redirect_to_sign_in_page()
 
     def on_delete_account_click(self, e):
-        print('Delete Account button clicked')
+        logger.debug('Delete Account button clicked')
         # Логика удаления аккаунта будет добавлена позже
         self.show_error_message(
             'Функция удаления аккаунта пока не реализована.'
         )
 
     def open_about_page(self, e):
-        print("Открыта кнопка 'О приложении'")
+        logger.debug("Открыта кнопка 'О приложении'")
         # Пока без логики. В будущем можно добавить диалог или новую страницу.
         pass
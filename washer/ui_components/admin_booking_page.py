@@ -2,10 +2,13 @@ import datetime
 import locale
 
 import flet as ft
-import httpx
 
 from washer.api_requests import BackendApi
 from washer.config import config
+from washer.logger import get_logger
+from washer.ui_updates import batched_updates
+
+logger = get_logger(__name__)
 
 
 class AdminSelectCarPage:
@@ -41,8 +44,7 @@ class AdminSelectCarPage:
         self.date = date
         self.time = time
         self.locations = locations
-        self.api = BackendApi()
-        self.api.set_access_token(self.page.client_storage.get('access_token'))
+        self.api = BackendApi.for_page(self.page)
 
         self.car_price = 0
         self.price_text = ft.Text(
@@ -113,7 +115,7 @@ class AdminSelectCarPage:
         try:
             response = self.api.create_booking(booking_data)
             if response.status_code == 200:
-                print('Букинг успешно создан!')
+                logger.debug('Букинг успешно создан!')
                 self.show_success_message('Букинг успешно создан!')
                 self.confirm_button.disabled = True
                 self.page.update()
@@ -131,17 +133,17 @@ class AdminSelectCarPage:
                 )
 
             else:
-                print(f'Ошибка создания букинга: {response.text}')
+                logger.error('Ошибка создания букинга: %s', response.text)
                 self.show_error_message(
                     f'Ошибка создания букинга: {response.text}'
                 )
         except Exception as ex:
-            print(f'Ошибка: {str(ex)}')
+            logger.error('Ошибка: %s', ex)
             self.show_error_message(f'Ошибка: {str(ex)}')
 
     def on_car_saved(self, car):
         self.selected_car = car
-        print(f'Сохраненные данные автомобиля: {car}')
+        logger.debug('Сохраненные данные автомобиля: %s', car)
 
         if (
             self.selected_car
@@ -231,56 +233,20 @@ class AdminSelectCarPage:
             border_radius=ft.border_radius.all(12),
         )
 
-    def refresh_token(self):
-        refresh_token = self.page.client_storage.get('refresh_token')
-        if not refresh_token:
-            print('Refresh token not found, redirecting to login.')
-            return False
-
-        response = httpx.post(
-            f'{self.api_url}/jwt/refresh',
-            json={'refresh_token': refresh_token},
-        )
-
-        if response.status_code == 200:
-            tokens = response.json()
-            self.page.client_storage.set(
-                'access_token', tokens['access_token']
-            )
-            self.page.client_storage.set(
-                'refresh_token', tokens['refresh_token']
-            )
-            return True
-        else:
-            print(f'Error refreshing token: {response.text}')
-            return False
-
     def load_brands(self):
-        access_token = self.page.client_storage.get('access_token')
-        if not access_token:
-            print('Access token not found, redirecting to login.')
+        if not self.api.access_token:
+            logger.warning('Access token not found, redirecting to login.')
             return
 
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Accept': 'application/json',
-        }
-
-        url = f'{self.api_url.rstrip("/")}/cars/brands?limit=1000'
-
-        response = httpx.get(url, headers=headers)
+        response = self.api.get_brands()
 
         if response.status_code == 401:
-            if 'token has expired' in response.text.lower():
-                if self.refresh_token():
-                    self.load_brands()
-                else:
-                    self.page.add(
-                        ft.Text(
-                            'Session expired, please login again.',
-                            color=ft.colors.RED,
-                        )
-                    )
+            self.page.add(
+                ft.Text(
+                    'Session expired, please login again.',
+                    color=ft.colors.RED,
+                )
+            )
         elif response.status_code == 200:
             brands = response.json().get('data', [])
             self.full_brands_list = brands
@@ -348,24 +314,16 @@ class AdminSelectCarPage:
 
         self.update_brands_list(filtered_brands)
 
+    @batched_updates
     def on_brand_select(self, e):
         selected_brand = e.control.data
         brand_id = self.brands_dict.get(selected_brand)
 
         if not brand_id:
-            print('ID марки не найден.')
+            logger.warning('ID марки не найден.')
             return
 
-        access_token = self.page.client_storage.get('access_token')
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Accept': 'application/json',
-        }
-
-        clean_url = self.api_url.rstrip('/')
-        url = f'{clean_url}/cars/models?brand_id={brand_id}&limit=100'
-
-        response = httpx.get(url, headers=headers)
+        response = self.api.get_models(brand_id)
 
         if response.status_code == 200:
             models = response.json().get('data', [])
@@ -394,33 +352,22 @@ class AdminSelectCarPage:
 
         self.close_search_dialog(None)
 
+    @batched_updates
     def on_model_select(self, e):
         selected_model = e.control.value
         self.selected_model_id = self.models_dict.get(selected_model)
 
         if not self.selected_model_id:
-            print('ID модели не найден.')
+            logger.warning('ID модели не найден.')
             return
 
-        access_token = self.page.client_storage.get('access_token')
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Accept': 'application/json',
-        }
-
-        clean_url = self.api_url.rstrip('/')
-        url = (
-            f'{clean_url}/cars/generations'
-            f'?model_id={self.selected_model_id}&limit=100'
-        )
-
-        response = httpx.get(url, headers=headers)
+        response = self.api.get_generations(self.selected_model_id)
 
         if response.status_code == 200:
             generations = response.json().get('data', [])
 
             if not generations:
-                print('Поколения для выбранной модели не найдены.')
+                logger.warning('Поколения для выбранной модели не найдены.')
                 self.generation_dropdown.visible = False
                 return
 
@@ -444,10 +391,11 @@ class AdminSelectCarPage:
                     bgcolor=ft.colors.BLUE,
                 )
 
-                print(
-                    f'Автоматически выбрано поколение: '
-                    f'{self.selected_generation} '
-                    f'({self.generation_codes}) ({self.generation_year_range})'
+                logger.debug(
+                    'Автоматически выбрано поколение: %s (%s) (%s)',
+                    self.selected_generation,
+                    self.generation_codes,
+                    self.generation_year_range,
                 )
                 self.generation_dropdown.visible = False
                 self.get_body_type(self.selected_generation_id)
@@ -490,21 +438,23 @@ class AdminSelectCarPage:
                 self.page.update()
 
         else:
-            print(f'Ошибка при загрузке поколений: {response.text}')
+            logger.error('Ошибка при загрузке поколений: %s', response.text)
 
+    @batched_updates
     def on_generation_select(self, e):
         selected_generation = e.control.value
         self.selected_generation_id = self.generations_dict.get(
             selected_generation
         )
 
-        print(
-            f'Выбранное поколение: {selected_generation}, '
-            f'ID поколения: {self.selected_generation_id}'
+        logger.debug(
+            'Выбранное поколение: %s, ID поколения: %s',
+            selected_generation,
+            self.selected_generation_id,
         )
 
         if not self.selected_generation_id:
-            print('ID поколения не найден.')
+            logger.warning('ID поколения не найден.')
             return
 
         self.selected_generation = selected_generation
@@ -524,24 +474,12 @@ class AdminSelectCarPage:
         self.body_type_dropdown.value = None
         self.body_type_dropdown.visible = False
         self.page.update()
-        print('Скрыт и сброшен dropdown с типом кузова')
+        logger.debug('Скрыт и сброшен dropdown с типом кузова')
 
         self.get_body_type(self.selected_generation_id)
 
     def get_body_type(self, generation_id):
-        access_token = self.page.client_storage.get('access_token')
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Accept': 'application/json',
-        }
-
-        clean_url = self.api_url.rstrip('/')
-        url = (
-            f'{clean_url}/cars/configurations'
-            f'?generation_id={generation_id}&limit=100'
-        )
-
-        response = httpx.get(url, headers=headers)
+        response = self.api.get_configurations(generation_id)
 
         if response.status_code == 200:
             configurations = response.json().get('data', [])
@@ -553,7 +491,10 @@ class AdminSelectCarPage:
                 body_type_id = configurations[0]['body_type_id']
                 body_type_name = self.get_body_type_name(body_type_id)
                 self.selected_body_type = body_type_name
-                print(f'Автоматически выбран тип кузова: {body_type_name}')
+                logger.debug(
+                    'Автоматически выбран тип кузова: %s',
+                    body_type_name,
+                )
 
                 self.show_snack_bar(
                     f'Тип кузова "{body_type_name}" выбран автоматически',
@@ -597,19 +538,20 @@ class AdminSelectCarPage:
                 self.body_type_dropdown.on_change = on_body_type_select
                 self.page.update()
         else:
-            print(f'Ошибка при загрузке конфигураций: {response.text}')
+            logger.error('Ошибка при загрузке конфигураций: %s', response.text)
 
     def load_car_price(self, body_type_id):
-        print(
-            f"Загружаем цену для car_wash_id: "
-            f"{self.car_wash['id']}, body_type_id: {body_type_id}"
+        logger.debug(
+            'Загружаем цену для car_wash_id: %s, body_type_id: %s',
+            self.car_wash['id'],
+            body_type_id,
         )
 
         response = self.api.get_prices(self.car_wash['id'])
 
         if response.status_code == 200:
             prices = response.json().get('data', [])
-            print(f'Цены получены: {prices}')
+            logger.debug('Цены получены: %s', prices)
 
             price = next(
                 (
@@ -622,19 +564,22 @@ class AdminSelectCarPage:
 
             if price:
                 self.car_price = price['price']
-                print(
-                    f'Цена для body_type_id {body_type_id}: {self.car_price}'
+                logger.debug(
+                    'Цена для body_type_id %s: %s',
+                    body_type_id,
+                    self.car_price,
                 )
                 self.show_price()
             else:
-                print(
-                    f'Цена для body_type_id '
-                    f'{body_type_id} не найдена в списке.'
+                logger.warning(
+                    'Цена для body_type_id %s не найдена в списке.',
+                    body_type_id,
                 )
         else:
-            print(
-                f'Ошибка загрузки цены: '
-                f'{response.status_code} - {response.text}'
+            logger.error(
+                'Ошибка загрузки цены: %s - %s',
+                response.status_code,
+                response.text,
             )
 
     def show_price(self):
@@ -642,16 +587,7 @@ class AdminSelectCarPage:
         self.page.update()
 
     def fetch_body_type_names(self, body_type_ids):
-        access_token = self.page.client_storage.get('access_token')
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Accept': 'application/json',
-        }
-
-        clean_url = self.api_url.rstrip('/')
-        url = f'{clean_url}/cars/body_types?limit=100'
-
-        response = httpx.get(url, headers=headers)
+        response = self.api.get_body_types()
 
         if response.status_code == 200:
             body_types = response.json().get('data', [])
@@ -732,7 +668,7 @@ class AdminSelectCarPage:
         bgcolor: str = ft.colors.GREEN,
         text_color: str = ft.colors.WHITE,
     ):
-        print(f'Показываем сообщение: {message}')
+        logger.debug('Показываем сообщение: %s', message)
 
         self.snack_bar.content.value = message
         self.snack_bar.content.color = text_color
@@ -751,9 +687,7 @@ class AdminSelectCarPage:
         self.show_snack_bar(message, bgcolor=ft.colors.RED)
 
     def on_save_click(self, e):
-        access_token = self.page.client_storage.get('access_token')
-
-        if not access_token:
+        if not self.api.access_token:
             self.show_error_message('Токен доступа отсутствует!')
             return
 
@@ -788,15 +722,8 @@ class AdminSelectCarPage:
             'name': full_name,
         }
 
-        api_url = f"{self.api_url.rstrip('/')}/cars"
-
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Accept': 'application/json',
-        }
-
         try:
-            response = httpx.post(api_url, json=selected_car, headers=headers)
+            response = self.api.create_user_car(selected_car)
 
             if response.status_code == 200:
                 self.show_success_message(
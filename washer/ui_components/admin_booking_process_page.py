@@ -6,7 +6,12 @@ from typing import List, Tuple
 import flet as ft
 
 from washer.api_requests import BackendApi
+from washer.car_wash_store import CarWashStore
+from washer.logger import get_logger
 from washer.ui_components.admin_car_selection_page import AdminCarSelectionPage
+from washer.ui_updates import batched_updates
+
+logger = get_logger(__name__)
 
 
 class AdminBookingProcessPage:
@@ -28,10 +33,7 @@ class AdminBookingProcessPage:
         self.selected_car = selected_car
         self.car_price = car_price
 
-        self.api = BackendApi()
-        access_token = self.page.client_storage.get('access_token')
-        if access_token:
-            self.api.set_access_token(access_token)
+        self.api = BackendApi.for_page(self.page)
 
         self.snack_bar = None
         self.page.floating_action_button = None
@@ -87,7 +89,7 @@ class AdminBookingProcessPage:
                 self.selected_car['body_type'] = body_type
 
     def parse_car_name(self, name: str) -> tuple[str, str, str, str]:
-        print(f'Parsing car name: {name}')
+        logger.debug('Parsing car name: %s', name)
 
         body_types = [
             'внедорожник 5 дв',
@@ -136,13 +138,13 @@ class AdminBookingProcessPage:
         )
 
         words = name.split()
-        print(f'Words: {words}')
+        logger.debug('Words: %s', words)
 
         brand = words[0] if words else 'Бренд не указан'
         remaining_words = words[1:] if len(words) > 1 else []
 
-        print(f'Brand: {brand}')
-        print(f'Remaining words: {remaining_words}')
+        logger.debug('Brand: %s', brand)
+        logger.debug('Remaining words: %s', remaining_words)
 
         generation = 'Поколение не указано'
         body_type = 'Тип кузова не указан'
@@ -162,14 +164,18 @@ class AdminBookingProcessPage:
             # Сортируем, чтобы взять самое длинное совпадение
             matches.sort(key=lambda x: (-x[0], x[3]))
             _, generation_index, generation, generation_type = matches[0]
-            print(f'Found generation: {generation} ({generation_type})')
+            logger.debug(
+                'Found generation: %s (%s)',
+                generation,
+                generation_type,
+            )
             # Убираем найденный кусок из remaining_words
             remaining_words = (
                 remaining_words[:generation_index]
                 + remaining_words[generation_index + matches[0][0] :]
             )
         else:
-            print('Generation not found')
+            logger.debug('Generation not found')
 
         matched_body_types = []
         # Ищем тип кузова
@@ -185,18 +191,18 @@ class AdminBookingProcessPage:
             matched_body_types.sort(key=lambda x: x[0])
             body_type_index, body_type = matched_body_types[0]
             remaining_words = remaining_words[:body_type_index]
-            print(f'Found body type: {body_type}')
+            logger.debug('Found body type: %s', body_type)
         else:
-            print('Body type not found')
+            logger.debug('Body type not found')
 
         if remaining_words:
             model = ' '.join(remaining_words)
         else:
             model = 'Модель не указана'
 
-        print(f'Model: {model}')
-        print(f'Generation: {generation}')
-        print(f'Body type: {body_type}')
+        logger.debug('Model: %s', model)
+        logger.debug('Generation: %s', generation)
+        logger.debug('Body type: %s', body_type)
 
         return brand, model, generation, body_type
 
@@ -215,7 +221,7 @@ class AdminBookingProcessPage:
         bgcolor: str = ft.colors.GREEN,
         text_color: str = ft.colors.WHITE,
     ):
-        print(f'Показываем сообщение: {message}')
+        logger.debug('Показываем сообщение: %s', message)
 
         self.snack_bar.content.value = message
         self.snack_bar.content.color = text_color
@@ -231,6 +237,7 @@ class AdminBookingProcessPage:
     def show_error_message(self, message: str):
         self.show_snack_bar(message, bgcolor=ft.colors.RED)
 
+    @batched_updates
     def on_car_selected(self, car, price):
         """
         Метод вызывается, когда пользователь выбрал автомобиль
@@ -238,7 +245,7 @@ class AdminBookingProcessPage:
         """
         self.selected_car = car
         self.car_price = price
-        print(f'Сохраненные данные автомобиля: {car}')
+        logger.debug('Сохраненные данные автомобиля: %s', car)
 
         # Если у автомобиля нет brand/model/generation/body_type,
         # попробуем их получить из parse_car_name
@@ -307,7 +314,10 @@ class AdminBookingProcessPage:
         try:
             response = self.api.create_booking(booking_data)
             if response.status_code == 200:
-                print('Букинг успешно создан!')
+                logger.debug('Букинг успешно создан!')
+                CarWashStore.for_page(
+                    self.page, self.api, self.car_wash
+                ).invalidate('bookings')
                 self.show_success_message('Букинг успешно создан!')
                 self.confirm_button.disabled = True
                 self.page.update()
@@ -324,12 +334,12 @@ class AdminBookingProcessPage:
                 )
 
             else:
-                print(f'Ошибка создания букинга: {response.text}')
+                logger.error('Ошибка создания букинга: %s', response.text)
                 self.show_error_message(
                     f'Ошибка создания букинга: {response.text}'
                 )
         except Exception as ex:
-            print(f'Ошибка: {str(ex)}')
+            logger.error('Ошибка: %s', ex)
             self.show_error_message(f'Ошибка: {str(ex)}')
 
     def show_car_selection_page(self):
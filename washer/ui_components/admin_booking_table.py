@@ -4,6 +4,10 @@ import locale
 import flet as ft
 
 from washer.api_requests import BackendApi
+from washer.car_wash_store import CarWashStore
+from washer.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class AdminBookingTable:
@@ -17,8 +21,7 @@ class AdminBookingTable:
     ):
         self.page = page
         self.car_wash = car_wash
-        self.api = BackendApi()
-        self.api.set_access_token(self.page.client_storage.get('access_token'))
+        self.api = BackendApi.for_page(self.page)
         self.date = date
         self.selected_date = selected_date
         self.locations = locations
@@ -28,6 +31,9 @@ class AdminBookingTable:
         self.available_times = {}
         self.bookings = []
         self.loaded_days = set()
+        self.booking_tabs = None
+        self.store = CarWashStore.for_page(self.page, self.api, self.car_wash)
+        self.booking_store = self.store.bookings
 
         self.booking_colors = {}
 
@@ -65,9 +71,9 @@ class AdminBookingTable:
         self.load_schedules()
 
         if self.selected_date and self.selected_date not in self.loaded_days:
-            print(
-                f'Обновляем доступные слоты '
-                f'для выбранной даты {self.selected_date}'
+            logger.debug(
+                'Обновляем доступные слоты для выбранной даты %s',
+                self.selected_date,
             )
             self.load_available_times(self.selected_date)
 
@@ -75,60 +81,87 @@ class AdminBookingTable:
         self.page.add(app_bar)
         self.page.add(self.create_booking_page())
 
+        self.booking_store.subscribe(
+            'AdminBookingTable', self.on_bookings_changed
+        )
+        self.store.start_feed()
+
     def handle_booking_click(self, e, booking):
         self.open_booking_details_dialog(booking)
 
     def on_car_saved(self, car_data):
-        print(f'Сохраненные данные автомобиля: {car_data}')
+        logger.debug('Сохраненные данные автомобиля: %s', car_data)
 
     def load_bookings(self):
         try:
-            car_wash_id = self.car_wash['id']
-            response = self.api.get_bookings(car_wash_id)
-            if response and response.status_code == 200:
-                bookings_data = response.json().get('data', [])
-
+            bookings_data = self.store.load_bookings()
+            if bookings_data is not None:
                 self.bookings = bookings_data
-
                 for booking in self.bookings:
-                    user_car = booking.get('user_car')
-                    if user_car:
-                        booking['car_name'] = user_car.get(
-                            'name', 'Неизвестно'
-                        )
-                        booking['license_plate'] = user_car.get(
-                            'license_plate', '---'
-                        )
-                        user = user_car.get('user', {})
-                        booking['first_name'] = user.get(
-                            'first_name', 'Неизвестен'
-                        )
-                        booking['last_name'] = user.get('last_name', '')
-                        booking['phone_number'] = user.get(
-                            'phone_number', '---'
-                        )
-                    else:
-                        booking['car_name'] = 'Неизвестно'
-                        booking['license_plate'] = '---'
-                        booking['first_name'] = 'Неизвестен'
-                        booking['last_name'] = ''
-                        booking['phone_number'] = '---'
-
-                    # Корректное присвоение состояния букинга
-                    booking['state'] = booking.get('state', 'CREATED').upper()
-
-                print(
-                    f"Загружено букингов: {len(self.bookings)} "
-                    f"для автомойки {self.car_wash['id']}"
-                )
-            else:
-                print(
-                    f'Ошибка загрузки букингов: '
-                    f'{response.status_code if response else "No response"}, '
-                    f'{response.text if response else ""}'
+                    self.prepare_booking(booking)
+
+                logger.debug(
+                    'Загружено букингов: %s для автомойки %s',
+                    len(self.bookings),
+                    self.car_wash['id'],
                 )
         except Exception as e:
-            print(f'Ошибка при загрузке букингов: {e}')
+            logger.error('Ошибка при загрузке букингов: %s', e)
+
+    def prepare_booking(self, booking):
+        user_car = booking.get('user_car')
+        if user_car:
+            booking['car_name'] = user_car.get('name', 'Неизвестно')
+            booking['license_plate'] = user_car.get('license_plate', '---')
+            user = user_car.get('user', {})
+            booking['first_name'] = user.get('first_name', 'Неизвестен')
+            booking['last_name'] = user.get('last_name', '')
+            booking['phone_number'] = user.get('phone_number', '---')
+        else:
+            booking['car_name'] = 'Неизвестно'
+            booking['license_plate'] = '---'
+            booking['first_name'] = 'Неизвестен'
+            booking['last_name'] = ''
+            booking['phone_number'] = '---'
+
+        # Корректное присвоение состояния букинга
+        booking['state'] = booking.get('state', 'CREATED').upper()
+
+    def on_bookings_changed(self, changed, removed):
+        """
+        Применяет дельту из ленты букингов и перестраивает открытую
+        вкладку, только если изменения касаются её дня.
+        """
+        removed_ids = set(removed)
+        changed_by_id = {booking['id']: booking for booking in changed}
+        affected_dates = {
+            booking['start_datetime'][:10]
+            for booking in self.bookings
+            if booking['id'] in removed_ids or booking['id'] in changed_by_id
+        }
+
+        for booking in changed:
+            self.prepare_booking(booking)
+            affected_dates.add(booking['start_datetime'][:10])
+
+        self.bookings = [
+            changed_by_id.pop(booking['id'], booking)
+            for booking in self.bookings
+            if booking['id'] not in removed_ids
+        ] + list(changed_by_id.values())
+        self.assign_colors_to_created_bookings()
+
+        if self.booking_tabs is None:
+            return
+        selected_index = self.booking_tabs.selected_index
+        day_of_week = self.schedule_data[selected_index]['day_of_week']
+        schedule_date = self.dates_storage[day_of_week]
+        if str(schedule_date) not in affected_dates:
+            return
+
+        self.load_available_times(schedule_date)
+        self.render_tab(selected_index)
+        self.page.update()
 
     def assign_colors_to_created_bookings(self):
         """Назначает цвета букингам со статусом CREATED,"""
@@ -140,9 +173,9 @@ class AdminBookingTable:
         for i, booking in enumerate(created_bookings):
             color = ft.colors.GREY_500 if i % 2 == 0 else ft.colors.GREY_400
             self.booking_colors[booking['id']] = color
-        print(
-            f'Назначено цветов для '
-            f'{len(self.booking_colors)} букингов со статусом CREATED.'
+        logger.debug(
+            'Назначено цветов для %s букингов со статусом CREATED.',
+            len(self.booking_colors),
         )
 
     def generate_timeslots(self, start_time_str, end_time_str):
@@ -162,30 +195,28 @@ class AdminBookingTable:
         if start_time == end_time:
             timeslots.append(end_time.strftime('%H:%M'))
 
-        print(f'Сгенерированные временные слоты: {timeslots}')
+        logger.debug('Сгенерированные временные слоты: %s', timeslots)
         return timeslots
 
     def load_schedules(self):
-        print(
-            f"Загружаем расписание для автомойки с ID: {self.car_wash['id']}"
+        logger.debug(
+            'Загружаем расписание для автомойки с ID: %s',
+            self.car_wash['id'],
         )
-        response = self.api.get_schedules(self.car_wash['id'])
-        if response.status_code == 200:
-            self.schedule_data = [
-                schedule
-                for schedule in response.json().get('data', [])
-                if schedule['car_wash_id'] == self.car_wash['id']
-            ]
+        schedules = self.store.schedules()
+        if schedules is not None:
+            self.schedule_data = schedules
             if not self.schedule_data:
-                print('Нет расписаний для данной автомойки.')
+                logger.warning('Нет расписаний для данной автомойки.')
             else:
                 self.initialize_dates_for_schedule()
                 self.schedule_data.sort(
                     key=lambda x: self.dates_storage.get(x['day_of_week'])
                 )
-                print(f'Загружено расписаний: {len(self.schedule_data)}')
-        else:
-            print(f'Ошибка загрузки расписаний: {response.text}')
+                logger.debug(
+                    'Загружено расписаний: %s',
+                    len(self.schedule_data),
+                )
 
     def initialize_dates_for_schedule(self):
         current_date = datetime.date.today()
@@ -197,26 +228,17 @@ class AdminBookingTable:
             self.dates_storage[day_of_week] = target_date
 
     def load_boxes(self):
-        print(f"Загружаем боксы для автомойки с ID: {self.car_wash['id']}")
-        response = self.api.get_boxes(self.car_wash['id'])
-        if response.status_code == 200:
-            # Фильтрация по текущей автомойке
-            self.boxes_list = [
-                box
-                for box in response.json().get('data', [])
-                if box['car_wash_id'] == self.car_wash['id']
-            ]
-            print(
-                f'Загружено боксов: {len(self.boxes_list)} '
-                f'для автомойки {self.car_wash["id"]}'
-            )
-        else:
-            print(f'Ошибка загрузки боксов: {response.text}')
+        logger.debug(
+            'Загружаем боксы для автомойки с ID: %s',
+            self.car_wash['id'],
+        )
+        self.boxes_list = self.store.boxes() or []
 
     def load_available_times(self, target_date):
-        print(
-            f"Загружаем доступное время для автомойки с ID: "
-            f"{self.car_wash['id']} на дату {target_date}"
+        logger.debug(
+            'Загружаем доступное время для автомойки с ID: %s на дату %s',
+            self.car_wash['id'],
+            target_date,
         )
 
         response = self.api.get_available_times(
@@ -229,19 +251,21 @@ class AdminBookingTable:
             self.available_times[str(target_date)] = daily_times
             self.loaded_days.add(target_date)
 
-            print(
-                f'Доступное время загружено для '
-                f'{target_date}: {self.available_times[str(target_date)]}'
+            logger.debug(
+                'Доступное время загружено для %s: %s',
+                target_date,
+                self.available_times[str(target_date)],
             )
         else:
-            print(
-                f'Ошибка загрузки доступного времени для '
-                f'{target_date}: {response.text}'
+            logger.error(
+                'Ошибка загрузки доступного времени для %s: %s',
+                target_date,
+                response.text,
             )
 
     def create_booking_page(self):
         if not self.schedule_data:
-            print('Нет расписаний для отображения.')
+            logger.warning('Нет расписаний для отображения.')
             return ft.Text(
                 'Нет доступных расписаний.',
                 size=18,
@@ -280,50 +304,54 @@ class AdminBookingTable:
             )
 
         if not tabs:
-            print('Расписания есть, но вкладки не создались.')
+            logger.debug('Расписания есть, но вкладки не создались.')
             return ft.Text(
                 'Ошибка создания вкладок.',
                 size=18,
                 text_align=ft.TextAlign.CENTER,
             )
 
-        booking_tabs = ft.Tabs(
+        self.booking_tabs = ft.Tabs(
             tabs=tabs,
             selected_index=selected_index,
             expand=True,
             on_change=self.on_tab_change,
         )
 
-        return booking_tabs
+        return self.booking_tabs
 
     def on_tab_change(self, e):
         booking_tabs = e.control
         selected_index = booking_tabs.selected_index
 
         if not booking_tabs.tabs or selected_index >= len(booking_tabs.tabs):
-            print('Ошибка: Некорректный индекс вкладки.')
+            logger.error('Ошибка: Некорректный индекс вкладки.')
             return
 
-        selected_tab = booking_tabs.tabs[selected_index]
         day_of_week = self.schedule_data[selected_index]['day_of_week']
         schedule_date = self.dates_storage[day_of_week]
 
         if schedule_date not in self.loaded_days:
             self.load_available_times(schedule_date)
 
-        schedule = self.schedule_data[selected_index]
+        self.render_tab(selected_index)
+        self.page.update()
+
+    def render_tab(self, index):
+        schedule = self.schedule_data[index]
+        day_of_week = schedule['day_of_week']
+        schedule_date = self.dates_storage[day_of_week]
         day_with_date = (
             f"{self.get_day_name(day_of_week)} "
             f"({schedule_date.strftime('%d %B')})"
         )
-        selected_tab.content = self.create_booking_table(
+        self.booking_tabs.tabs[index].content = self.create_booking_table(
             day_with_date,
             schedule,
             self.generate_timeslots(
                 schedule['start_time'], schedule['end_time']
             ),
         )
-        self.page.update()
 
     def create_booking_table(self, day_with_date, schedule, timeslots):
         rows = []
@@ -845,42 +873,14 @@ class AdminBookingTable:
         try:
             response = self.api.delete_booking(booking_id)
             if response.status_code == 200:
-                self.bookings = [
-                    b for b in self.bookings if b['id'] != booking_id
-                ]
-                print(f'Букинг с ID {booking_id} успешно удалён.')
-
-                self.assign_colors_to_created_bookings()
-
-                booking_tabs = self.page.controls[
-                    1
-                ]  # Предполагается, что Tabs на позиции 1
-                selected_index = booking_tabs.selected_index
-                selected_tab = booking_tabs.tabs[selected_index]
-
-                day_of_week = self.schedule_data[selected_index]['day_of_week']
-                schedule_date = self.dates_storage[day_of_week]
-
-                self.load_available_times(schedule_date)
-                self.load_bookings()
-                self.assign_colors_to_created_bookings()
-
-                schedule = self.schedule_data[selected_index]
-                timeslots = self.generate_timeslots(
-                    schedule['start_time'], schedule['end_time']
-                )
-                selected_tab.content = self.create_booking_table(
-                    f"{self.get_day_name(day_of_week)} "
-                    f"({schedule_date.strftime('%d %B')})",
-                    schedule,
-                    timeslots,
-                )
-                self.page.update()
+                logger.debug('Букинг с ID %s успешно удалён.', booking_id)
+                # Слушатель хранилища уберёт букинг и перерисует вкладку
+                self.booking_store.remove([booking_id])
             else:
-                print(f'Ошибка удаления букинга: {response.text}')
+                logger.error('Ошибка удаления букинга: %s', response.text)
                 self.show_error_message('Ошибка при удалении букинга.')
         except Exception as e:
-            print(f'Ошибка при удалении букинга: {e}')
+            logger.error('Ошибка при удалении букинга: %s', e)
             self.show_error_message('Произошла ошибка при удалении букинга.')
 
     def show_error_message(self, message: str):
@@ -963,9 +963,9 @@ class AdminBookingTable:
                 self.page.launch_url(tel_url)
             except Exception as e:
                 self.show_error_message('Не удалось открыть звонилку.')
-                print(f'Не удалось открыть звонилку: {e}')
+                logger.error('Не удалось открыть звонилку: %s', e)
         else:
             self.show_error_message(
                 'Номер телефона не указан или некорректен.'
             )
-            print('Номер телефона не указан или некорректен.')
+            logger.warning('Номер телефона не указан или некорректен.')
@@ -3,8 +3,12 @@ import re
 import flet as ft
 
 from washer.api_requests import BackendApi
+from washer.logger import get_logger
 from washer.ui_components.admin_booking_table import AdminBookingTable
 from washer.ui_components.clients_page import ClientsPage
+from washer.ui_updates import batched_updates
+
+logger = get_logger(__name__)
 
 
 class AdminCarSelectionPage:
@@ -55,10 +59,7 @@ class AdminCarSelectionPage:
         self.brand_button_text = 'Выберите марку автомобиля'
         self.selected_car = {}
         self.snack_bar = None
-        self.api = BackendApi()
-        access_token = self.page.client_storage.get('access_token')
-        if access_token:
-            self.api.set_access_token(access_token)
+        self.api = BackendApi.for_page(self.page)
 
         self.car_price = 0
         self.price_text = ft.Text(
@@ -209,6 +210,7 @@ class AdminCarSelectionPage:
         self.last_two_field.visible = False
         self.last_two_field.value = ''
 
+    @batched_updates
     def on_main_number_change(self, e):
         main_value = e.control.value or ''
         raw_value = re.sub(r'\s+', '', main_value).upper()
@@ -257,6 +259,7 @@ class AdminCarSelectionPage:
         e.page.update()
         self._validate_number()
 
+    @batched_updates
     def on_last_two_change(self, e):
         last_val = e.control.value or ''
         last_val = re.sub(r'\s+', '', last_val).upper()
@@ -399,15 +402,16 @@ class AdminCarSelectionPage:
         )
 
     def on_client_car_selected(self, selected_car):
-        print(f'Выбранный клиентский автомобиль: {selected_car}')
+        logger.debug('Выбранный клиентский автомобиль: %s', selected_car)
         self.selected_car = selected_car
 
         configuration_id = selected_car.get('configuration_id')
         if configuration_id:
             response = self.api.get_configuration_by_id(configuration_id)
-            print(
-                f'API Response for configuration_id '
-                f'{configuration_id}: {response.json()}'
+            logger.debug(
+                'API Response for configuration_id %s: %s',
+                configuration_id,
+                response.json(),
             )
 
             if response.status_code == 200:
@@ -418,10 +422,10 @@ class AdminCarSelectionPage:
                 for config in data:
                     if config.get('id') == configuration_id:
                         body_type_id = config.get('body_type_id')
-                        print(f'Найдена конфигурация: {config}')
+                        logger.debug('Найдена конфигурация: %s', config)
                         break
 
-                print(f'Извлечённый body_type_id: {body_type_id}')
+                logger.debug('Извлечённый body_type_id: %s', body_type_id)
 
                 if body_type_id:
                     self.selected_body_type_id = body_type_id
@@ -442,16 +446,12 @@ class AdminCarSelectionPage:
     def load_brands(self):
         response = self.api.get_brands()
         if response.status_code == 401:
-            # Проверяем просроченность токена
-            if self.refresh_token():
-                self.load_brands()
-            else:
-                self.page.add(
-                    ft.Text(
-                        'Сессия истекла, пожалуйста, войдите снова.',
-                        color=ft.colors.RED,
-                    )
+            self.page.add(
+                ft.Text(
+                    'Сессия истекла, пожалуйста, войдите снова.',
+                    color=ft.colors.RED,
                 )
+            )
         elif response.status_code == 200:
             brands = response.json().get('data', [])
             self.full_brands_list = brands
@@ -486,7 +486,7 @@ class AdminCarSelectionPage:
             self.brands_dict = {brand['name']: brand['id'] for brand in brands}
             self.update_brands_list(brands)
         else:
-            print(f'Ошибка загрузки брендов: {response.text}')
+            logger.error('Ошибка загрузки брендов: %s', response.text)
 
     def update_brands_list(self, brands):
         self.brands_list.controls.clear()
@@ -549,12 +549,13 @@ class AdminCarSelectionPage:
 
         self.update_brands_list(filtered_brands)
 
+    @batched_updates
     def on_brand_select(self, e):
         selected_brand = e.control.data
         brand_id = self.brands_dict.get(selected_brand)
 
         if not brand_id:
-            print('ID марки не найден.')
+            logger.warning('ID марки не найден.')
             return
 
         response = self.api.get_models(brand_id)
@@ -591,13 +592,14 @@ class AdminCarSelectionPage:
 
         self.close_search_dialog(None)
 
+    @batched_updates
     def on_model_select(self, e):
         selected_model = e.control.value
         self.selected_model = selected_model
         self.selected_model_id = self.models_dict.get(selected_model)
 
         if not self.selected_model_id:
-            print('ID модели не найден.')
+            logger.warning('ID модели не найден.')
             return
 
         response = self.api.get_generations(self.selected_model_id)
@@ -605,7 +607,7 @@ class AdminCarSelectionPage:
             generations = response.json().get('data', [])
 
             if not generations:
-                print('Поколения для выбранной модели не найдены.')
+                logger.warning('Поколения для выбранной модели не найдены.')
                 self.generation_dropdown.visible = False
                 return
 
@@ -689,8 +691,9 @@ class AdminCarSelectionPage:
                 self.page.update()
 
         else:
-            print(f'Ошибка при загрузке поколений: {response.text}')
+            logger.error('Ошибка при загрузке поколений: %s', response.text)
 
+    @batched_updates
     def on_generation_select(self, e):
         selected_generation = e.control.value
         self.selected_generation_id = self.generations_dict.get(
@@ -698,7 +701,7 @@ class AdminCarSelectionPage:
         )
 
         if not self.selected_generation_id:
-            print('ID поколения не найден.')
+            logger.warning('ID поколения не найден.')
             return
 
         self.selected_generation = selected_generation
@@ -746,7 +749,10 @@ class AdminCarSelectionPage:
                 body_type_name = self.get_body_type_name(body_type_id)
                 self.selected_body_type = body_type_name
                 self.selected_body_type_id = body_type_id
-                print(f'Автоматически выбран тип кузова: {body_type_name}')
+                logger.debug(
+                    'Автоматически выбран тип кузова: %s',
+                    body_type_name,
+                )
 
                 self.show_snack_bar(
                     f'Тип кузова "{body_type_name}" выбран автоматически',
@@ -831,7 +837,7 @@ class AdminCarSelectionPage:
                 self.body_type_dropdown.on_change = on_body_type_select_inner
                 self.page.update()
         else:
-            print(f'Ошибка при загрузке конфигураций: {response.text}')
+            logger.error('Ошибка при загрузке конфигураций: %s', response.text)
 
     def get_configuration_id(self, generation_id, body_type_id):
         response = self.api.get_configurations(generation_id)
@@ -843,16 +849,17 @@ class AdminCarSelectionPage:
         return None
 
     def load_car_price(self, body_type_id):
-        print(
-            f"Загружаем цену для car_wash_id: "
-            f"{self.car_wash['id']}, body_type_id: {body_type_id}"
+        logger.debug(
+            'Загружаем цену для car_wash_id: %s, body_type_id: %s',
+            self.car_wash['id'],
+            body_type_id,
         )
 
         response = self.api.get_prices(self.car_wash['id'])
 
         if response.status_code == 200:
             prices = response.json().get('data', [])
-            print(f'Цены получены: {prices}')
+            logger.debug('Цены получены: %s', prices)
 
             price = next(
                 (
@@ -865,19 +872,22 @@ class AdminCarSelectionPage:
 
             if price:
                 self.car_price = price['price']
-                print(
-                    f'Цена для body_type_id {body_type_id}: {self.car_price}'
+                logger.debug(
+                    'Цена для body_type_id %s: %s',
+                    body_type_id,
+                    self.car_price,
                 )
                 self.show_price()
             else:
-                print(
-                    f'Цена для body_type_id '
-                    f'{body_type_id} не найдена в списке.'
+                logger.warning(
+                    'Цена для body_type_id %s не найдена в списке.',
+                    body_type_id,
                 )
         else:
-            print(
-                f'Ошибка загрузки цены: '
-                f'{response.status_code} - {response.text}'
+            logger.error(
+                'Ошибка загрузки цены: %s - %s',
+                response.status_code,
+                response.text,
             )
 
     def show_price(self):
@@ -894,9 +904,10 @@ class AdminCarSelectionPage:
                 if bt['id'] in body_type_ids
             }
         else:
-            print(
-                f'Ошибка загрузки типов кузовов: '
-                f'{response.status_code}, {response.text}'
+            logger.error(
+                'Ошибка загрузки типов кузовов: %s, %s',
+                response.status_code,
+                response.text,
             )
             return {}
 
@@ -972,7 +983,7 @@ class AdminCarSelectionPage:
         bgcolor: str = ft.colors.GREEN,
         text_color: str = ft.colors.WHITE,
     ):
-        print(f'Показываем сообщение: {message}')
+        logger.debug('Показываем сообщение: %s', message)
 
         self.snack_bar.content.value = message
         self.snack_bar.content.color = text_color
@@ -1055,24 +1066,3 @@ class AdminCarSelectionPage:
 
         except Exception as ex:
             self.show_error_message(f'Ошибка: {str(ex)}')
-
-    def refresh_token(self):
-        refresh_token = self.page.client_storage.get('refresh_token')
-        if not refresh_token:
-            print('Refresh token not found, redirecting to login.')
-            return False
-
-        response = self.api.refresh_token(refresh_token)
-
-        if 'error' not in response:
-            self.page.client_storage.set(
-                'access_token', response['access_token']
-            )
-            self.page.client_storage.set(
-                'refresh_token', response['refresh_token']
-            )
-            self.api.set_access_token(response['access_token'])
-            return True
-        else:
-            print(f'Ошибка обновления токена: {response["details"]}')
-            return False
@@ -1,12 +1,16 @@
 import flet as ft
 
 from washer.api_requests import BackendApi
+from washer.car_wash_directory import CarWashDirectory
 from washer.config import config
+from washer.geo import LocationIndex
+from washer.images import image_cache
+from washer.logger import get_logger
 
+logger = get_logger(__name__)
 
-class AdminPage:
-    car_washes_cache = None
 
+class AdminPage:
     def __init__(self, page: ft.Page):
         self.page = page
         self.api_url = config.api_url
@@ -14,10 +18,7 @@ class AdminPage:
         self.selected_image = None
         self.current_car_wash_id = None
 
-        self.api = BackendApi()
-        access_token = self.page.client_storage.get('access_token')
-        if access_token:
-            self.api.set_access_token(access_token)
+        self.api = BackendApi.for_page(self.page)
 
         self.page.adaptive = True
 
@@ -91,46 +92,39 @@ class AdminPage:
         self.show_loading()
         self.load_locations()
 
-        if AdminPage.car_washes_cache:
-            print('Используем кэшированные данные')
-            self.car_washes = AdminPage.car_washes_cache
-            self.update_car_washes_list()
-            self.hide_loading()
-            return
-
         access_token = self.page.client_storage.get('access_token')
         if not access_token:
-            print('Access token not found, redirecting to login.')
+            logger.warning('Access token not found, redirecting to login.')
             self.hide_loading()
             return
 
-        response = self.api.get_car_washes()
-        if response.status_code == 200:
-            self.car_washes = response.json().get('data', [])
-            AdminPage.car_washes_cache = self.car_washes
+        directory = CarWashDirectory.for_view(
+            'admin', self.page.client_storage.get('user_id')
+        )
+        car_washes = directory.car_washes(
+            self.api, on_refresh=self.on_car_washes_refreshed
+        )
+        if car_washes is not None:
+            self.car_washes = car_washes
             self.update_car_washes_list()
-        else:
-            print(f'Ошибка загрузки данных: {response.text}')
 
         self.hide_loading()
 
+    def on_car_washes_refreshed(self, car_washes):
+        self.car_washes = car_washes
+        if self.car_washes_list_view.page is not None:
+            self.update_car_washes_list()
+
     def load_locations(self):
         access_token = self.page.client_storage.get('access_token')
         if not access_token:
-            print('Access token not found, redirecting to login.')
+            logger.warning('Access token not found, redirecting to login.')
             return
 
-        response = self.api.get_locations()
-        if response is not None and response.status_code == 200:
-            self.locations = {
-                loc['id']: loc for loc in response.json().get('data', [])
-            }
-            print(f'Загруженные локации: {self.locations}')
-        else:
-            print(
-                f'Ошибка загрузки локаций: '
-                f'{response.text if response else "No Response"}'
-            )
+        location_index = LocationIndex.shared(self.api)
+        if location_index is not None:
+            self.locations = dict(location_index.locations)
+            logger.debug('Загружено локаций: %s', len(self.locations))
 
     def update_car_washes_list(self):
         if self.car_washes_list_view:
@@ -138,6 +132,11 @@ class AdminPage:
             self.page.update()
 
     def create_wash_list(self):
+        image_cache.prefetch(
+            [wash.get('image_link') for wash in self.car_washes],
+            width=float('inf'),
+            height=170,
+        )
         return [self.create_car_wash_card(wash) for wash in self.car_washes]
 
     def create_car_wash_card(self, car_wash):
@@ -160,8 +159,8 @@ class AdminPage:
                     content=ft.Stack(
                         [
                             ft.Container(
-                                content=ft.Image(
-                                    src=image_link,
+                                content=image_cache.image(
+                                    image_link,
                                     fit=ft.ImageFit.COVER,
                                     width=float('inf'),
                                     height=170,
@@ -219,6 +218,7 @@ class AdminPage:
 
         user_key = f'cars_{self.page.client_storage.get("username")}'
         self.page.client_storage.remove(user_key)
+        self.api.set_tokens(None, None)
         self.page.client_storage.remove('access_token')
         self.page.client_storage.remove('refresh_token')
         self.page.client_storage.remove('username')
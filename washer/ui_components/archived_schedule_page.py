@@ -3,18 +3,23 @@ import datetime
 import flet as ft
 
 from washer.api_requests import BackendApi
+from washer.car_wash_store import CarWashStore
+from washer.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class ArchivedSchedulePage:
     def __init__(self, page: ft.Page, car_wash, locations):
         self.page = page
         self.car_wash = car_wash
-        self.api = BackendApi()
-        self.api.set_access_token(self.page.client_storage.get('access_token'))
+        self.api = BackendApi.for_page(self.page)
         self.locations = locations
+        self.store = CarWashStore.for_page(self.page, self.api, self.car_wash)
         self.schedule_data = []
         self.boxes_list = []
         self.bookings = []
+        self.tabs = None
 
         app_bar = ft.AppBar(
             leading=ft.Row(
@@ -49,19 +54,13 @@ class ArchivedSchedulePage:
         self.page.add(self.create_archived_schedule_page())
 
     def load_boxes(self):
-        response = self.api.get_boxes(self.car_wash['id'])
-        if response.status_code == 200:
-            self.boxes_list = response.json().get('data', [])
-        else:
-            print(f'Ошибка загрузки боксов: {response.text}')
+        self.boxes_list = self.store.boxes() or []
 
     def load_bookings(self):
         try:
-            car_wash_id = self.car_wash['id']
-            response = self.api.get_bookings(car_wash_id)
+            all_bookings = self.store.load_bookings()
 
-            if response.status_code == 200:
-                all_bookings = response.json().get('data', [])
+            if all_bookings is not None:
                 today = datetime.date.today()
                 self.bookings = [
                     booking
@@ -95,13 +94,8 @@ class ArchivedSchedulePage:
                     else:
                         booking['car_name'] = 'Неизвестно'
                         booking['license_plate'] = '---'
-            else:
-                print(
-                    f'Ошибка загрузки букингов: '
-                    f'{response.status_code}, {response.text}'
-                )
         except Exception as e:
-            print(f'Ошибка при загрузке букингов: {e}')
+            logger.error('Ошибка при загрузке букингов: %s', e)
 
     def create_archived_schedule_page(self):
         if not self.bookings:
@@ -124,7 +118,8 @@ class ArchivedSchedulePage:
             tab_content = self.create_booking_table(date, bookings)
             tabs.append(ft.Tab(text=date, content=tab_content))
 
-        return ft.Tabs(tabs=tabs, expand=True)
+        self.tabs = ft.Tabs(tabs=tabs, expand=True)
+        return self.tabs
 
     def create_booking_table(self, date, bookings):
         header = ft.Container(
@@ -295,40 +290,100 @@ class ArchivedSchedulePage:
             for booking in self.bookings
             if booking['start_datetime'].startswith(date)
         ]
+        if not bookings_to_delete:
+            return
 
-        success_deletions = []
-        failed_deletions = []
-
-        for booking_id in bookings_to_delete:
-            response = self.api.delete_booking(booking_id)
-            if response.status_code == 200:
-                success_deletions.append(booking_id)
-            else:
-                failed_deletions.append(booking_id)
-                print(
-                    f'Ошибка при удалении букинга '
-                    f'{booking_id}: {response.text}'
-                )
-
-        if success_deletions:
-            print(f'Букинги {success_deletions} успешно удалены.')
-            self.page.snack_bar = ft.SnackBar(
-                ft.Text(f'Букинги за {date} успешно удалены.'),
-                open=True,
+        total = len(bookings_to_delete)
+        progress_bar = ft.ProgressBar(value=0, width=300)
+        progress_text = ft.Text(f'Удалено 0 из {total}')
+        progress_dialog = ft.AlertDialog(
+            modal=True,
+            title=ft.Text(f'Удаление букингов за {date}'),
+            content=ft.Column(
+                controls=[progress_bar, progress_text],
+                tight=True,
+            ),
+        )
+        self.page.dialog = progress_dialog
+        progress_dialog.open = True
+        self.page.update()
+
+        def on_progress(done, total):
+            progress_bar.value = done / total
+            progress_text.value = f'Удалено {done} из {total}'
+            progress_dialog.update()
+
+        def task():
+            result = self.api.delete_bookings(
+                bookings_to_delete, on_progress=on_progress
             )
+            progress_dialog.open = False
+            self.on_bookings_deleted(date, result)
+
+        self.page.run_thread(task)
 
-        if failed_deletions:
+    def on_bookings_deleted(self, date, result):
+        deleted_ids = set(result['deleted'])
+        failed = result['failed']
+
+        for booking_id, error in failed.items():
+            logger.error(
+                'Ошибка при удалении букинга %s: %s', booking_id, error
+            )
+
+        if deleted_ids:
+            logger.debug('Букинги %s успешно удалены.', sorted(deleted_ids))
+            self.store.bookings.remove(list(deleted_ids))
+            self.remove_bookings_locally(date, deleted_ids)
+
+        if failed:
             self.page.snack_bar = ft.SnackBar(
-                ft.Text(f'Не удалось удалить некоторые букинги за {date}.'),
+                ft.Text(
+                    f'Не удалось удалить {len(failed)} из '
+                    f'{len(failed) + len(deleted_ids)} букингов за {date}.'
+                ),
                 open=True,
                 bgcolor=ft.colors.RED_200,
             )
+        else:
+            self.page.snack_bar = ft.SnackBar(
+                ft.Text(f'Букинги за {date} успешно удалены.'),
+                open=True,
+            )
 
         self.page.update()
 
-        self.load_bookings()
-        self.page.controls[-1] = self.create_archived_schedule_page()
-        self.page.update()
+    def remove_bookings_locally(self, date, deleted_ids):
+        """
+        Убирает удалённые букинги из текущего представления без повторной
+        загрузки архива: пересобирается только вкладка этой даты.
+        """
+        self.bookings = [
+            booking
+            for booking in self.bookings
+            if booking['id'] not in deleted_ids
+        ]
+        remaining = [
+            booking
+            for booking in self.bookings
+            if booking['start_datetime'].startswith(date)
+        ]
+
+        if not self.bookings:
+            self.page.controls[-1] = self.create_archived_schedule_page()
+            return
+
+        tab = next((tab for tab in self.tabs.tabs if tab.text == date), None)
+        if tab is None:
+            return
+
+        if remaining:
+            tab.content = self.create_booking_table(date, remaining)
+        else:
+            self.tabs.tabs.remove(tab)
+            self.tabs.selected_index = min(
+                self.tabs.selected_index, len(self.tabs.tabs) - 1
+            )
 
     def on_back_click(self, e):
         from washer.ui_components.carwash_edit_page import CarWashEditPage
@@ -6,7 +6,16 @@ from datetime import date, datetime, timedelta
 import flet as ft
 
 from washer.api_requests import BackendApi
+from washer.box_assignment import get_strategy
+from washer.images import image_cache
+from washer.logger import get_logger
+from washer.request_generations import RequestGenerations, RequestToken
+from washer.schedule_horizon import ScheduleHorizon
+from washer.slot_finder import EarliestSlotFinder, box_slots, earliest_start
 from washer.ui_components.select_car_page import SelectCarPage
+from washer.ui_updates import batched_updates, flush_updates
+
+logger = get_logger(__name__)
 
 date_class: dict[int, str] = {
     0: 'Пн',
@@ -125,12 +134,20 @@ class DateBox(ft.Container):
             self.content = ft.Text('', text_align=ft.TextAlign.CENTER)
 
     def selected(self, e: ft.TapEvent):
+        if self.date_instance:
+            self.highlight()
+
+            if self.on_date_selected and self.date_obj:
+                self.on_date_selected(self.date_obj)
+
+    def highlight(self):
+        """Выделяет эту дату и снимает выделение с остальных."""
         if self.date_instance:
             for row in self.date_instance.controls:
                 if isinstance(row, ft.Row):
                     for date_box in row.controls:
                         if isinstance(date_box, DateBox):
-                            if date_box == e.control:
+                            if date_box is self:
                                 date_box.bgcolor = ft.colors.BLUE
                                 date_box.border = ft.Border(
                                     left=ft.BorderSide(
@@ -179,9 +196,6 @@ class DateBox(ft.Container):
 
             self.date_instance.update()
 
-            if self.on_date_selected and self.date_obj:
-                self.on_date_selected(self.date_obj)
-
 
 class DateGrid(ft.Column):
     def __init__(
@@ -191,7 +205,7 @@ class DateGrid(ft.Column):
         self.year = year
         self.month = month
         self.on_date_selected = on_date_selected
-        self.available_dates = []
+        self.available_dates = frozenset()
         self.today = today
 
         self.date_text = ft.Text(
@@ -257,9 +271,12 @@ class DateGrid(ft.Column):
     def populate_date_grid(self, year: int, month: int):
         self.date_rows.controls.clear()
 
-        print(f'Populating calendar for {month_class[month]} {year}')
-        print(f'Available dates: {self.available_dates}')
-        print(f'Today is: {self.today}')
+        logger.debug('Populating calendar for %s %s', month_class[month], year)
+        logger.debug(
+            'Available dates: %s, today is: %s',
+            len(self.available_dates),
+            self.today,
+        )
 
         for week in calendar.monthcalendar(year, month):
             row = ft.Row(
@@ -271,17 +288,15 @@ class DateGrid(ft.Column):
                         date_obj = datetime(year, month, day).date()
                         is_today = date_obj == self.today
                         is_available = date_obj in self.available_dates
-                        print(
-                            f'Date: {date_obj}, Is Today: {is_today}, '
-                            f'Available: {is_available}'
-                        )
                     except ValueError:
                         date_obj = None
                         is_today = False
                         is_available = False
-                        print(
-                            f'Invalid date: '
-                            f'Year={year}, Month={month}, Day={day}'
+                        logger.error(
+                            'Invalid date: Year=%s, Month=%s, Day=%s',
+                            year,
+                            month,
+                            day,
                         )
 
                     date_box = DateBox(
@@ -333,19 +348,54 @@ class DateGrid(ft.Column):
         self.year = year
         self.month = month
         self.date_text.value = f'{month_class[self.month]} {self.year}'
-        print(f'Updated calendar to {month_class[self.month]} {year}')
+        logger.debug(
+            'Updated calendar to %s %s',
+            month_class[self.month],
+            year,
+        )
         self.date_text.update()
 
     def format_date(self, day: int) -> str:
         return f'{month_class[self.month]} {day}, {self.year}'
 
-    def set_available_dates(self, available_dates: list[date]):
-        self.available_dates = available_dates
-        print(f'Setting available_dates for DateGrid: {self.available_dates}')
+    def select_date(self, selected_date: date):
+        """
+        Выделяет дату без вызова on_date_selected, при необходимости
+        переключая календарь на её месяц.
+        """
+        year, month = selected_date.year, selected_date.month
+        if (year, month) != (self.year, self.month):
+            Settings.year, Settings.month = year, month
+            self.update_year_and_month(year, month)
+            self.populate_date_grid(year, month)
+
+        for row in self.date_rows.controls:
+            for date_box in row.controls:
+                if (
+                    isinstance(date_box, DateBox)
+                    and date_box.date_obj == selected_date
+                ):
+                    date_box.highlight()
+                    return
+
+    def set_available_dates(self, available_dates: frozenset[date]):
+        self.available_dates = frozenset(available_dates)
+        logger.debug(
+            'Setting available_dates for DateGrid: %s dates',
+            len(self.available_dates),
+        )
         self.populate_date_grid(self.year, self.month)
         self.update()
 
 
+# Секции сетки времени: название, первый час и час после последнего
+TIME_SECTIONS = (
+    ('Утро', 2, 12),
+    ('День', 12, 18),
+    ('Вечер', 18, 23),
+)
+
+
 class BookingPage:
     def __init__(
         self,
@@ -358,9 +408,8 @@ class BookingPage:
         self.page = page
         self.car_wash = car_wash
         self.username = username
-        self.api = BackendApi()
+        self.api = BackendApi.for_page(self.page)
         self.location_data = location_data or {}
-        self.api.set_access_token(self.page.client_storage.get('access_token'))
         self.phone_number = self.car_wash.get('phone_number', '')
 
         self.selected_car_id = None
@@ -370,13 +419,17 @@ class BookingPage:
         self.selected_time = None
         self.selected_time_iso = None
         self.available_times = []
+        self.time_buttons: dict[str, ft.ElevatedButton] = {}
+        self.time_sections: dict[str, tuple[ft.Text, ft.GridView]] = {}
         self.cars = cars
         self.car_price = 0
 
         self.boxes = []
         self.available_boxes = []
         self.schedule_list = []
-        self.available_dates = []
+        self.available_dates = frozenset()
+        self.schedule_horizon = ScheduleHorizon()
+        self.availability_requests = RequestGenerations('BookingPage')
 
         self.available_additions = []
         self.selected_addition_ids = []
@@ -570,13 +623,13 @@ class BookingPage:
                 self.snack_bar.bgcolor = ft.colors.RED
                 self.snack_bar.open = True
                 self.page.update()
-                print(f'Не удалось открыть звонилку: {e}')
+                logger.error('Не удалось открыть звонилку: %s', e)
         else:
             self.snack_bar.content.value = 'Номер телефона не указан.'
             self.snack_bar.bgcolor = ft.colors.RED
             self.snack_bar.open = True
             self.page.update()
-            print('Номер телефона не указан.')
+            logger.warning('Номер телефона не указан.')
 
     def create_car_wash_card(self):
         image_link = self.car_wash.get('image_link', 'assets/spa_logo.png')
@@ -604,8 +657,8 @@ class BookingPage:
                     content=ft.Stack(
                         [
                             ft.Container(
-                                content=ft.Image(
-                                    src=image_link,
+                                content=image_cache.image(
+                                    image_link,
                                     fit=ft.ImageFit.COVER,
                                     width=float('inf'),
                                     height=170,
@@ -861,7 +914,7 @@ class BookingPage:
     def parse_car_name(self, name: str) -> tuple[str, str, str, str]:
         from typing import List, Tuple
 
-        print(f'Parsing car name: {name}')
+        logger.debug('Parsing car name: %s', name)
 
         body_types = [
             'внедорожник 5 дв',
@@ -912,13 +965,13 @@ class BookingPage:
         )
 
         words = name.split()
-        print(f'Words: {words}')
+        logger.debug('Words: %s', words)
 
         brand = words[0] if words else 'Бренд не указан'
         remaining_words = words[1:] if len(words) > 1 else []
 
-        print(f'Brand: {brand}')
-        print(f'Remaining words: {remaining_words}')
+        logger.debug('Brand: %s', brand)
+        logger.debug('Remaining words: %s', remaining_words)
 
         generation = 'Поколение не указано'
         body_type = 'Тип кузова не указан'
@@ -938,24 +991,31 @@ class BookingPage:
         if matches:
             matches.sort(key=lambda x: (-x[0], x[3]))
             _, generation_index, generation, generation_type = matches[0]
-            print(f'Found generation: {generation} ({generation_type})')
+            logger.debug(
+                'Found generation: %s (%s)',
+                generation,
+                generation_type,
+            )
             remaining_words = (
                 remaining_words[:generation_index]
                 + remaining_words[generation_index + matches[0][0] :]
             )
-            print(
-                f'Remaining words after generation extraction: '
-                f'{remaining_words}'
+            logger.debug(
+                'Remaining words after generation extraction: %s',
+                remaining_words,
             )
         else:
-            print('Generation not found')
+            logger.debug('Generation not found')
 
         matched_body_types = []
         for i in range(len(remaining_words), 0, -1):
             potential_body_type = (
                 ' '.join(remaining_words[i - 1 :]).lower().rstrip('.')
             )
-            print(f'Checking potential body type: {potential_body_type}')
+            logger.debug(
+                'Checking potential body type: %s',
+                potential_body_type,
+            )
             for bt in body_types:
                 if potential_body_type == bt.lower():
                     matched_body_types.append((i - 1, bt))
@@ -964,22 +1024,22 @@ class BookingPage:
             matched_body_types.sort(key=lambda x: x[0])
             body_type_index, body_type = matched_body_types[0]
             remaining_words = remaining_words[:body_type_index]
-            print(f'Found body type: {body_type}')
-            print(
-                f'Remaining words after body type extraction: '
-                f'{remaining_words}'
+            logger.debug('Found body type: %s', body_type)
+            logger.debug(
+                'Remaining words after body type extraction: %s',
+                remaining_words,
             )
         else:
-            print('Body type not found')
+            logger.debug('Body type not found')
 
         if remaining_words:
             model = ' '.join(remaining_words)
         else:
             model = 'Модель не указана'
 
-        print(f'Model: {model}')
-        print(f'Generation: {generation}')
-        print(f'Body type: {body_type}')
+        logger.debug('Model: %s', model)
+        logger.debug('Generation: %s', generation)
+        logger.debug('Body type: %s', body_type)
 
         return brand, model, generation, body_type
 
@@ -1055,17 +1115,18 @@ class BookingPage:
         )
         confirm_page.open()
 
+    @batched_updates
     def on_panel_change(self, e: ft.ControlEvent):
         if self.updating_panels:
             return
 
         index_str = e.data
-        print(f'Panel change event: {index_str}')
+        logger.debug('Panel change event: %s', index_str)
 
         try:
             index = int(index_str)
         except ValueError:
-            print(f'Invalid panel index: {index_str}')
+            logger.error('Invalid panel index: %s', index_str)
             return
 
         self.updating_panels = True
@@ -1079,7 +1140,7 @@ class BookingPage:
         finally:
             self.updating_panels = False
 
-        print(f'Updated expanded_panels: {self.expanded_panels}')
+        logger.debug('Updated expanded_panels: %s', self.expanded_panels)
 
         self.expansion_panel_list.update()
         self.page.update()
@@ -1088,7 +1149,7 @@ class BookingPage:
         user_id = self.page.client_storage.get('user_id')
 
         if not user_id:
-            print('User ID не найден.')
+            logger.warning('User ID не найден.')
             self.cars = []
             self.update_add_car_button()
             return []
@@ -1097,7 +1158,7 @@ class BookingPage:
 
         if response.status_code == 200:
             cars = response.json().get('data', [])
-            print(f'Автомобили успешно загружены: {cars}')
+            logger.debug('Автомобили успешно загружены: %s', cars)
             self.cars = cars
             self.update_add_car_button()
             return [
@@ -1115,9 +1176,10 @@ class BookingPage:
                 if car.get('id')
             ]
         else:
-            print(
-                f'Ошибка при загрузке автомобилей: '
-                f'{response.status_code}, {response.text}'
+            logger.error(
+                'Ошибка при загрузке автомобилей: %s, %s',
+                response.status_code,
+                response.text,
             )
             self.cars = []
             self.update_add_car_button()
@@ -1130,9 +1192,11 @@ class BookingPage:
             self.add_car_button.text = 'Добавить ещё автомобиль'
         self.page.update()
 
+    @batched_updates
     def on_car_select(self, e):
         self.selected_car_id = e.control.value
-        print(f'Выбран автомобиль с ID: {self.selected_car_id}')
+        logger.debug('Выбран автомобиль с ID: %s', self.selected_car_id)
+        self.availability_requests.begin()
 
         self.selected_date = None
         self.selected_time = None
@@ -1159,19 +1223,20 @@ class BookingPage:
 
         if selected_car:
             configuration_id = selected_car.get('configuration_id')
-            print(
-                f'Configuration ID для выбранного автомобиля: '
-                f'{configuration_id}'
+            logger.debug(
+                'Configuration ID для выбранного автомобиля: %s',
+                configuration_id,
             )
 
             if configuration_id:
                 self.load_body_type_id(configuration_id)
             else:
-                print('Configuration ID для автомобиля не определен.')
+                logger.warning('Configuration ID для автомобиля не определен.')
 
         else:
-            print(
-                f'Автомобиль с ID {self.selected_car_id} не найден в списке.'
+            logger.warning(
+                'Автомобиль с ID %s не найден в списке.',
+                self.selected_car_id,
             )
 
         self.updating_panels = True
@@ -1220,9 +1285,9 @@ class BookingPage:
 
         if response.status_code == 200:
             data = response.json().get('data', [])
-            print(
-                f'Конфигурации успешно загружены. '
-                f'Всего конфигураций: {len(data)}'
+            logger.debug(
+                'Конфигурации успешно загружены. Всего конфигураций: %s',
+                len(data),
             )
 
             selected_config = next(
@@ -1236,23 +1301,28 @@ class BookingPage:
 
             if selected_config:
                 body_type_id = selected_config.get('body_type_id')
-                print(
-                    f'Тип кузова для конфигурации '
-                    f'{configuration_id}: {body_type_id}'
+                logger.debug(
+                    'Тип кузова для конфигурации %s: %s',
+                    configuration_id,
+                    body_type_id,
                 )
 
                 if body_type_id:
                     self.load_car_price(body_type_id, auto_update_price)
                 else:
-                    print('Тип кузова для конфигурации не найден.')
+                    logger.warning('Тип кузова для конфигурации не найден.')
                     self.hide_loading()
             else:
-                print(f'Конфигурация с ID {configuration_id} не найдена.')
+                logger.warning(
+                    'Конфигурация с ID %s не найдена.',
+                    configuration_id,
+                )
                 self.hide_loading()
         else:
-            print(
-                f'Ошибка при запросе конфигурации: '
-                f'{response.status_code}, {response.text}'
+            logger.error(
+                'Ошибка при запросе конфигурации: %s, %s',
+                response.status_code,
+                response.text,
             )
             self.hide_loading()
 
@@ -1261,7 +1331,7 @@ class BookingPage:
 
         if response.status_code == 200:
             prices = response.json().get('data', [])
-            print(f'Цены: {prices}')
+            logger.debug('Цены: %s', prices)
 
             price = next(
                 (
@@ -1274,18 +1344,22 @@ class BookingPage:
 
             if price:
                 self.car_price = price['price']
-                print(
-                    f'Цена для автомобиля с типом кузова '
-                    f'{body_type_id}: {self.car_price}'
+                logger.debug(
+                    'Цена для автомобиля с типом кузова %s: %s',
+                    body_type_id,
+                    self.car_price,
                 )
                 if auto_update_price:
                     self.show_price()
                 self.hide_loading()
             else:
-                print(f'Цена для body_type_id {body_type_id} не найдена.')
+                logger.warning(
+                    'Цена для body_type_id %s не найдена.',
+                    body_type_id,
+                )
                 self.hide_loading()
         else:
-            print(f'Ошибка загрузки цены автомобиля: {response.text}')
+            logger.error('Ошибка загрузки цены автомобиля: %s', response.text)
             self.hide_loading()
 
     def show_price(self):
@@ -1299,6 +1373,7 @@ class BookingPage:
             self.book_button.disabled = True
         self.price_text.update()
 
+    @batched_updates
     def on_box_select(self, e):
         if self.nearest_time_selected:
             self.nearest_time_selected = False
@@ -1312,7 +1387,7 @@ class BookingPage:
             self.or_text.update()
 
         self.selected_box_id = int(e.control.value)
-        print(f'Выбранный бокс: {self.selected_box_id}')
+        logger.debug('Выбранный бокс: %s', self.selected_box_id)
 
         self.selected_time = None
         self.selected_time_iso = None
@@ -1324,7 +1399,7 @@ class BookingPage:
         self.price_text.value = 'Стоимость: ₸0'
         self.select_nearest_time_button.disabled = False
 
-        self.load_available_times_for_box()
+        self.load_available_times_for_box(self.availability_requests.begin())
 
         self.updating_panels = True
         try:
@@ -1337,12 +1412,13 @@ class BookingPage:
 
         self.page.update()
 
+    @batched_updates
     def handle_date_selected(self, selected_date):
         """
         Callback-функция для обработки выбранной даты из календаря.
         """
         self.selected_date = selected_date
-        print(f'Выбрана дата: {self.selected_date}')
+        logger.debug('Выбрана дата: %s', self.selected_date)
 
         if self.nearest_time_selected:
             self.nearest_time_selected = False
@@ -1350,12 +1426,13 @@ class BookingPage:
             self.update_nearest_time_button_style()
             self.or_text.visible = True
             self.or_text.update()
-            print(
-                'Состояние ближайшего времени сброшено из-за изменения даты.'
+            logger.debug(
+                'Состояние ближайшего времени сброшено из-за изменения даты.',
             )
 
+        request = self.availability_requests.begin()
         if self.selected_date:
-            self.load_available_boxes()
+            self.load_available_boxes(request)
             self.selected_time = None
             self.selected_time_iso = None
             self.book_button.disabled = True
@@ -1407,98 +1484,84 @@ class BookingPage:
         self.expansion_panel_list.update()
 
     def load_schedules(self):
-        response = self.api.get_schedules(self.car_wash['id'])
-        if response.status_code == 200:
-            data = response.json()
-            print(
-                f'Расписания успешно загружены для автомойки '
-                f'{self.car_wash["name"]}:'
+        car_wash_id = self.car_wash['id']
+        cached = self.schedule_horizon.get_cached(car_wash_id, self.today)
+
+        if cached is not None:
+            self.schedule_list, self.available_dates = cached
+            logger.debug(
+                'Доступные даты взяты из кэша для автомойки %s: %s',
+                self.car_wash['name'],
+                len(self.available_dates),
             )
-            import pprint
-
-            pp = pprint.PrettyPrinter(indent=4)
-            pp.pprint(data)
-
-            self.schedule_list = [
-                schedule
-                for schedule in data.get('data', [])
-                if schedule.get('car_wash_id') == self.car_wash['id']
-            ]
-
-            if not self.schedule_list:
-                print('Нет расписаний для выбранной автомойки.')
-            else:
-                print(
-                    f'Количество расписаний для автомойки: '
-                    f'{len(self.schedule_list)}'
+        else:
+            response = self.api.get_schedules(car_wash_id)
+            if response.status_code == 200:
+                data = response.json()
+                logger.debug(
+                    'Расписания успешно загружены для автомойки %s',
+                    self.car_wash['name'],
                 )
 
-            available_days_of_week = [
-                schedule['day_of_week']
-                for schedule in self.schedule_list
-                if schedule.get('is_available', False)
-                and 'day_of_week' in schedule
-            ]
-            print(f'Available days of week: {available_days_of_week}')
-
-            available_days_of_week = list(set(available_days_of_week))
-            print(f'Unique available days of week: {available_days_of_week}')
-
-            today_date = datetime.today().date()
+                self.schedule_list = [
+                    schedule
+                    for schedule in data.get('data', [])
+                    if schedule.get('car_wash_id') == car_wash_id
+                ]
 
-            available_dates = [
-                today_date + timedelta(days=i)
-                for i in range(7)
-                if (today_date + timedelta(days=i)).weekday()
-                in available_days_of_week
-            ]
-            print(f'Computed available_dates: {available_dates}')
+                if not self.schedule_list:
+                    logger.warning('Нет расписаний для выбранной автомойки.')
+                else:
+                    logger.debug(
+                        'Количество расписаний для автомойки: %s',
+                        len(self.schedule_list),
+                    )
 
-            self.available_dates = available_dates
-            print(
-                f'Список доступных дат после обработки: '
-                f'{self.available_dates}'
-            )
+                self.available_dates = self.schedule_horizon.build(
+                    car_wash_id, self.schedule_list, self.today
+                )
+                logger.debug(
+                    'Доступных дат на %s дней вперёд: %s',
+                    self.schedule_horizon.horizon_days,
+                    len(self.available_dates),
+                )
 
-        else:
-            print(
-                f'Ошибка загрузки расписаний: '
-                f'{response.status_code}, {response.text}'
-            )
-            self.schedule_list = []
-            self.available_dates = []
+            else:
+                logger.error(
+                    'Ошибка загрузки расписаний: %s, %s',
+                    response.status_code,
+                    response.text,
+                )
+                self.schedule_list = []
+                self.available_dates = frozenset()
 
         if hasattr(self.calendar, 'set_available_dates'):
             self.calendar.set_available_dates(self.available_dates)
         else:
-            print('Календарь не имеет метода set_available_dates.')
+            logger.warning('Календарь не имеет метода set_available_dates.')
         self.page.update()
 
-    def load_available_boxes(self):
+    def load_available_boxes(self, request: RequestToken = None):
+        request = request or self.availability_requests.begin()
         if self.selected_date:
-            self.show_loading()
+            if self.discard_if_stale(request):
+                return
+            self.show_loading(request)
             date_str = self.selected_date.strftime('%Y-%m-%d')
             response = self.api.get_available_times(
                 self.car_wash['id'], date_str
             )
+            if self.discard_if_stale(request):
+                return
 
             if response.status_code == 200:
                 available_times_data = response.json().get(
                     'available_times', {}
                 )
-                print(f'Available times data: {available_times_data}')
+                logger.debug('Available times data: %s', available_times_data)
 
                 available_box_ids = list(map(int, available_times_data.keys()))
-                available_boxes = [
-                    box for box in self.boxes if box['id'] in available_box_ids
-                ]
-
-                self.available_boxes = available_boxes
-
-                self.box_dropdown.options = [
-                    ft.dropdown.Option(text=box['name'], key=str(box['id']))
-                    for box in self.available_boxes
-                ]
+                self.set_box_options(available_box_ids)
 
                 if not self.available_boxes:
                     self.box_dropdown.disabled = True
@@ -1509,13 +1572,16 @@ class BookingPage:
                     )
                     self.time_dropdown_container.controls = []
                     self.time_dropdown_container.disabled = True
-                    self.select_nearest_time_button.disabled = True
+                    # Ближайшее время ищется и в следующих днях
+                    self.select_nearest_time_button.disabled = False
                 else:
                     self.box_dropdown.disabled = False
                     if self.selected_box_id is not None:
                         if self.selected_box_id in available_box_ids:
                             self.box_dropdown.value = str(self.selected_box_id)
-                            self.load_available_times_for_box()
+                            self.load_available_times_for_box(
+                                request, available_times_data
+                            )
                         else:
                             self.box_dropdown.value = None
                             self.selected_box_id = None
@@ -1531,39 +1597,65 @@ class BookingPage:
 
                     self.select_nearest_time_button.disabled = False
 
-                self.hide_loading()
+                self.hide_loading(request)
                 self.page.update()
             else:
-                print(f'Ошибка загрузки доступных времен: {response.text}')
+                logger.error(
+                    'Ошибка загрузки доступных времен: %s',
+                    response.text,
+                )
                 self.show_snack_bar(
                     'Не удалось загрузить доступные времена.',
                     bgcolor=ft.colors.RED,
                 )
-                self.hide_loading()
+                self.hide_loading(request)
         else:
-            print('Дата не выбрана.')
+            logger.warning('Дата не выбрана.')
             self.show_snack_bar(
                 'Пожалуйста, выберите дату.', bgcolor=ft.colors.RED
             )
 
-    def load_available_times_for_box(self):
-        if self.selected_box_id and self.selected_date:
-            self.show_loading()
-            date_str = self.selected_date.strftime('%Y-%m-%d')
-            response = self.api.get_available_times(
-                self.car_wash['id'], date_str
-            )
+    def set_box_options(self, available_box_ids):
+        self.available_boxes = [
+            box for box in self.boxes if box['id'] in available_box_ids
+        ]
+        self.box_dropdown.options = [
+            ft.dropdown.Option(text=box['name'], key=str(box['id']))
+            for box in self.available_boxes
+        ]
 
-            if response.status_code == 200:
-                available_times_data = response.json().get(
-                    'available_times', {}
+    def load_available_times_for_box(
+        self, request: RequestToken = None, available_times_data: dict = None
+    ):
+        """
+        Показывает слоты выбранного бокса. available_times_data —
+        уже загруженные на эту дату слоты, чтобы не запрашивать их снова.
+        """
+        request = request or self.availability_requests.begin()
+        if self.selected_box_id and self.selected_date:
+            if self.discard_if_stale(request):
+                return
+            self.show_loading(request)
+            if available_times_data is None:
+                date_str = self.selected_date.strftime('%Y-%m-%d')
+                response = self.api.get_available_times(
+                    self.car_wash['id'], date_str
                 )
+                if self.discard_if_stale(request):
+                    return
+                if response.status_code == 200:
+                    available_times_data = response.json().get(
+                        'available_times', {}
+                    )
+
+            if available_times_data is not None:
                 box_times = available_times_data.get(
                     str(self.selected_box_id), []
                 )
-                print(
-                    f'Available times for box '
-                    f'{self.selected_box_id}: {box_times}'
+                logger.debug(
+                    'Available times for box %s: %s',
+                    self.selected_box_id,
+                    box_times,
                 )
 
                 filtered_times = self.parse_available_times(box_times)
@@ -1594,52 +1686,24 @@ class BookingPage:
                     self.time_dropdown_container.disabled = True
                     self.book_button.disabled = True
                 else:
-                    morning_slots = [
-                        slot for slot in filtered_times if 2 <= slot.hour < 12
-                    ]
-                    day_slots = [
-                        slot for slot in filtered_times if 12 <= slot.hour < 18
-                    ]
-                    evening_slots = [
-                        slot
-                        for slot in filtered_times
-                        if 18 <= slot.hour <= 22
-                    ]
-
-                    controls = []
-                    if morning_slots:
-                        controls.append(
-                            ft.Text('Утро', size=20, weight=ft.FontWeight.BOLD)
-                        )
-                        controls.append(self.create_time_grid(morning_slots))
-                    if day_slots:
-                        controls.append(
-                            ft.Text('День', size=20, weight=ft.FontWeight.BOLD)
-                        )
-                        controls.append(self.create_time_grid(day_slots))
-                    if evening_slots:
-                        controls.append(
-                            ft.Text(
-                                'Вечер', size=20, weight=ft.FontWeight.BOLD
-                            )
-                        )
-                        controls.append(self.create_time_grid(evening_slots))
-
-                    self.time_dropdown_container.controls = controls
+                    self.show_time_slots(filtered_times)
                     self.time_dropdown_container.disabled = False
                     self.book_button.disabled = True
 
-                self.hide_loading()
+                self.hide_loading(request)
                 self.page.update()
             else:
-                print(f'Ошибка загрузки доступных времен: {response.text}')
+                logger.error(
+                    'Ошибка загрузки доступных времен: %s',
+                    response.text,
+                )
                 self.show_snack_bar(
                     'Не удалось загрузить доступные времена.',
                     bgcolor=ft.colors.RED,
                 )
-                self.hide_loading()
+                self.hide_loading(request)
         else:
-            print('Не выбрана дата или бокс.')
+            logger.warning('Не выбрана дата или бокс.')
             self.show_snack_bar(
                 'Пожалуйста, выберите дату и бокс.', bgcolor=ft.colors.RED
             )
@@ -1655,19 +1719,79 @@ class BookingPage:
         )
 
         for time_slot in time_slots:
-            grid.controls.append(self.create_time_button(time_slot))
+            button = self.create_time_button(time_slot)
+            self.time_buttons[button.data] = button
+            grid.controls.append(button)
 
         return grid
 
+    def show_time_slots(self, time_slots) -> bool:
+        """
+        Показывает слоты по секциям «Утро», «День» и «Вечер».
+
+        Секции и кнопки, которые уже на экране, переиспользуются, так что
+        при обновлении Flet отправляет только добавленные и удалённые
+        слоты. Возвращает False, если показанное не изменилось.
+        """
+        on_screen = set(map(id, self.time_dropdown_container.controls))
+        shown_buttons = {
+            button.data: button
+            for _, grid in self.time_sections.values()
+            if id(grid) in on_screen
+            for button in grid.controls
+        }
+
+        changed = False
+        sections = {}
+        controls = []
+        for title, first_hour, end_hour in TIME_SECTIONS:
+            slots = [
+                slot
+                for slot in time_slots
+                if first_hour <= slot.hour < end_hour
+            ]
+            if not slots:
+                continue
+
+            heading, grid = self.time_sections.get(title, (None, None))
+            if id(grid) not in on_screen:
+                heading = ft.Text(title, size=20, weight=ft.FontWeight.BOLD)
+                grid = self.create_time_grid([])
+            grid_buttons = [
+                shown_buttons.get(slot.isoformat())
+                or self.create_time_button(slot)
+                for slot in slots
+            ]
+            if grid_buttons != grid.controls:
+                grid.controls = grid_buttons
+                changed = True
+            sections[title] = (heading, grid)
+            controls.extend((heading, grid))
+
+        self.time_sections = sections
+        self.time_buttons = {
+            button.data: button
+            for _, grid in sections.values()
+            for button in grid.controls
+        }
+        if controls != self.time_dropdown_container.controls:
+            self.time_dropdown_container.controls = controls
+            changed = True
+        self.time_dropdown_container.disabled = False
+        return changed
+
+    @batched_updates
     def on_time_select_grid(self, time_slot_iso):
         self.nearest_time_selected = False
         self.select_nearest_time_button.text = 'Выбрать ближайшее время'
         self.update_nearest_time_button_style()
 
+        previous_time_iso = self.selected_time_iso
         self.selected_time_iso = time_slot_iso
         self.selected_time = datetime.fromisoformat(time_slot_iso)
+        self.restyle_time_buttons(previous_time_iso, time_slot_iso)
 
-        print(f'Selected time: {self.selected_time}')
+        logger.debug('Selected time: %s', self.selected_time)
 
         if self.selected_time:
             self.complex_wash_checkbox.disabled = False
@@ -1686,8 +1810,10 @@ class BookingPage:
 
         self.page.update()
 
-        self.refresh_time_grid()
-        self.page.update()
+        # Сетка уже перекрашена, свежие слоты подтянутся в фоне
+        self.page.run_thread(
+            self.refresh_time_grid, self.availability_requests.begin()
+        )
 
         self.show_snack_bar(
             f'Выбран бокс {self.selected_box_id} на '
@@ -1697,6 +1823,7 @@ class BookingPage:
 
         self.update_service_selection_state()
 
+    @batched_updates
     def on_complex_wash_change(self, e):
         if self.complex_wash_checkbox.value:
             self.complex_wash_text.color = ft.colors.BLUE
@@ -1708,130 +1835,107 @@ class BookingPage:
         self.page.update()
 
     def create_time_button(self, time_slot: datetime):
-        is_selected = self.selected_time_iso == time_slot.isoformat()
+        time_slot_iso = time_slot.isoformat()
         return ft.ElevatedButton(
             text=self.format_time(time_slot),
-            on_click=lambda e: self.on_time_select_grid(time_slot.isoformat()),
-            style=ft.ButtonStyle(
-                bgcolor=ft.colors.BLUE if is_selected else ft.colors.GREY,
-                color=ft.colors.WHITE if is_selected else ft.colors.BLACK,
-                shape=ft.RoundedRectangleBorder(radius=20),
-                padding={'top': 5, 'bottom': 5, 'left': 10, 'right': 10},
+            data=time_slot_iso,
+            on_click=lambda e: self.on_time_select_grid(time_slot_iso),
+            style=self.time_button_style(
+                self.selected_time_iso == time_slot_iso
             ),
         )
 
-    def parse_available_times(self, times):
-        parsed_times = []
-        now = datetime.now()
-
-        if not self.selected_date:
-            return parsed_times
-
-        is_today = self.selected_date == now.date()
+    def time_button_style(self, is_selected: bool) -> ft.ButtonStyle:
+        return ft.ButtonStyle(
+            bgcolor=ft.colors.BLUE if is_selected else ft.colors.GREY,
+            color=ft.colors.WHITE if is_selected else ft.colors.BLACK,
+            shape=ft.RoundedRectangleBorder(radius=20),
+            padding={'top': 5, 'bottom': 5, 'left': 10, 'right': 10},
+        )
 
-        if is_today:
-            ceil_hour = (now + timedelta(hours=1)).replace(
-                minute=0, second=0, microsecond=0
+    def restyle_time_buttons(self, *time_slot_isos):
+        """Перекрашивает только кнопки указанных слотов."""
+        for time_slot_iso in time_slot_isos:
+            button = self.time_buttons.get(time_slot_iso)
+            if button is None:
+                continue
+            button.style = self.time_button_style(
+                time_slot_iso == self.selected_time_iso
             )
-            print(f'Сегодня: {is_today}, ceil_hour: {ceil_hour}')
-        else:
-            ceil_hour = None
+            if button.page is not None:
+                button.update()
 
-        for time_range in times:
-            try:
-                start_datetime_full = datetime.fromisoformat(time_range[0])
-                end_datetime_full = datetime.fromisoformat(time_range[1])
-
-                if start_datetime_full.date() != self.selected_date:
-                    print(
-                        f'Date mismatch: '
-                        f'{start_datetime_full.date()} != {self.selected_date}'
-                    )
-                    continue
-
-                start_time = start_datetime_full.time()
-                end_time = end_datetime_full.time()
-
-                start_datetime = datetime.combine(
-                    self.selected_date, start_time
-                )
-                end_datetime = datetime.combine(self.selected_date, end_time)
-
-                while start_datetime + timedelta(hours=2) <= end_datetime:
-                    if is_today:
-                        if start_datetime >= ceil_hour:
-                            parsed_times.append(start_datetime)
-                            print(f'Добавлено время: {start_datetime}')
-                    else:
-                        parsed_times.append(start_datetime)
-                        print(f'Добавлено время: {start_datetime}')
-                    start_datetime += timedelta(hours=1)  # Шаг 1 час
-
-            except (ValueError, TypeError) as e:
-                print(f'Invalid time range detected: {time_range}, Error: {e}')
-                continue
+    def parse_available_times(self, times):
+        if not self.selected_date:
+            return []
 
+        parsed_times = [
+            slot
+            for slot, _ in box_slots(
+                None,
+                times,
+                self.selected_date,
+                earliest_start(self.selected_date),
+            )
+        ]
+        logger.debug('Доступных слотов: %s', len(parsed_times))
         return parsed_times
 
     def format_time(self, time_obj):
         return time_obj.strftime('%H:%M')
 
-    def refresh_time_grid(self):
-        if not self.selected_box_id or not self.selected_date:
+    def refresh_time_grid(self, request: RequestToken = None):
+        """
+        Сверяет сетку времени со свежими слотами бокса: добавляет и
+        убирает изменившиеся кнопки, остальные остаются как есть.
+        Если выбранное время успели занять, выбор сбрасывается.
+        """
+        request = request or self.availability_requests.begin()
+        box_id, selected_date = self.selected_box_id, self.selected_date
+        if not box_id or not selected_date:
             return
 
-        date_str = self.selected_date.strftime('%Y-%m-%d')
+        date_str = selected_date.strftime('%Y-%m-%d')
         response = self.api.get_available_times(self.car_wash['id'], date_str)
-
-        if response.status_code == 200:
-            available_times_data = response.json().get('available_times', {})
-            box_times = available_times_data.get(str(self.selected_box_id), [])
-            print(
-                f'Available times for box {self.selected_box_id}: {box_times}'
+        if self.discard_if_stale(request):
+            return
+        if response.status_code != 200:
+            logger.error(
+                'Ошибка обновления доступных времен: %s', response.text
             )
+            return
 
-            filtered_times = self.parse_available_times(box_times)
-
-            if not filtered_times:
-                self.time_dropdown_container.controls = [
-                    ft.Text(
-                        'К сожалению, мест не осталось',
-                        color=ft.colors.RED,
-                        size=18,
-                        weight=ft.FontWeight.BOLD,
-                        text_align=ft.TextAlign.CENTER,
-                    )
-                ]
-                self.time_dropdown_container.disabled = True
-            else:
-                morning_slots = [
-                    slot for slot in filtered_times if 6 <= slot.hour < 12
-                ]
-                day_slots = [
-                    slot for slot in filtered_times if 12 <= slot.hour < 18
-                ]
-                evening_slots = [
-                    slot for slot in filtered_times if 18 <= slot.hour <= 22
-                ]
+        available_times_data = response.json().get('available_times', {})
+        box_times = available_times_data.get(str(box_id), [])
+        logger.debug('Available times for box %s: %s', box_id, box_times)
+        filtered_times = self.parse_available_times(box_times)
 
-                controls = []
-                if morning_slots:
-                    controls.append(
-                        ft.Text('Утро', size=20, weight=ft.FontWeight.BOLD)
-                    )
-                    controls.append(self.create_time_grid(morning_slots))
-                if day_slots:
-                    controls.append(
-                        ft.Text('День', size=20, weight=ft.FontWeight.BOLD)
-                    )
-                    controls.append(self.create_time_grid(day_slots))
-                if evening_slots:
-                    controls.append(
-                        ft.Text('Вечер', size=20, weight=ft.FontWeight.BOLD)
-                    )
-                    controls.append(self.create_time_grid(evening_slots))
+        if not filtered_times:
+            self.time_dropdown_container.controls = [
+                ft.Text(
+                    'К сожалению, мест не осталось',
+                    color=ft.colors.RED,
+                    size=18,
+                    weight=ft.FontWeight.BOLD,
+                    text_align=ft.TextAlign.CENTER,
+                )
+            ]
+            self.time_dropdown_container.disabled = True
+            self.time_buttons = {}
+        elif not self.show_time_slots(filtered_times):
+            return
 
-                self.time_dropdown_container.controls = controls
+        if (
+            self.selected_time_iso is not None
+            and self.selected_time_iso not in self.time_buttons
+        ):
+            self.selected_time = None
+            self.selected_time_iso = None
+            self.book_button.disabled = True
+            self.complex_wash_checkbox.value = False
+            self.complex_wash_checkbox.disabled = True
+            self.price_text.value = 'Стоимость: ₸0'
+            self.show_snack_bar('Выбранное время уже занято.')
 
         self.page.update()
 
@@ -1850,7 +1954,9 @@ class BookingPage:
                 return
             self.show_confirmation_page()
         else:
-            print('Выберите бокс, автомобиль, дату и время для букинга.')
+            logger.debug(
+                'Выберите бокс, автомобиль, дату и время для букинга.',
+            )
             self.show_snack_bar(
                 'Пожалуйста, выберите бокс, автомобиль, дату и время.'
             )
@@ -1901,18 +2007,18 @@ class BookingPage:
                     'end_datetime': end_datetime,
                 }
 
-                print(f'Данные для бронирования: {booking_data}')
+                logger.debug('Данные для бронирования: %s', booking_data)
 
                 self.show_loading()
                 response = self.api.create_booking(booking_data)
                 self.hide_loading()
 
                 if response.status_code in [200, 201]:
-                    print('Букинг успешно создан!')
+                    logger.debug('Букинг успешно создан!')
                     self.show_success_page()
                 else:
                     error_detail = response.json().get('detail', '')
-                    print(f'Ошибка создания букинга: {response.text}')
+                    logger.error('Ошибка создания букинга: %s', response.text)
 
                     if error_detail == (
                         'Booking for these start_datetime and '
@@ -1925,15 +2031,17 @@ class BookingPage:
                             'Попробуйте позже.'
                         )
             except ValueError as ve:
-                print(f'Ошибка при создании букинга: {ve}')
+                logger.error('Ошибка при создании букинга: %s', ve)
                 self.show_snack_bar('Произошла ошибка при обработке данных.')
             except Exception as ex:
-                print(f'Неизвестная ошибка при создании букинга: {ex}')
+                logger.error('Неизвестная ошибка при создании букинга: %s', ex)
                 self.show_snack_bar(
                     'Произошла неизвестная ошибка. Попробуйте позже.'
                 )
         else:
-            print('Выберите бокс, автомобиль, дату и время для букинга.')
+            logger.debug(
+                'Выберите бокс, автомобиль, дату и время для букинга.',
+            )
             self.show_snack_bar(
                 'Пожалуйста, выберите бокс, автомобиль, дату и время.'
             )
@@ -1978,16 +2086,17 @@ class BookingPage:
             response = self.api.get_boxes(self.car_wash['id'])
             if response.status_code == 200:
                 all_boxes = response.json().get('data', [])
-                print(
-                    f'Боксы успешно загружены для автомойки '
-                    f'{self.car_wash["name"]}: {all_boxes}'
+                logger.debug(
+                    'Боксы успешно загружены для автомойки %s: %s',
+                    self.car_wash['name'],
+                    all_boxes,
                 )
                 self.boxes = all_boxes
             else:
-                print(f'Ошибка загрузки боксов: {response.text}')
+                logger.error('Ошибка загрузки боксов: %s', response.text)
                 self.boxes = []
         except Exception as e:
-            print(f'Ошибка загрузки боксов: {str(e)}')
+            logger.error('Ошибка загрузки боксов: %s', e)
             self.boxes = []
         finally:
             self.hide_loading()
@@ -2101,7 +2210,7 @@ class BookingPage:
         """
         Отображает SnackBar с заданным сообщением и цветом фона.
         """
-        print(f'Показываем сообщение: {message}')
+        logger.debug('Показываем сообщение: %s', message)
 
         self.snack_bar.content.value = message
         self.snack_bar.bgcolor = bgcolor
@@ -2112,15 +2221,35 @@ class BookingPage:
     def show_success_message(self, message: str):
         self.show_snack_bar(message, bgcolor=ft.colors.GREEN)
 
-    def show_loading(self):
+    def show_loading(self, request: RequestToken = None):
+        if request is not None:
+            request.loading = True
         self.loading_overlay.visible = True
-        self.page.update()
+        flush_updates(self.page)
 
-    def hide_loading(self):
+    def hide_loading(self, request: RequestToken = None):
+        if request is not None:
+            request.loading = False
         self.loading_overlay.visible = False
         self.page.update()
 
+    def discard_if_stale(self, request: RequestToken) -> bool:
+        """
+        True, если пользователь уже сделал новый выбор и результат
+        request отрисовывать нельзя. Индикатор загрузки снимается, если
+        его не показывает запрос нового выбора.
+        """
+        if not self.availability_requests.is_stale(request):
+            return False
+        if request.loading:
+            request.loading = False
+            if not self.availability_requests.current.loading:
+                self.hide_loading()
+        return True
+
+    @batched_updates
     def on_select_nearest_time_click(self, e):
+        request = self.availability_requests.begin()
         if self.nearest_time_selected:
             self.nearest_time_selected = False
             self.select_nearest_time_button.text = 'Выбрать ближайшее время'
@@ -2158,87 +2287,94 @@ class BookingPage:
                 self.show_snack_bar('Пожалуйста, выберите дату.')
                 return
 
-            self.show_loading()
+            self.show_loading(request)
 
-            date_str = self.selected_date.strftime('%Y-%m-%d')
-            response = self.api.get_available_times(
-                self.car_wash['id'], date_str
+            finder = EarliestSlotFinder(
+                self.api,
+                self.car_wash['id'],
+                self.available_dates,
+                cancelled=request.cancelled,
             )
+            candidates = finder.earliest_candidates(self.selected_date)
+            if self.discard_if_stale(request):
+                return
 
-            if response.status_code == 200:
-                available_times_data = response.json().get(
-                    'available_times', {}
+            if candidates:
+                earliest_time, free_ranges = candidates
+                selected_box_id = get_strategy()(earliest_time, free_ranges)
+                logger.debug(
+                    'Самый ранний слот: %s в боксе %s из свободных %s',
+                    earliest_time,
+                    selected_box_id,
+                    sorted(free_ranges),
                 )
-                available_slots = []
-
-                for box_id, time_ranges in available_times_data.items():
-                    parsed_times = self.parse_available_times(time_ranges)
-                    for slot_datetime in parsed_times:
-                        available_slots.append((slot_datetime, int(box_id)))
-                        print(
-                            f'Добавлено время: {slot_datetime}, бокс: {box_id}'
-                        )
 
-                if available_slots:
-                    available_slots.sort(key=lambda x: x[0])
-                    earliest_time, selected_box_id = available_slots[0]
-                    print(
-                        f'Самый ранний слот: {earliest_time} '
-                        f'в боксе {selected_box_id}'
+                if earliest_time.date() != self.selected_date:
+                    self.selected_date = earliest_time.date()
+                    self.set_box_options(
+                        {
+                            int(box_id)
+                            for box_id in finder.availability(
+                                self.selected_date
+                            )
+                        }
                     )
+                    self.box_dropdown.disabled = False
+                    self.calendar.select_date(self.selected_date)
 
-                    self.selected_box_id = selected_box_id
-                    self.selected_time = earliest_time
-                    self.selected_time_iso = earliest_time.isoformat()
+                self.selected_box_id = selected_box_id
+                self.selected_time = earliest_time
+                self.selected_time_iso = earliest_time.isoformat()
 
-                    self.box_dropdown.value = str(self.selected_box_id)
-                    self.box_dropdown.update()
+                self.box_dropdown.value = str(self.selected_box_id)
+                self.box_dropdown.update()
 
-                    self.time_dropdown_container.controls = [
-                        self.create_time_grid([self.selected_time])
-                    ]
-                    self.time_dropdown_container.disabled = False
-                    self.book_button.disabled = True
-                    self.complex_wash_checkbox.value = False
-                    self.complex_wash_checkbox.disabled = False
-                    self.price_text.value = 'Стоимость: ₸0'
-
-                    self.nearest_time_selected = True
-                    self.select_nearest_time_button.text = (
-                        'Выбрано ближайшее время'
-                    )
-                    self.update_nearest_time_button_style()
+                self.time_buttons = {}
+                self.time_dropdown_container.controls = [
+                    self.create_time_grid([self.selected_time])
+                ]
+                self.time_dropdown_container.disabled = False
+                self.book_button.disabled = True
+                self.complex_wash_checkbox.value = False
+                self.complex_wash_checkbox.disabled = False
+                self.price_text.value = 'Стоимость: ₸0'
+
+                self.nearest_time_selected = True
+                self.select_nearest_time_button.text = (
+                    'Выбрано ближайшее время'
+                )
+                self.update_nearest_time_button_style()
 
-                    self.calendar.update()
+                self.calendar.update()
 
-                    self.or_text.visible = False
-                    self.or_text.update()
+                self.or_text.visible = False
+                self.or_text.update()
 
-                    self.updating_panels = True
-                    try:
-                        self.expanded_panels = [False, False, True]
-                        self.update_expansion_panel_list()
-                    finally:
-                        self.updating_panels = False
+                self.updating_panels = True
+                try:
+                    self.expanded_panels = [False, False, True]
+                    self.update_expansion_panel_list()
+                finally:
+                    self.updating_panels = False
 
-                    self.page.update()
-                    self.hide_loading()
-                    self.show_snack_bar(
-                        f'Выбран бокс {selected_box_id} на '
-                        f'{earliest_time.strftime("%H:%M")}.',
-                        bgcolor=ft.colors.GREEN,
-                    )
-                else:
-                    self.hide_loading()
-                    self.show_snack_bar(
-                        'На выбранную дату нет доступных боксов и времени.'
-                    )
-            else:
-                self.hide_loading()
+                self.page.update()
+                self.hide_loading(request)
+                self.show_snack_bar(
+                    f'Выбран бокс {selected_box_id} на '
+                    f'{earliest_time.strftime("%d.%m %H:%M")}.',
+                    bgcolor=ft.colors.GREEN,
+                )
+            elif finder.failed:
+                self.hide_loading(request)
                 self.show_snack_bar(
                     'Не удалось загрузить доступные времена.',
                     bgcolor=ft.colors.RED,
                 )
+            else:
+                self.hide_loading(request)
+                self.show_snack_bar(
+                    'В ближайшие дни нет доступных боксов и времени.'
+                )
 
             self.update_nearest_time_button_style()
             self.page.update()
@@ -2275,32 +2411,36 @@ class BookingPage:
     def load_additions(self):
         car_wash_id = self.car_wash.get('id')
         if not car_wash_id:
-            print('ID автомойки не найден.')
+            logger.warning('ID автомойки не найден.')
             return
 
         response = self.api.get_additions(car_wash_id)
         if response.status_code == 200:
             data = response.json().get('data', [])
             self.available_additions = data
-            print(
-                f'Получены дополнительные услуги: {self.available_additions}'
+            logger.debug(
+                'Получены дополнительные услуги: %s',
+                self.available_additions,
             )
             self.populate_additions()
         else:
-            print(
-                f'Ошибка при загрузке дополнительных услуг: '
-                f'{response.status_code}, {response.text}'
+            logger.error(
+                'Ошибка при загрузке дополнительных услуг: %s, %s',
+                response.status_code,
+                response.text,
             )
 
     def populate_additions(self):
         if not self.additions_container:
-            print('Не удалось найти контейнер для дополнительных услуг.')
+            logger.error(
+                'Не удалось найти контейнер для дополнительных услуг.',
+            )
             return
 
         self.additions_container.controls.clear()
 
         for addition in self.available_additions:
-            print(f'Добавляем чекбокс для услуги: {addition["name"]}')
+            logger.debug('Добавляем чекбокс для услуги: %s', addition['name'])
             label_text = (
                 f"{addition['name']} " f"(+₸{int(float(addition['price']))})"
             )
@@ -2317,6 +2457,7 @@ class BookingPage:
 
         self.additions_container.update()
 
+    @batched_updates
     def on_addition_toggle(
         self, e: ft.ControlEvent, addition_id: int, price: float
     ):
@@ -2324,17 +2465,19 @@ class BookingPage:
             if addition_id not in self.selected_addition_ids:
                 self.selected_addition_ids.append(addition_id)
                 self.car_price += price
-                print(
-                    f'Добавлена услуга ID {addition_id}. '
-                    f'Новая цена: {self.car_price}'
+                logger.debug(
+                    'Добавлена услуга ID %s. Новая цена: %s',
+                    addition_id,
+                    self.car_price,
                 )
         else:
             if addition_id in self.selected_addition_ids:
                 self.selected_addition_ids.remove(addition_id)
                 self.car_price -= price
-                print(
-                    f'Удалена услуга ID {addition_id}. '
-                    f'Новая цена: {self.car_price}'
+                logger.debug(
+                    'Удалена услуга ID %s. Новая цена: %s',
+                    addition_id,
+                    self.car_price,
                 )
 
         self.show_price()
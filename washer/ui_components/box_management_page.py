@@ -3,18 +3,24 @@ import datetime
 import flet as ft
 
 from washer.api_requests import BackendApi
+from washer.car_wash_store import CarWashStore
+from washer.logger import get_logger
+from washer.ui_updates import batched_updates, flush_updates
+
+logger = get_logger(__name__)
 
 
 class BoxManagementPage:
     def __init__(self, page: ft.Page, car_wash, locations):
         self.page = page
         self.car_wash = car_wash
-        self.api = BackendApi()
-        self.api.set_access_token(self.page.client_storage.get('access_token'))
+        self.api = BackendApi.for_page(self.page)
         self.locations = locations
         self.boxes_list = []
         self.current_tab_index = 0
         self.tab_contents = {}
+        self.store = CarWashStore.for_page(self.page, self.api, self.car_wash)
+        self.booking_store = self.store.bookings
         self.setup_snack_bar()
 
         self.page.floating_action_button = None
@@ -58,9 +64,14 @@ class BoxManagementPage:
         self.page.add(app_bar)
         self.page.add(self.create_box_management_tabs())
 
+        self.booking_store.subscribe(
+            'BoxManagementPage', self.on_bookings_changed
+        )
+        self.store.start_feed()
+
     def show_loading(self):
         self.loading_overlay.visible = True
-        self.page.update()
+        flush_updates(self.page)
 
     def hide_loading(self):
         self.loading_overlay.visible = False
@@ -68,61 +79,60 @@ class BoxManagementPage:
 
     def load_boxes(self):
         try:
-            response = self.api.get_boxes(self.car_wash['id'])
-            if response.status_code == 200:
-                self.boxes_list = [
-                    box
-                    for box in response.json().get('data', [])
-                    if box['car_wash_id'] == self.car_wash['id']
-                ]
-                print(f'Успешно загружены боксы: {self.boxes_list}')
-            else:
-                print(
-                    f'Ошибка загрузки боксов для автомойки '
-                    f'{self.car_wash["id"]}: {response.text}'
-                )
+            boxes = self.store.boxes()
+            if boxes is not None:
+                self.boxes_list = boxes
+                logger.debug('Успешно загружены боксы: %s', self.boxes_list)
         except Exception as e:
-            print(f'Ошибка при загрузке боксов: {e}')
+            logger.error('Ошибка при загрузке боксов: %s', e)
 
     def load_boxes_and_refresh(self):
         try:
             self.load_boxes()
             self.refresh_tabs()
         except Exception as e:
-            print(f'Ошибка при загрузке боксов и обновлении вкладок: {e}')
+            logger.error(
+                'Ошибка при загрузке боксов и обновлении вкладок: %s',
+                e,
+            )
         finally:
             self.hide_loading()
 
     def load_bookings(self, box):
         try:
-            response = self.api.get_bookings(self.car_wash['id'])
-            if response.status_code == 200:
-                bookings_data = response.json().get('data', [])
-
-                completed_today_bookings = [
-                    booking
-                    for booking in bookings_data
-                    if (
-                        booking['box_id'] == box['id']
-                        and booking.get('state') == 'COMPLETED'
-                        and self.is_booking_today(
-                            booking.get('start_datetime')
-                        )
-                    )
-                ]
-                print(
-                    f'Найдено завершенных букингов на сегодня: '
-                    f'{completed_today_bookings}'
-                )
-                return completed_today_bookings
-            else:
-                print(
-                    f'Ошибка загрузки букингов: '
-                    f'{response.status_code}, {response.text}'
-                )
+            bookings = self.store.load_bookings()
         except Exception as e:
-            print(f'Ошибка при загрузке букингов: {e}')
-        return []
+            logger.error('Ошибка при загрузке букингов: %s', e)
+            return []
+        if bookings is None:
+            return []
+
+        completed_today_bookings = [
+            booking
+            for booking in bookings
+            if (
+                booking['box_id'] == box['id']
+                and booking.get('state') == 'COMPLETED'
+                and self.is_booking_today(booking.get('start_datetime'))
+            )
+        ]
+        logger.debug(
+            'Найдено завершенных букингов на сегодня: %s',
+            completed_today_bookings,
+        )
+        return completed_today_bookings
+
+    @batched_updates
+    def on_bookings_changed(self, changed, removed):
+        """Перестраивает вкладки только тех боксов, чьи букинги изменились."""
+        if removed:
+            boxes = self.boxes_list
+        else:
+            box_ids = {booking['box_id'] for booking in changed}
+            boxes = [box for box in self.boxes_list if box['id'] in box_ids]
+
+        for box in boxes:
+            self.update_tab_content(box)
 
     def is_booking_today(self, start_datetime_str):
         try:
@@ -131,7 +141,10 @@ class BoxManagementPage:
             )
             return start_datetime.date() == datetime.date.today()
         except ValueError:
-            print(f"Некорректный формат даты начала: '{start_datetime_str}'")
+            logger.debug(
+                "Некорректный формат даты начала: '%s'",
+                start_datetime_str,
+            )
             return False
 
     def create_box_management_tabs(self):
@@ -178,9 +191,10 @@ class BoxManagementPage:
                 total_price = round(float(total_price_str))
             except ValueError:
                 total_price = 0
-                print(
-                    f"Некорректная цена '{total_price_str}' "
-                    f"для букинга ID {booking.get('id')}."
+                logger.debug(
+                    "Некорректная цена '%s' для букинга ID %s.",
+                    total_price_str,
+                    booking.get('id'),
                 )
 
             start_datetime_str = booking.get('start_datetime', '')
@@ -190,9 +204,10 @@ class BoxManagementPage:
                 ).strftime('%H:%M')
             except ValueError:
                 start_time = 'Не указано'
-                print(
-                    f"Некорректное время начала '{start_datetime_str}' "
-                    f"для букинга ID {booking.get('id')}."
+                logger.debug(
+                    "Некорректное время начала '%s' для букинга ID %s.",
+                    start_datetime_str,
+                    booking.get('id'),
                 )
 
             total_revenue += total_price
@@ -379,6 +394,7 @@ class BoxManagementPage:
             padding=ft.padding.all(20),
         )
 
+    @batched_updates
     def on_add_box(self, box_name):
         self.show_loading()
         new_box_data = {
@@ -389,17 +405,21 @@ class BoxManagementPage:
 
         response = self.api.create_box(new_box_data)
         if response.status_code == 200:
-            print(f"Бокс '{box_name}' успешно добавлен.")
+            logger.debug("Бокс '%s' успешно добавлен.", box_name)
             new_box = response.json().get('data', {})
 
             if not new_box:
-                print('Сервер вернул пустой ответ. Обновляем список боксов...')
+                logger.warning(
+                    'Сервер вернул пустой ответ. Обновляем список боксов...',
+                )
+                self.store.invalidate('boxes')
                 self.load_boxes_and_refresh()
             else:
+                self.store.put('boxes', new_box)
                 self.boxes_list.append(new_box)
                 self.add_new_tab(new_box)
         else:
-            print(f'Ошибка добавления бокса: {response.text}')
+            logger.error('Ошибка добавления бокса: %s', response.text)
         self.hide_loading()
 
     def add_new_tab(self, box):
@@ -418,7 +438,7 @@ class BoxManagementPage:
                 )
                 tabs_control.update()
         except KeyError as e:
-            print(f'Ошибка при создании вкладки: отсутствует ключ {e}')
+            logger.error('Ошибка при создании вкладки: отсутствует ключ %s', e)
 
     def refresh_page(self):
         self.page.clean()
@@ -455,11 +475,13 @@ class BoxManagementPage:
 
         self.page.open(dlg_modal)
 
+    @batched_updates
     def delete_box_from_server(self, box_id):
         self.show_loading()
         response = self.api.delete_box(box_id)
         if response.status_code == 200:
-            print(f'Бокс с ID {box_id} успешно удалён.')
+            logger.debug('Бокс с ID %s успешно удалён.', box_id)
+            self.store.remove('boxes', box_id)
             self.boxes_list = [
                 box for box in self.boxes_list if box['id'] != box_id
             ]
@@ -471,14 +493,14 @@ class BoxManagementPage:
             error_message = response.json().get(
                 'detail', 'Невозможно удалить бокс.'
             )
-            print(f'Ошибка при удалении бокса: {error_message}')
+            logger.error('Ошибка при удалении бокса: %s', error_message)
             self.show_snack_bar(
                 f'Ошибка: {error_message}\nУдалите '
                 f'записи перед удалением бокса.',
                 bgcolor=ft.colors.RED,
             )
         else:
-            print(f'Ошибка при удалении бокса: {response.text}')
+            logger.error('Ошибка при удалении бокса: %s', response.text)
             self.show_snack_bar(
                 'На данном боксе зарегистрирована история записей.',
                 bgcolor=ft.colors.RED,
@@ -575,16 +597,18 @@ class BoxManagementPage:
             self.page.overlay.remove(self.modal_container)
         self.page.update()
 
+    @batched_updates
     def on_save_box(self, box, new_name):
         if new_name.strip():
             self.show_loading()
             box['name'] = new_name
             response = self.api.update_box(box['id'], new_name)
             if response.status_code == 200:
-                print(f"Бокс с ID {box['id']} успешно обновлён.")
+                logger.debug('Бокс с ID %s успешно обновлён.', box['id'])
+                self.store.put('boxes', box)
                 self.refresh_tabs()
             else:
-                print(f'Ошибка при обновлении бокса: {response.text}')
+                logger.error('Ошибка при обновлении бокса: %s', response.text)
             self.hide_loading()
         self.close_modal()
 
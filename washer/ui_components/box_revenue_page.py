@@ -1,9 +1,11 @@
 import datetime
 
 import flet as ft
-import httpx
 
 from washer.api_requests import BackendApi
+from washer.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class BoxRevenuePage:
@@ -11,8 +13,7 @@ class BoxRevenuePage:
         self.page = page
         self.box = box
         self.car_wash = car_wash
-        self.api = BackendApi()
-        self.api.set_access_token(self.page.client_storage.get('access_token'))
+        self.api = BackendApi.for_page(self.page)
         self.api_url = api_url
 
         self.current_date = datetime.date.today()
@@ -25,17 +26,7 @@ class BoxRevenuePage:
 
     def load_bookings(self):
         try:
-            access_token = self.page.client_storage.get('access_token')
-            car_wash_id = self.car_wash['id']
-            headers = {
-                'Authorization': f'Bearer {access_token}',
-                'Accept': 'application/json',
-            }
-            url = (
-                f"{self.api_url.rstrip('/')}/car_washes/bookings"
-                f"?car_wash_id={car_wash_id}&limit=1000"
-            )
-            response = httpx.get(url, headers=headers)
+            response = self.api.get_bookings(self.car_wash['id'])
 
             if response.status_code == 200:
                 bookings_data = response.json().get('data', [])
@@ -52,14 +43,15 @@ class BoxRevenuePage:
                     )
                     < current_time
                 ]
-                print('Полученные бронирования:', self.bookings)
+                logger.debug('Полученные бронирования: %s', self.bookings)
             else:
-                print(
-                    f'Ошибка загрузки букингов: '
-                    f'{response.status_code}, {response.text}'
+                logger.error(
+                    'Ошибка загрузки букингов: %s, %s',
+                    response.status_code,
+                    response.text,
                 )
         except Exception as e:
-            print(f'Ошибка при загрузке букингов: {e}')
+            logger.error('Ошибка при загрузке букингов: %s', e)
 
     def create_revenue_page(self):
         header = ft.Container(
@@ -93,7 +85,7 @@ class BoxRevenuePage:
         total_revenue = 0
 
         for index, booking in enumerate(self.bookings, start=1):
-            print('Данные бронирования:', booking)
+            logger.debug('Данные бронирования: %s', booking)
             service_name = booking.get('service_name', 'Не указано')
             price = round(float(booking.get('price', 0)))
             time = datetime.datetime.strptime(
@@ -1,26 +1,36 @@
 import datetime
-import io
 from datetime import date
 
 import flet as ft
+import httpx
 
 from washer.api_requests import BackendApi
+from washer.car_wash_directory import CarWashDirectory
+from washer.car_wash_store import CarWashStore
+from washer.geo import LocationIndex
+from washer.images import CAR_WASH_UPLOAD_SIZE, prepare_upload, upload_file
+from washer.logger import get_logger
 from washer.ui_components.archived_schedule_page import ArchivedSchedulePage
 from washer.ui_components.schedule_management_page import (
     ScheduleManagementPage,
 )
+from washer.ui_components.upload_progress_dialog import UploadProgressDialog
+from washer.ui_updates import batched_updates, flush_updates
+from washer.uploads import UploadCancelled
+
+logger = get_logger(__name__)
 
 
 class CarWashEditPage:
     def __init__(self, page: ft.Page, car_wash, locations):
         self.page = page
         self.car_wash = car_wash
-        self.api = BackendApi()
-        self.api.set_access_token(self.page.client_storage.get('access_token'))
+        self.api = BackendApi.for_page(self.page)
         self.locations = locations or self.fetch_locations()
         self.selected_image = None
-        self.selected_image_bytes = None
         self.original_image = self.car_wash['image_link']
+        self.store = CarWashStore.for_page(self.page, self.api, self.car_wash)
+        self.booking_store = self.store.bookings
         self.body_type_dict = {}
         self.total_revenue = 0
         self.total_monthly_revenue = 0
@@ -108,6 +118,11 @@ class CarWashEditPage:
         self.page.add(self.create_edit_page())
         self.page.update()
 
+        self.booking_store.subscribe(
+            'CarWashEditPage', self.on_bookings_changed
+        )
+        self.store.start_feed()
+
     def create_navigation_bar(self):
         navigation_bar = ft.NavigationBar(
             destinations=[
@@ -144,10 +159,12 @@ class CarWashEditPage:
         )
         return navigation_bar
 
+    @batched_updates
     def on_navigation_change(self, e):
         selected_index = e.control.selected_index
-        print(
-            f'[CarWashEditPage] NavigationBar selected index: {selected_index}'
+        logger.debug(
+            '[CarWashEditPage] NavigationBar selected index: %s',
+            selected_index,
         )
         if selected_index == 0:
             self.on_prices_button_click(None)
@@ -174,50 +191,35 @@ class CarWashEditPage:
         self.today_bookings = []
         self.total_revenue = 0
         self.total_monthly_revenue = 0  # Сброс месячной выручки
-        print(f'Данные сброшены для автомойки {self.car_wash["id"]}.')
+        logger.debug('Данные сброшены для автомойки %s.', self.car_wash['id'])
 
     def show_loading(self):
         self.loading_overlay.visible = True
-        self.page.update()
+        flush_updates(self.page)
 
     def hide_loading(self):
         self.loading_overlay.visible = False
         self.page.update()
 
     def fetch_locations(self):
-        print('Загружаем данные о локациях через API...')
-        response = self.api.get_locations()
-
-        if response.status_code == 200:
-            locations = response.json().get('data', [])
-            print(f'Загруженные локации: {locations}')
-            return {loc['id']: loc for loc in locations}
-        else:
-            print(f'Ошибка загрузки локаций: {response.text}')
+        logger.debug('Загружаем данные о локациях через API...')
+        location_index = LocationIndex.shared(self.api)
+        if location_index is None:
             return {}
+        return dict(location_index.locations)
 
     def load_schedules(self):
         self.schedule_list = []
         self.dates_storage = {}
-        print(f'Загрузка расписаний для автомойки {self.car_wash["id"]}')
+        logger.debug(
+            'Загрузка расписаний для автомойки %s',
+            self.car_wash['id'],
+        )
         self.show_loading()
-        response = self.api.get_schedules(self.car_wash['id'])
-        if response.status_code == 200:
-            self.schedule_list = [
-                schedule
-                for schedule in response.json().get('data', [])
-                if schedule['car_wash_id'] == self.car_wash['id']
-            ]
+        schedules = self.store.schedules()
+        if schedules is not None:
+            self.schedule_list = schedules
             self.initialize_dates_for_schedule()
-            print(
-                f'Загружено расписаний: {len(self.schedule_list)} '
-                f'для автомойки {self.car_wash["id"]}'
-            )
-        else:
-            print(
-                f'Ошибка загрузки расписаний для автомойки '
-                f'{self.car_wash["id"]}: {response.text}'
-            )
         self.hide_loading()
 
     def initialize_dates_for_schedule(self):
@@ -229,6 +231,7 @@ class CarWashEditPage:
             target_date = current_date + datetime.timedelta(days=delta_days)
             self.dates_storage[day_of_week] = target_date.strftime('%Y-%m-%d')
 
+    @batched_updates
     def update_revenue(self):
         self.load_total_revenue()
         self.load_monthly_revenue()
@@ -237,9 +240,8 @@ class CarWashEditPage:
         car_wash_id = None
         try:
             car_wash_id = self.car_wash['id']
-            response = self.api.get_bookings(car_wash_id)
-            if response and response.status_code == 200:
-                bookings_data = response.json().get('data', [])
+            bookings_data = self.store.load_bookings()
+            if bookings_data is not None:
                 current_date_str = datetime.date.today().strftime('%Y-%m-%d')
                 total_revenue = 0
                 for booking in bookings_data:
@@ -254,9 +256,10 @@ class CarWashEditPage:
 
                 self.total_revenue = int(total_revenue)
                 formatted_revenue = self.format_currency(self.total_revenue)
-                print(
-                    f'Общая выручка для автомойки '
-                    f'{car_wash_id}: {formatted_revenue} ₸'
+                logger.debug(
+                    'Общая выручка для автомойки %s: %s ₸',
+                    car_wash_id,
+                    formatted_revenue,
                 )
 
                 if hasattr(self, 'total_revenue_text'):
@@ -264,20 +267,16 @@ class CarWashEditPage:
                     self.total_revenue_text.color = ft.colors.WHITE
                     self.total_revenue_text.update()
             else:
-                print(
-                    f'Ошибка загрузки букингов для автомойки {car_wash_id}: '
-                    f'{response.status_code if response else "No response"}, '
-                    f'{response.text if response else ""}'
-                )
                 self.total_revenue = 0
                 if hasattr(self, 'total_revenue_text'):
                     self.total_revenue_text.value = '0 ₸'
                     self.total_revenue_text.color = ft.colors.WHITE
                     self.total_revenue_text.update()
         except Exception as e:
-            print(
-                f'Ошибка при загрузке букингов для автомойки '
-                f'{car_wash_id}: {e}'
+            logger.error(
+                'Ошибка при загрузке букингов для автомойки %s: %s',
+                car_wash_id,
+                e,
             )
             self.total_revenue = 0
             if hasattr(self, 'total_revenue_text'):
@@ -289,9 +288,8 @@ class CarWashEditPage:
         car_wash_id = None
         try:
             car_wash_id = self.car_wash['id']
-            response = self.api.get_bookings(car_wash_id)
-            if response and response.status_code == 200:
-                bookings_data = response.json().get('data', [])
+            bookings_data = self.store.load_bookings()
+            if bookings_data is not None:
                 today = datetime.date.today()
                 first_day_of_month = today.replace(day=1)
                 current_month_str = first_day_of_month.strftime('%Y-%m')
@@ -313,9 +311,10 @@ class CarWashEditPage:
                 formatted_monthly_revenue = self.format_currency(
                     self.total_monthly_revenue
                 )
-                print(
-                    f'Месячная выручка для автомойки '
-                    f'{car_wash_id}: {formatted_monthly_revenue} ₸'
+                logger.debug(
+                    'Месячная выручка для автомойки %s: %s ₸',
+                    car_wash_id,
+                    formatted_monthly_revenue,
                 )
 
                 if hasattr(self, 'monthly_revenue_text'):
@@ -325,20 +324,16 @@ class CarWashEditPage:
                     self.monthly_revenue_text.color = ft.colors.WHITE
                     self.monthly_revenue_text.update()
             else:
-                print(
-                    f'Ошибка загрузки букингов для автомойки {car_wash_id}: '
-                    f'{response.status_code if response else "No response"}, '
-                    f'{response.text if response else ""}'
-                )
                 self.total_monthly_revenue = 0
                 if hasattr(self, 'monthly_revenue_text'):
                     self.monthly_revenue_text.value = '0 ₸'
                     self.monthly_revenue_text.color = ft.colors.WHITE
                     self.monthly_revenue_text.update()
         except Exception as e:
-            print(
-                f'Ошибка при загрузке букингов для автомойки '
-                f'{car_wash_id}: {e}'
+            logger.error(
+                'Ошибка при загрузке букингов для автомойки %s: %s',
+                car_wash_id,
+                e,
             )
             self.total_monthly_revenue = 0
             if hasattr(self, 'monthly_revenue_text'):
@@ -347,10 +342,8 @@ class CarWashEditPage:
                 self.monthly_revenue_text.update()
 
     def load_today_bookings(self):
-        car_wash_id = self.car_wash['id']
-        response = self.api.get_bookings(car_wash_id)
-        if response.status_code == 200:
-            all_bookings = response.json().get('data', [])
+        all_bookings = self.store.load_bookings()
+        if all_bookings is not None:
             today = datetime.date.today().strftime('%Y-%m-%d')
             today_bookings = [
                 booking
@@ -358,44 +351,19 @@ class CarWashEditPage:
                 if booking['start_datetime'].startswith(today)
             ]
             for booking in today_bookings:
-                box = next(
-                    (
-                        bx
-                        for bx in self.boxes_list
-                        if bx['id'] == booking['box_id']
-                    ),
-                    None,
-                )
-                booking['box_name'] = (
-                    box['name'] if box else 'Неизвестный бокс'
-                )
-                if box is None:
-                    print(f"Не удалось найти бокс с ID: {booking['box_id']}")
+                booking['box_name'] = self.get_box_name(booking['box_id'])
             return today_bookings
-        else:
-            print(
-                f'Ошибка загрузки букингов для автомойки {car_wash_id}: '
-                f'{response.status_code}, {response.text}'
-            )
-            return []
+        return []
+
+    def get_box_name(self, box_id):
+        box = next((bx for bx in self.boxes_list if bx['id'] == box_id), None)
+        if box is None:
+            logger.error('Не удалось найти бокс с ID: %s', box_id)
+            return 'Неизвестный бокс'
+        return box['name']
 
     def load_boxes(self):
-        self.boxes_list = []
-        response = self.api.get_boxes(self.car_wash['id'])
-        if response.status_code == 200:
-            self.boxes_list = [
-                box
-                for box in response.json().get('data', [])
-                if box['car_wash_id'] == self.car_wash['id']
-            ]
-            print(
-                f'Боксы для автомойки {self.car_wash["id"]} успешно загружены.'
-            )
-        else:
-            print(
-                f'Ошибка загрузки боксов для автомойки '
-                f'{self.car_wash["id"]}: {response.text}'
-            )
+        self.boxes_list = self.store.boxes() or []
 
     def create_edit_page(self):
         location_id = self.car_wash.get('location_id')
@@ -403,9 +371,10 @@ class CarWashEditPage:
         city = location.get('city', 'Неизвестный город')
         address = location.get('address', 'Неизвестный адрес')
 
-        print(
-            f'Создаем страницу редактирования '
-            f'для города: {city}, адрес: {address}'
+        logger.debug(
+            'Создаем страницу редактирования для города: %s, адрес: %s',
+            city,
+            address,
         )
 
         location_display = f'{city}, {address}'
@@ -588,297 +557,302 @@ class CarWashEditPage:
         section_header = ft.Text(
             'Новые букинги', size=24, weight=ft.FontWeight.BOLD
         )
-        bookings_container = ft.Column(controls=[], spacing=10, expand=True)
-        created_bookings = [
-            b for b in self.today_bookings if b.get('state') == 'CREATED'
-        ]
+        self.created_booking_cards = {
+            booking['id']: self.create_created_booking_card(booking)
+            for booking in self.today_bookings
+            if booking.get('state') == 'CREATED'
+        }
+        self.created_bookings_container = ft.Column(
+            controls=[], spacing=10, expand=True
+        )
+        self.fill_created_bookings_container()
 
-        if not created_bookings:
-            bookings_container.controls.append(
+        return ft.Column(
+            controls=[section_header, self.created_bookings_container],
+            spacing=10,
+        )
+
+    def fill_created_bookings_container(self):
+        if self.created_booking_cards:
+            self.created_bookings_container.controls = [
+                self.created_booking_cards[booking['id']]
+                for booking in self.today_bookings
+                if booking['id'] in self.created_booking_cards
+            ]
+        else:
+            self.created_bookings_container.controls = [
                 ft.Text(
                     'Нет букингов',
                     size=16,
                     color=ft.colors.GREY,
                     text_align=ft.TextAlign.CENTER,
                 )
-            )
-        else:
-            for booking in created_bookings:
-                user_car = booking.get('user_car', {})
-                user_info = user_car.get('user', {})
-                first_name = user_info.get('first_name', 'Неизвестный')
-                last_name = user_info.get('last_name', 'Клиент')
-                full_name = f'{first_name} {last_name}'.strip()
-                phone_number = user_info.get(
-                    'phone_number', 'Неизвестный номер'
-                )
-                user_id = user_info.get('id', None)
+            ]
 
-                car_name = user_car.get('name', 'Неизвестный автомобиль')
-                license_plate = user_car.get(
-                    'license_plate', 'Неизвестный номер'
-                )
+    def create_created_booking_card(self, booking):
+        user_car = booking.get('user_car', {})
+        user_info = user_car.get('user', {})
+        first_name = user_info.get('first_name', 'Неизвестный')
+        last_name = user_info.get('last_name', 'Клиент')
+        full_name = f'{first_name} {last_name}'.strip()
+        phone_number = user_info.get('phone_number', 'Неизвестный номер')
+        user_id = user_info.get('id', None)
+
+        car_name = user_car.get('name', 'Неизвестный автомобиль')
+        license_plate = user_car.get('license_plate', 'Неизвестный номер')
+
+        start_time = datetime.datetime.fromisoformat(
+            booking['start_datetime']
+        ).strftime('%H:%M')
+        end_time = datetime.datetime.fromisoformat(
+            booking['end_datetime']
+        ).strftime('%H:%M')
+        time_range = f'{start_time} - {end_time}'
+        box_name = booking.get('box_name', 'Неизвестный бокс')
+        total_price = booking.get('total_price', '0.00 ₸')
+        notes = booking.get('notes', '').strip()
 
-                start_time = datetime.datetime.fromisoformat(
-                    booking['start_datetime']
-                ).strftime('%H:%M')
-                end_time = datetime.datetime.fromisoformat(
-                    booking['end_datetime']
-                ).strftime('%H:%M')
-                time_range = f'{start_time} - {end_time}'
-                box_name = booking.get('box_name', 'Неизвестный бокс')
-                total_price = booking.get('total_price', '0.00 ₸')
-                notes = booking.get('notes', '').strip()
-
-                confirm_button = ft.ElevatedButton(
-                    text='Подтвердить',
-                    on_click=lambda e,
-                    b_id=booking['id']: self.show_confirmation_dialog(b_id),
-                    bgcolor=ft.colors.ORANGE,
-                    color=ft.colors.WHITE,
-                )
+        confirm_button = ft.ElevatedButton(
+            text='Подтвердить',
+            on_click=lambda e,
+            b_id=booking['id']: self.show_confirmation_dialog(b_id),
+            bgcolor=ft.colors.ORANGE,
+            color=ft.colors.WHITE,
+        )
 
-                decline_button = ft.TextButton(
-                    text='Отказать',
-                    on_click=lambda e,
-                    b_id=booking['id']: self.show_decline_dialog(b_id),
-                    style=ft.ButtonStyle(color=ft.colors.RED),
-                )
+        decline_button = ft.TextButton(
+            text='Отказать',
+            on_click=lambda e, b_id=booking['id']: self.show_decline_dialog(
+                b_id
+            ),
+            style=ft.ButtonStyle(color=ft.colors.RED),
+        )
 
-                buttons_column = ft.Column(
-                    controls=[
-                        confirm_button,
-                        ft.Container(height=5),
-                        decline_button,
-                    ],
-                    alignment=ft.MainAxisAlignment.CENTER,
-                    horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                    spacing=0,
-                )
+        buttons_column = ft.Column(
+            controls=[
+                confirm_button,
+                ft.Container(height=5),
+                decline_button,
+            ],
+            alignment=ft.MainAxisAlignment.CENTER,
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+            spacing=0,
+        )
 
-                booking_controls = [
+        booking_controls = [
+            ft.Text(
+                'Пользователь',
+                weight=ft.FontWeight.BOLD,
+                size=16,
+            ),
+            ft.Row(
+                [
+                    ft.Icon(
+                        ft.icons.PERSON,
+                        size=20,
+                        color=ft.colors.BLUE_600,
+                    ),
                     ft.Text(
-                        'Пользователь',
-                        weight=ft.FontWeight.BOLD,
-                        size=16,
+                        full_name,
+                        width=200,
+                        text_align=ft.TextAlign.LEFT,
                     ),
+                ]
+            ),
+        ]
+
+        if user_id != 1:
+            call_on_click = self.create_phone_click_handler(phone_number)
+
+            booking_controls.extend(
+                [
                     ft.Row(
                         [
                             ft.Icon(
-                                ft.icons.PERSON,
+                                ft.icons.PHONE,
                                 size=20,
-                                color=ft.colors.BLUE_600,
+                                color=ft.colors.GREEN_600,
                             ),
-                            ft.Text(
-                                full_name,
-                                width=200,
-                                text_align=ft.TextAlign.LEFT,
+                            ft.Container(
+                                content=ft.Row(
+                                    controls=[
+                                        ft.Text(
+                                            phone_number,
+                                            size=14,
+                                            color=ft.colors.BLUE_600,
+                                            weight=ft.FontWeight.NORMAL,
+                                        ),
+                                    ],
+                                    alignment=ft.MainAxisAlignment.START,
+                                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                    spacing=4,
+                                ),
+                                on_click=call_on_click,
+                                padding=ft.padding.symmetric(vertical=2),
+                                bgcolor=ft.colors.TRANSPARENT,
+                                border_radius=ft.border_radius.all(4),
+                                ink=True,  # Добавляет эффект нажатия
                             ),
                         ]
                     ),
                 ]
+            )
 
-                if user_id != 1:
-                    call_on_click = self.create_phone_click_handler(
-                        phone_number
-                    )
-
-                    booking_controls.extend(
-                        [
-                            ft.Row(
-                                [
-                                    ft.Icon(
-                                        ft.icons.PHONE,
-                                        size=20,
-                                        color=ft.colors.GREEN_600,
-                                    ),
-                                    ft.Container(
-                                        content=ft.Row(
-                                            controls=[
-                                                ft.Text(
-                                                    phone_number,
-                                                    size=14,
-                                                    color=ft.colors.BLUE_600,
-                                                    weight=ft.FontWeight.NORMAL,
-                                                ),
-                                            ],
-                                            alignment=ft.MainAxisAlignment.START,
-                                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                                            spacing=4,
-                                        ),
-                                        on_click=call_on_click,
-                                        padding=ft.padding.symmetric(
-                                            vertical=2
-                                        ),
-                                        bgcolor=ft.colors.TRANSPARENT,
-                                        border_radius=ft.border_radius.all(4),
-                                        ink=True,  # Добавляет эффект нажатия
-                                    ),
-                                ]
-                            ),
-                        ]
-                    )
-
-                booking_controls.extend(
+        booking_controls.extend(
+            [
+                ft.Divider(thickness=1, color=ft.colors.GREY_300),
+                ft.Text(
+                    'Информация о записи',
+                    weight=ft.FontWeight.BOLD,
+                    size=16,
+                ),
+                ft.Row(
                     [
-                        ft.Divider(thickness=1, color=ft.colors.GREY_300),
+                        ft.Icon(
+                            ft.icons.ACCESS_TIME,
+                            size=20,
+                            color=ft.colors.ORANGE_600,
+                        ),
                         ft.Text(
-                            'Информация о записи',
-                            weight=ft.FontWeight.BOLD,
-                            size=16,
+                            time_range,
+                            width=200,
+                            text_align=ft.TextAlign.LEFT,
                         ),
-                        ft.Row(
-                            [
-                                ft.Icon(
-                                    ft.icons.ACCESS_TIME,
-                                    size=20,
-                                    color=ft.colors.ORANGE_600,
-                                ),
-                                ft.Text(
-                                    time_range,
-                                    width=200,
-                                    text_align=ft.TextAlign.LEFT,
-                                ),
-                            ]
+                    ]
+                ),
+                ft.Row(
+                    [
+                        ft.Icon(
+                            ft.icons.INBOX,
+                            size=20,
+                            color=ft.colors.PURPLE_600,
                         ),
-                        ft.Row(
-                            [
-                                ft.Icon(
-                                    ft.icons.INBOX,
-                                    size=20,
-                                    color=ft.colors.PURPLE_600,
-                                ),
-                                ft.Text(
-                                    box_name,
-                                    width=200,
-                                    text_align=ft.TextAlign.LEFT,
-                                ),
-                            ]
+                        ft.Text(
+                            box_name,
+                            width=200,
+                            text_align=ft.TextAlign.LEFT,
                         ),
-                        ft.Row(
-                            [
-                                ft.Icon(
-                                    ft.icons.ATTACH_MONEY,
-                                    size=20,
-                                    color=ft.colors.GREEN_600,
-                                ),
-                                ft.Text(
-                                    f'{total_price}',
-                                    width=200,
-                                    text_align=ft.TextAlign.LEFT,
-                                ),
-                            ]
+                    ]
+                ),
+                ft.Row(
+                    [
+                        ft.Icon(
+                            ft.icons.ATTACH_MONEY,
+                            size=20,
+                            color=ft.colors.GREEN_600,
+                        ),
+                        ft.Text(
+                            f'{total_price}',
+                            width=200,
+                            text_align=ft.TextAlign.LEFT,
                         ),
                     ]
-                )
+                ),
+            ]
+        )
 
-                additions = booking.get('additions', [])
-                if additions:
-                    additional_services = ', '.join(
-                        [addition['name'] for addition in additions]
-                    )
-                    booking_controls.extend(
+        additions = booking.get('additions', [])
+        if additions:
+            additional_services = ', '.join(
+                [addition['name'] for addition in additions]
+            )
+            booking_controls.extend(
+                [
+                    ft.Row(
                         [
-                            ft.Row(
-                                [
-                                    ft.Icon(
-                                        ft.icons.ADD,
-                                        size=20,
-                                        color=ft.colors.BLUE_600,
-                                    ),
-                                    ft.Text(
-                                        additional_services,
-                                        width=200,
-                                        text_align=ft.TextAlign.LEFT,
-                                    ),
-                                ],
-                                alignment=ft.MainAxisAlignment.START,
-                                spacing=10,
-                                visible=True,
+                            ft.Icon(
+                                ft.icons.ADD,
+                                size=20,
+                                color=ft.colors.BLUE_600,
                             ),
-                        ]
-                    )
-
-                if has_notes := bool(notes):
-                    booking_controls.append(
-                        ft.Row(
-                            [
-                                ft.Icon(
-                                    ft.icons.NOTE,
-                                    size=20,
-                                    color=ft.colors.RED_600,
-                                ),
-                                ft.Text(
-                                    notes,
-                                    width=200,
-                                    text_align=ft.TextAlign.LEFT,
-                                    overflow=ft.TextOverflow.CLIP,
-                                    expand=True,
-                                    max_lines=None,
-                                ),
-                            ],
-                            alignment=ft.MainAxisAlignment.START,
-                            spacing=10,
-                            visible=has_notes,
-                        )
-                    )
+                            ft.Text(
+                                additional_services,
+                                width=200,
+                                text_align=ft.TextAlign.LEFT,
+                            ),
+                        ],
+                        alignment=ft.MainAxisAlignment.START,
+                        spacing=10,
+                        visible=True,
+                    ),
+                ]
+            )
 
-                booking_controls.extend(
+        if has_notes := bool(notes):
+            booking_controls.append(
+                ft.Row(
                     [
-                        ft.Divider(thickness=1, color=ft.colors.GREY_300),
+                        ft.Icon(
+                            ft.icons.NOTE,
+                            size=20,
+                            color=ft.colors.RED_600,
+                        ),
                         ft.Text(
-                            'Автомобиль',
-                            weight=ft.FontWeight.BOLD,
-                            size=16,
+                            notes,
+                            width=200,
+                            text_align=ft.TextAlign.LEFT,
+                            overflow=ft.TextOverflow.CLIP,
+                            expand=True,
+                            max_lines=None,
                         ),
-                        ft.Row(
-                            [
-                                ft.Icon(
-                                    ft.icons.DIRECTIONS_CAR,
-                                    size=20,
-                                    color=ft.colors.BLUE_GREY_600,
-                                ),
-                                ft.Text(
-                                    car_name,
-                                    width=200,
-                                    text_align=ft.TextAlign.LEFT,
-                                ),
-                            ]
+                    ],
+                    alignment=ft.MainAxisAlignment.START,
+                    spacing=10,
+                    visible=has_notes,
+                )
+            )
+
+        booking_controls.extend(
+            [
+                ft.Divider(thickness=1, color=ft.colors.GREY_300),
+                ft.Text(
+                    'Автомобиль',
+                    weight=ft.FontWeight.BOLD,
+                    size=16,
+                ),
+                ft.Row(
+                    [
+                        ft.Icon(
+                            ft.icons.DIRECTIONS_CAR,
+                            size=20,
+                            color=ft.colors.BLUE_GREY_600,
                         ),
-                        ft.Row(
-                            [
-                                ft.Icon(
-                                    ft.icons.NUMBERS,
-                                    size=20,
-                                    color=ft.colors.PINK_600,
-                                ),
-                                ft.Text(
-                                    license_plate,
-                                    width=200,
-                                    text_align=ft.TextAlign.LEFT,
-                                ),
-                            ]
+                        ft.Text(
+                            car_name,
+                            width=200,
+                            text_align=ft.TextAlign.LEFT,
                         ),
-                        buttons_column,
                     ]
-                )
-
-                booking_card = ft.Card(
-                    content=ft.Container(
-                        content=ft.Column(
-                            controls=booking_controls,
-                            spacing=10,
+                ),
+                ft.Row(
+                    [
+                        ft.Icon(
+                            ft.icons.NUMBERS,
+                            size=20,
+                            color=ft.colors.PINK_600,
                         ),
-                        padding=ft.padding.all(10),
-                    ),
-                    elevation=2,
-                )
-                bookings_container.controls.append(booking_card)
+                        ft.Text(
+                            license_plate,
+                            width=200,
+                            text_align=ft.TextAlign.LEFT,
+                        ),
+                    ]
+                ),
+                buttons_column,
+            ]
+        )
 
-        return ft.Column(
-            controls=[section_header, bookings_container],
-            spacing=10,
+        booking_card = ft.Card(
+            content=ft.Container(
+                content=ft.Column(
+                    controls=booking_controls,
+                    spacing=10,
+                ),
+                padding=ft.padding.all(10),
+            ),
+            elevation=2,
         )
+        return booking_card
 
     def create_phone_click_handler(self, phone_number):
         def handler(e):
@@ -887,40 +861,190 @@ class CarWashEditPage:
         return handler
 
     def on_confirm_booking(self, booking_id):
-        print(f'Подтверждение букинга ID: {booking_id}')
-        self.show_loading()
-        updated_data = {'state': 'ACCEPTED'}
-        response = self.api.update_booking(booking_id, updated_data)
+        logger.debug('Подтверждение букинга ID: %s', booking_id)
+        self.apply_booking_update(
+            booking_id,
+            {'state': 'ACCEPTED'},
+            success_message=f'Букинг ID {booking_id} успешно подтвержден',
+            error_message=f'Ошибка при подтверждении букинга ID {booking_id}',
+        )
 
-        if response and response.status_code == 200:
-            for booking in self.today_bookings:
-                if booking['id'] == booking_id:
-                    booking['state'] = 'ACCEPTED'
-                    break
-            self.show_success_message(
-                f'Букинг ID {booking_id} успешно подтвержден'
+    def apply_booking_update(
+        self, booking_id, changes, success_message, error_message
+    ):
+        """
+        Оптимистичное изменение букинга: новое состояние сразу
+        применяется локально и перерисовывается только строка этого
+        букинга, PATCH уходит в фоне. При ошибке откатываются поля,
+        которые с тех пор никто не менял, и показывается уведомление.
+        """
+        booking = next(
+            (
+                booking
+                for booking in self.today_bookings
+                if booking['id'] == booking_id
+            ),
+            None,
+        )
+        if not booking:
+            self.show_error_message('Букинг не найден.')
+            return
+
+        with self.booking_store.lock:
+            previous_values = {key: booking.get(key) for key in changes}
+            previous_state = booking.get('state', '').upper()
+            booking.update(changes)
+        self.patch_booking_controls(booking, previous_state)
+        self.page.update()
+
+        def task():
+            try:
+                response = self.api.update_booking(booking_id, changes)
+            except httpx.HTTPError as e:
+                logger.error('Ошибка запроса при обновлении букинга: %s', e)
+                response = None
+
+            if response is not None and response.status_code == 200:
+                self.store.bookings.upsert(
+                    [self.stored_booking(response, booking)]
+                )
+                self.show_success_message(success_message)
+                new_state = booking.get('state', '').upper()
+                if 'COMPLETED' in (previous_state, new_state):
+                    self.update_revenue()
+                return
+
+            logger.error(
+                'Ошибка при обновлении букинга ID %s: %s',
+                booking_id,
+                response.text if response is not None else 'No response',
             )
-            self.update_booking_status_dashboard()
-            self.update_created_bookings_dashboard()
-        else:
-            print(
-                f'Ошибка при подтверждении букинга ID '
-                f'{booking_id}: {response.text if response else "No response"}'
+            # Откатываются только поля, которые с тех пор не изменили
+            # другая правка или лента букингов
+            with self.booking_store.lock:
+                current_state = booking.get('state', '').upper()
+                reverted = {
+                    key: previous_values[key]
+                    for key, value in changes.items()
+                    if booking.get(key) == value
+                }
+                booking.update(reverted)
+                is_listed = any(
+                    listed is booking for listed in self.today_bookings
+                )
+            if reverted and is_listed:
+                self.patch_booking_controls(booking, current_state)
+                self.page.update()
+            self.show_error_message(error_message)
+
+        self.page.run_thread(task)
+
+    def stored_booking(self, response, booking):
+        """
+        Букинг из ответа на PATCH для общего хранилища. Если бэкенд
+        вернул не букинг, берётся локальная копия с применёнными
+        изменениями.
+        """
+        payload = response.json()
+        if isinstance(payload, dict) and 'id' in payload:
+            return payload
+        return {
+            key: value for key, value in booking.items() if key != 'box_name'
+        }
+
+    def patch_booking_controls(self, booking, previous_state):
+        """
+        Перестраивает карточку или строку одного букинга и переносит её
+        между секциями новых букингов и статусов, если изменилось
+        состояние CREATED.
+        """
+        booking_id = booking['id']
+        self.created_booking_cards.pop(booking_id, None)
+        self.booking_status_rows.pop(booking_id, None)
+
+        if booking.get('state', '').upper() == 'CREATED':
+            self.created_booking_cards[booking_id] = (
+                self.create_created_booking_card(booking)
             )
-            self.show_error_message(
-                f'Ошибка при подтверждении букинга ID {booking_id}'
+        else:
+            self.booking_status_rows[booking_id] = (
+                self.create_booking_status_row(booking)
             )
 
-        self.hide_loading()
+        if previous_state == 'CREATED' or booking_id in (
+            self.created_booking_cards
+        ):
+            self.fill_created_bookings_container()
+        self.fill_booking_status_rows_column()
+
+    @batched_updates
+    def on_bookings_changed(self, changed, removed):
+        """
+        Применяет дельту из ленты букингов: перестраиваются только
+        строки изменившихся букингов за сегодня.
+        """
+        today = datetime.date.today().isoformat()
+        revenue_changed = False
+        patched = []
+        dropped = []
+
+        # Под замком хранилища, чтобы не смешаться с оптимистичной
+        # правкой или её откатом в apply_booking_update
+        with self.booking_store.lock:
+            bookings_by_id = {
+                booking['id']: booking for booking in self.today_bookings
+            }
+            for booking in changed:
+                current = bookings_by_id.get(booking['id'])
+                if not booking['start_datetime'].startswith(today):
+                    if current:
+                        removed = [*removed, booking['id']]
+                    continue
+
+                booking['box_name'] = self.get_box_name(booking['box_id'])
+                if current:
+                    previous_state = current.get('state', '').upper()
+                    current.clear()
+                    current.update(booking)
+                else:
+                    previous_state = None
+                    current = booking
+                    self.today_bookings.append(booking)
+                    bookings_by_id[booking['id']] = booking
+                patched.append((current, previous_state))
+
+            for booking_id in removed:
+                current = bookings_by_id.pop(booking_id, None)
+                if current is not None:
+                    self.today_bookings.remove(current)
+                    dropped.append(current)
+
+        for current, previous_state in patched:
+            new_state = current.get('state', '').upper()
+            if 'COMPLETED' in (previous_state, new_state):
+                revenue_changed = True
+            self.patch_booking_controls(current, previous_state)
+
+        for current in dropped:
+            booking_id = current['id']
+            if current.get('state', '').upper() == 'COMPLETED':
+                revenue_changed = True
+            if self.created_booking_cards.pop(booking_id, None):
+                self.fill_created_bookings_container()
+            if self.booking_status_rows.pop(booking_id, None):
+                self.fill_booking_status_rows_column()
+
         self.page.update()
+        if revenue_changed:
+            self.update_revenue()
 
     def update_created_bookings_dashboard(self):
-        print('Обновление таблицы новых букингов (CREATED)...')
+        logger.debug('Обновление таблицы новых букингов (CREATED)...')
         self.created_bookings_dashboard.content = (
             self.create_created_bookings_section()
         )
         self.created_bookings_dashboard.update()
-        print('Таблица новых букингов обновлена.')
+        logger.debug('Таблица новых букингов обновлена.')
 
     def create_booking_status_dashboard(self):
         header = ft.Row(
@@ -952,17 +1076,40 @@ class CarWashEditPage:
             ],
             alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
         )
-        rows = [header]
+        self.booking_status_rows = {
+            booking['id']: self.create_booking_status_row(booking)
+            for booking in self.today_bookings
+            if booking.get('state') != 'CREATED'
+        }
+        self.booking_status_rows_column = ft.Column(controls=[], spacing=10)
+        self.fill_booking_status_rows_column()
 
-        filtered_bookings = [
-            b for b in self.today_bookings if b.get('state') != 'CREATED'
-        ]
+        return ft.Column(
+            controls=[
+                ft.Text('Статус букингов', size=24, weight=ft.FontWeight.BOLD),
+                header,
+                self.booking_status_rows_column,
+            ],
+            spacing=10,
+        )
+
+    def fill_booking_status_rows_column(self):
         sorted_bookings = sorted(
-            filtered_bookings, key=lambda b: b['start_datetime']
+            (
+                booking
+                for booking in self.today_bookings
+                if booking['id'] in self.booking_status_rows
+            ),
+            key=lambda b: b['start_datetime'],
         )
 
-        if not sorted_bookings:
-            rows.append(
+        if sorted_bookings:
+            self.booking_status_rows_column.controls = [
+                self.booking_status_rows[booking['id']]
+                for booking in sorted_bookings
+            ]
+        else:
+            self.booking_status_rows_column.controls = [
                 ft.Row(
                     controls=[
                         ft.Text(
@@ -973,87 +1120,77 @@ class CarWashEditPage:
                     ],
                     alignment=ft.MainAxisAlignment.CENTER,
                 )
-            )
-        else:
-            for booking in sorted_bookings:
-                booking_id = booking.get('id')
-                start_time = datetime.datetime.fromisoformat(
-                    booking['start_datetime']
-                ).strftime('%H:%M')
-                end_time = datetime.datetime.fromisoformat(
-                    booking['end_datetime']
-                ).strftime('%H:%M')
-                state = booking.get('state', 'CREATED').upper()
-                notes = booking.get('notes', '')
-                box_name = booking.get('box_name', 'Неизвестный бокс')
-
-                status_info = self.get_status_info(state)
-                display_text = status_info['text']
-
-                # Обработка клика по кнопке статуса
-                status_btn = ft.TextButton(
-                    text=display_text,
-                    style=ft.ButtonStyle(
-                        color={ft.MaterialState.DEFAULT: status_info['color']},
-                    ),
-                    on_click=lambda e,
-                    b_id=booking_id,
-                    c_notes=notes,
-                    st=state: self.create_radio_dialog(b_id, c_notes, st),
-                    tooltip=display_text,  # Подсказка с полным текстом
-                )
-
-                # Создаем строку букинга
-                row = ft.Row(
-                    controls=[
-                        ft.Text(
-                            start_time,
-                            width=70,
-                            text_align=ft.TextAlign.CENTER,
-                        ),
-                        ft.Text(
-                            end_time, width=90, text_align=ft.TextAlign.CENTER
-                        ),
-                        ft.Text(
-                            box_name, width=70, text_align=ft.TextAlign.CENTER
-                        ),
-                        status_btn,
-                    ],
-                    alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-                )
-
-                # Оборачиваем строку в Container для кликабельности
-                clickable_row = ft.Container(
-                    content=row,
-                    on_click=lambda e,
-                    b=booking: self.open_booking_details_dialog(b),
-                    bgcolor=ft.colors.TRANSPARENT,
-                    padding=ft.padding.symmetric(vertical=0, horizontal=0),
-                    margin=ft.margin.symmetric(vertical=0, horizontal=0),
-                )
-                rows.append(clickable_row)
+            ]
 
-                if state == 'STARTED':
-                    progress_bar = ft.ProgressBar(
-                        width=600,
-                        height=10,
-                        color=ft.colors.ORANGE,
-                        bgcolor=ft.colors.TRANSPARENT,
-                        value=None,
-                    )
-                    progress_container = ft.Container(
-                        content=progress_bar,
-                        padding=ft.padding.only(top=5, bottom=10),
-                    )
-                    rows.append(progress_container)
+    def create_booking_status_row(self, booking):
+        rows = []
+        booking_id = booking.get('id')
+        start_time = datetime.datetime.fromisoformat(
+            booking['start_datetime']
+        ).strftime('%H:%M')
+        end_time = datetime.datetime.fromisoformat(
+            booking['end_datetime']
+        ).strftime('%H:%M')
+        state = booking.get('state', 'CREATED').upper()
+        notes = booking.get('notes', '')
+        box_name = booking.get('box_name', 'Неизвестный бокс')
+
+        status_info = self.get_status_info(state)
+        display_text = status_info['text']
+
+        # Обработка клика по кнопке статуса
+        status_btn = ft.TextButton(
+            text=display_text,
+            style=ft.ButtonStyle(
+                color={ft.MaterialState.DEFAULT: status_info['color']},
+            ),
+            on_click=lambda e,
+            b_id=booking_id,
+            c_notes=notes,
+            st=state: self.create_radio_dialog(b_id, c_notes, st),
+            tooltip=display_text,  # Подсказка с полным текстом
+        )
 
-        return ft.Column(
+        # Создаем строку букинга
+        row = ft.Row(
             controls=[
-                ft.Text('Статус букингов', size=24, weight=ft.FontWeight.BOLD)
-            ]
-            + rows,
-            spacing=10,
+                ft.Text(
+                    start_time,
+                    width=70,
+                    text_align=ft.TextAlign.CENTER,
+                ),
+                ft.Text(end_time, width=90, text_align=ft.TextAlign.CENTER),
+                ft.Text(box_name, width=70, text_align=ft.TextAlign.CENTER),
+                status_btn,
+            ],
+            alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+        )
+
+        # Оборачиваем строку в Container для кликабельности
+        clickable_row = ft.Container(
+            content=row,
+            on_click=lambda e, b=booking: self.open_booking_details_dialog(b),
+            bgcolor=ft.colors.TRANSPARENT,
+            padding=ft.padding.symmetric(vertical=0, horizontal=0),
+            margin=ft.margin.symmetric(vertical=0, horizontal=0),
         )
+        rows.append(clickable_row)
+
+        if state == 'STARTED':
+            progress_bar = ft.ProgressBar(
+                width=600,
+                height=10,
+                color=ft.colors.ORANGE,
+                bgcolor=ft.colors.TRANSPARENT,
+                value=None,
+            )
+            progress_container = ft.Container(
+                content=progress_bar,
+                padding=ft.padding.only(top=5, bottom=10),
+            )
+            rows.append(progress_container)
+
+        return ft.Column(controls=rows, spacing=10)
 
     def create_radio_dialog(self, booking_id, current_notes, current_state):
         radio_values = [
@@ -1131,9 +1268,10 @@ class CarWashEditPage:
         self.page.update()
 
     def on_save_radio_selection(self, e, booking_id, new_state, current_notes):
-        print(
-            f'[on_save_radio_selection] '
-            f'booking_id={booking_id}, new_state={new_state}'
+        logger.debug(
+            '[on_save_radio_selection] booking_id=%s, new_state=%s',
+            booking_id,
+            new_state,
         )
         self.close_dialog()
         self.show_status_change_dialog(booking_id, new_state, current_notes)
@@ -1214,6 +1352,7 @@ class CarWashEditPage:
             self.page.dialog.open = False
             self.page.update()
 
+    @batched_updates
     def confirm_status_change(self, booking_id, new_state, additional_notes):
         booking_to_update = next(
             (
@@ -1228,8 +1367,6 @@ class CarWashEditPage:
             self.page.update()
             return
 
-        old_state = booking_to_update.get('state', '').upper()
-
         if new_state == 'COMPLETED' and additional_notes:
             existing_notes = booking_to_update.get('notes', '')
             if existing_notes:
@@ -1239,26 +1376,13 @@ class CarWashEditPage:
         else:
             updated_notes = booking_to_update.get('notes', '')
 
-        updated_data = {'state': new_state, 'notes': updated_notes}
-        response = self.api.update_booking(booking_id, updated_data)
-
-        if response and response.status_code == 200:
-            booking_to_update['state'] = new_state
-            booking_to_update['notes'] = updated_notes
-
-            self.close_dialog()
-            self.show_success_message('Статус успешно обновлён')
-
-            self.load_total_revenue()
-            self.update_booking_status_dashboard()
-            self.update_created_bookings_dashboard()
-
-            if old_state == 'COMPLETED' or new_state == 'COMPLETED':
-                self.update_revenue()
-        else:
-            self.close_dialog()
-            self.show_error_message('Ошибка при обновлении статуса')
-        self.page.update()
+        self.close_dialog()
+        self.apply_booking_update(
+            booking_id,
+            {'state': new_state, 'notes': updated_notes},
+            success_message='Статус успешно обновлён',
+            error_message='Ошибка при обновлении статуса',
+        )
 
     def create_schedule_list_section(self):
         header = ft.Row(
@@ -1389,12 +1513,7 @@ class CarWashEditPage:
         )
 
     def load_prices(self):
-        response = self.api.get_prices(self.car_wash['id'])
-        if response.status_code == 200:
-            return response.json().get('data', [])
-        else:
-            print(f'Ошибка загрузки цен: {response.text}')
-            return []
+        return self.store.prices() or []
 
     def on_avatar_click(self, e):
         self.show_change_button = not self.show_change_button
@@ -1404,12 +1523,11 @@ class CarWashEditPage:
             show_cancel=False,
         )
 
+    @batched_updates
     def on_image_picked(self, e: ft.FilePickerResultEvent):
         if e.files:
             self.original_image = self.car_wash['image_link']
             self.selected_image = e.files[0].path
-            if hasattr(e.files[0], 'bytes') and e.files[0].bytes:
-                self.selected_image_bytes = e.files[0].bytes
             self.avatar_container.content = ft.Image(
                 src=self.selected_image,
                 width=150,
@@ -1422,6 +1540,7 @@ class CarWashEditPage:
             )
             self.page.update()
 
+    @batched_updates
     def on_cancel_click(self, e):
         self.avatar_container.content = ft.Image(
             src=self.original_image,
@@ -1435,15 +1554,15 @@ class CarWashEditPage:
         )
         self.page.update()
 
+    @batched_updates
     def on_save_click(self, e):
-        if self.selected_image or self.selected_image_bytes:
-            self.show_loading()
-            self.upload_image()
+        if self.selected_image:
             self.update_button_visibility(
                 show_change=False, show_save=False, show_cancel=False
             )
-            self.hide_loading()
-            self.page.update()
+            progress_dialog = UploadProgressDialog(self.page)
+            progress_dialog.open()
+            self.page.run_thread(self.upload_image, progress_dialog)
 
     def update_button_visibility(self, show_change, show_save, show_cancel):
         self.show_change_button = show_change
@@ -1454,33 +1573,38 @@ class CarWashEditPage:
         self.cancel_button.visible = show_cancel
         self.page.update()
 
-    def upload_image(self):
-        files = None
-        if self.selected_image_bytes:
-            files = {
-                'image': ('image.png', io.BytesIO(self.selected_image_bytes))
-            }
-        elif self.selected_image:
-            try:
-                with open(self.selected_image, 'rb') as img_file:
-                    files = {'image': img_file}
-            except FileNotFoundError:
-                self.hide_loading()
-                self.show_error_message('Файл изображения не найден.')
-                return
-
+    def upload_image(self, progress_dialog: UploadProgressDialog):
         new_values = {
             'name': self.car_wash['name'],
             'location_id': self.car_wash['location_id'],
         }
 
-        response = self.api.update_car_wash(
-            self.car_wash['id'], new_values=new_values, files=files
-        )
+        try:
+            with prepare_upload(
+                self.selected_image, CAR_WASH_UPLOAD_SIZE
+            ) as image:
+                response = self.api.update_car_wash(
+                    self.car_wash['id'],
+                    new_values=new_values,
+                    files={'image': upload_file('image', image)},
+                    on_progress=progress_dialog.on_progress,
+                    cancel=progress_dialog.cancel,
+                )
+        except FileNotFoundError:
+            progress_dialog.close()
+            self.show_error_message('Файл изображения не найден.')
+            return
+        except UploadCancelled:
+            progress_dialog.close()
+            self.on_cancel_click(None)
+            return
+
+        progress_dialog.close()
         if response and response.status_code == 200:
             self.car_wash['image_link'] = response.json().get(
                 'image_link', self.car_wash['image_link']
             )
+            CarWashDirectory.invalidate_all()
             self.avatar_container.content = ft.Image(
                 src=self.car_wash['image_link'],
                 width=150,
@@ -1491,14 +1615,12 @@ class CarWashEditPage:
             self.page.update()
             self.show_success_message('Изображение успешно обновлено.')
         else:
-            print(
-                f'Ошибка при загрузке изображения: '
-                f'{response.text if response else "No response"}'
+            logger.error(
+                'Ошибка при загрузке изображения: %s',
+                response.text if response else 'No response',
             )
             self.show_error_message('Ошибка при загрузке изображения.')
 
-        self.hide_loading()
-
     def load_body_types(self):
         response = self.api.get_body_types(limit=100)
         if response.status_code == 200:
@@ -1506,15 +1628,15 @@ class CarWashEditPage:
             self.body_type_dict = {
                 body_type['id']: body_type['name'] for body_type in body_types
             }
-            print('Типы кузовов успешно загружены.')
+            logger.debug('Типы кузовов успешно загружены.')
         else:
-            print(f'Ошибка загрузки типов кузовов: {response.text}')
+            logger.error('Ошибка загрузки типов кузовов: %s', response.text)
             self.body_type_dict = {}
 
     def on_back_to_admin_page(self, e=None):
         from washer.ui_components.admin_page import AdminPage
 
-        AdminPage.car_washes_cache = None
+        CarWashStore.release(self.page)
         AdminPage(self.page)
 
     def on_view_archived_schedule_click(self, e):
@@ -1549,6 +1671,7 @@ class CarWashEditPage:
         dialog.open = True
         self.page.update()
 
+    @batched_updates
     def confirm_booking_and_close(self, event, booking_id):
         """
         Закрывает диалог и выполняет подтверждение букинга.
@@ -1565,7 +1688,7 @@ class CarWashEditPage:
         self.page.update()
 
     def update_booking_status_dashboard(self):
-        print('Обновление таблицы статусов букингов...')
+        logger.debug('Обновление таблицы статусов букингов...')
 
         # Перезагружаем / обновляем данные букингов
         self.today_bookings = self.load_today_bookings()
@@ -1577,7 +1700,7 @@ class CarWashEditPage:
 
         # Обновляем контейнер в UI
         self.booking_status_dashboard.update()
-        print('Таблица статусов букингов обновлена.')
+        logger.debug('Таблица статусов букингов обновлена.')
 
     def show_error_message(self, message):
         self.page.snack_bar = ft.SnackBar(
@@ -1630,6 +1753,7 @@ class CarWashEditPage:
         dialog.open = True
         self.page.update()
 
+    @batched_updates
     def confirm_decline_booking(self, booking_id):
         booking_to_delete = next(
             (
@@ -1660,6 +1784,7 @@ class CarWashEditPage:
                 for booking in self.today_bookings
                 if booking['id'] != booking_id
             ]
+            self.booking_store.remove([booking_id])
             self.show_success_message(
                 f'Букинг ID {booking_id} успешно удалён.'
             )
@@ -1668,9 +1793,10 @@ class CarWashEditPage:
             if was_completed:
                 self.update_revenue()
         else:
-            print(
-                f'Ошибка при удалении букинга ID {booking_id}: '
-                f'{response.text if response else "No response"}'
+            logger.error(
+                'Ошибка при удалении букинга ID %s: %s',
+                booking_id,
+                response.text if response else 'No response',
             )
             self.show_error_message(
                 f'Ошибка при удалении букинга ID {booking_id}.'
@@ -1869,6 +1995,7 @@ class CarWashEditPage:
             spacing=10,
         )
 
+    @batched_updates
     def delete_booking(self, booking_id: int):
         try:
             response = self.api.delete_booking(booking_id)
@@ -1876,15 +2003,16 @@ class CarWashEditPage:
                 self.today_bookings = [
                     b for b in self.today_bookings if b['id'] != booking_id
                 ]
+                self.booking_store.remove([booking_id])
                 self.show_success_message(
                     f'Букинг ID {booking_id} успешно удалён.'
                 )
                 self.update_booking_status_dashboard()
             else:
-                print(f'Ошибка удаления букинга: {response.text}')
+                logger.error('Ошибка удаления букинга: %s', response.text)
                 self.show_error_message('Ошибка при удалении букинга.')
         except Exception as e:
-            print(f'Ошибка при удалении букинга: {e}')
+            logger.error('Ошибка при удалении букинга: %s', e)
             self.show_error_message('Произошла ошибка при удалении букинга.')
         self.page.update()
 
@@ -1895,9 +2023,9 @@ class CarWashEditPage:
                 self.page.launch_url(tel_url)
             except Exception as e:
                 self.show_error_message('Не удалось открыть звонилку.')
-                print(f'Не удалось открыть звонилку: {e}')
+                logger.error('Не удалось открыть звонилку: %s', e)
         else:
             self.show_error_message(
                 'Номер телефона не указан или некорректен.'
             )
-            print('Номер телефона не указан или некорректен.')
+            logger.warning('Номер телефона не указан или некорректен.')
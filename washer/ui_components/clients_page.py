@@ -3,8 +3,12 @@ from collections import defaultdict
 import flet as ft
 
 from washer.api_requests import BackendApi
+from washer.car_wash_store import CarWashStore
+from washer.logger import get_logger
 from washer.ui_components.carwash_edit_page import CarWashEditPage
 
+logger = get_logger(__name__)
+
 
 class ClientsPage:
     def __init__(
@@ -18,8 +22,8 @@ class ClientsPage:
         self.page = page
         self.car_wash = car_wash
         self.locations = locations
-        self.api = BackendApi()
-        self.api.set_access_token(self.page.client_storage.get('access_token'))
+        self.api = BackendApi.for_page(self.page)
+        self.store = CarWashStore.for_page(self.page, self.api, self.car_wash)
         self.clients = defaultdict(lambda: {'user_info': {}, 'cars': []})
 
         self.is_selection_mode = is_selection_mode
@@ -135,14 +139,11 @@ class ClientsPage:
         CarWashEditPage(self.page, self.car_wash, self.locations)
 
     def load_clients(self):
-        car_wash_id = self.car_wash['id']
-        response = self.api.get_bookings(car_wash_id)
-
-        if response.status_code != 200:
+        bookings = self.store.load_bookings()
+        if bookings is None:
             self.show_error_message('Не удалось загрузить букинги.')
             return
 
-        bookings = response.json().get('data', [])
         user_ids = set()
 
         for booking in bookings:
@@ -167,9 +168,10 @@ class ClientsPage:
                 cars = cars_response.json().get('data', [])
                 self.clients[user_id]['cars'] = cars
             else:
-                print(
-                    f"Ошибка загрузки автомобилей для пользователя {user_id}: "
-                    f"{cars_response.text if cars_response else 'No response'}"
+                logger.error(
+                    'Ошибка загрузки автомобилей для пользователя %s: %s',
+                    user_id,
+                    cars_response.text if cars_response else 'No response',
                 )
 
                 self.clients[user_id]['cars'] = []
@@ -240,7 +242,7 @@ class ClientsPage:
             user_info = data['user_info']
             role_id = user_info.get('role_id')
 
-            print(f'Processing user_id={user_id}, role_id={role_id}')
+            logger.debug('Processing user_id=%s, role_id=%s', user_id, role_id)
 
             if role_id != 2:
                 continue
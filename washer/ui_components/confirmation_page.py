@@ -1,5 +1,9 @@
 import flet as ft
 
+from washer.logger import get_logger
+
+logger = get_logger(__name__)
+
 
 class ConfirmationPage:
     def __init__(
@@ -236,10 +240,10 @@ class ConfirmationPage:
         if self.on_confirm:
             self.on_confirm(notes)
         else:
-            print('Нет on_confirm callback - ничего не делаем.')
+            logger.warning('Нет on_confirm callback - ничего не делаем.')
 
     def _on_cancel_click(self, e):
         if self.on_cancel:
             self.on_cancel(e)
         else:
-            print('Нет on_cancel callback - ничего не делаем.')
+            logger.warning('Нет on_cancel callback - ничего не делаем.')
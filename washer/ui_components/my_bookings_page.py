@@ -4,6 +4,11 @@ import urllib.parse
 import flet as ft
 
 from washer.api_requests import BackendApi
+from washer.car_wash_directory import CarWashDirectory
+from washer.images import image_cache
+from washer.logger import get_logger
+
+logger = get_logger(__name__)
 
 BODY_TYPES = [
     'внедорожник 5 дв',
@@ -60,8 +65,7 @@ def remove_body_type_suffix(car_name: str) -> str:
 class MyBookingsPage:
     def __init__(self, page, api_url, car_wash, location_data):
         self.page = page
-        self.api = BackendApi()
-        self.api.set_access_token(self.page.client_storage.get('access_token'))
+        self.api = BackendApi.for_page(self.page)
         self.api_url = api_url
         self.car_wash = car_wash
         self.location_data = location_data
@@ -110,8 +114,8 @@ class MyBookingsPage:
 
     def _create_avatar_image_container(self, image_src, size=60):
         return ft.Container(
-            content=ft.Image(
-                src=image_src,
+            content=image_cache.image(
+                image_src,
                 fit=ft.ImageFit.COVER,
                 width=size,
                 height=size,
@@ -158,7 +162,7 @@ class MyBookingsPage:
 
             return f'{day} {month} ({weekday}) в {time_str}'
         except Exception as e:
-            print(f'Ошибка при форматировании даты и времени: {e}')
+            logger.error('Ошибка при форматировании даты и времени: %s', e)
             return datetime_str
 
     def fetch_boxes(self):
@@ -166,49 +170,45 @@ class MyBookingsPage:
         if response and response.status_code == 200:
             data = response.json().get('data', [])
             self.boxes_dict = {box['id']: box['name'] for box in data}
-            print(f'Получено боксов: {self.boxes_dict}')
+            logger.debug('Получено боксов: %s', self.boxes_dict)
         else:
             status = response.status_code if response else 'No Response'
             error_text = response.text if response else 'No Response'
-            print(f'Ошибка при получении боксов: {status} - {error_text}')
+            logger.error(
+                'Ошибка при получении боксов: %s - %s',
+                status,
+                error_text,
+            )
             self.boxes_dict = {}
 
     def fetch_car_washes(self):
-        page = 1
-        # limit = 100
-        while True:
-            response = self.api.get_car_washes(page=page)
-            if response and response.status_code == 200:
-                data = response.json().get('data', [])
-                if not data:
-                    break
-                for car_wash in data:
-                    car_wash_id = car_wash.get('id')
-                    name = car_wash.get('name', 'Без названия')
-                    image_link = car_wash.get('image_link', '')
-                    phone_number = car_wash.get('phone_number', '')
-                    self.car_washes_dict[car_wash_id] = {
-                        'name': name,
-                        'image_link': image_link,
-                        'phone_number': phone_number,
-                    }
-                if response.json().get('next') is None:
-                    break
-                page += 1
-            else:
-                status = response.status_code if response else 'No Response'
-                error_text = response.text if response else 'No Response'
-                print(
-                    f'Ошибка при получении автомоек: {status} - {error_text}'
-                )
-                break
+        """
+        Автомойки из букингов пользователя. Справочник отдаёт уже
+        загруженные, а недостающие запрашиваются по id, без обхода
+        всех страниц списка.
+        """
+        car_wash_ids = {
+            booking.get('car_wash_id') or booking.get('location', {}).get('id')
+            for booking in self.bookings
+        }
+        car_washes = CarWashDirectory.for_view('client').lookup(
+            self.api, car_wash_ids
+        )
+        self.car_washes_dict = {
+            car_wash_id: {
+                'name': car_wash.get('name', 'Без названия'),
+                'image_link': car_wash.get('image_link', ''),
+                'phone_number': car_wash.get('phone_number', ''),
+            }
+            for car_wash_id, car_wash in car_washes.items()
+        }
 
     def open(self):
         self.page.drawer = None
         self.completed_visible = False
         self.fetch_boxes()
-        self.fetch_car_washes()
         self.load_user_bookings_from_server()
+        self.fetch_car_washes()
         self.page.clean()
         self.page.add(self.create_bookings_page())
         self.page.update()
@@ -375,7 +375,11 @@ class MyBookingsPage:
         image_link = car_wash_info.get('image_link', '')
         phone_number = car_wash_info.get('phone_number', '')
 
-        print(f"Booking ID: {booking.get('id')}, Image Link: {image_link}")
+        logger.debug(
+            'Booking ID: %s, Image Link: %s',
+            booking.get('id'),
+            image_link,
+        )
 
         if image_link:
             image_src = image_link
@@ -651,10 +655,13 @@ class MyBookingsPage:
                 page=1, limit=100, order_by='id'
             )
             if response is None:
-                print('Не удалось получить ответ от сервера (None).')
+                logger.error('Не удалось получить ответ от сервера (None).')
                 return
 
-            print(f'Ответ от сервера при загрузке букингов: {response.text}')
+            logger.debug(
+                'Ответ от сервера при загрузке букингов: %s',
+                response.text,
+            )
 
             if response.status_code == 200:
                 all_bookings = response.json().get('data', [])
@@ -674,12 +681,13 @@ class MyBookingsPage:
 
                 self.bookings = all_bookings
             else:
-                print(
-                    f'Ошибка при загрузке букингов с сервера: '
-                    f'{response.status_code} - {response.text}'
+                logger.error(
+                    'Ошибка при загрузке букингов с сервера: %s - %s',
+                    response.status_code,
+                    response.text,
                 )
         except Exception as e:
-            print(f'Ошибка при запросе букингов с сервера: {e}')
+            logger.error('Ошибка при запросе букингов с сервера: %s', e)
 
     def redirect_to_booking_page(self, e):
         self.page.appbar = None
@@ -1,14 +1,16 @@
 import flet as ft
 
 from washer.api_requests import BackendApi
+from washer.logger import get_logger
 from washer.ui_components.select_car_page import SelectCarPage
 
+logger = get_logger(__name__)
+
 
 class MyCarsPage:
     def __init__(self, page, api_url, cars, on_car_saved_callback=None):
         self.page = page
-        self.api = BackendApi()
-        self.api.set_access_token(page.client_storage.get('access_token'))
+        self.api = BackendApi.for_page(self.page)
         self.api_url = api_url
         self.cars = cars
         self.on_car_saved_callback = on_car_saved_callback
@@ -171,7 +173,7 @@ class MyCarsPage:
         import re
         from typing import List, Tuple
 
-        print(f'Parsing car name: {name}')
+        logger.debug('Parsing car name: %s', name)
 
         body_types = [
             'внедорожник 5 дв',
@@ -221,13 +223,13 @@ class MyCarsPage:
         )
 
         words = name.split()
-        print(f'Words: {words}')
+        logger.debug('Words: %s', words)
 
         brand = words[0] if words else 'Бренд не указан'
         remaining_words = words[1:] if len(words) > 1 else []
 
-        print(f'Brand: {brand}')
-        print(f'Remaining words: {remaining_words}')
+        logger.debug('Brand: %s', brand)
+        logger.debug('Remaining words: %s', remaining_words)
 
         generation = 'Поколение не указано'
         body_type = 'Тип кузова не указан'
@@ -247,24 +249,31 @@ class MyCarsPage:
         if matches:
             matches.sort(key=lambda x: (-x[0], x[3]))
             _, generation_index, generation, generation_type = matches[0]
-            print(f'Found generation: {generation} ({generation_type})')
+            logger.debug(
+                'Found generation: %s (%s)',
+                generation,
+                generation_type,
+            )
             remaining_words = (
                 remaining_words[:generation_index]
                 + remaining_words[generation_index + matches[0][0] :]
             )
-            print(
-                f'Remaining words after generation extraction: '
-                f'{remaining_words}'
+            logger.debug(
+                'Remaining words after generation extraction: %s',
+                remaining_words,
             )
         else:
-            print('Generation not found')
+            logger.debug('Generation not found')
 
         matched_body_types = []
         for i in range(len(remaining_words), 0, -1):
             potential_body_type = (
                 ' '.join(remaining_words[i - 1 :]).lower().rstrip('.')
             )
-            print(f'Checking potential body type: {potential_body_type}')
+            logger.debug(
+                'Checking potential body type: %s',
+                potential_body_type,
+            )
             for bt in body_types:
                 if potential_body_type == bt.lower():
                     matched_body_types.append((i - 1, bt))
@@ -272,22 +281,22 @@ class MyCarsPage:
             matched_body_types.sort(key=lambda x: x[0])
             body_type_index, body_type = matched_body_types[0]
             remaining_words = remaining_words[:body_type_index]
-            print(f'Found body type: {body_type}')
-            print(
-                f'Remaining words after body type extraction: '
-                f'{remaining_words}'
+            logger.debug('Found body type: %s', body_type)
+            logger.debug(
+                'Remaining words after body type extraction: %s',
+                remaining_words,
             )
         else:
-            print('Body type not found')
+            logger.debug('Body type not found')
 
         if remaining_words:
             model = ' '.join(remaining_words)
         else:
             model = 'Модель не указана'
 
-        print(f'Model: {model}')
-        print(f'Generation: {generation}')
-        print(f'Body type: {body_type}')
+        logger.debug('Model: %s', model)
+        logger.debug('Generation: %s', generation)
+        logger.debug('Body type: %s', body_type)
 
         return brand, model, generation, body_type
 
@@ -295,23 +304,25 @@ class MyCarsPage:
         try:
             user_id = self.page.client_storage.get('user_id')
             if not user_id:
-                print('User ID not found!')
+                logger.warning('User ID not found!')
                 return
 
             response = self.api.get_user_cars(user_id=user_id)
-            print(
-                f'Ответ от сервера при загрузке автомобилей: {response.text}'
+            logger.debug(
+                'Ответ от сервера при загрузке автомобилей: %s',
+                response.text,
             )
 
             if response.status_code == 200:
                 self.cars[:] = response.json().get('data', [])
             else:
-                print(
-                    f'Ошибка при загрузке автомобилей с сервера: '
-                    f'{response.status_code} - {response.text}'
+                logger.error(
+                    'Ошибка при загрузке автомобилей с сервера: %s - %s',
+                    response.status_code,
+                    response.text,
                 )
         except Exception as e:
-            print(f'Ошибка при запросе автомобилей с сервера: {e}')
+            logger.error('Ошибка при запросе автомобилей с сервера: %s', e)
 
     def on_add_car_click(self, e):
         SelectCarPage(
@@ -320,7 +331,7 @@ class MyCarsPage:
         )
 
     def on_car_saved(self, car):
-        print(f'Сохранен новый автомобиль (ID={car.get("id")})')
+        logger.debug('Сохранен новый автомобиль (ID=%s)', car.get('id'))
         self.load_user_cars_from_server()
         self.page.clean()
         self.page.add(self.create_cars_page())
@@ -361,11 +372,14 @@ class MyCarsPage:
                 self.page.clean()
                 self.page.add(self.create_cars_page())
                 self.page.update()
-                print(f'Автомобиль с ID {car_id} успешно удален.')
+                logger.debug('Автомобиль с ID %s успешно удален.', car_id)
             else:
-                print(f'Ошибка при удалении автомобиля: {response.text}')
+                logger.error(
+                    'Ошибка при удалении автомобиля: %s',
+                    response.text,
+                )
         except Exception as e:
-            print(f'Ошибка при удалении автомобиля: {e}')
+            logger.error('Ошибка при удалении автомобиля: %s', e)
 
     def return_to_wash_selection(self, e):
         self.page.appbar = None
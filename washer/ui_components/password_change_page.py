@@ -1,6 +1,9 @@
 import flet as ft
 
 from washer.api_requests import BackendApi
+from washer.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class PasswordChangePage:
@@ -11,7 +14,7 @@ class PasswordChangePage:
         on_change_callback,
         api: BackendApi,
     ):
-        print('Initializing PasswordChangePage')
+        logger.debug('Initializing PasswordChangePage')
         self.page = page
         self.api = api
         self.user_data = user_data
@@ -33,12 +36,12 @@ class PasswordChangePage:
         )
         self.page.overlay.append(self.snack_bar)
         self.page.update()
-        print('SnackBar initialized and added to page overlay')
+        logger.debug('SnackBar initialized and added to page overlay')
 
         self.show_password_change_page()
 
     def create_current_password_field(self):
-        print('Creating current password field')
+        logger.debug('Creating current password field')
         return ft.TextField(
             label='Текущий пароль',
             password=True,
@@ -51,7 +54,7 @@ class PasswordChangePage:
         )
 
     def create_new_password_field(self):
-        print('Creating new password field')
+        logger.debug('Creating new password field')
         return ft.TextField(
             label='Новый пароль',
             password=True,
@@ -64,7 +67,7 @@ class PasswordChangePage:
         )
 
     def create_confirm_password_field(self):
-        print('Creating confirm password field')
+        logger.debug('Creating confirm password field')
         return ft.TextField(
             label='Подтвердите новый пароль',
             password=True,
@@ -77,7 +80,7 @@ class PasswordChangePage:
         )
 
     def show_password_change_page(self):
-        print('Displaying PasswordChangePage')
+        logger.debug('Displaying PasswordChangePage')
 
         self.page.appbar = ft.AppBar(
             leading=ft.IconButton(
@@ -141,63 +144,63 @@ class PasswordChangePage:
             )
         )
         self.page.update()
-        print('PasswordChangePage displayed successfully')
+        logger.debug('PasswordChangePage displayed successfully')
 
     def change_password(self, e=None):
-        print('Attempting to change password')
+        logger.debug('Attempting to change password')
         current_password = self.current_password_field.value.strip()
         new_password = self.new_password_field.value.strip()
         confirm_password = self.confirm_password_field.value.strip()
 
-        print(f"Current password: {'*' * len(current_password)}")
-        print(f"New password: {'*' * len(new_password)}")
-        print(f"Confirm password: {'*' * len(confirm_password)}")
+        logger.debug('Current password: %s', '*' * len(current_password))
+        logger.debug('New password: %s', '*' * len(new_password))
+        logger.debug('Confirm password: %s', '*' * len(confirm_password))
 
         if not current_password or not new_password or not confirm_password:
-            print('One or more password fields are empty')
+            logger.debug('One or more password fields are empty')
             self.show_error_message('Все поля обязательны для заполнения.')
             return
 
         if new_password != confirm_password:
-            print('New password and confirmation do not match')
+            logger.debug('New password and confirmation do not match')
             self.show_error_message(
                 'Новый пароль и подтверждение не совпадают.'
             )
             return
 
-        print('Passwords validated successfully')
+        logger.debug('Passwords validated successfully')
 
         new_values = {'password': new_password}
 
-        print(f'New values to update for password: {new_values}')
+        logger.debug('New values to update for password: %s', new_values)
 
         try:
-            print('Sending request to update password')
+            logger.debug('Sending request to update password')
             response = self.api.update_user_data(
                 self.user_data['id'], new_values
             )
-            print(f'Update password response: {response}')
+            logger.debug('Update password response: %s', response)
         except Exception as ex:
+            logger.debug('Ошибка при смене пароля: %s', ex)
             error_message = f'Ошибка при смене пароля: {str(ex)}'
-            print(error_message)
             self.show_error_message(error_message)
             return
 
         if response and response.get('status_code') == 200:
-            print('Пароль успешно изменен')
+            logger.debug('Пароль успешно изменен')
             self.show_success_message('Пароль успешно изменен.')
             if self.on_change_callback:
-                print('Calling on_change_callback')
+                logger.debug('Calling on_change_callback')
                 self.on_change_callback()
         else:
             error_message = response.get('error', 'Неизвестная ошибка')
-            print(f'Ошибка при смене пароля: {error_message}')
+            logger.error('Ошибка при смене пароля: %s', error_message)
             self.show_error_message(
                 f'Ошибка при смене пароля: {error_message}'
             )
 
     def go_back(self, e):
-        print('Navigating back to AccountSettingsPage')
+        logger.debug('Navigating back to AccountSettingsPage')
         from washer.ui_components.account_settings_page import (
             AccountSettingsPage,
         )
@@ -205,16 +208,16 @@ class PasswordChangePage:
         AccountSettingsPage(self.page, self.api)
 
     def show_snack_bar(self, message: str, bgcolor: str = ft.colors.RED):
-        print(f'Показываем сообщение в SnackBar: {message}')
+        logger.debug('Показываем сообщение в SnackBar: %s', message)
         self.snack_bar.content.value = message
         self.snack_bar.bgcolor = bgcolor
         self.snack_bar.open = True
         self.page.update()
 
     def show_success_message(self, message: str):
-        print(f'Showing success message: {message}')
+        logger.debug('Showing success message: %s', message)
         self.show_snack_bar(message, bgcolor=ft.colors.GREEN)
 
     def show_error_message(self, message: str):
-        print(f'Showing error message: {message}')
+        logger.error('Showing error message: %s', message)
         self.show_snack_bar(message, bgcolor=ft.colors.RED)
@@ -1,6 +1,10 @@
 import flet as ft
 
 from washer.api_requests import BackendApi
+from washer.car_wash_store import CarWashStore
+from washer.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class PriceManagementPage:
@@ -18,10 +22,8 @@ class PriceManagementPage:
         self.price_list = prices
         self.locations = locations
 
-        self.api = BackendApi()
-        access_token = self.page.client_storage.get('access_token')
-        if access_token:
-            self.api.set_access_token(access_token)
+        self.api = BackendApi.for_page(self.page)
+        self.store = CarWashStore.for_page(self.page, self.api, self.car_wash)
 
         self.load_prices_from_server()
 
@@ -30,12 +32,7 @@ class PriceManagementPage:
         self.page.add(self.create_price_management_page())
 
     def load_prices_from_server(self):
-        response = self.api.get_prices(self.car_wash['id'])
-        if response.status_code == 200:
-            self.price_list = response.json().get('data', [])
-        else:
-            print(f'Ошибка загрузки цен: {response.text}')
-            self.price_list = []
+        self.price_list = self.store.prices() or []
 
     def create_price_management_page(self):
         price_list_view = ft.ListView(
@@ -234,7 +231,7 @@ class PriceManagementPage:
 
     def on_create_price_click(self, body_type_id, price):
         if not body_type_id or not price:
-            print('Заполните все поля!')
+            logger.debug('Заполните все поля!')
             return
 
         price_data = {
@@ -245,36 +242,38 @@ class PriceManagementPage:
 
         response = self.api.create_price(price_data)
         if response.status_code == 200:
-            print('Цена успешно добавлена')
+            logger.debug('Цена успешно добавлена')
+            self.store.apply_response('prices', response.json())
             self.load_prices_from_server()
             self.page.clean()
             self.page.add(self.create_price_management_page())
         else:
-            print(f'Ошибка добавления цены: {response.text}')
+            logger.error('Ошибка добавления цены: %s', response.text)
 
     def on_edit_price_click(self, price):
         def save_changes(e):
             new_price = price_field.value
             if not new_price:
-                print('Поле цены не может быть пустым!')
+                logger.warning('Поле цены не может быть пустым!')
                 return
 
             try:
                 new_price_value = float(new_price)
             except ValueError:
-                print('Введите корректное значение для цены!')
+                logger.debug('Введите корректное значение для цены!')
                 return
 
             response = self.api.update_price(
                 price['id'], {'price': new_price_value}
             )
             if response.status_code == 200:
-                print('Цена успешно обновлена.')
+                logger.debug('Цена успешно обновлена.')
+                self.store.apply_response('prices', response.json())
                 self.load_prices_from_server()
                 self.refresh_price_list()
                 self.page.close(dlg_modal)
             else:
-                print(f'Ошибка обновления цены: {response.text}')
+                logger.error('Ошибка обновления цены: %s', response.text)
 
         def cancel_edit(e):
             self.page.close(dlg_modal)
@@ -360,12 +359,13 @@ class PriceManagementPage:
     def delete_price(self, price_id):
         response = self.api.delete_price(price_id)
         if response.status_code == 200:
-            print(f'Цена с ID {price_id} успешно удалена.')
+            logger.debug('Цена с ID %s успешно удалена.', price_id)
+            self.store.remove('prices', price_id)
             self.load_prices_from_server()
             self.page.clean()
             self.page.add(self.create_price_management_page())
         else:
-            print(f'Ошибка удаления цены: {response.text}')
+            logger.error('Ошибка удаления цены: %s', response.text)
 
     def on_back_to_edit_page(self, e=None):
         from washer.ui_components.carwash_edit_page import CarWashEditPage
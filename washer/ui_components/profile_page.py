@@ -1,22 +1,27 @@
 import flet as ft
 
 from washer.api_requests import BackendApi
+from washer.images import AVATAR_UPLOAD_SIZE, prepare_upload
+from washer.logger import get_logger
 from washer.ui_components.account_settings_page import AccountSettingsPage
 from washer.ui_components.my_finance_page import MyFinancePage
+from washer.ui_components.upload_progress_dialog import UploadProgressDialog
+from washer.uploads import UploadCancelled
+
+logger = get_logger(__name__)
 
 
 class ProfilePage:
     def __init__(self, page: ft.Page):
         self.page = page
-        self.api = BackendApi()
-        self.api.set_access_token(page.client_storage.get('access_token'))
+        self.api = BackendApi.for_page(self.page)
         self.api_url = self.api.url
         self.username = self.page.client_storage.get('username')
 
         self.cars = []
         self.bookings = []
         self.completed_visible = False
-        self.selected_image_bytes = None
+        self.selected_image = None
 
         self.completed_bookings_container = ft.Container(visible=False)
 
@@ -192,8 +197,6 @@ class ProfilePage:
 
     def on_picture_select(self, e: ft.FilePickerResultEvent):
         if e.files:
-            with open(e.files[0].path, 'rb') as image_file:
-                self.selected_image_bytes = image_file.read()
             self.avatar_container.content = ft.Image(
                 src=e.files[0].path,
                 width=100,
@@ -202,13 +205,16 @@ class ProfilePage:
                 border_radius=ft.border_radius.all(50),
             )
             self.page.update()
+            self.selected_image = e.files[0].path
             self.upload_avatar_to_server()
 
     def upload_avatar_to_server(self):
         user_id = self.page.client_storage.get('user_id')
         username = self.username
-        if not user_id or not self.selected_image_bytes:
-            print('Необходимые данные отсутствуют для обновления аватара.')
+        if not user_id or not self.selected_image:
+            logger.warning(
+                'Необходимые данные отсутствуют для обновления аватара.',
+            )
             self.show_snackbar(
                 'Необходимые данные отсутствуют для обновления аватара.',
                 color=ft.colors.RED,
@@ -216,13 +222,38 @@ class ProfilePage:
             return
 
         new_values = {'username': username}
-        response = self.api.update_user_with_avatar(
-            user_id=user_id,
-            new_values=new_values,
-            image_bytes=self.selected_image_bytes,
-        )
+        progress_dialog = UploadProgressDialog(self.page)
+        progress_dialog.open()
+
+        def task():
+            try:
+                with prepare_upload(
+                    self.selected_image, AVATAR_UPLOAD_SIZE
+                ) as image:
+                    response = self.api.update_user_with_avatar(
+                        user_id=user_id,
+                        new_values=new_values,
+                        image=image,
+                        on_progress=progress_dialog.on_progress,
+                        cancel=progress_dialog.cancel,
+                    )
+            except UploadCancelled:
+                progress_dialog.close()
+                self.show_snackbar(
+                    'Загрузка аватара отменена.', color=ft.colors.ORANGE
+                )
+                return
+            except OSError as e:
+                logger.error('Не удалось прочитать изображение: %s', e)
+                response = None
+            progress_dialog.close()
+            self.on_avatar_uploaded(response)
+
+        self.page.run_thread(task)
+
+    def on_avatar_uploaded(self, response):
         if response and response.status_code == 200:
-            print('Аватар успешно обновлен.')
+            logger.debug('Аватар успешно обновлен.')
             self.get_user_data()
             self.show_snackbar(
                 'Аватар успешно обновлен!', color=ft.colors.GREEN
@@ -233,7 +264,7 @@ class ProfilePage:
                 if response
                 else 'Неизвестная ошибка при обновлении аватара.'
             )
-            print(f'Ошибка при обновлении аватара: {error_text}')
+            logger.error('Ошибка при обновлении аватара: %s', error_text)
             self.show_snackbar(
                 f'Ошибка при обновлении аватара: {error_text}',
                 color=ft.colors.RED,
@@ -257,7 +288,9 @@ class ProfilePage:
                 'error',
                 'Неизвестная ошибка при получении данных пользователя.',
             )
-            print(error_message)
+            logger.debug(
+                'Ошибка при получении данных пользователя: %s', error_message
+            )
             self.show_snackbar(
                 f'Ошибка при получении данных: {error_message}',
                 color=ft.colors.RED,
@@ -284,6 +317,7 @@ class ProfilePage:
         WashSelectionPage(self.page)
 
     def on_logout_click(self, e):
+        self.api.set_tokens(None, None)
         self.page.client_storage.remove('access_token')
         self.page.client_storage.remove('refresh_token')
         self.page.client_storage.remove('username')
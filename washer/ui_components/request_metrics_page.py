@@ -0,0 +1,149 @@
+import flet as ft
+
+from washer.api_requests import BackendApi
+from washer.ui_updates import update_stats
+
+
+class RequestMetricsPage:
+    """
+    Отладочное окно с самыми медленными запросами текущей сессии
+    и сводкой перцентилей по эндпоинтам. Счётчики обновлений страниц
+    общие для процесса и кнопкой сброса не обнуляются.
+
+    Включается через REQUEST_METRICS_OVERLAY=true: на экране появляется
+    кнопка, также окно открывается сочетанием Ctrl+Shift+M.
+    """
+
+    def __init__(self, page: ft.Page, limit: int = 15):
+        self.page = page
+        self.api = BackendApi.for_page(page)
+        self.limit = limit
+        self.content_column = ft.Column(
+            spacing=10, scroll=ft.ScrollMode.AUTO, width=700
+        )
+        self.dialog = ft.AlertDialog(
+            title=ft.Text('Медленные запросы', weight=ft.FontWeight.BOLD),
+            content=self.content_column,
+            actions=[
+                ft.TextButton(text='Обновить', on_click=self.refresh),
+                ft.TextButton(text='Сбросить', on_click=self.on_reset_click),
+                ft.TextButton(text='Закрыть', on_click=self.close),
+            ],
+        )
+
+    @staticmethod
+    def attach(page: ft.Page):
+        """Добавляет кнопку-оверлей и горячую клавишу на страницу."""
+        metrics_page = RequestMetricsPage(page)
+
+        page.overlay.append(
+            ft.Container(
+                content=ft.IconButton(
+                    icon=ft.icons.SPEED,
+                    icon_color=ft.colors.AMBER,
+                    tooltip='Медленные запросы',
+                    on_click=metrics_page.open,
+                ),
+                left=5,
+                bottom=90,
+            )
+        )
+
+        def on_keyboard(e: ft.KeyboardEvent):
+            if e.ctrl and e.shift and e.key.upper() == 'M':
+                metrics_page.open()
+
+        page.on_keyboard_event = on_keyboard
+        page.update()
+        return metrics_page
+
+    def open(self, e=None):
+        self.populate()
+        self.page.open(self.dialog)
+
+    def close(self, e=None):
+        self.page.close(self.dialog)
+
+    def refresh(self, e=None):
+        self.populate()
+        self.dialog.update()
+
+    def on_reset_click(self, e):
+        self.api.metrics.reset()
+        self.refresh()
+
+    def populate(self):
+        self.content_column.controls.clear()
+        self.content_column.controls.append(
+            ft.Text(
+                f'Обновления страниц процесса: '
+                f'запрошено {update_stats.requested}, '
+                f'отправлено {update_stats.sent}, '
+                f'объединено {update_stats.saved}',
+                size=12,
+                color=ft.colors.GREY_700,
+            )
+        )
+
+        slowest = self.api.metrics.slowest(self.limit)
+        if not slowest:
+            self.content_column.controls.append(
+                ft.Text('Запросов пока не было.', color=ft.colors.GREY_600)
+            )
+            return
+
+        self.content_column.controls.append(
+            ft.DataTable(
+                columns=[
+                    ft.DataColumn(ft.Text('Эндпоинт')),
+                    ft.DataColumn(ft.Text('Экран')),
+                    ft.DataColumn(ft.Text('Код'), numeric=True),
+                    ft.DataColumn(ft.Text('TTFB, мс'), numeric=True),
+                    ft.DataColumn(ft.Text('Всего, мс'), numeric=True),
+                    ft.DataColumn(ft.Text('Ответ, КБ'), numeric=True),
+                ],
+                rows=[
+                    ft.DataRow(
+                        cells=[
+                            ft.DataCell(ft.Text(sample.endpoint, size=12)),
+                            ft.DataCell(ft.Text(sample.screen or '-')),
+                            ft.DataCell(ft.Text(str(sample.status_code))),
+                            ft.DataCell(ft.Text(self.format_ms(sample.ttfb))),
+                            ft.DataCell(ft.Text(self.format_ms(sample.total))),
+                            ft.DataCell(
+                                ft.Text(f'{sample.response_bytes / 1024:.1f}')
+                            ),
+                        ]
+                    )
+                    for sample in slowest
+                ],
+                column_spacing=15,
+            )
+        )
+
+        self.content_column.controls.append(
+            ft.Text('Перцентили по эндпоинтам', weight=ft.FontWeight.BOLD)
+        )
+        summary = sorted(
+            self.api.metrics.summary().items(),
+            key=lambda item: item[1]['p90'],
+            reverse=True,
+        )
+        for endpoint, stats in summary:
+            self.content_column.controls.append(
+                ft.Text(
+                    f'{endpoint}: n={stats["count"]}, '
+                    f'p50={self.format_ms(stats["p50"])} мс, '
+                    f'p90={self.format_ms(stats["p90"])} мс, '
+                    f'p99={self.format_ms(stats["p99"])} мс, '
+                    f'ошибок={stats["errors"]}, '
+                    f'объединено={stats["deduplicated"]}',
+                    size=12,
+                    color=ft.colors.GREY_700,
+                )
+            )
+
+    def format_ms(self, seconds: float) -> str:
+        if seconds is None:
+            return '-'
+        return f'{seconds * 1000:.0f}'
@@ -3,15 +3,21 @@ import datetime
 import flet as ft
 
 from washer.api_requests import BackendApi
+from washer.car_wash_store import CarWashStore
+from washer.logger import get_logger
+from washer.schedule_horizon import ScheduleHorizon
+from washer.ui_updates import batched_updates, flush_updates
+
+logger = get_logger(__name__)
 
 
 class ScheduleManagementPage:
     def __init__(self, page: ft.Page, car_wash, locations):
         self.page = page
         self.car_wash = car_wash
-        self.api = BackendApi()
-        self.api.set_access_token(self.page.client_storage.get('access_token'))
+        self.api = BackendApi.for_page(self.page)
         self.locations = locations
+        self.store = CarWashStore.for_page(self.page, self.api, self.car_wash)
 
         self.schedule_list = []
         self.selected_days = []
@@ -104,7 +110,7 @@ class ScheduleManagementPage:
         bgcolor: str = ft.colors.GREEN,
         text_color: str = ft.colors.WHITE,
     ):
-        print(f'Показываем сообщение: {message}')
+        logger.debug('Показываем сообщение: %s', message)
         self.snack_bar.content.value = message
         self.snack_bar.content.color = text_color
         self.snack_bar.bgcolor = bgcolor
@@ -119,7 +125,7 @@ class ScheduleManagementPage:
 
     def show_loading(self):
         self.loading_overlay.visible = True
-        self.page.update()
+        flush_updates(self.page)
 
     def hide_loading(self):
         self.loading_overlay.visible = False
@@ -128,25 +134,15 @@ class ScheduleManagementPage:
     def load_schedules(self):
         self.schedule_list = []
         self.dates_storage = {}
-        print(f'Загрузка расписаний для автомойки {self.car_wash["id"]}')
+        logger.debug(
+            'Загрузка расписаний для автомойки %s',
+            self.car_wash['id'],
+        )
         self.show_loading()
-        response = self.api.get_schedules(self.car_wash['id'])
-        if response.status_code == 200:
-            self.schedule_list = [
-                schedule
-                for schedule in response.json().get('data', [])
-                if schedule['car_wash_id'] == self.car_wash['id']
-            ]
+        schedules = self.store.schedules()
+        if schedules is not None:
+            self.schedule_list = schedules
             self.initialize_dates_for_schedule()
-            print(
-                f'Загружено расписаний: {len(self.schedule_list)} '
-                f'для автомойки {self.car_wash["id"]}'
-            )
-        else:
-            print(
-                f'Ошибка загрузки расписаний для автомойки '
-                f'{self.car_wash["id"]}: {response.text}'
-            )
         self.hide_loading()
 
     def initialize_dates_for_schedule(self):
@@ -341,7 +337,7 @@ class ScheduleManagementPage:
             self.close_modal()
             self.show_end_time_modal()
         except ValueError:
-            print('Ошибка: Неверный формат времени. Используйте ЧЧ:ММ.')
+            logger.error('Ошибка: Неверный формат времени. Используйте ЧЧ:ММ.')
             self.show_error_message(
                 'Неверный формат времени. Используйте ЧЧ:ММ.'
             )
@@ -372,6 +368,7 @@ class ScheduleManagementPage:
         self.page.dialog.open = True
         self.page.update()
 
+    @batched_updates
     def on_confirm_end_time(self, e):
         end_time = self.end_time_input.value.strip()
         try:
@@ -389,25 +386,30 @@ class ScheduleManagementPage:
                 self.current_edit_schedule['id'], updated_schedule
             )
             if response.status_code == 200:
+                logger.debug(
+                    'Время расписания обновлено: %s - %s.',
+                    self.current_start_time,
+                    self.current_end_time,
+                )
                 message = (
                     f'Время расписания обновлено: '
                     f'{self.current_start_time} - {self.current_end_time}.'
                 )
-                print(message)
+                self.store.apply_response('schedules', response.json())
                 self.show_success_message(message)
                 self.refresh_schedule_list()
             else:
+                logger.debug('Ошибка обновления расписания: %s', response.text)
                 error_message = (
                     f'Ошибка обновления расписания: {response.text}'
                 )
-                print(error_message)
                 self.show_error_message(error_message)
             self.hide_loading()
         except ValueError:
             error_message = (
                 'Ошибка: Неверный формат времени. Используйте ЧЧ:ММ.'
             )
-            print(error_message)
+            logger.debug('Неверный формат времени расписания')
             self.show_error_message(error_message)
 
     def close_modal(self):
@@ -443,18 +445,20 @@ class ScheduleManagementPage:
         self.page.dialog.open = True
         self.page.update()
 
+    @batched_updates
     def confirm_delete_schedule(self, schedule_id):
         self.close_modal()
         self.show_loading()
         response = self.api.delete_schedule(schedule_id)
         if response.status_code == 200:
             message = 'Расписание успешно удалено.'
-            print(message)
+            logger.debug('Расписание %s удалено', schedule_id)
+            self.store.remove('schedules', schedule_id)
             self.show_success_message(message)
             self.refresh_schedule_list()
         else:
+            logger.debug('Ошибка при удалении расписания: %s', response.text)
             error_message = f'Ошибка при удалении расписания: {response.text}'
-            print(error_message)
             self.show_error_message(error_message)
         self.hide_loading()
 
@@ -614,13 +618,14 @@ class ScheduleManagementPage:
                 )
         self.page.update()
 
+    @batched_updates
     def create_week_schedule_for_all_boxes(self, e):
         if (
             self.schedule_start_time_picker.value is None
             or self.schedule_end_time_picker.value is None
         ):
             error_message = 'Ошибка: Время начала или окончания не указано.'
-            print(error_message)
+            logger.debug('Время начала или окончания не указано')
             self.show_error_message(error_message)
             return
 
@@ -628,47 +633,40 @@ class ScheduleManagementPage:
         start_time = self.schedule_start_time_picker.value.strftime('%H:%M:%S')
         end_time = self.schedule_end_time_picker.value.strftime('%H:%M:%S')
 
-        self.show_loading()
-        success_count = 0
-        for i in range(7):
-            schedule_date = today + datetime.timedelta(days=i)
-            day_of_week = schedule_date.weekday()
-            new_schedule_data = {
+        schedules_data = [
+            {
                 'car_wash_id': self.car_wash['id'],
-                'day_of_week': day_of_week,
+                'day_of_week': (today + datetime.timedelta(days=i)).weekday(),
                 'start_time': start_time,
                 'end_time': end_time,
                 'is_available': True,
             }
-            response = self.api.create_schedule(new_schedule_data)
-            if response.status_code == 200:
-                success_count += 1
-            else:
-                print(
-                    f'Ошибка создания расписания для дня {day_of_week}: '
-                    f'{response.text}'
-                )
+            for i in range(7)
+        ]
 
+        self.show_loading()
+        result = self.api.create_schedules(schedules_data)
         self.hide_loading()
-        if success_count > 0:
-            message = f'Создано расписаний: {success_count} из 7.'
-            self.show_success_message(message)
-        else:
-            error_message = 'Ошибка создания недельного расписания.'
-            self.show_error_message(error_message)
-        self.refresh_schedule_list()
+
+        self.report_schedule_results(
+            result,
+            total=len(schedules_data),
+            error_message='Ошибка создания недельного расписания.',
+        )
 
     # В новом варианте сначала проверяется, не является ли value у пикеров None
     # Если value None, сразу выводится ошибка, и strftime даже не вызывается.
     # Это предотвращает возможную ошибку при вызове strftime на None.
 
     def refresh_schedule_list(self):
+        ScheduleHorizon.invalidate(self.car_wash['id'])
         self.load_schedules()
         self.schedule_list_container.content = (
             self.create_schedule_list_section()
         )
         self.page.update()
 
+    @batched_updates
     def on_add_schedule(self, e):
         if (
             self.schedule_start_time_picker_manual.value is None
@@ -677,7 +675,7 @@ class ScheduleManagementPage:
             error_message = (
                 'Ошибка: Время начала и окончания должно быть выбрано.'
             )
-            print(error_message)
+            logger.debug('Время начала и окончания не выбрано')
             self.show_error_message(error_message)
             return
 
@@ -687,35 +685,49 @@ class ScheduleManagementPage:
         end_time = self.schedule_end_time_picker_manual.value.strftime(
             '%H:%M:%S'
         )
-        self.show_loading()
-        success_count = 0
-
-        for day in self.selected_days:
-            schedule_data = {
+        schedules_data = [
+            {
                 'car_wash_id': self.car_wash['id'],
                 'day_of_week': day,
                 'start_time': start_time,
                 'end_time': end_time,
                 'is_available': True,
             }
-            response = self.api.create_schedule(schedule_data)
-            if response.status_code == 200:
-                success_count += 1
-            else:
-                print(
-                    f'Ошибка создания расписания для дня {day + 1}: '
-                    f'{response.text}'
-                )
+            for day in self.selected_days
+        ]
 
+        self.show_loading()
+        result = self.api.create_schedules(schedules_data)
         self.hide_loading()
-        if success_count > 0:
-            message = (
-                f'Создано расписаний: {success_count} из '
-                f'{len(self.selected_days)}.'
+
+        self.report_schedule_results(
+            result,
+            total=len(schedules_data),
+            error_message='Ошибка создания механического расписания.',
+        )
+
+    def report_schedule_results(self, result, total, error_message):
+        for schedule in result['created'].values():
+            self.store.apply_response('schedules', schedule)
+
+        for day_of_week, error in sorted(result['failed'].items()):
+            logger.error(
+                'Ошибка создания расписания для дня %s: %s',
+                self.get_day_name(day_of_week),
+                error,
             )
+
+        success_count = len(result['created'])
+        if success_count > 0:
+            message = f'Создано расписаний: {success_count} из {total}.'
+            if result['failed']:
+                failed_days = ', '.join(
+                    self.get_day_name(day_of_week)
+                    for day_of_week in sorted(result['failed'])
+                )
+                message += f' Не удалось: {failed_days}.'
             self.show_success_message(message)
         else:
-            error_message = 'Ошибка создания механического расписания.'
             self.show_error_message(error_message)
         self.refresh_schedule_list()
 
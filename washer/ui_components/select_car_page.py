@@ -4,6 +4,10 @@ import flet as ft
 
 from washer.api_requests import BackendApi
 from washer.config import config
+from washer.logger import get_logger
+from washer.ui_updates import batched_updates
+
+logger = get_logger(__name__)
 
 
 def format_plate_with_spaces(raw: str) -> str:
@@ -46,8 +50,7 @@ class SelectCarPage:
         self.selected_car = {}
         self.snack_bar = None
 
-        self.api = BackendApi()
-        self.api.set_access_token(self.page.client_storage.get('access_token'))
+        self.api = BackendApi.for_page(self.page)
 
         self.save_button = self.create_save_button()
         self.save_button.disabled = True
@@ -156,6 +159,7 @@ class SelectCarPage:
         self.last_two_field.visible = False
         self.last_two_field.value = ''
 
+    @batched_updates
     def on_main_number_change(self, e):
         main_value = e.control.value or ''
         raw_value = re.sub(r'\s+', '', main_value).upper()
@@ -204,6 +208,7 @@ class SelectCarPage:
         e.page.update()
         self._validate_number()
 
+    @batched_updates
     def on_last_two_change(self, e):
         last_val = e.control.value or ''
         last_val = re.sub(r'\s+', '', last_val).upper()
@@ -335,16 +340,12 @@ class SelectCarPage:
     def load_brands(self):
         response = self.api.get_brands()
         if response.status_code == 401:
-            if 'token has expired' in response.text.lower():
-                if self.refresh_token():
-                    self.load_brands()
-                else:
-                    self.page.add(
-                        ft.Text(
-                            'Сессия истекла, пожалуйста, войдите снова.',
-                            color=ft.colors.RED,
-                        )
-                    )
+            self.page.add(
+                ft.Text(
+                    'Сессия истекла, пожалуйста, войдите снова.',
+                    color=ft.colors.RED,
+                )
+            )
         elif response.status_code == 200:
             brands = response.json().get('data', [])
             POPULAR_BRANDS = [
@@ -441,12 +442,13 @@ class SelectCarPage:
 
         self.update_brands_list(filtered_brands)
 
+    @batched_updates
     def on_brand_select(self, e):
         selected_brand = e.control.data
         brand_id = self.brands_dict.get(selected_brand)
 
         if not brand_id:
-            print('ID марки не найден.')
+            logger.warning('ID марки не найден.')
             return
 
         response = self.api.get_models(brand_id)
@@ -485,13 +487,14 @@ class SelectCarPage:
 
         self.close_search_dialog(None)
 
+    @batched_updates
     def on_model_select(self, e):
         selected_model = e.control.value
         self.selected_model = selected_model
         self.selected_model_id = self.models_dict.get(selected_model)
 
         if not self.selected_model_id:
-            print('ID модели не найден.')
+            logger.warning('ID модели не найден.')
             return
 
         response = self.api.get_generations(self.selected_model_id)
@@ -499,7 +502,7 @@ class SelectCarPage:
             generations = response.json().get('data', [])
 
             if not generations:
-                print('Поколения для выбранной модели не найдены.')
+                logger.warning('Поколения для выбранной модели не найдены.')
                 self.generation_dropdown.visible = False
                 return
 
@@ -578,8 +581,9 @@ class SelectCarPage:
                 self.generation_dropdown.on_change = on_generation_select
                 self.page.update()
         else:
-            print(f'Ошибка при загрузке поколений: {response.text}')
+            logger.error('Ошибка при загрузке поколений: %s', response.text)
 
+    @batched_updates
     def on_generation_select(self, e):
         selected_generation = e.control.value
         self.selected_generation_id = self.generations_dict.get(
@@ -587,7 +591,7 @@ class SelectCarPage:
         )
 
         if not self.selected_generation_id:
-            print('ID поколения не найден.')
+            logger.warning('ID поколения не найден.')
             return
 
         self.selected_generation = selected_generation
@@ -634,7 +638,10 @@ class SelectCarPage:
                 body_type_name = self.get_body_type_name(body_type_id)
                 self.selected_body_type = body_type_name
                 self.selected_body_type_id = body_type_id
-                print(f'Автоматически выбран тип кузова: {body_type_name}')
+                logger.debug(
+                    'Автоматически выбран тип кузова: %s',
+                    body_type_name,
+                )
 
                 self.show_snack_bar(
                     f'Тип кузова "{body_type_name}" выбран автоматически',
@@ -692,7 +699,7 @@ class SelectCarPage:
                 self.body_type_dropdown.on_change = on_body_type_select
                 self.page.update()
         else:
-            print(f'Ошибка при загрузке конфигураций: {response.text}')
+            logger.error('Ошибка при загрузке конфигураций: %s', response.text)
 
     def get_body_type_name(self, body_type_id):
         response = self.api.get_body_types()
@@ -771,7 +778,7 @@ class SelectCarPage:
         bgcolor: str = ft.colors.GREEN,
         text_color: str = ft.colors.WHITE,
     ):
-        print(f'Показываем сообщение: {message}')
+        logger.debug('Показываем сообщение: %s', message)
 
         self.snack_bar.content.value = message
         self.snack_bar.content.color = text_color
@@ -842,26 +849,6 @@ class SelectCarPage:
         except Exception as ex:
             self.show_error_message(f'Ошибка: {str(ex)}')
 
-    def refresh_token(self):
-        refresh_token = self.page.client_storage.get('refresh_token')
-        if not refresh_token:
-            print('Refresh token not found, redirecting to login.')
-            return False
-
-        response = self.api.refresh_token(refresh_token)
-        if 'error' not in response:
-            self.page.client_storage.set(
-                'access_token', response['access_token']
-            )
-            self.page.client_storage.set(
-                'refresh_token', response['refresh_token']
-            )
-            self.api.set_access_token(response['access_token'])
-            return True
-        else:
-            print(f'Ошибка обновления токена: {response["details"]}')
-            return False
-
     def return_to_cars_page(self, e=None):
         self.page.appbar = None
         from washer.ui_components.my_cars_page import MyCarsPage
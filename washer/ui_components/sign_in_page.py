@@ -2,13 +2,16 @@ import flet as ft
 from pydantic import ValidationError
 
 from washer.api_requests import BackendApi
+from washer.logger import get_logger
 from washer.models.user import UserSignIn
 
+logger = get_logger(__name__)
+
 
 class SignInPage:
     def __init__(self, page: ft.Page):
         self.page = page
-        self.api = BackendApi()
+        self.api = BackendApi.for_page(self.page)
 
         self.disable_navigation_drawer_and_appbar()
 
@@ -160,7 +163,10 @@ class SignInPage:
             self.display_validation_errors(ve)
             return
 
-        print(f'Пытаемся войти с пользователем: {user_sign_in.username}')
+        logger.debug(
+            'Пытаемся войти с пользователем: %s',
+            user_sign_in.username,
+        )
         tokens = self.api.login(user_sign_in.username, user_sign_in.password)
 
         if 'access_token' in tokens:
@@ -201,7 +207,7 @@ class SignInPage:
         self.show_snack_bar(error_text, bgcolor=ft.colors.RED)
 
     def show_snack_bar(self, message: str, bgcolor: str = ft.colors.RED):
-        print(f'Показываем сообщение: {message}')
+        logger.debug('Показываем сообщение: %s', message)
 
         self.snack_bar.content.value = message
         self.snack_bar.bgcolor = bgcolor
@@ -210,7 +216,7 @@ class SignInPage:
         self.page.update()
 
     def on_forgot_password_click(self, e):
-        print('Переход на страницу восстановления пароля.')
+        logger.debug('Переход на страницу восстановления пароля.')
         # Здесь можно добавить переход на соответствующую страницу
         # Например:
         # from washer.ui_components.forgot_password_page
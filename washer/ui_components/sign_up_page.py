@@ -4,14 +4,24 @@ import flet as ft
 from pydantic import ValidationError
 
 from washer.api_requests import BackendApi
+from washer.images import (
+    AVATAR_UPLOAD_SIZE,
+    discard_prepared,
+    prepare_upload_in_background,
+)
+from washer.logger import get_logger
 from washer.models.user import UserBasicInfo, UserPassword, UserRegistration
 from washer.ui_components.add_car_prompt_page import AddCarPromptPage
+from washer.ui_components.upload_progress_dialog import UploadProgressDialog
+from washer.uploads import UploadCancelled
+
+logger = get_logger(__name__)
 
 
 class SignUpPage:
     def __init__(self, page: ft.Page):
         self.page = page
-        self.api = BackendApi()
+        self.api = BackendApi.for_page(self.page)
 
         self.user_basic_info: Optional[UserBasicInfo] = None
         self.user_password: Optional[UserPassword] = None
@@ -31,6 +41,7 @@ class SignUpPage:
         self.image_picker = ft.FilePicker(on_result=self.on_file_picked)
         self.page.overlay.append(self.image_picker)
         self.selected_image = None
+        self.prepared_image = None
 
         self.snack_bar = ft.SnackBar(
             content=ft.Text(
@@ -560,10 +571,42 @@ class SignUpPage:
             )
         )
 
+    def send_registration(self, image):
+        """
+        Отправляет регистрацию; аватар загружается с диалогом прогресса.
+        Возвращает None, если пользователь отменил загрузку.
+        """
+        if image is None:
+            return self.api.register_user(user=self.user_registration)
+
+        progress_dialog = UploadProgressDialog(self.page, 'Регистрация')
+        progress_dialog.open()
+        try:
+            return self.api.register_user(
+                user=self.user_registration,
+                image=image,
+                on_progress=progress_dialog.on_progress,
+                cancel=progress_dialog.cancel,
+            )
+        except UploadCancelled:
+            self.show_snack_bar(
+                'Регистрация отменена.', bgcolor=ft.colors.ORANGE
+            )
+            return None
+        finally:
+            image.close()
+            self.prepared_image = None
+            progress_dialog.close()
+
     def on_file_picked(self, e: ft.FilePickerResultEvent):
         if e.files:
+            if self.prepared_image is not None:
+                discard_prepared(self.prepared_image)
             self.selected_image = e.files[0].path
-            print(f'Выбрано изображение: {self.selected_image}')
+            self.prepared_image = prepare_upload_in_background(
+                self.selected_image, AVATAR_UPLOAD_SIZE
+            )
+            logger.debug('Выбрано изображение: %s', self.selected_image)
 
     def on_sign_up_click(self, e=None):
         if (
@@ -590,27 +633,40 @@ class SignUpPage:
             self.display_validation_errors(ve)
             return
 
+        image = None
         if self.selected_image:
+            if self.prepared_image is None:
+                self.prepared_image = prepare_upload_in_background(
+                    self.selected_image, AVATAR_UPLOAD_SIZE
+                )
             try:
-                with open(self.selected_image, 'rb') as img_file:
-                    image_bytes = img_file.read()
-                self.user_registration.image = image_bytes
+                image = self.prepared_image.result()
             except Exception as ex:
+                self.prepared_image = None
                 self.show_snack_bar(
                     f'Ошибка при чтении изображения: {ex}',
                     bgcolor=ft.colors.RED,
                 )
                 return
 
-        response = self.api.register_user(user=self.user_registration)
+        response = self.send_registration(image)
+        if response is None:
+            return
 
         if response.status_code == 200:
             tokens = response.json()
-            self.api.set_access_token(tokens['access_token'])
-            self.api.refresh_token = tokens['refresh_token']  # Если необходимо
+            self.api.set_tokens(
+                tokens['access_token'], tokens['refresh_token']
+            )
 
-            print(f'Access token после установки: {self.api.access_token}')
-            print(f'Refresh token после установки: {self.api.refresh_token}')
+            logger.debug(
+                'Access token после установки: %s',
+                self.api.access_token,
+            )
+            logger.debug(
+                'Refresh token после установки: %s',
+                self.api.refresh_token,
+            )
 
             self.page.client_storage.set(
                 'access_token', tokens['access_token']
@@ -645,7 +701,7 @@ class SignUpPage:
         error_messages = []
         for error in ve.errors():
             msg = error['msg']
-            print(f'Error message before processing: {msg}')  # Отладка
+            logger.error('Error message before processing: %s', msg)  # Отладка
             prefix = 'Value error, '
             if msg.startswith(prefix):
                 msg = msg[len(prefix) :]
@@ -654,7 +710,7 @@ class SignUpPage:
         self.show_snack_bar(error_text, bgcolor=ft.colors.RED)
 
     def show_snack_bar(self, message: str, bgcolor: str = ft.colors.RED):
-        print(f'Показываем сообщение: {message}')
+        logger.debug('Показываем сообщение: %s', message)
 
         self.snack_bar.content.value = message
         self.snack_bar.bgcolor = bgcolor
@@ -0,0 +1,50 @@
+import threading
+
+import flet as ft
+
+
+class UploadProgressDialog:
+    """
+    Модальный диалог с прогрессом загрузки файла и кнопкой «Отмена».
+
+    on_progress и cancel передаются в методы загрузки BackendApi;
+    сама загрузка идёт в отдельном потоке (page.run_thread).
+    """
+
+    def __init__(self, page: ft.Page, title: str = 'Загрузка изображения'):
+        self.page = page
+        self.cancel = threading.Event()
+        self.progress_bar = ft.ProgressBar(value=0, width=300)
+        self.progress_text = ft.Text('Подготовка...')
+        self.dialog = ft.AlertDialog(
+            modal=True,
+            title=ft.Text(title),
+            content=ft.Column(
+                controls=[self.progress_bar, self.progress_text],
+                tight=True,
+            ),
+            actions=[ft.TextButton('Отмена', on_click=self.on_cancel_click)],
+            actions_alignment=ft.MainAxisAlignment.END,
+        )
+
+    def open(self):
+        self.page.dialog = self.dialog
+        self.dialog.open = True
+        self.page.update()
+
+    def close(self):
+        self.dialog.open = False
+        self.page.update()
+
+    def on_progress(self, sent: int, total: int):
+        self.progress_bar.value = sent / total if total else 1
+        self.progress_text.value = (
+            f'Отправлено {sent // 1024} из {total // 1024} КБ'
+        )
+        if self.dialog.page is not None:
+            self.dialog.update()
+
+    def on_cancel_click(self, e):
+        self.cancel.set()
+        self.progress_text.value = 'Отмена...'
+        self.dialog.update()
@@ -1,28 +1,36 @@
 import datetime
+import threading
 import urllib.parse
 
 import flet as ft
 
 from washer.api_requests import BackendApi
+from washer.car_wash_directory import CarWashDirectory
 from washer.config import config
+from washer.geo import LocationIndex
+from washer.images import image_cache
+from washer.logger import get_logger
 from washer.ui_components.account_settings_page import AccountSettingsPage
 from washer.ui_components.my_finance_page import MyFinancePage
+from washer.ui_updates import batched_updates, flush_updates
 
+logger = get_logger(__name__)
+
+# За сколько пикселей до конца списка подгружать следующую страницу
+SCROLL_LOAD_THRESHOLD = 400
+NEAREST_PAGE_SIZE = 10
+GEOLOCATION_TIMEOUT = 10
 
-class WashSelectionPage:
-    car_washes_cache = None
 
+class WashSelectionPage:
     def __init__(self, page: ft.Page, username: str = None):
         self.page = page
         self.page.clean()
         self.page.adaptive = True
 
-        self.api = BackendApi()
-        access_token = self.page.client_storage.get('access_token')
-        if access_token:
-            self.api.set_access_token(access_token)
-        else:
-            print('Access token not found -> redirect to SignIn')
+        self.api = BackendApi.for_page(self.page)
+        if not self.api.access_token:
+            logger.warning('Access token not found -> redirect to SignIn')
             self.redirect_to_sign_in_page()
             return
 
@@ -30,6 +38,12 @@ class WashSelectionPage:
         self.api_url = config.api_url
 
         self.car_washes = []
+        self.directory = CarWashDirectory.for_view('client')
+        self.load_more_lock = threading.Lock()
+        self.search_text = ''
+        self.location_index = None
+        self.user_position = None
+        self.distances = {}
         self.search_bar = self.create_search_bar()
         self.search_bar.visible = False
 
@@ -88,6 +102,8 @@ class WashSelectionPage:
             ],
             padding=ft.padding.only(top=10, bottom=10),
             spacing=10,
+            on_scroll=self.on_list_scroll,
+            on_scroll_interval=100,
         )
 
         self.main_container = ft.Container(
@@ -103,11 +119,15 @@ class WashSelectionPage:
             ft.Container(self.progress_bar, alignment=ft.alignment.center),
         )
 
+        self.geolocator = ft.Geolocator()
+        self.page.overlay.append(self.geolocator)
+
         self.progress_bar.visible = True
         self.page.update()
         self.load_car_washes()
         self.progress_bar.visible = False
         self.page.update()
+        self.page.run_thread(self.locate_user)
 
     def create_app_bar_with_drawer(self):
         return ft.AppBar(
@@ -182,19 +202,21 @@ class WashSelectionPage:
         self.page.update()
 
     def on_drawer_dismiss(self, e):
-        print('NavigationDrawer закрыт')
+        logger.debug('NavigationDrawer закрыт')
 
+    @batched_updates
     def on_drawer_change(self, e):
         if not self.page.drawer:
-            print('NavigationDrawer отсутствует на текущей странице.')
+            logger.warning('NavigationDrawer отсутствует на текущей странице.')
             return
 
         selected = e.control.selected_index
-        print(f'Выбранный индекс в NavigationDrawer: {selected}')
+        logger.debug('Выбранный индекс в NavigationDrawer: %s', selected)
 
         self.page.drawer.open = False
-        self.page.update()
-        print(f'NavigationDrawer закрыт: {self.page.drawer.open}')
+        # Ящик закрывается сразу, не дожидаясь загрузки следующего экрана
+        flush_updates(self.page)
+        logger.debug('NavigationDrawer закрыт: %s', self.page.drawer.open)
 
         if selected == 0:
             self.reload_page()
@@ -206,27 +228,142 @@ class WashSelectionPage:
             self.logout()
 
     def load_car_washes(self):
-        if WashSelectionPage.car_washes_cache:
-            print('Using cached car washes data')
-            self.car_washes = WashSelectionPage.car_washes_cache
+        car_washes = self.directory.car_washes(
+            self.api, on_refresh=self.on_car_washes_refreshed
+        )
+        if car_washes is not None:
+            self.car_washes = car_washes
             self.update_wash_list_with_slots(self.car_washes)
+            # Следующая страница грузится заранее: если первая не
+            # заполняет экран, прокрутки может и не быть
+            self.page.run_thread(self.load_more_car_washes)
+
+    def on_list_scroll(self, e: ft.OnScrollEvent):
+        if e.pixels >= e.max_scroll_extent - SCROLL_LOAD_THRESHOLD:
+            self.page.run_thread(self.load_more_car_washes)
+
+    def load_more_car_washes(self):
+        """Дописывает в список следующую страницу автомоек."""
+        if self.search_text:
             return
+        if self.user_position is None and not self.directory.has_more:
+            return
+        if not self.load_more_lock.acquire(blocking=False):
+            return
+        try:
+            if self.user_position is None:
+                car_washes = self.directory.load_more(self.api)
+            else:
+                car_washes = self.nearest_car_washes(
+                    len(self.car_washes) + NEAREST_PAGE_SIZE
+                )
+            known = {wash['id'] for wash in self.car_washes}
+            car_washes = [
+                wash for wash in car_washes if wash['id'] not in known
+            ]
+            if not car_washes or self.search_text:
+                return
+            image_cache.prefetch(
+                [wash.get('image_link') for wash in car_washes],
+                width=float('inf'),
+                height=170,
+            )
+            self.car_washes.extend(car_washes)
+            self.car_washes_list.controls.extend(
+                self.create_car_wash_card(wash) for wash in car_washes
+            )
+            if self.car_washes_list.page is not None:
+                self.car_washes_list.update()
+        finally:
+            self.load_more_lock.release()
 
-        response = self.api.get_car_washes(page=1)
-        if response.status_code == 200:
-            self.car_washes = response.json().get('data', [])
-            WashSelectionPage.car_washes_cache = self.car_washes
+    def on_car_washes_refreshed(self, car_washes):
+        if self.user_position is not None:
+            return
+        self.car_washes = car_washes
+        if self.car_washes_list.page is not None:
             self.update_wash_list_with_slots(self.car_washes)
-        else:
-            print(
-                f'Error loading car washes: '
-                f'{response.status_code}, {response.text}'
+
+    def locate_user(self):
+        """
+        Определяет положение пользователя и показывает ближайшие
+        автомойки первыми. Без разрешения на геолокацию список остаётся
+        в порядке каталога.
+        """
+        try:
+            permission = self.geolocator.request_permission(
+                wait_timeout=GEOLOCATION_TIMEOUT
+            )
+            if permission not in (
+                ft.GeolocatorPermissionStatus.ALWAYS,
+                ft.GeolocatorPermissionStatus.WHILE_IN_USE,
+            ):
+                logger.debug('Нет разрешения на геолокацию: %s', permission)
+                return
+            position = self.geolocator.get_current_position(
+                accuracy=ft.GeolocatorPositionAccuracy.LOW,
+                wait_timeout=GEOLOCATION_TIMEOUT,
             )
+        except Exception as e:
+            logger.debug('Геолокация недоступна: %s', e)
+            return
+        if position.latitude is None or position.longitude is None:
+            return
+
+        self.location_index = LocationIndex.shared(self.api)
+        if not self.location_index:
+            return
+        self.directory.load_all(self.api)
+        with self.load_more_lock:
+            self.user_position = (position.latitude, position.longitude)
+            self.car_washes = self.nearest_car_washes(NEAREST_PAGE_SIZE)
+            if not self.search_text:
+                self.update_wash_list_with_slots(self.car_washes)
+
+    def nearest_car_washes(self, count: int) -> list[dict]:
+        """
+        Первые count автомоек по расстоянию до пользователя. Ближайшие
+        локации берутся из индекса, k удваивается, пока автомоек
+        не хватит.
+        """
+        catalog = self.directory.loaded()
+        by_location = {}
+        for car_wash in catalog:
+            by_location.setdefault(car_wash.get('location_id'), []).append(
+                car_wash
+            )
+
+        latitude, longitude = self.user_position
+        k = count
+        while True:
+            nearest = self.location_index.nearest(latitude, longitude, k)
+            car_washes = []
+            for distance, location in nearest:
+                for car_wash in by_location.get(location['id'], []):
+                    self.distances[car_wash['id']] = distance
+                    car_washes.append(car_wash)
+            if len(car_washes) >= count:
+                return car_washes[:count]
+            if k >= len(self.location_index):
+                # Автомойки без координат — в конце, в порядке каталога
+                shown = {car_wash['id'] for car_wash in car_washes}
+                car_washes.extend(
+                    car_wash
+                    for car_wash in catalog
+                    if car_wash['id'] not in shown
+                )
+                return car_washes[:count]
+            k *= 2
 
     def update_wash_list_with_slots(self, washes):
         if not washes:
             self.car_washes_list.controls = [self.create_no_results_message()]
         else:
+            image_cache.prefetch(
+                [wash.get('image_link') for wash in washes],
+                width=float('inf'),
+                height=170,
+            )
             self.car_washes_list.controls = [
                 self.create_car_wash_card(wash) for wash in washes
             ]
@@ -291,14 +428,14 @@ class WashSelectionPage:
                 open=True,
             )
             self.page.update()
-            print(f'Не удалось открыть почтовый клиент: {error}')
+            logger.error('Не удалось открыть почтовый клиент: %s', error)
 
     def create_car_wash_card(self, car_wash):
         image_link = car_wash.get('image_link', 'assets/spa_logo.png')
         location_id = car_wash.get('location_id')
         location_data = (
-            self.load_location_data(location_id) if location_id else None
-        )
+            self.location_index and self.location_index.get(location_id)
+        ) or (self.load_location_data(location_id) if location_id else None)
         location_address = (
             f"{location_data['city']}, {location_data['address']}"
             if (
@@ -308,6 +445,9 @@ class WashSelectionPage:
             )
             else 'Адрес недоступен'
         )
+        distance = self.distances.get(car_wash['id'])
+        if distance is not None:
+            location_address = f'{location_address} · {distance:.1f} км'
 
         available_slots = self.get_available_slots(car_wash['id'])
         slots_text = (
@@ -332,8 +472,8 @@ class WashSelectionPage:
                     content=ft.Stack(
                         [
                             ft.Container(
-                                content=ft.Image(
-                                    src=image_link,
+                                content=image_cache.image(
+                                    image_link,
                                     fit=ft.ImageFit.COVER,
                                     width=float('inf'),
                                     height=170,
@@ -477,12 +617,17 @@ class WashSelectionPage:
         response = self.api.get_location_data(location_id)
         if response.status_code == 200:
             location = response.json()
-            print(f'Location data for location_id {location_id}: {location}')
+            logger.debug(
+                'Location data for location_id %s: %s',
+                location_id,
+                location,
+            )
             return location
         else:
-            print(
-                f'Error loading car washes: '
-                f'{response.status_code}, {response.text}'
+            logger.error(
+                'Error loading car washes: %s, %s',
+                response.status_code,
+                response.text,
             )
             return None
 
@@ -524,7 +669,7 @@ class WashSelectionPage:
                         except ValueError:
                             continue
         except Exception as e:
-            print(f'Ошибка при обновлении доступных мест: {str(e)}')
+            logger.error('Ошибка при обновлении доступных мест: %s', e)
 
         return total_available
 
@@ -562,6 +707,10 @@ class WashSelectionPage:
 
     def on_search_text_change(self, e):
         search_text = e.control.value.lower()
+        self.search_text = search_text
+        if search_text and self.directory.has_more:
+            self.directory.load_all(self.api)
+            self.car_washes = self.directory.loaded()
         filtered_washes = [
             wash
             for wash in self.car_washes
@@ -578,10 +727,14 @@ class WashSelectionPage:
     def on_fab_click(self, e):
         self.search_bar.visible = not self.search_bar.visible
         self.page.update()
+        if self.search_bar.visible and self.directory.has_more:
+            # Поиск идёт по всем автомойкам: догружаем их, пока вводят текст
+            self.page.run_thread(self.directory.load_all, self.api)
 
+    @batched_updates
     def on_navigation_change(self, e):
         selected_index = e.control.selected_index
-        print(f'NavigationBar selected index: {selected_index}')
+        logger.debug('NavigationBar selected index: %s', selected_index)
 
         if selected_index == 0:
             self.open_my_bookings_page()
@@ -594,7 +747,7 @@ class WashSelectionPage:
 
     def open_my_bookings_page(self):
         if not self.car_washes:
-            print('Car washes data is not loaded yet.')
+            logger.debug('Car washes data is not loaded yet.')
             return
 
         from washer.ui_components.my_bookings_page import MyBookingsPage
@@ -647,6 +800,7 @@ class WashSelectionPage:
         self.page.update()
 
     def logout(self):
+        self.api.logout()
         self.page.client_storage.clear()
         self.redirect_to_sign_in_page()
 
@@ -658,8 +812,8 @@ class WashSelectionPage:
     def create_avatar_container(self):
         avatar_url = self.get_avatar_from_server()
         if avatar_url:
-            avatar_content = ft.Image(
-                src=avatar_url,
+            avatar_content = image_cache.image(
+                avatar_url,
                 width=50,
                 height=50,
                 border_radius=ft.border_radius.all(25),
@@ -690,9 +844,10 @@ class WashSelectionPage:
             user_data = response.json()
             return user_data.get('image_link')
         else:
-            print(
-                f'Error fetching avatar: '
-                f'{response.status_code}, {response.text}'
+            logger.error(
+                'Error fetching avatar: %s, %s',
+                response.status_code,
+                response.text,
             )
             return None
 
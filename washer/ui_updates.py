@@ -0,0 +1,121 @@
+import functools
+import threading
+from contextlib import contextmanager
+
+from washer.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class UpdateStats:
+    """
+    Счётчики обновлений страниц за время работы процесса: сколько раз
+    обработчики вызвали update и сколько обновлений ушло клиенту.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requested = 0
+        self.sent = 0
+
+    @property
+    def saved(self) -> int:
+        return self.requested - self.sent
+
+    def record(self, requested: int, sent: int):
+        with self.lock:
+            self.requested += requested
+            self.sent += sent
+
+    def reset(self):
+        with self.lock:
+            self.requested = 0
+            self.sent = 0
+
+
+update_stats = UpdateStats()
+
+
+class UpdateBatcher:
+    """
+    Объединяет обновления страницы Flet внутри обработчика события.
+
+    Каждый page.update() и control.update() отправляет клиенту
+    отдельный diff. control.update() сводится к page.update(control),
+    поэтому батчер подменяет page.update: внутри batch() вызовы только
+    отмечаются, а на выходе уходит один page.update(), diff которого
+    включает все изменённые контролы. Подмена действует лишь в потоке,
+    открывшем batch, — фоновые потоки сессии обновляют страницу сразу.
+    """
+
+    install_lock = threading.Lock()
+
+    def __init__(self, page):
+        self.page = page
+        self.send = page.update
+        self.local = threading.local()
+        page.update = self.update
+
+    @staticmethod
+    def for_page(page) -> 'UpdateBatcher':
+        with UpdateBatcher.install_lock:
+            batcher = getattr(page, 'update_batcher', None)
+            if batcher is None:
+                batcher = UpdateBatcher(page)
+                page.update_batcher = batcher
+            return batcher
+
+    def update(self, *controls):
+        if getattr(self.local, 'depth', 0):
+            self.local.pending += 1
+            return
+        update_stats.record(1, 1)
+        self.send(*controls)
+
+    def flush(self):
+        """
+        Отправляет накопленные изменения сразу, например чтобы показать
+        индикатор загрузки перед долгим запросом.
+        """
+        if not getattr(self.local, 'depth', 0):
+            self.update()
+            return
+        pending, self.local.pending = self.local.pending, 0
+        update_stats.record(max(pending, 1), 1)
+        self.send()
+
+    @contextmanager
+    def batch(self):
+        depth = getattr(self.local, 'depth', 0)
+        if depth == 0:
+            self.local.pending = 0
+        self.local.depth = depth + 1
+        try:
+            yield self
+        finally:
+            self.local.depth = depth
+            if depth == 0:
+                pending, self.local.pending = self.local.pending, 0
+                if pending:
+                    update_stats.record(pending, 1)
+                    logger.debug('Объединено обновлений страницы: %s', pending)
+                    self.send()
+
+
+def batched_updates(handler):
+    """
+    Декоратор обработчика страницы (метода с self.page): все update
+    внутри него отправляются клиенту одним page.update() в конце.
+    """
+
+    @functools.wraps(handler)
+    def wrapper(self, *args, **kwargs):
+        with UpdateBatcher.for_page(self.page).batch():
+            return handler(self, *args, **kwargs)
+
+    return wrapper
+
+
+def flush_updates(page):
+    """Отправляет отложенные обновления страницы немедленно."""
+    UpdateBatcher.for_page(page).flush()
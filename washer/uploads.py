@@ -0,0 +1,111 @@
+import os
+import threading
+from typing import BinaryIO, Callable
+
+from washer.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class UploadCancelled(Exception):
+    """Загрузка файла отменена пользователем."""
+
+
+class UploadProgress:
+    """
+    Общий прогресс всех файлов одного multipart-запроса.
+
+    on_progress(sent, total) вызывается из потока, отправляющего запрос,
+    не чаще одного раза на процент. Если установлено событие cancel,
+    следующее чтение файла прерывает отправку с UploadCancelled.
+    """
+
+    def __init__(
+        self,
+        on_progress: Callable[[int, int], None] = None,
+        cancel: threading.Event = None,
+    ):
+        self.on_progress = on_progress
+        self.cancel = cancel
+        self.readers: list[ProgressReader] = []
+        self.reported = None
+
+    @property
+    def total(self) -> int:
+        return sum(reader.length for reader in self.readers)
+
+    @property
+    def sent(self) -> int:
+        return sum(reader.position for reader in self.readers)
+
+    def check_cancelled(self):
+        if self.cancel is not None and self.cancel.is_set():
+            raise UploadCancelled('Загрузка отменена')
+
+    def report(self):
+        if self.on_progress is None:
+            return
+        sent, total = self.sent, self.total
+        percent = sent * 100 // total if total else 100
+        if percent != self.reported:
+            self.reported = percent
+            self.on_progress(sent, total)
+
+
+class ProgressReader:
+    """
+    Файловый объект для части multipart-запроса httpx. Отдаёт данные
+    исходного файла кусками по мере отправки, поэтому файл не
+    копируется в память целиком. Поддерживает seek: httpx перематывает
+    файл, когда запрос отправляется повторно (например, после 401).
+    """
+
+    def __init__(self, file: BinaryIO, progress: UploadProgress):
+        self.file = file
+        self.name = getattr(file, 'name', 'upload')
+        self.progress = progress
+        self.position = file.tell()
+        self.length = file.seek(0, os.SEEK_END)
+        file.seek(self.position)
+        progress.readers.append(self)
+
+    def read(self, size: int = -1) -> bytes:
+        self.progress.check_cancelled()
+        chunk = self.file.read(size)
+        self.position += len(chunk)
+        self.progress.report()
+        return chunk
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        self.position = self.file.seek(offset, whence)
+        return self.position
+
+    def tell(self) -> int:
+        return self.position
+
+    def close(self):
+        self.file.close()
+
+
+def streaming_files(
+    files: dict,
+    on_progress: Callable[[int, int], None] = None,
+    cancel: threading.Event = None,
+) -> dict:
+    """
+    Оборачивает файлы в files (формат httpx) в ProgressReader.
+    Без on_progress и cancel возвращает files как есть.
+    """
+    if not files or (on_progress is None and cancel is None):
+        return files
+
+    progress = UploadProgress(on_progress, cancel)
+    wrapped = {}
+    for name, value in files.items():
+        if isinstance(value, tuple) and hasattr(value[1], 'read'):
+            value = (value[0], ProgressReader(value[1], progress), *value[2:])
+        elif hasattr(value, 'read'):
+            value = ProgressReader(value, progress)
+        wrapped[name] = value
+    logger.debug('Загрузка %s байт в %s частях', progress.total, len(files))
+    return wrapped